@@ -0,0 +1,60 @@
+"""Index candidate name/email/title for the pipeline search box.
+
+The role pipeline and global application search match recruiter input against
+``lower(full_name)``, ``lower(email)`` and ``lower(position)``. Terms of three
+or more characters use a contains match served by trigram GIN indexes; shorter
+terms use a prefix match served by org-leading ``text_pattern_ops`` B-trees.
+Roles are matched by name in the global search, so ``roles.name`` gets a
+trigram index as well.
+
+Revision ID: 191_add_application_text_search_indexes
+Revises: 190_deck_share_links
+Create Date: 2026-10-18
+"""
+from __future__ import annotations
+
+from alembic import op
+
+
+revision = "191_add_application_text_search_indexes"
+down_revision = "190_deck_share_links"
+branch_labels = None
+depends_on = None
+
+
+_TRIGRAM_INDEXES = (
+    ("ix_candidates_full_name_lower_trgm", "candidates", "full_name"),
+    ("ix_candidates_email_lower_trgm", "candidates", "email"),
+    ("ix_candidates_position_lower_trgm", "candidates", "position"),
+    ("ix_roles_name_lower_trgm", "roles", "name"),
+)
+_PREFIX_INDEXES = (
+    ("ix_candidates_org_full_name_lower_prefix", "full_name"),
+    ("ix_candidates_org_email_lower_prefix", "email"),
+    ("ix_candidates_org_position_lower_prefix", "position"),
+)
+
+
+def upgrade() -> None:
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    # Concurrent builds keep candidate ingestion writable on large orgs. IF NOT
+    # EXISTS makes a retry safe if a deployment is interrupted between indexes.
+    with op.get_context().autocommit_block():
+        for name, table, column in _TRIGRAM_INDEXES:
+            op.execute(
+                f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {name} "
+                f"ON {table} USING gin (lower({column}) gin_trgm_ops)"
+            )
+        for name, column in _PREFIX_INDEXES:
+            op.execute(
+                f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {name} "
+                f"ON candidates (organization_id, lower({column}) text_pattern_ops)"
+            )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, _column in reversed(_PREFIX_INDEXES):
+            op.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {name}")
+        for name, _table, _column in reversed(_TRIGRAM_INDEXES):
+            op.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {name}")
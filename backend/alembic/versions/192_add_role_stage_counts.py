@@ -0,0 +1,51 @@
+"""Add the maintained per-role pipeline stage-count projection.
+
+Backs ``RoleStageCount``. Purely additive: rows are created lazily by the
+first pipeline read or the first stage/outcome write for a role, so no backfill
+is needed and this is safe to apply ahead of the code that uses it.
+
+Revision ID: 192_add_role_stage_counts
+Revises: 191_add_application_text_search_indexes
+Create Date: 2026-10-18
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "192_add_role_stage_counts"
+down_revision = "191_add_application_text_search_indexes"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "role_stage_counts",
+        sa.Column("role_id", sa.Integer(), autoincrement=False, nullable=False),
+        sa.Column("organization_id", sa.Integer(), nullable=True),
+        sa.Column("applied", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("invited", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("in_assessment", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("review", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("total", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("version", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("stale", sa.Boolean(), nullable=False, server_default=sa.true()),
+        sa.Column("refreshed_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.func.now(),
+            nullable=True,
+        ),
+        sa.PrimaryKeyConstraint("role_id"),
+    )
+    op.create_index(
+        "ix_role_stage_counts_organization_id",
+        "role_stage_counts",
+        ["organization_id"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_role_stage_counts_organization_id", table_name="role_stage_counts")
+    op.drop_table("role_stage_counts")
@@ -0,0 +1,38 @@
+"""Let score jobs route their holistic call through the Message Batches API.
+
+``delivery`` is ``live`` (synchronous provider call, the historical
+behaviour) or ``batch``. ``batch_trace_id`` records the trace of the batch
+result written to the shared score cache, so the worker that persists it
+does not bill it again as a cache hit. Additive; existing rows are live.
+
+Revision ID: 193_add_score_job_batch_delivery
+Revises: 192_add_role_stage_counts
+Create Date: 2026-10-18
+"""
+
+from __future__ import annotations
+
+import sqlalchemy as sa
+from alembic import op
+
+
+revision = "193_add_score_job_batch_delivery"
+down_revision = "192_add_role_stage_counts"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "cv_score_jobs",
+        sa.Column("delivery", sa.String(), nullable=False, server_default="live"),
+    )
+    op.add_column(
+        "cv_score_jobs",
+        sa.Column("batch_trace_id", sa.String(), nullable=True),
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("cv_score_jobs", "batch_trace_id")
+    op.drop_column("cv_score_jobs", "delivery")
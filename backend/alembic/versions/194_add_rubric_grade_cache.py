@@ -0,0 +1,50 @@
+"""Add rubric_grade_cache table.
+
+Content-addressed cache of successful rubric dimension grades, keyed on the
+submission evidence, dimension spec, lens, model and grader prompt version.
+Rubric retries and re-scores of unchanged submissions read from here instead
+of re-calling the grader. Purely additive.
+
+Revision ID: 194_add_rubric_grade_cache
+Revises: 193_add_score_job_batch_delivery
+Create Date: 2026-10-18
+"""
+
+from __future__ import annotations
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "194_add_rubric_grade_cache"
+down_revision = "193_add_score_job_batch_delivery"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "rubric_grade_cache",
+        sa.Column("cache_key", sa.String, primary_key=True),
+        sa.Column("organization_id", sa.Integer, nullable=False),
+        sa.Column("dimension_id", sa.String, nullable=False),
+        sa.Column("prompt_version", sa.String, nullable=False),
+        sa.Column("model", sa.String, nullable=False),
+        sa.Column("result", sa.JSON, nullable=False),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            nullable=False,
+            server_default=sa.func.now(),
+        ),
+    )
+    op.create_index(
+        "ix_rubric_grade_cache_organization_id",
+        "rubric_grade_cache",
+        ["organization_id"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_rubric_grade_cache_organization_id", table_name="rubric_grade_cache")
+    op.drop_table("rubric_grade_cache")
@@ -0,0 +1,71 @@
+"""Add sandbox_pool_entries for pre-warmed assessment sandboxes.
+
+Backs ``SandboxPoolEntry``. Purely additive: the pool is empty until the
+replenisher runs with SANDBOX_POOL_ENABLED, and assessment start falls back to
+creating a sandbox inline whenever no pooled entry matches.
+
+Revision ID: 195_add_sandbox_pool_entries
+Revises: 194_add_rubric_grade_cache
+Create Date: 2026-10-18
+"""
+
+from __future__ import annotations
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "195_add_sandbox_pool_entries"
+down_revision = "194_add_rubric_grade_cache"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "sandbox_pool_entries",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column(
+            "organization_id",
+            sa.Integer(),
+            sa.ForeignKey("organizations.id"),
+            nullable=False,
+        ),
+        sa.Column(
+            "task_id",
+            sa.Integer(),
+            sa.ForeignKey("tasks.id", ondelete="CASCADE"),
+            nullable=False,
+        ),
+        sa.Column("task_snapshot_sha256", sa.String(64), nullable=False),
+        sa.Column("sandbox_id", sa.String(), nullable=False, unique=True),
+        sa.Column("status", sa.String(), nullable=False, server_default="warming"),
+        sa.Column("bootstrap", sa.JSON(), nullable=True),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            nullable=False,
+            server_default=sa.func.now(),
+        ),
+        sa.Column("ready_at", sa.DateTime(timezone=True), nullable=True),
+    )
+    op.create_index("ix_sandbox_pool_entries_id", "sandbox_pool_entries", ["id"])
+    op.create_index(
+        "ix_sandbox_pool_entries_organization_id",
+        "sandbox_pool_entries",
+        ["organization_id"],
+    )
+    op.create_index(
+        "ix_sandbox_pool_entries_task_snapshot_sha256",
+        "sandbox_pool_entries",
+        ["task_snapshot_sha256"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(
+        "ix_sandbox_pool_entries_task_snapshot_sha256", table_name="sandbox_pool_entries"
+    )
+    op.drop_index("ix_sandbox_pool_entries_organization_id", table_name="sandbox_pool_entries")
+    op.drop_index("ix_sandbox_pool_entries_id", table_name="sandbox_pool_entries")
+    op.drop_table("sandbox_pool_entries")
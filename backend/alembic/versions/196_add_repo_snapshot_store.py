@@ -0,0 +1,94 @@
+"""Add repo_file_blobs, assessment_repo_manifests and repo_blob_refs.
+
+Back the incremental sandbox repo snapshot engine: a task-scoped,
+content-addressed file blob store, each assessment's last snapshot manifest,
+and the blob references that let unreferenced blobs be deleted. Purely
+additive; an assessment without a manifest snapshots from
+the task baseline.
+
+Revision ID: 196_add_repo_snapshot_store
+Revises: 195_add_sandbox_pool_entries
+Create Date: 2026-10-18
+"""
+
+from __future__ import annotations
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "196_add_repo_snapshot_store"
+down_revision = "195_add_sandbox_pool_entries"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "repo_file_blobs",
+        sa.Column(
+            "task_id",
+            sa.Integer(),
+            sa.ForeignKey("tasks.id", ondelete="CASCADE"),
+            primary_key=True,
+        ),
+        sa.Column("sha256", sa.String(64), primary_key=True),
+        sa.Column("content", sa.Text(), nullable=False),
+        sa.Column("size_bytes", sa.Integer(), nullable=False),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            nullable=False,
+            server_default=sa.func.now(),
+        ),
+    )
+    op.create_table(
+        "assessment_repo_manifests",
+        sa.Column(
+            "assessment_id",
+            sa.Integer(),
+            sa.ForeignKey("assessments.id", ondelete="CASCADE"),
+            primary_key=True,
+        ),
+        sa.Column(
+            "task_id",
+            sa.Integer(),
+            sa.ForeignKey("tasks.id", ondelete="CASCADE"),
+            nullable=False,
+        ),
+        sa.Column("manifest", sa.JSON(), nullable=False),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(timezone=True),
+            nullable=False,
+            server_default=sa.func.now(),
+        ),
+    )
+    op.create_table(
+        "repo_blob_refs",
+        sa.Column(
+            "task_id",
+            sa.Integer(),
+            sa.ForeignKey("tasks.id", ondelete="CASCADE"),
+            primary_key=True,
+        ),
+        sa.Column("sha256", sa.String(64), primary_key=True),
+        sa.Column(
+            "assessment_id",
+            sa.Integer(),
+            sa.ForeignKey("assessments.id", ondelete="CASCADE"),
+            primary_key=True,
+        ),
+    )
+    op.create_index(
+        "ix_repo_blob_refs_assessment_id",
+        "repo_blob_refs",
+        ["assessment_id"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_repo_blob_refs_assessment_id", table_name="repo_blob_refs")
+    op.drop_table("repo_blob_refs")
+    op.drop_table("assessment_repo_manifests")
+    op.drop_table("repo_file_blobs")
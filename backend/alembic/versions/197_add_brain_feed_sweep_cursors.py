@@ -0,0 +1,41 @@
+"""Add brain_feed_sweep_cursors.
+
+Persist the brain-feed sweep's per-source keyset high-water mark so each
+sweep pages only over decisions/outcomes newer than the last one it
+enqueued. Purely additive; a source without a cursor sweeps the full
+lookback window once.
+
+Revision ID: 197_add_brain_feed_sweep_cursors
+Revises: 196_add_repo_snapshot_store
+Create Date: 2026-10-18
+"""
+
+from __future__ import annotations
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "197_add_brain_feed_sweep_cursors"
+down_revision = "196_add_repo_snapshot_store"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "brain_feed_sweep_cursors",
+        sa.Column("source", sa.String(16), primary_key=True),
+        sa.Column("last_seen_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("last_seen_id", sa.BigInteger(), nullable=False, server_default="0"),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(timezone=True),
+            nullable=False,
+            server_default=sa.func.now(),
+        ),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("brain_feed_sweep_cursors")
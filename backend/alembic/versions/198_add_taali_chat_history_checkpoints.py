@@ -0,0 +1,52 @@
+"""Add taali_chat_history_checkpoints.
+
+Store each Taali Chat conversation's compacted replay prefix so a turn loads
+one checkpoint row plus the messages after it instead of the full transcript.
+Purely additive and derived; a conversation without a checkpoint replays its
+transcript as before.
+
+Revision ID: 198_add_taali_chat_history_checkpoints
+Revises: 197_add_brain_feed_sweep_cursors
+Create Date: 2026-10-18
+"""
+
+from __future__ import annotations
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "198_add_taali_chat_history_checkpoints"
+down_revision = "197_add_brain_feed_sweep_cursors"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "taali_chat_history_checkpoints",
+        sa.Column(
+            "conversation_id",
+            sa.Integer(),
+            sa.ForeignKey("taali_chat_conversations.id", ondelete="CASCADE"),
+            primary_key=True,
+        ),
+        sa.Column("through_message_id", sa.Integer(), nullable=False),
+        sa.Column("messages", sa.JSON(), nullable=False),
+        sa.Column(
+            "compacted_tokens_saved",
+            sa.Integer(),
+            nullable=False,
+            server_default="0",
+        ),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(timezone=True),
+            nullable=False,
+            server_default=sa.func.now(),
+        ),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("taali_chat_history_checkpoints")
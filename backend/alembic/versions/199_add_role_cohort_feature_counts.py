@@ -0,0 +1,80 @@
+"""Add the maintained per-role cohort feature counts.
+
+Backs ``RoleCohortState``, ``RoleCohortMember`` and ``RoleCohortFeatureCount``
+(``get_cohort_signals``). Purely additive and derived: a role's rows are
+built by its first cohort-signals read, so no backfill is needed and this is
+safe to apply ahead of the code that uses it.
+
+Revision ID: 199_add_role_cohort_feature_counts
+Revises: 198_add_taali_chat_history_checkpoints
+Create Date: 2026-10-19
+"""
+
+from __future__ import annotations
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "199_add_role_cohort_feature_counts"
+down_revision = "198_add_taali_chat_history_checkpoints"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "role_cohort_states",
+        sa.Column("role_id", sa.Integer(), autoincrement=False, nullable=False),
+        sa.Column("organization_id", sa.Integer(), nullable=True),
+        sa.Column("pool_size", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("top_size", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("top_threshold_score", sa.Float(), nullable=True),
+        sa.Column("rebuilt_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("refreshed_at", sa.DateTime(timezone=True), nullable=True),
+        sa.PrimaryKeyConstraint("role_id"),
+    )
+    op.create_index(
+        "ix_role_cohort_states_organization_id",
+        "role_cohort_states",
+        ["organization_id"],
+    )
+    op.create_table(
+        "role_cohort_members",
+        sa.Column("role_id", sa.Integer(), autoincrement=False, nullable=False),
+        sa.Column("application_id", sa.Integer(), autoincrement=False, nullable=False),
+        sa.Column("score", sa.Float(), nullable=True),
+        sa.Column("in_top", sa.Boolean(), nullable=False, server_default=sa.false()),
+        sa.Column("features", sa.JSON(), nullable=True),
+        sa.Column("version", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("applied_version", sa.Integer(), nullable=False, server_default="0"),
+        sa.PrimaryKeyConstraint("role_id", "application_id"),
+    )
+    op.create_index(
+        "ix_role_cohort_members_role_top_score",
+        "role_cohort_members",
+        ["role_id", "in_top", "score"],
+    )
+    op.create_table(
+        "role_cohort_feature_counts",
+        sa.Column("role_id", sa.Integer(), autoincrement=False, nullable=False),
+        sa.Column("category", sa.String(length=16), nullable=False),
+        sa.Column("feature", sa.String(), nullable=False),
+        sa.Column("pool_n", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("top_n", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.func.now(),
+            nullable=True,
+        ),
+        sa.PrimaryKeyConstraint("role_id", "category", "feature"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("role_cohort_feature_counts")
+    op.drop_index("ix_role_cohort_members_role_top_score", table_name="role_cohort_members")
+    op.drop_table("role_cohort_members")
+    op.drop_index("ix_role_cohort_states_organization_id", table_name="role_cohort_states")
+    op.drop_table("role_cohort_states")
@@ -70,6 +70,11 @@ from ..mcp.provenance import (
 )
 from ..mcp.required_reads import RequiredReadController
 from ..mcp.shared_reads import GroundingLedger
+from ..llm.history_compaction import (
+    compact_settled_tool_results,
+    settled_boundary,
+    with_cache_breakpoints,
+)
 from ..llm.tool_pairs import sanitize_tool_pairs
 from ..services.pricing_service import Feature
 from ..services.usage_metering_service import InsufficientCreditsError, reserve
@@ -130,7 +135,8 @@ def _load_history(db: Session, conversation: AgentConversation) -> list[dict[str
 
     Includes the hidden tool plumbing (tool_use / tool_result turns) so the
     model gets full context; only the rendered timeline hides them. Sanitised
-    so an interrupted-turn orphan can't 400 the whole conversation.
+    so an interrupted-turn orphan can't 400 the whole conversation, and tool
+    results from settled turns are compacted (stable across replays).
     """
     rows = (
         db.query(AgentConversationMessage)
@@ -148,8 +154,10 @@ def _load_history(db: Session, conversation: AgentConversation) -> list[dict[str
         )
         .all()
     )
-    return sanitize_tool_pairs(
-        [{"role": r.author_role, "content": r.content} for r in rows]
+    return compact_settled_tool_results(
+        sanitize_tool_pairs(
+            [{"role": r.author_role, "content": r.content} for r in rows]
+        )
     )
 
 
@@ -272,7 +280,12 @@ def _run_agent_response(
 
     client = None
     system_blocks = build_system_blocks(db, role=role)
-    messages = _load_history(db, conversation)
+    history = _load_history(db, conversation)
+    # Cache the settled (compacted, replay-stable) prefix across turns and the
+    # whole loaded history across this turn's tool rounds.
+    messages = with_cache_breakpoints(
+        history, [settled_boundary(history) - 1, len(history) - 1]
+    )
     user_request_text = latest_user_text(messages)
     grounding_ledger = GroundingLedger(user_request_text)
     required_reads = RequiredReadController(
@@ -46,7 +46,7 @@ from ..models.assessment import Assessment
 from ..models.candidate_application import CandidateApplication
 from ..models.organization import Organization
 from ..models.role import Role
-from ..services import cohort_signals_service
+from ..services import cohort_feature_store
 from ..services.assessment_autosend_guard import check_auto_send
 from ..services.agent_decision_admission import latest_active_decision
 from ..services.agent_policy_settings import (
@@ -1109,10 +1109,11 @@ def _tool_get_cohort_signals(db: Session, *, agent_run: AgentRun, role: Role, ar
         cached = role.agent_cohort_signals or {}
         return {**cached, "from_cache": True}
 
-    payload = cohort_signals_service.compute_cohort_signals(
+    payload = cohort_feature_store.cohort_signals(
         db,
         role_id=int(role.id),
         organization_id=int(role.organization_id),
+        rebuild=force,
     )
     role.agent_cohort_signals = payload
     role.agent_cohort_signals_at = datetime.now(timezone.utc)
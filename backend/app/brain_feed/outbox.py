@@ -1,10 +1,11 @@
 """Durable outbox for the outbound mainspring brain feed.
 
 ``enqueue`` writes a pending ``brain_feed_outbox`` row, idempotent on
-``event_id`` (a re-sweep of the same source row is a no-op). ``drain`` ships
-pending rows to mainspring's ingest API and marks them ``sent``; a send that
-doesn't land leaves the row ``pending`` (until a retry cap) so signal is never
-silently dropped.
+``event_id`` (a re-sweep of the same source row is a no-op); ``enqueue_many``
+is the set-based form the sweep uses. ``drain`` ships pending rows to
+mainspring's ingest API and marks them ``sent``; a send that doesn't land
+leaves the row ``pending`` (until a retry cap) so signal is never silently
+dropped.
 
 Posture is governed entirely by config (see ``app.platform.config``):
   - flag off (default)       -> ``enqueue`` is a no-op; nothing is written.
@@ -17,9 +18,11 @@ from __future__ import annotations
 
 import logging
 from datetime import datetime, timezone
-from typing import Any, Optional
+from typing import Any, Iterable, Optional
 
 import httpx
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlalchemy.orm import Session
 
 from ..models.brain_feed_outbox import (
@@ -91,6 +94,47 @@ def enqueue(
     return row
 
 
+def enqueue_many(
+    db: Session,
+    *,
+    record_kind: str,
+    records: Iterable[tuple[str, dict[str, Any]]],
+) -> int:
+    """Insert pending rows for ``(event_id, payload)`` pairs in one statement.
+
+    ``INSERT ... ON CONFLICT (event_id) DO NOTHING``: already-enqueued ids are
+    skipped by the database instead of one existence probe per row. Returns
+    the number of rows actually written (0 when the feature is disabled).
+    """
+    if not settings.MAINSPRING_BRAIN_FEED_ENABLED:
+        return 0
+    if record_kind not in BRAIN_FEED_KINDS:
+        raise ValueError(f"unknown brain-feed record_kind: {record_kind!r}")
+    values = [
+        {
+            "record_kind": record_kind,
+            "event_id": event_id,
+            "payload": payload,
+            "status": BRAIN_FEED_STATUS_PENDING,
+            "attempts": 0,
+        }
+        for event_id, payload in records
+    ]
+    if not values:
+        return 0
+    dialect_insert = (
+        pg_insert
+        if db.bind is not None and db.bind.dialect.name == "postgresql"
+        else sqlite_insert
+    )
+    result = db.execute(
+        dialect_insert(BrainFeedOutbox)
+        .values(values)
+        .on_conflict_do_nothing(index_elements=[BrainFeedOutbox.event_id])
+    )
+    return max(0, int(result.rowcount or 0))
+
+
 def _post(row: BrainFeedOutbox, base_url: str, token: str) -> None:
     """POST one row to mainspring. Raises on any non-2xx / transport error."""
     path = _INGEST_PATH[row.record_kind]
@@ -174,4 +218,4 @@ def drain(
     }
 
 
-__all__ = ["enqueue", "drain"]
+__all__ = ["enqueue", "enqueue_many", "drain"]
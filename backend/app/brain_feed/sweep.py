@@ -6,69 +6,164 @@ decisions, teach outcomes, and whole-day usage rollups and enqueues anything
 not already in the outbox (idempotent on ``event_id``). That keeps the feed
 entirely off the critical path of the live platform — a sweep failure can
 never affect a recruiter action — at the cost of a short, bounded delay.
+
+Decisions and outcomes are paged from a persisted per-source high-water mark
+(``brain_feed_sweep_cursors``), so a sweep only reads rows it has not seen,
+and each page is inserted as one ``ON CONFLICT (event_id) DO NOTHING`` batch.
 """
 
 from __future__ import annotations
 
 import logging
 from datetime import datetime, timedelta, timezone
+from typing import Any, Callable
 
+from sqlalchemy import and_, or_
 from sqlalchemy.orm import Session
 
 from ..models.agent_decision import AgentDecision
+from ..models.brain_feed_outbox import (
+    BRAIN_FEED_KIND_DECISION,
+    BRAIN_FEED_KIND_OUTCOME,
+    BRAIN_FEED_KIND_USAGE,
+    BrainFeedSweepCursor,
+)
 from ..models.decision_feedback import DecisionFeedback
 from ..models.usage_event import UsageEvent
 from ..platform.config import settings
 from . import anonymize
-from .outbox import enqueue
+from .outbox import enqueue_many
 
 
 logger = logging.getLogger("taali.brain_feed.sweep")
 
+_SWEEP_PAGE_SIZE = 500
+# Re-read window behind the high-water mark. A decision resolved inside a
+# long transaction can commit after a later-stamped one was swept; the
+# overlap re-scans recent rows and ON CONFLICT drops the ones already queued.
+_CURSOR_OVERLAP = timedelta(minutes=15)
+
 
 def _now() -> datetime:
     return datetime.now(timezone.utc)
 
 
-def _enqueue_resolved_decisions(db: Session, cutoff: datetime) -> int:
-    rows = (
-        db.query(AgentDecision)
-        .filter(
-            AgentDecision.resolved_at.isnot(None),
-            AgentDecision.resolved_at >= cutoff,
-        )
-        .order_by(AgentDecision.resolved_at.asc())
-        .all()
-    )
+def _aware(value: datetime) -> datetime:
+    # SQLite hands timezone=True columns back naive; they are stored as UTC.
+    return value if value.tzinfo is not None else value.replace(tzinfo=timezone.utc)
+
+
+def _sweep_source(
+    db: Session,
+    *,
+    record_kind: str,
+    columns: tuple[Any, ...],
+    seen_at: Any,
+    filters: tuple[Any, ...],
+    event_id: Callable[[int], str],
+    payload: Callable[[Any], dict],
+    cutoff: datetime,
+) -> int:
+    """Keyset-page one source past its high-water mark into the outbox.
+
+    Pages are ``(seen_at, id)``-ordered, anonymized as a batch and inserted
+    with one ``ON CONFLICT DO NOTHING`` statement; each page commits together
+    with the advanced cursor, so an interrupted sweep resumes where it
+    stopped. The scan restarts ``_CURSOR_OVERLAP`` before the mark to pick up
+    rows whose transaction committed after a later row had been swept.
+    """
+    seen_id = columns[0]
+    cursor = db.get(BrainFeedSweepCursor, record_kind)
+    start = cutoff
+    if cursor is not None:
+        start = max(cutoff, _aware(cursor.last_seen_at) - _CURSOR_OVERLAP)
+    last_at, last_id = start, 0
     n = 0
-    for d in rows:
-        if enqueue(
+    while True:
+        page = (
+            db.query(*columns)
+            .filter(
+                *filters,
+                or_(seen_at > last_at, and_(seen_at == last_at, seen_id > last_id)),
+            )
+            .order_by(seen_at.asc(), seen_id.asc())
+            .limit(_SWEEP_PAGE_SIZE)
+            .all()
+        )
+        if not page:
+            return n
+        n += enqueue_many(
             db,
-            record_kind="decision",
-            event_id=anonymize.decision_event_id(d.id),
-            payload=anonymize.decision_payload(d),
-        ) is not None:
-            n += 1
-    return n
+            record_kind=record_kind,
+            records=[(event_id(row.id), payload(row)) for row in page],
+        )
+        last_at, last_id = _aware(getattr(page[-1], seen_at.key)), int(page[-1].id)
+        if cursor is None:
+            cursor = BrainFeedSweepCursor(source=record_kind, last_seen_at=last_at)
+            db.add(cursor)
+        if (last_at, last_id) > (_aware(cursor.last_seen_at), int(cursor.last_seen_id or 0)):
+            cursor.last_seen_at = last_at
+            cursor.last_seen_id = last_id
+        db.commit()
+        if len(page) < _SWEEP_PAGE_SIZE:
+            return n
+
+
+# Only the columns the anonymized payloads read: free text never leaves the DB.
+_DECISION_COLUMNS = (
+    AgentDecision.id,
+    AgentDecision.organization_id,
+    AgentDecision.role_id,
+    AgentDecision.decision_type,
+    AgentDecision.recommendation,
+    AgentDecision.confidence,
+    AgentDecision.model_version,
+    AgentDecision.prompt_version,
+    AgentDecision.status,
+    AgentDecision.human_disposition,
+    AgentDecision.override_action,
+    AgentDecision.active_capabilities,
+    AgentDecision.token_spend,
+    AgentDecision.created_at,
+    AgentDecision.resolved_at,
+)
+_OUTCOME_COLUMNS = (
+    DecisionFeedback.id,
+    DecisionFeedback.decision_id,
+    DecisionFeedback.failure_mode,
+    DecisionFeedback.scope,
+    DecisionFeedback.attributed_to,
+    DecisionFeedback.direction,
+    DecisionFeedback.applied_at,
+    DecisionFeedback.reverted_at,
+    DecisionFeedback.created_at,
+)
+
+
+def _enqueue_resolved_decisions(db: Session, cutoff: datetime) -> int:
+    return _sweep_source(
+        db,
+        record_kind=BRAIN_FEED_KIND_DECISION,
+        columns=_DECISION_COLUMNS,
+        seen_at=AgentDecision.resolved_at,
+        filters=(AgentDecision.resolved_at.isnot(None),),
+        event_id=anonymize.decision_event_id,
+        payload=anonymize.decision_payload,
+        cutoff=cutoff,
+    )
 
 
 def _enqueue_outcomes(db: Session, cutoff: datetime) -> int:
-    rows = (
-        db.query(DecisionFeedback)
-        .filter(DecisionFeedback.created_at >= cutoff)
-        .order_by(DecisionFeedback.created_at.asc())
-        .all()
+    return _sweep_source(
+        db,
+        record_kind=BRAIN_FEED_KIND_OUTCOME,
+        columns=_OUTCOME_COLUMNS,
+        seen_at=DecisionFeedback.created_at,
+        filters=(),
+        event_id=anonymize.outcome_event_id,
+        payload=anonymize.outcome_payload,
+        cutoff=cutoff,
     )
-    n = 0
-    for f in rows:
-        if enqueue(
-            db,
-            record_kind="outcome",
-            event_id=anonymize.outcome_event_id(f.id),
-            payload=anonymize.outcome_payload(f),
-        ) is not None:
-            n += 1
-    return n
 
 
 def _enqueue_usage_rollups(db: Session, cutoff: datetime, today_start: datetime) -> int:
@@ -109,17 +204,17 @@ def _enqueue_usage_rollups(db: Session, cutoff: datetime, today_start: datetime)
         agg["cost_usd_micro"] += int(u.cost_usd_micro or 0)
         agg["event_count"] += 1
 
-    n = 0
-    for (day, feature, model), agg in buckets.items():
-        payload = anonymize.usage_payload(day=day, feature=feature, model=model, **agg)
-        if enqueue(
-            db,
-            record_kind="usage",
-            event_id=anonymize.usage_event_id(day, feature, model),
-            payload=payload,
-        ) is not None:
-            n += 1
-    return n
+    return enqueue_many(
+        db,
+        record_kind=BRAIN_FEED_KIND_USAGE,
+        records=[
+            (
+                anonymize.usage_event_id(day, feature, model),
+                anonymize.usage_payload(day=day, feature=feature, model=model, **agg),
+            )
+            for (day, feature, model), agg in buckets.items()
+        ],
+    )
 
 
 def sweep_and_enqueue(db: Session, *, lookback_hours: int | None = None) -> dict:
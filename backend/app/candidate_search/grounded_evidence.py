@@ -40,7 +40,9 @@ from ..components.ai_routing import (
     prepare_route,
     routed_messages_client,
 )
+from ..components.ai_routing.lineage import current_route
 from ..llm import MeteringContext, one_call
+from ..platform.redis_cache import cache_redis, mark_cache_redis_failed
 from ..services.pricing_service import Feature
 from .metering import search_metering
 
@@ -376,19 +378,10 @@ def _content_document(chunks: list[str], title: str) -> dict[str, Any]:
 
 
 def _redis():
-    """Best-effort Redis handle for the grounding cache (shared infra with the
-    holistic scorer's caches). Returns None when Redis is unavailable, which
+    """The shared pooled Redis client for the grounding cache (shared infra with
+    the holistic scorer's caches). Returns None when Redis is unavailable, which
     disables caching cleanly — grounding still works, just without reuse."""
-    try:
-        import redis
-
-        from ..platform.config import settings
-
-        return redis.Redis.from_url(
-            settings.REDIS_URL, socket_connect_timeout=2, socket_timeout=2
-        )
-    except Exception:  # pragma: no cover — cache is best-effort
-        return None
+    return cache_redis()
 
 
 def _doc_hash(cv_text: str | None, notes_text: str | None) -> str:
@@ -422,58 +415,122 @@ def _cache_key(
     )
 
 
-def _cache_get(
-    r,
-    organization_id: int,
-    doc_hash: str,
-    criterion: str,
-    *,
-    behavior_fingerprint: str,
-) -> CriterionVerdict | None:
-    if r is None:
-        return None
+def _cache_get_many(r, keys: list[str]) -> list[CriterionVerdict | None]:
+    """Cached verdicts for ``keys`` in one ``MGET`` round-trip (None = miss)."""
+    if r is None or not keys:
+        return [None] * len(keys)
     try:
-        raw = r.get(
-            _cache_key(
-                organization_id,
-                doc_hash,
-                criterion,
-                behavior_fingerprint=behavior_fingerprint,
-            )
-        )
-        if not raw:
-            return None
-        return CriterionVerdict.from_dict(json.loads(raw))
-    except Exception:  # pragma: no cover — never fail a query on a cache read
+        raws = r.mget(keys)
+    except Exception:  # never fail a query on a cache read
         logger.debug("grounding cache read failed", exc_info=True)
-        return None
-
-
-def _cache_set(
-    r,
+        mark_cache_redis_failed()
+        return [None] * len(keys)
+    out: list[CriterionVerdict | None] = []
+    for raw in raws:
+        try:
+            out.append(CriterionVerdict.from_dict(json.loads(raw)) if raw else None)
+        except Exception:  # pragma: no cover — a corrupt entry is just a miss
+            out.append(None)
+    return out
+
+
+def _cache_entries(
     organization_id: int,
     doc_hash: str,
-    verdict: CriterionVerdict,
+    verdicts: list[CriterionVerdict],
     *,
     behavior_fingerprint: str,
-) -> None:
+) -> list[tuple[str, str]]:
     # Only cache real judgements. An `error` verdict is a failed check, not a
     # result — caching it would freeze a transient blip into a permanent answer.
-    if r is None or verdict is None or verdict.status == "error":
-        return
-    try:
-        r.setex(
+    return [
+        (
             _cache_key(
                 organization_id,
                 doc_hash,
                 verdict.criterion,
                 behavior_fingerprint=behavior_fingerprint,
             ),
-            GROUNDING_CACHE_TTL_S,
             json.dumps(verdict.to_dict()),
         )
-    except Exception:  # pragma: no cover — never fail a query on a cache write
+        for verdict in verdicts
+        if verdict is not None and verdict.status != "error"
+    ]
+
+
+def write_cached_verdicts(entries: list[tuple[str, str]], *, r=None) -> None:
+    """Store ``(key, payload)`` verdict entries with one pipelined ``SETEX`` batch."""
+    r = r if r is not None else _redis()
+    if r is None or not entries:
+        return
+    try:
+        pipe = r.pipeline(transaction=False)
+        for key, payload in entries:
+            pipe.setex(key, GROUNDING_CACHE_TTL_S, payload)
+        pipe.execute()
+    except Exception:  # never fail a query on a cache write
         logger.debug("grounding cache write failed", exc_info=True)
+        mark_cache_redis_failed()
+
+
+def _planned_behavior_fingerprint(*, require_role_authority: bool = False) -> str:
+    """The route behavior fingerprint a grounding call made from here would key
+    its cache entries under, without starting an invocation.
+
+    Mirrors ``prepare_route``'s strengthening by an active parent workflow. If
+    the executed route ever differs (e.g. an estimate-dependent deployment),
+    its writes land under its own fingerprint and a prefetch simply misses.
+    """
+    parent = current_route()
+    if parent is not None and parent.decision.require_role_authority:
+        require_role_authority = True
+    return plan_route(
+        TaskKey.SEARCH_GROUNDING,
+        require_role_authority=bool(require_role_authority),
+    ).behavior_fingerprint
+
+
+def prefetch_cached_verdicts(
+    evidence: list[tuple[str | None, str | None]],
+    criteria: list[str],
+    *,
+    organization_id: int,
+    require_role_authority: bool = False,
+) -> tuple[str | None, list[dict[str, CriterionVerdict]]]:
+    """Cached verdicts for a whole window of candidates in one ``MGET``.
+
+    ``evidence`` is one ``(cv_text, notes_text)`` pair per candidate. Returns
+    the planned behavior fingerprint the hits were read under (None when the
+    cache is unavailable) and one ``{criterion: verdict}`` dict of hits per
+    candidate, in order, for ``extract_cv_evidence(prefetched=...)``.
+    """
+    criteria = [c.strip() for c in (criteria or []) if c and c.strip()]
+    hits: list[dict[str, CriterionVerdict]] = [{} for _ in evidence]
+    r = _redis()
+    if r is None or not criteria or not evidence:
+        return None, hits
+    try:
+        behavior_fingerprint = _planned_behavior_fingerprint(
+            require_role_authority=require_role_authority
+        )
+    except Exception:  # noqa: BLE001 — no plan, no prefetch; workers still route
+        logger.debug("grounding prefetch planning failed", exc_info=True)
+        return None, hits
+    keys = [
+        _cache_key(
+            organization_id,
+            _doc_hash(cv_text, notes_text),
+            criterion,
+            behavior_fingerprint=behavior_fingerprint,
+        )
+        for cv_text, notes_text in evidence
+        for criterion in criteria
+    ]
+    cached = _cache_get_many(r, keys)
+    for index, verdict in enumerate(cached):
+        if verdict is not None:
+            hits[index // len(criteria)][criteria[index % len(criteria)]] = verdict
+    return behavior_fingerprint, hits
 
 
 def _grounding_request(
@@ -529,6 +586,9 @@ def extract_cv_evidence(
     application_id: int,
     notes_text: str | None = None,
     require_role_authority: bool = False,
+    prefetched: dict[str, CriterionVerdict] | None = None,
+    prefetch_fingerprint: str | None = None,
+    cache_writes: list[tuple[str, str]] | None = None,
 ) -> list[CriterionVerdict]:
     """Per-criterion grounded verdicts over the candidate's evidence (CV +
     recruiter notes / stated details), backed by a persistent cache.
@@ -546,6 +606,14 @@ def extract_cv_evidence(
     rejection may be retried; ambiguous transport failures are never replayed.
     A criterion that cannot complete comes back as ``status="error"`` (never a
     fabricated ``missing``, never cached) so the caller can retry intentionally.
+
+    Window callers pass ``prefetched`` hits from ``prefetch_cached_verdicts``
+    (keyed under ``prefetch_fingerprint``). The route is still prepared for a
+    fully cached candidate, so role authority and admission are enforced
+    before any verdict is served; hits are reused without a second cache read
+    when the executed route has the same fingerprint. ``cache_writes`` collects fresh
+    entries for the caller's single ``write_cached_verdicts`` flush instead of
+    writing them here.
     """
     criteria = [c.strip() for c in (criteria or []) if c and c.strip()]
     if not criteria:
@@ -617,14 +685,22 @@ def extract_cv_evidence(
     misses: list[str] = []
     workflow_succeeded = False
     try:
-        for criterion in criteria:
-            cached = _cache_get(
+        if prefetched is not None and prefetch_fingerprint == behavior_fingerprint:
+            cached_verdicts = [prefetched.get(criterion) for criterion in criteria]
+        else:
+            cached_verdicts = _cache_get_many(
                 r,
-                organization_id,
-                doc_hash,
-                criterion,
-                behavior_fingerprint=behavior_fingerprint,
+                [
+                    _cache_key(
+                        organization_id,
+                        doc_hash,
+                        criterion,
+                        behavior_fingerprint=behavior_fingerprint,
+                    )
+                    for criterion in criteria
+                ],
             )
+        for criterion, cached in zip(criteria, cached_verdicts):
             if cached is not None:
                 verdicts[criterion] = cached
             else:
@@ -676,14 +752,17 @@ def extract_cv_evidence(
                 )
                 for verdict in fresh:
                     verdict.model_id = selected_model_id
-                    _cache_set(
-                        r,
-                        organization_id,
-                        doc_hash,
-                        verdict,
-                        behavior_fingerprint=behavior_fingerprint,
-                    )
                     verdicts[verdict.criterion] = verdict
+                entries = _cache_entries(
+                    organization_id,
+                    doc_hash,
+                    fresh,
+                    behavior_fingerprint=behavior_fingerprint,
+                )
+                if cache_writes is not None:
+                    cache_writes.extend(entries)
+                else:
+                    write_cached_verdicts(entries, r=r)
 
         workflow_succeeded = all(
             verdict.status != "error" for verdict in verdicts.values()
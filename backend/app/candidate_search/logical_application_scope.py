@@ -219,6 +219,39 @@ class LogicalApplicationSelection:
             else_=CandidateApplication.application_outcome_updated_at,
         )
 
+    def open_stage_counts(self, db: Session) -> dict[int, dict[str, int]]:
+        """Open memberships per logical role and effective stage, one query.
+
+        Roles without open memberships are absent; callers zero-fill. The
+        stage CASE is projected in a subquery and grouped by column, because
+        PostgreSQL does not match a repeated bound-parameter CASE in GROUP BY.
+        """
+
+        if not self.active:
+            return {}
+        memberships = (
+            self.apply_roster_membership(
+                db.query(CandidateApplication).filter(
+                    CandidateApplication.organization_id == int(self.organization_id),
+                )
+            )
+            .filter(self.application_outcome_expression() == "open")
+            .with_entities(
+                self.logical_role_id_expression().label("role_id"),
+                self.pipeline_stage_expression().label("stage"),
+            )
+            .subquery("open_logical_memberships")
+        )
+        rows = (
+            db.query(memberships.c.role_id, memberships.c.stage, func.count())
+            .group_by(memberships.c.role_id, memberships.c.stage)
+            .all()
+        )
+        counts: dict[int, dict[str, int]] = {}
+        for role_id, stage, total in rows:
+            counts.setdefault(int(role_id), {})[str(stage)] = int(total or 0)
+        return counts
+
     def score_expression(self, score_field: str) -> Any:
         """Return a role-owned score expression for list filters/sorts."""
 
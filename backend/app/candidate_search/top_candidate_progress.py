@@ -0,0 +1,91 @@
+"""Incremental progress events for a grounded top-candidates search.
+
+``find_top_candidates`` blocks until every candidate in the grounding window
+is verified. Streaming callers (Taali Chat's event stream) pass an
+``on_progress`` callback instead of waiting blind: it receives the
+deterministic score/relevance-ranked shortlist as soon as the window is
+loaded, then one event per candidate as its evidence check completes. The
+final return value is unchanged and remains the only authoritative answer —
+shortlist rows are explicitly ``provisional`` until their verdicts arrive.
+
+Progress is best-effort: a failing callback is logged and ignored, never
+allowed to break the search it is reporting on.
+"""
+
+from __future__ import annotations
+
+import logging
+from dataclasses import replace
+from typing import Any, Callable
+
+from .constraint_policy import _recompute_self_score_verdict
+from .grounded_evidence import CriterionVerdict
+
+logger = logging.getLogger("taali.candidate_search")
+
+ProgressCallback = Callable[[dict[str, Any]], None]
+
+PHASE_SHORTLIST = "shortlist"
+PHASE_VERDICT = "verdict"
+
+
+def emit_progress(
+    on_progress: ProgressCallback | None, build: Callable[[], dict[str, Any]]
+) -> None:
+    """Build and deliver one event; ``build`` runs only when someone listens."""
+    if on_progress is None:
+        return
+    try:
+        on_progress(build())
+    except Exception:  # noqa: BLE001 — progress never fails the search
+        logger.warning("top-candidates progress callback failed", exc_info=True)
+
+
+def shortlist_event(
+    candidates: list[dict[str, Any]],
+    *,
+    window: int,
+    criteria: list[str],
+) -> dict[str, Any]:
+    """The pre-grounding shortlist, in deterministic rank order."""
+    return {
+        "phase": PHASE_SHORTLIST,
+        "provisional": True,
+        "criteria_checked": list(criteria),
+        "window": int(window),
+        "candidates": [{**row, "provisional": True} for row in candidates],
+    }
+
+
+def verdict_event(
+    app: Any,
+    verdicts: list[CriterionVerdict],
+    *,
+    checked: int,
+    window: int,
+) -> dict[str, Any]:
+    """One candidate's completed evidence check (``checked`` of ``window``).
+
+    Self-referential Taali-score criteria are decided on copies, as the final
+    payload does, so the grounded verdicts the ranking uses are not mutated.
+    """
+    shown = [replace(verdict, evidence=list(verdict.evidence)) for verdict in verdicts]
+    for verdict in shown:
+        _recompute_self_score_verdict(verdict, app)
+    return {
+        "phase": PHASE_VERDICT,
+        "application_id": int(app.id),
+        "criteria": [verdict.to_dict() for verdict in shown],
+        "checked": int(checked),
+        "window": int(window),
+    }
+
+
+__all__ = [
+    "PHASE_SHORTLIST",
+    "PHASE_VERDICT",
+    "ProgressCallback",
+    "emit_progress",
+    "shortlist_event",
+    "verdict_event",
+]
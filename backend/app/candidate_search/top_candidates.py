@@ -62,6 +62,12 @@ from .criteria_policy import (
 )
 from .grounded_evidence import CriterionVerdict
 from .retrieval_reporting import search_output_metadata
+from .top_candidate_progress import (
+    ProgressCallback,
+    emit_progress,
+    shortlist_event,
+    verdict_event,
+)
 from .top_candidate_runtime import (
     load_candidates as _load_candidates,
     load_candidates_by_ids as _load_candidates_by_ids,
@@ -155,6 +161,7 @@ def _ground(
     role_id: int | None,
     application_id: int,
     require_role_authority: bool = False,
+    **cache_kwargs: Any,
 ) -> list[CriterionVerdict]:
     """Pure (no DB / no ORM access) — safe to run in a worker thread. Grounds
     every criterion through the cached Citations pass (no stored-assessment
@@ -172,6 +179,7 @@ def _ground(
         role_id=role_id,
         application_id=int(application_id),
         require_role_authority=bool(require_role_authority),
+        **cache_kwargs,
     )
     for v in verdicts:
         # Salary/currency caps: trust the cited figure, not the model's verdict word.
@@ -187,20 +195,34 @@ def _ground_window(
     organization_id: int,
     role_id: int | None = None,
     require_role_authority: bool = False,
+    on_grounded: Callable[[CandidateApplication, list[CriterionVerdict]], None]
+    | None = None,
 ) -> list[tuple[CandidateApplication, list[CriterionVerdict]]]:
     """Ground each app in ``apps`` concurrently (I/O-bound routed calls).
 
     Evidence is collected in this (main) thread; only the pure ``_ground`` runs
-    in workers, so the DB session is never touched off-thread. Order preserved.
+    in workers, so the DB session is never touched off-thread. Cached verdicts
+    for the whole window come from one MGET up front: fully cached candidates
+    still prepare their route but resolve inline, only misses reach the pool,
+    and fresh verdicts are written back in one pipelined batch. Order
+    preserved. ``on_grounded`` is called in this thread as each candidate
+    completes, in completion order.
     """
     import concurrent.futures as cf
 
     if not apps:
         return []
     jobs = [(app, *_collect_evidence(app)) for app in apps]  # (app, cv, notes)
+    fingerprint, hits = _ge.prefetch_cached_verdicts(
+        [(cv, notes) for _app, cv, notes in jobs],
+        criteria,
+        organization_id=organization_id,
+        require_role_authority=bool(require_role_authority),
+    )
+    cache_writes: list[tuple[str, str]] = []
 
-    def _one(job):
-        app, cv, notes = job
+    def _one(i):
+        app, cv, notes = jobs[i]
         try:
             return _ground(
                 cv,
@@ -211,6 +233,9 @@ def _ground_window(
                 role_id=role_id,
                 application_id=int(app.id),
                 require_role_authority=bool(require_role_authority),
+                prefetched=hits[i] if fingerprint else None,
+                prefetch_fingerprint=fingerprint,
+                cache_writes=cache_writes,
             )
         except Exception as exc:  # noqa: BLE001 — degrade this candidate, not the query
             logger.warning("ground app=%s failed: %s", getattr(app, "id", "?"), exc)
@@ -228,19 +253,31 @@ def _ground_window(
             criterion=c, status="error", note="Evidence check didn't finish — retrying."
         )
 
-    workers = max(1, min(GROUND_CONCURRENCY, len(jobs)))
+    n_criteria = len({c.strip() for c in criteria if c and c.strip()})
     results: dict[int, list[CriterionVerdict]] = {}
+
+    def _done(i: int, verdicts: list[CriterionVerdict]) -> None:
+        results[i] = verdicts
+        if on_grounded is not None:
+            on_grounded(jobs[i][0], verdicts)
+
+    for i in range(len(jobs)):
+        if len(hits[i]) >= n_criteria > 0:
+            _done(i, _one(i))
+    misses = [i for i in range(len(jobs)) if i not in results]
+    workers = max(1, min(GROUND_CONCURRENCY, len(misses)))
     ex = cf.ThreadPoolExecutor(max_workers=workers)
     try:
-        fut_to_idx = {
-            ex.submit(copy_context().run, _one, job): i for i, job in enumerate(jobs)
-        }
-        done, not_done = cf.wait(fut_to_idx, timeout=GROUND_BATCH_DEADLINE_S)
-        for fut in done:
-            try:
-                results[fut_to_idx[fut]] = fut.result()
-            except Exception:  # noqa: BLE001
-                results[fut_to_idx[fut]] = [_timed_out(c) for c in criteria]
+        fut_to_idx = {ex.submit(copy_context().run, _one, i): i for i in misses}
+        try:
+            for fut in cf.as_completed(fut_to_idx, timeout=GROUND_BATCH_DEADLINE_S):
+                try:
+                    _done(fut_to_idx[fut], fut.result())
+                except Exception:  # noqa: BLE001
+                    _done(fut_to_idx[fut], [_timed_out(c) for c in criteria])
+        except cf.TimeoutError:
+            pass
+        not_done = [fut for fut, i in fut_to_idx.items() if i not in results]
         if not_done:
             logger.warning(
                 "grounding batch deadline (%.0fs) hit: %d/%d candidates incomplete",
@@ -253,6 +290,8 @@ def _ground_window(
     finally:
         # Don't block the response on stragglers; cancel anything not started.
         ex.shutdown(wait=False, cancel_futures=True)
+    # Stragglers finishing after this flush keep their verdicts uncached.
+    _ge.write_cached_verdicts(list(cache_writes))
 
     return [
         (jobs[i][0], results.get(i) or [_timed_out(c) for c in criteria])
@@ -519,12 +558,15 @@ def find_top_candidates(
     payload_transform: Callable[[Any, dict[str, Any]], dict[str, Any]] | None = None,
     authoritative_pool_size: int | None = None,
     candidate_loader: Any | None = None,
+    on_progress: ProgressCallback | None = None,
 ) -> dict[str, Any]:
     """Run the grounded top-N procedure.
 
     Never raises. Score-only and explicitly optional searches degrade with an
     honest warning; qualitative must-haves fail closed when evidence is
     unavailable so unverified profiles are never presented as matches.
+    ``on_progress`` receives the provisional shortlist before grounding and a
+    verdict event per candidate as its check completes (top_candidate_progress).
     """
     from .runner import run_search  # local import keeps graph deps lazy
 
@@ -838,13 +880,37 @@ def find_top_candidates(
             candidate_loader=candidate_loader,
         )
     apps.sort(key=_rank_key, reverse=True)
+    window = apps[:window_size]
+    on_grounded = None
+    if on_progress is not None:
+        emit_progress(
+            on_progress,
+            lambda: shortlist_event(
+                [
+                    _payload(app, rank=i, verdicts=[], has_criteria=False)
+                    for i, app in enumerate(window[:limit], start=1)
+                ],
+                window=len(window),
+                criteria=criteria,
+            ),
+        )
+        checked = iter(range(1, len(window) + 1))
+
+        def on_grounded(app, verdicts):
+            n = next(checked)
+            emit_progress(
+                on_progress,
+                lambda: verdict_event(app, verdicts, checked=n, window=len(window)),
+            )
+
     grounded = _ground_window(
-        apps[:window_size],
+        window,
         criteria=criteria,
         route_client_factory=evidence_route_client_factory,
         organization_id=organization_id,
         role_id=role_id,
         require_role_authority=bool(require_role_authority),
+        on_grounded=on_grounded,
     )
 
     survivors, excluded = _partition_required_matches(grounded, checked_required)
@@ -0,0 +1,380 @@
+"""Incremental, archive-based snapshots of a candidate's sandbox repository.
+
+Editor rehydrate and submission capture both need the live workspace's file
+contents. Shipping every file as one JSON blob over ``run_code`` stdout made
+each read cost the whole repository, however little the candidate changed.
+
+A snapshot now runs in two halves:
+
+- Sandbox side, one ``run_code``: walk the repo under the caller's policy,
+  sha256 every file, and return a ``path -> sha256`` manifest plus a gzip'd
+  tar of only the blobs whose hash the server did not say it already holds.
+  Tar members are named by their sha256, so duplicate content travels once.
+- Server side: unpack and verify the bundle, fill every other path from the
+  task-scoped blob store (``RepoFileBlob``), persist new blobs and the
+  assessment's manifest (``AssessmentRepoManifest``), and release the blobs
+  the replaced manifest was the last to reference. Starter files are never
+  stored; they are rebuilt from the task.
+
+The "already held" hints are the hashes of the task's starter files plus the
+assessment's previous manifest, filtered to blobs actually present in the
+store. A first snapshot therefore transfers only what the candidate changed,
+and later ones only what changed since the last read. Blob-store reads and
+writes are best-effort: any gap is re-read in full from the sandbox, and a
+storage failure never fails the snapshot.
+"""
+
+from __future__ import annotations
+
+import base64
+import hashlib
+import io
+import json
+import logging
+import re
+import tarfile
+from typing import Any, Dict, Iterable, Optional, Set
+
+from ...models.repo_snapshot import AssessmentRepoManifest, RepoFileBlob, reference_repo_blobs
+from ...platform.database import SessionLocal
+from .workspace_provisioning import _execution_stdout_text, _repo_files_from_structure
+
+logger = logging.getLogger("taali.assessments.repo_snapshot")
+
+_SHA256_RE = re.compile(r"^[0-9a-f]{64}$")
+# Decoded bundles larger than this are refused rather than unpacked.
+_MAX_BUNDLE_BYTES = 64 * 1024 * 1024
+
+
+def _sha256(raw: bytes) -> str:
+    return hashlib.sha256(raw).hexdigest()
+
+
+def _snapshot_script(
+    repo_root: str,
+    known: Iterable[str],
+    *,
+    strict: bool,
+    max_files: int,
+    max_file_bytes: int,
+    max_total_bytes: int,
+    skip_dirs: Iterable[str],
+    skip_suffixes: Iterable[str],
+    skip_names: Iterable[str],
+) -> str:
+    """Sandbox-side walker.
+
+    ``strict`` is the submission-capture policy: text files only, hard links
+    and escapes excluded, and any limit violation reported as ``error``
+    instead of a silently truncated tree. Otherwise (editor rehydrate) files
+    past a limit are listed in ``skipped`` and the walk continues.
+    """
+    return (
+        "import base64, hashlib, io, json, os, stat, tarfile\n"
+        f"configured_root = os.path.abspath({repo_root!r})\n"
+        "root = os.path.realpath(configured_root)\n"
+        f"known = set({sorted(set(known))!r})\n"
+        f"skip_dirs = {set(skip_dirs)!r}\n"
+        f"skip_suffixes = {tuple(skip_suffixes)!r}\n"
+        f"skip_names = {set(skip_names)!r}\n"
+        f"STRICT = {bool(strict)!r}\n"
+        "manifest = {}\n"
+        "skipped = []\n"
+        "sent = set()\n"
+        "total = 0\n"
+        "error = None\n"
+        "buf = io.BytesIO()\n"
+        "bundle = tarfile.open(fileobj=buf, mode='w:gz')\n"
+        "try:\n"
+        "    root_info = os.lstat(configured_root)\n"
+        "    if not stat.S_ISDIR(root_info.st_mode) or stat.S_ISLNK(root_info.st_mode) or root != configured_root:\n"
+        "        error = 'unsafe_repo_root'\n"
+        "except OSError:\n"
+        "    error = 'unsafe_repo_root'\n"
+        "for dirpath, dirnames, filenames in ([] if error else os.walk(root)):\n"
+        "    dirnames[:] = sorted(d for d in dirnames if d.casefold().rstrip(' .') not in skip_dirs)\n"
+        "    for fn in sorted(filenames):\n"
+        "        full = os.path.join(dirpath, fn)\n"
+        "        rel = os.path.relpath(full, root).replace(os.sep, '/')\n"
+        "        if fn in skip_names or rel.endswith(skip_suffixes):\n"
+        "            continue\n"
+        f"        if len(manifest) >= {int(max_files)}:\n"
+        "            if STRICT:\n"
+        "                error = 'file_count_limit_exceeded'\n"
+        "                break\n"
+        "            skipped.append(rel)\n"
+        "            continue\n"
+        "        try:\n"
+        "            info = os.lstat(full)\n"
+        "            if not stat.S_ISREG(info.st_mode):\n"
+        "                continue\n"
+        "            if STRICT and (info.st_nlink != 1 or os.path.commonpath([root, os.path.realpath(full)]) != root):\n"
+        "                continue\n"
+        f"            if info.st_size > {int(max_file_bytes)}:\n"
+        "                if STRICT:\n"
+        "                    error = 'file_size_limit_exceeded:' + rel\n"
+        "                    break\n"
+        "                skipped.append(rel)\n"
+        "                continue\n"
+        "            with open(full, 'rb') as fh:\n"
+        "                raw = fh.read()\n"
+        "            if STRICT:\n"
+        "                if b'\\x00' in raw:\n"
+        "                    continue\n"
+        "                raw.decode('utf-8')\n"
+        "                total += len(raw)\n"
+        f"                if total > {int(max_total_bytes)}:\n"
+        "                    error = 'total_size_limit_exceeded'\n"
+        "                    break\n"
+        "            digest = hashlib.sha256(raw).hexdigest()\n"
+        "            manifest[rel] = digest\n"
+        "            if digest not in known and digest not in sent:\n"
+        "                sent.add(digest)\n"
+        "                member = tarfile.TarInfo(digest)\n"
+        "                member.size = len(raw)\n"
+        "                bundle.addfile(member, io.BytesIO(raw))\n"
+        "        except UnicodeDecodeError:\n"
+        "            continue\n"
+        "        except Exception as exc:\n"
+        "            if STRICT:\n"
+        "                error = 'capture_failed:' + rel + ':' + type(exc).__name__\n"
+        "                break\n"
+        "            skipped.append(rel)\n"
+        "    if error:\n"
+        "        break\n"
+        "bundle.close()\n"
+        "print(json.dumps({'manifest': manifest, 'bundle': base64.b64encode(buf.getvalue()).decode('ascii'), 'skipped': skipped, 'error': error}))\n"
+    )
+
+
+def _unpack_bundle(encoded: str) -> Dict[str, bytes]:
+    """Verified ``sha256 -> bytes`` from a snapshot bundle."""
+    raw = base64.b64decode(encoded or "", validate=True)
+    if not raw:
+        return {}
+    blobs: Dict[str, bytes] = {}
+    unpacked = 0
+    with tarfile.open(fileobj=io.BytesIO(raw), mode="r:gz") as archive:
+        for member in archive:
+            if not member.isfile() or not _SHA256_RE.match(member.name):
+                raise RuntimeError("Snapshot bundle has an unexpected member")
+            unpacked += member.size
+            if unpacked > _MAX_BUNDLE_BYTES:
+                raise RuntimeError("Snapshot bundle exceeds size limit")
+            handle = archive.extractfile(member)
+            content = handle.read() if handle is not None else b""
+            if _sha256(content) != member.name:
+                raise RuntimeError("Snapshot bundle blob failed digest verification")
+            blobs[member.name] = content
+    return blobs
+
+
+def _baseline_contents(task: Any) -> Dict[str, str]:
+    """``sha256 -> text`` of the task's starter files (the first-read hints)."""
+    try:
+        files = _repo_files_from_structure(getattr(task, "repo_structure", None))
+    except Exception:
+        return {}
+    return {_sha256(content.encode("utf-8")): content for _path, content in files}
+
+
+def _previous_manifest(assessment_id: Optional[int]) -> Dict[str, str]:
+    if assessment_id is None:
+        return {}
+    session = SessionLocal()
+    try:
+        row = session.get(AssessmentRepoManifest, int(assessment_id))
+        manifest = row.manifest if row is not None else None
+        return dict(manifest) if isinstance(manifest, dict) else {}
+    except Exception as exc:
+        logger.warning("Repo manifest read failed assessment_id=%s: %s", assessment_id, exc)
+        return {}
+    finally:
+        session.close()
+
+
+def _stored_blobs(
+    task_id: Optional[int], shas: Set[str], *, with_content: bool,
+) -> Dict[str, Optional[str]]:
+    """Blobs of ``task_id`` among ``shas`` (content only when asked)."""
+    if task_id is None or not shas:
+        return {}
+    columns = [RepoFileBlob.sha256, RepoFileBlob.content] if with_content else [RepoFileBlob.sha256]
+    session = SessionLocal()
+    try:
+        rows = (
+            session.query(*columns)
+            .filter(RepoFileBlob.task_id == int(task_id), RepoFileBlob.sha256.in_(sorted(shas)))
+            .all()
+        )
+        return {row[0]: (row[1] if with_content else None) for row in rows}
+    except Exception as exc:
+        logger.warning("Repo blob read failed task_id=%s: %s", task_id, exc)
+        return {}
+    finally:
+        session.close()
+
+
+def _persist(
+    task_id: Optional[int],
+    assessment_id: Optional[int],
+    manifest: Dict[str, str],
+    new_blobs: Dict[str, str],
+    previous: Dict[str, str],
+) -> None:
+    if task_id is None:
+        return
+    session = SessionLocal()
+    try:
+        existing = {
+            sha
+            for (sha,) in session.query(RepoFileBlob.sha256)
+            .filter(RepoFileBlob.task_id == int(task_id), RepoFileBlob.sha256.in_(sorted(new_blobs)))
+            .all()
+        } if new_blobs else set()
+        for sha, content in new_blobs.items():
+            if sha not in existing:
+                session.add(RepoFileBlob(
+                    task_id=int(task_id),
+                    sha256=sha,
+                    content=content,
+                    size_bytes=len(content.encode("utf-8")),
+                ))
+        if assessment_id is not None and manifest != previous:
+            row = session.get(AssessmentRepoManifest, int(assessment_id))
+            if row is None:
+                session.add(AssessmentRepoManifest(
+                    assessment_id=int(assessment_id), task_id=int(task_id), manifest=manifest,
+                ))
+            else:
+                row.manifest = manifest
+            session.flush()
+            reference_repo_blobs(
+                session, int(task_id), int(assessment_id), previous.values(), manifest.values()
+            )
+        session.commit()
+    except Exception as exc:
+        # A concurrent snapshot may have stored the same blob first; the next
+        # snapshot simply re-sends whatever is still missing.
+        logger.warning("Repo snapshot persist failed task_id=%s: %s", task_id, exc)
+        session.rollback()
+    finally:
+        session.close()
+
+
+def _run_snapshot(
+    sandbox: Any, repo_root: str, known: Set[str], policy: Dict[str, Any],
+) -> Dict[str, Any]:
+    lines = _execution_stdout_text(
+        sandbox.run_code(_snapshot_script(repo_root, known, **policy))
+    ).strip().splitlines()
+    if not lines:
+        raise RuntimeError("Repo snapshot returned no output")
+    payload = json.loads(lines[-1])
+    if not isinstance(payload, dict):
+        raise RuntimeError("Repo snapshot returned an invalid payload")
+    return payload
+
+
+def read_repo_snapshot(
+    sandbox: Any,
+    repo_root: str,
+    *,
+    assessment: Any = None,
+    task: Any = None,
+    strict: bool,
+    max_files: int,
+    max_file_bytes: int,
+    max_total_bytes: int = _MAX_BUNDLE_BYTES,
+    skip_dirs: Iterable[str] = (),
+    skip_suffixes: Iterable[str] = (),
+    skip_names: Iterable[str] = (),
+) -> Dict[str, Any]:
+    """Snapshot ``repo_root``: ``{"files", "skipped", "error", "stats"}``.
+
+    ``files`` maps repo-relative paths to UTF-8 text. A sandbox-reported
+    policy violation comes back as ``error`` with no files; transport and
+    decoding failures raise. Without an ``assessment``/``task`` the read is
+    a plain full transfer (still one compressed archive).
+    """
+    policy = {
+        "strict": strict,
+        "max_files": max_files,
+        "max_file_bytes": max_file_bytes,
+        "max_total_bytes": max_total_bytes,
+        "skip_dirs": {str(name).casefold() for name in skip_dirs},
+        "skip_suffixes": tuple(skip_suffixes),
+        "skip_names": set(skip_names),
+    }
+    task_id = getattr(task, "id", None)
+    assessment_id = getattr(assessment, "id", None)
+    baseline = _baseline_contents(task) if task_id is not None else {}
+    previous = _previous_manifest(assessment_id)
+    candidates = set(baseline) | {sha for sha in previous.values() if isinstance(sha, str)}
+    stored = set(_stored_blobs(task_id, candidates, with_content=False))
+    known = set(baseline) | (candidates & stored)
+
+    for _attempt in range(2):
+        payload = _run_snapshot(sandbox, repo_root, known, policy)
+        if payload.get("error"):
+            return {"files": {}, "skipped": [], "error": str(payload["error"]), "stats": {}}
+        manifest = payload.get("manifest")
+        if not isinstance(manifest, dict) or not all(
+            isinstance(sha, str) and _SHA256_RE.match(sha) for sha in manifest.values()
+        ):
+            raise RuntimeError("Repo snapshot returned an invalid manifest")
+        bundle: Dict[str, str] = {}
+        lossy: Dict[str, str] = {}
+        for sha, raw in _unpack_bundle(payload.get("bundle") or "").items():
+            text = raw.decode("utf-8", "replace")
+            # Blobs are keyed by the text actually stored. A file that is not
+            # valid UTF-8 gets the digest of its replacement text, which the
+            # sandbox never reports, so it is simply re-sent next time.
+            stored_sha = _sha256(text.encode("utf-8"))
+            bundle[stored_sha] = text
+            if stored_sha != sha:
+                lossy[sha] = stored_sha
+        manifest = {path: lossy.get(sha, sha) for path, sha in manifest.items()}
+        needed = set(manifest.values())
+        contents: Dict[str, str] = {sha: baseline[sha] for sha in needed & set(baseline)}
+        contents.update(bundle)
+        stored_contents = _stored_blobs(task_id, needed - set(contents), with_content=True)
+        contents.update({sha: text for sha, text in stored_contents.items() if text is not None})
+        if needed <= set(contents):
+            break
+        # A hinted blob vanished between the hint and the read; re-read with
+        # no hints so every blob travels in the bundle.
+        logger.warning("Repo snapshot missing %d blob(s); retrying full read", len(needed - set(contents)))
+        known = set()
+    else:
+        raise RuntimeError("Repo snapshot could not resolve every file blob")
+
+    files = {str(path): contents[sha] for path, sha in manifest.items()}
+    _persist(
+        task_id,
+        assessment_id,
+        dict(manifest),
+        {sha: contents[sha] for sha in needed if sha not in stored and sha not in baseline},
+        previous,
+    )
+    stats = {
+        "file_count": len(files),
+        "transferred_blobs": len(bundle),
+        "bundle_bytes": len(payload.get("bundle") or ""),
+        "reused_blobs": len(needed) - len(bundle),
+    }
+    logger.info(
+        "Repo snapshot assessment_id=%s files=%d transferred=%d reused=%d bundle_bytes=%d",
+        assessment_id, stats["file_count"], stats["transferred_blobs"],
+        stats["reused_blobs"], stats["bundle_bytes"],
+    )
+    skipped = payload.get("skipped")
+    return {
+        "files": files,
+        "skipped": list(skipped) if isinstance(skipped, list) else [],
+        "error": None,
+        "stats": stats,
+    }
+
+
+__all__ = ["read_repo_snapshot"]
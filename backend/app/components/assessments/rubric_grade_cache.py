@@ -0,0 +1,162 @@
+"""Cache adapter over the ``rubric_grade_cache`` table.
+
+Cache key:
+
+    sha256(org + dimension + json(criteria) + lens + model + grader_version
+           + sha256(system prompt) + sha256(rendered evidence prompt))
+
+The evidence prompt is what the grader actually reads — the bounded excerpts
+of the submission artifact, design doc, transcript and process trace — so it
+is the artifact/transcript digest that matters for the grade. Rubric weights
+are deliberately NOT part of the key: re-weighting a rubric re-aggregates
+cached grades without re-grading.
+
+Only successful grades are stored, so a rubric retry re-grades exactly the
+dimensions that failed. Every lookup feeds the process-wide hit/miss counters
+reported by :func:`grade_cache_stats`.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import threading
+from typing import Any, Dict, List, Optional
+
+from ...platform.database import SessionLocal
+
+logger = logging.getLogger("taali.assessments.rubric_grade_cache")
+
+_stats_lock = threading.Lock()
+_hits = 0
+_misses = 0
+
+
+def _sha256(text: str) -> str:
+    return hashlib.sha256((text or "").encode("utf-8")).hexdigest()
+
+
+def grade_cache_key(
+    *,
+    organization_id: int,
+    dimension_id: str,
+    criteria: Dict[str, Any],
+    lens: Optional[str],
+    model: str,
+    grader_version: str,
+    system_prompt: str,
+    user_prompt: str,
+) -> str:
+    """Stable SHA256 over everything a dimension grade depends on."""
+    payload = {
+        "organization_id": int(organization_id),
+        "dimension": dimension_id,
+        "criteria": criteria or {},
+        "lens": lens or "",
+        "model": model,
+        "grader_version": grader_version,
+        "system": _sha256(system_prompt),
+        "evidence": _sha256(user_prompt),
+    }
+    blob = json.dumps(payload, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(blob.encode("utf-8")).hexdigest()
+
+
+def _record_lookups(hits: int, misses: int) -> None:
+    global _hits, _misses
+    with _stats_lock:
+        _hits += hits
+        _misses += misses
+
+
+def grade_cache_stats() -> Dict[str, Any]:
+    """Process-wide lookup counters and hit rate since start (or reset)."""
+    with _stats_lock:
+        hits, misses = _hits, _misses
+    total = hits + misses
+    return {
+        "hits": hits,
+        "misses": misses,
+        "hit_rate": round(hits / total, 4) if total else None,
+    }
+
+
+def reset_grade_cache_stats() -> None:
+    global _hits, _misses
+    with _stats_lock:
+        _hits = _misses = 0
+
+
+def get_cached_grades(cache_keys: List[str]) -> Dict[str, Dict[str, Any]]:
+    """Fetch cached grade payloads for ``cache_keys`` in one query.
+
+    Misses are simply absent. The read is read-only (no per-hit write on the
+    grading path); hit rates come from :func:`grade_cache_stats`. A lookup
+    failure counts every key as a miss and never raises: the grader call is
+    the fallback.
+    """
+    keys = list(dict.fromkeys(cache_keys))
+    if not keys:
+        return {}
+    from ...models.rubric_grade_cache import RubricGradeCache
+
+    found: Dict[str, Dict[str, Any]] = {}
+    session = SessionLocal()
+    try:
+        rows = (
+            session.query(RubricGradeCache)
+            .filter(RubricGradeCache.cache_key.in_(keys))
+            .all()
+        )
+        for row in rows:
+            if isinstance(row.result, dict):
+                found[row.cache_key] = row.result
+    except Exception as exc:
+        logger.warning("Rubric grade cache read failed: %s", exc)
+        found = {}
+    finally:
+        session.close()
+    _record_lookups(len(found), len(keys) - len(found))
+    return found
+
+
+def store_grades(entries: List[Dict[str, Any]]) -> None:
+    """Persist successful grades: dicts of ``cache_key``, ``organization_id``,
+    ``dimension_id``, ``prompt_version``, ``model`` and ``result``. Keys that
+    already exist are left untouched (rows are immutable)."""
+    if not entries:
+        return
+    from ...models.rubric_grade_cache import RubricGradeCache
+
+    session = SessionLocal()
+    try:
+        keys = [entry["cache_key"] for entry in entries]
+        existing = {
+            key
+            for (key,) in session.query(RubricGradeCache.cache_key)
+            .filter(RubricGradeCache.cache_key.in_(keys))
+            .all()
+        }
+        for entry in entries:
+            if entry["cache_key"] in existing:
+                continue
+            existing.add(entry["cache_key"])
+            session.add(RubricGradeCache(**entry))
+        session.commit()
+    except Exception as exc:
+        # A concurrent scorer may have written the same key first; the next
+        # lookup is served from whichever row won.
+        logger.warning("Rubric grade cache write failed: %s", exc)
+        session.rollback()
+    finally:
+        session.close()
+
+
+__all__ = [
+    "get_cached_grades",
+    "grade_cache_key",
+    "grade_cache_stats",
+    "reset_grade_cache_stats",
+    "store_grades",
+]
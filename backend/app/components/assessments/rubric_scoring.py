@@ -42,18 +42,23 @@ from __future__ import annotations
 
 import json
 import logging
+import threading
 import uuid
+from concurrent.futures import ThreadPoolExecutor
+from contextvars import copy_context
 from dataclasses import dataclass, field
 from typing import Any, Dict, List, Optional
 
 from anthropic import Anthropic
 
+from ...platform.config import settings
 from ...platform.database import SessionLocal
 from ...services.metered_anthropic_client import MeteredAnthropicClient
 from ...services.pricing_service import Feature
 from ...services.usage_credit_reservations import (
     CreditReservation,
     InsufficientRoleBudgetError,
+    release_credit_reservation,
     reserve_credits,
 )
 from ...services.usage_metering_service import (
@@ -64,11 +69,34 @@ from .interrogation import (
     RESOLVED_STATUSES,
     derive_interrogation_state,
 )
+from .rubric_grade_cache import get_cached_grades, grade_cache_key, store_grades
 
 logger = logging.getLogger("taali.assessments.rubric_scoring")
 
+# Deterministic graders: computed inline from artifacts, never an Anthropic call.
+_DETERMINISTIC_GRADERS = frozenset(
+    {"interrogation_outcome", "practice_outcome", "comprehension_outcome"}
+)
+
+# Per-org bound on concurrent grader calls, shared by every scorer in this
+# process (a burst of submissions from one org cannot monopolise the pool).
+_org_slots: Dict[int, threading.BoundedSemaphore] = {}
+_org_slots_lock = threading.Lock()
+
+
+def _org_grading_slots(organization_id: int) -> threading.BoundedSemaphore:
+    with _org_slots_lock:
+        slots = _org_slots.get(organization_id)
+        if slots is None:
+            limit = max(1, int(settings.RUBRIC_GRADING_ORG_CONCURRENCY or 1))
+            slots = _org_slots[organization_id] = threading.BoundedSemaphore(limit)
+        return slots
+
 _DEFAULT_RUBRIC_SCORING_MODEL = "claude-sonnet-4-5-20250929"
 _MAX_TOKENS_PER_DIMENSION = 1500
+# Keys the rubric grade cache. Bump when grading semantics change in a way
+# the prompts don't capture (response parsing, clamping, max tokens).
+_GRADER_VERSION = "rubric-grader-v1"
 
 # Caller can supply richer artifacts but these defaults keep prompts
 # bounded so we don't fan out to 30k-token grader calls.
@@ -299,6 +327,8 @@ class RubricResult:
     total_input_tokens: int = 0
     total_output_tokens: int = 0
     failed_dimension_ids: List[str] = field(default_factory=list)
+    # Dimensions served from the rubric grade cache (no grader call).
+    cached_dimension_ids: List[str] = field(default_factory=list)
 
     @property
     def fully_graded(self) -> bool:
@@ -785,6 +815,8 @@ class RubricScorer:
             )
         )
         self._credit_error: Optional[Exception] = None
+        # Holds taken up front by ``_reserve_paid_calls``, keyed by dimension.
+        self._prereserved: Dict[str, CreditReservation] = {}
         self._model = (model or "").strip() or _DEFAULT_RUBRIC_SCORING_MODEL
         logger.info(
             "RubricScorer init org=%s assessment=%s model=%s",
@@ -824,8 +856,30 @@ class RubricScorer:
             meta["credit_reservation"] = credit_reservation.as_metering_payload()
         return meta
 
+    def _reserve_hold(self, meter_db, dimension_id: str) -> CreditReservation:
+        return reserve_credits(
+            meter_db,
+            organization_id=self._organization_id,
+            feature=Feature.ASSESSMENT,
+            external_ref=(
+                f"usage-hold:{self._trace_id}:{dimension_id}:"
+                f"{uuid.uuid4().hex}"
+            ),
+            metadata={
+                "sub_feature": "rubric_scoring",
+                "dimension": dimension_id,
+                "assessment_id": self._assessment_id,
+                "trace_id": f"{self._trace_id}:{dimension_id}",
+            },
+            role_id=self._role_id,
+            enforce_role_budget=self._role_id is not None,
+        )
+
     def _reserve_paid_call(self, dimension_id: str) -> CreditReservation:
         """Hard-hold one model-graded dimension against org + role budgets."""
+        prereserved = self._prereserved.pop(dimension_id, None)
+        if prereserved is not None:
+            return prereserved
         if self._credit_error is not None:
             raise self._credit_error
         try:
@@ -833,29 +887,156 @@ class RubricScorer:
             # its own session.  A fresh reservation session therefore sees the
             # latest debit and cannot reuse a stale Organization identity.
             with SessionLocal() as meter_db:
-                reservation = reserve_credits(
-                    meter_db,
-                    organization_id=self._organization_id,
-                    feature=Feature.ASSESSMENT,
-                    external_ref=(
-                        f"usage-hold:{self._trace_id}:{dimension_id}:"
-                        f"{uuid.uuid4().hex}"
-                    ),
-                    metadata={
-                        "sub_feature": "rubric_scoring",
-                        "dimension": dimension_id,
-                        "assessment_id": self._assessment_id,
-                        "trace_id": f"{self._trace_id}:{dimension_id}",
-                    },
-                    role_id=self._role_id,
-                    enforce_role_budget=self._role_id is not None,
-                )
+                reservation = self._reserve_hold(meter_db, dimension_id)
                 meter_db.commit()
                 return reservation
         except (InsufficientCreditsError, InsufficientRoleBudgetError) as exc:
             self._credit_error = exc
             raise
 
+    def _reserve_paid_calls(self, dimension_ids: List[str]) -> None:
+        """Hold every model-graded dimension of a rubric in one transaction.
+
+        Holds are taken in rubric order. The first budget refusal stops the
+        batch and is remembered, so dimensions after it fail fast in
+        ``grade_dimension`` exactly as they would have when reserved one at a
+        time; the holds already taken are committed and still graded.
+        """
+        try:
+            with SessionLocal() as meter_db:
+                for dimension_id in dimension_ids:
+                    try:
+                        self._prereserved[dimension_id] = self._reserve_hold(
+                            meter_db, dimension_id,
+                        )
+                    except (InsufficientCreditsError, InsufficientRoleBudgetError) as exc:
+                        self._credit_error = exc
+                        break
+                meter_db.commit()
+        except Exception:
+            # Nothing was committed; each dimension reserves (and reports a
+            # failure) on its own in ``grade_dimension`` instead.
+            logger.exception(
+                "RubricScorer batch reservation failed trace=%s", self._trace_id,
+            )
+            self._prereserved = {}
+
+    def _release_unused_holds(self) -> None:
+        """Refund prereserved holds whose dimension never reached the grader."""
+        unused, self._prereserved = list(self._prereserved.values()), {}
+        if not unused:
+            return
+        try:
+            with SessionLocal() as meter_db:
+                for reservation in unused:
+                    release_credit_reservation(
+                        meter_db,
+                        reservation=reservation,
+                        reason="rubric_dimension_not_graded",
+                    )
+                meter_db.commit()
+        except Exception:  # usage-hold recovery sweeps anything left behind
+            logger.exception(
+                "RubricScorer failed to release unused holds trace=%s", self._trace_id,
+            )
+
+    def _apply_cached_grades(
+        self, pending: List[Dict[str, Any]], artifacts: ScoringArtifacts,
+    ) -> List[str]:
+        """Resolve ``pending`` dimensions from the grade cache, in place.
+
+        Each item gets its ``cache_key``; hits also get their ``grade`` and
+        are never reserved or sent to the grader. Returns the hit ids.
+        """
+        if not pending or not settings.RUBRIC_GRADE_CACHE_ENABLED:
+            return []
+        for item in pending:
+            item["cache_key"] = grade_cache_key(
+                organization_id=self._organization_id,
+                dimension_id=item["dim_id"],
+                criteria=item["criteria"],
+                lens=item["lens"],
+                model=self._model,
+                grader_version=_GRADER_VERSION,
+                system_prompt=_system_prompt_for_lens(item["lens"]),
+                user_prompt=_build_user_prompt(item["dim_id"], item["criteria"], artifacts),
+            )
+        cached = get_cached_grades([item["cache_key"] for item in pending])
+        hit_ids: List[str] = []
+        for item in pending:
+            payload = cached.get(item["cache_key"])
+            if payload is None:
+                continue
+            item["grade"] = DimensionGrade(
+                dimension_id=item["dim_id"],
+                score=float(payload.get("score") or 0.0),
+                rating=str(payload.get("rating") or "poor"),
+                reasoning=str(payload.get("reasoning") or ""),
+                evidence_citations=list(payload.get("evidence_citations") or []),
+                weight=item["weight"],
+            )
+            hit_ids.append(item["dim_id"])
+        logger.info(
+            "RubricScorer grade cache trace=%s hits=%d misses=%d",
+            self._trace_id, len(hit_ids), len(pending) - len(hit_ids),
+        )
+        return hit_ids
+
+    def _store_cached_grades(self, graded: List[Dict[str, Any]]) -> None:
+        """Cache freshly graded dimensions; failures are never cached."""
+        store_grades([
+            {
+                "cache_key": item["cache_key"],
+                "organization_id": self._organization_id,
+                "dimension_id": item["dim_id"],
+                "prompt_version": _GRADER_VERSION,
+                "model": self._model,
+                "result": {
+                    "score": item["grade"].score,
+                    "rating": item["grade"].rating,
+                    "reasoning": item["grade"].reasoning,
+                    "evidence_citations": item["grade"].evidence_citations,
+                },
+            }
+            for item in graded
+            if "cache_key" in item and item["grade"].error is None
+        ])
+
+    def _grade_model_dimensions(
+        self, pending: List[Dict[str, Any]], artifacts: ScoringArtifacts,
+    ) -> List[DimensionGrade]:
+        """Grade model-backed dimensions, concurrently when configured.
+
+        Bounded twice: ``RUBRIC_GRADING_CONCURRENCY`` threads for this
+        submission, and a per-org semaphore across the process. Results come
+        back in ``pending`` order regardless of completion order.
+        """
+        def grade(item: Dict[str, Any]) -> DimensionGrade:
+            return self.grade_dimension(
+                item["dim_id"], item["criteria"], artifacts,
+                weight=item["weight"], lens=item["lens"],
+            )
+
+        workers = min(
+            len(pending), max(1, int(settings.RUBRIC_GRADING_CONCURRENCY or 1)),
+        )
+        if workers <= 1:
+            return [grade(item) for item in pending]
+
+        slots = _org_grading_slots(self._organization_id)
+
+        def bounded(item: Dict[str, Any]) -> DimensionGrade:
+            with slots:
+                return grade(item)
+
+        with ThreadPoolExecutor(
+            max_workers=workers, thread_name_prefix="rubric-grade",
+        ) as pool:
+            futures = [
+                pool.submit(copy_context().run, bounded, item) for item in pending
+            ]
+            return [future.result() for future in futures]
+
     def _parse_grader_response(self, raw: str, dimension_id: str) -> Dict[str, Any]:
         """Parse the grader's JSON response. Tolerant of stray markdown
         fences a misbehaving grader sometimes wraps the JSON in."""
@@ -1225,14 +1406,27 @@ class RubricScorer:
         usually sum to 1.0 across dimensions; we normalize defensively
         in case a redesign lands with weights summing to e.g. 0.95.
         """
-        graded: List[DimensionGrade] = []
-        failed_ids: List[str] = []
-        total_weight = 0.0
+        # Deterministic dimensions are graded inline; model-graded ones are
+        # served from the grade cache where possible, the rest reserved in
+        # one batch and graded concurrently, then slotted back so aggregation
+        # walks the rubric in its declared order.
+        slots: List[tuple[str, float, Any]] = []
+        pending: List[Dict[str, Any]] = []
         for dim_id, dim_spec in (rubric or {}).items():
             if not isinstance(dim_spec, dict):
                 continue
             weight = float(dim_spec.get("weight") or 0.0)
             grader_kind = str(dim_spec.get("grader") or "").strip()
+            if grader_kind not in _DETERMINISTIC_GRADERS:
+                criteria = dim_spec.get("criteria") or {}
+                if not isinstance(criteria, dict):
+                    criteria = {}
+                pending.append({
+                    "dim_id": dim_id, "criteria": criteria, "weight": weight,
+                    "lens": dim_spec.get("lens"),
+                })
+                slots.append((dim_id, weight, pending[-1]))
+                continue
             if grader_kind == "interrogation_outcome":
                 # Deterministic, no Anthropic call. Reads decision_points
                 # + per-turn interrogation_state from artifacts.
@@ -1246,20 +1440,31 @@ class RubricScorer:
                 grade = self.grade_dimension_via_practice_outcome(
                     dim_id, artifacts, weight=weight, probe=dim_spec.get("probe"),
                 )
-            elif grader_kind == "comprehension_outcome":
+            else:
                 # Deterministic, no Anthropic call. Reads the post-submit
                 # understanding check, which was auto-graded at answer time.
                 grade = self.grade_dimension_via_comprehension_outcome(
                     dim_id, artifacts, weight=weight,
                 )
-            else:
-                criteria = dim_spec.get("criteria") or {}
-                if not isinstance(criteria, dict):
-                    criteria = {}
-                grade = self.grade_dimension(
-                    dim_id, criteria, artifacts, weight=weight,
-                    lens=dim_spec.get("lens"),
-                )
+            slots.append((dim_id, weight, grade))
+
+        cached_ids = self._apply_cached_grades(pending, artifacts)
+        to_grade = [item for item in pending if "grade" not in item]
+        if to_grade:
+            self._reserve_paid_calls([item["dim_id"] for item in to_grade])
+            try:
+                fresh = self._grade_model_dimensions(to_grade, artifacts)
+            finally:
+                self._release_unused_holds()
+            for item, grade in zip(to_grade, fresh):
+                item["grade"] = grade
+            self._store_cached_grades(to_grade)
+
+        graded: List[DimensionGrade] = []
+        failed_ids: List[str] = []
+        total_weight = 0.0
+        for dim_id, weight, slot in slots:
+            grade = slot["grade"] if isinstance(slot, dict) else slot
             graded.append(grade)
             if grade.error is not None:
                 failed_ids.append(dim_id)
@@ -1282,6 +1487,7 @@ class RubricScorer:
             weighted_score_100=round(weighted, 2),
             model_used=self._model,
             failed_dimension_ids=failed_ids,
+            cached_dimension_ids=cached_ids,
         )
 
 
@@ -0,0 +1,335 @@
+"""Pre-warmed sandbox pool for assessment start.
+
+A first start used to create the E2B sandbox, materialize the task repository
+and run the task's workspace bootstrap inside the candidate's start request.
+The pool moves that work off the request: for the frozen task snapshots with
+the most pending invites, a Celery replenisher keeps up to
+``SANDBOX_POOL_SIZE_PER_TASK`` sandboxes prepared exactly as a cold start
+would prepare them, and ``start_or_resume_assessment`` claims one when the
+assessment's snapshot digest matches.
+
+Invariants:
+
+- Entries are keyed by ``Assessment.task_spec_snapshot_sha256`` and warmed
+  from that snapshot, so a candidate only receives a workspace built from
+  their own frozen task definition.
+- Handing out is a compare-and-delete on the entry row in its own committed
+  transaction: exactly one claimer owns a sandbox, and the start request's
+  transaction is untouched. A claimed sandbox is re-verified before use;
+  anything wrong falls through to the cold path.
+- Entries age from sandbox creation (the provider timeout starts then) and are
+  reaped past ``SANDBOX_POOL_MAX_AGE_SECONDS``, or as soon as their snapshot
+  has no pending demand or the pool is switched off.
+- One replenisher runs at a time. Beat and every claim kick it, and a warm
+  run takes minutes, so an overlapping run returns at once instead of
+  computing the same deficit and creating duplicate paid sandboxes.
+
+Provider-agnostic: every entry point takes the sandbox provider
+(``E2BService`` in production, ``LocalSandboxProvider`` in tests).
+"""
+
+from __future__ import annotations
+
+import logging
+from contextlib import contextmanager
+from datetime import timedelta
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from sqlalchemy import func, text
+from sqlalchemy.orm import Session
+
+from ...models.assessment import Assessment, AssessmentStatus
+from ...models.sandbox_pool_entry import (
+    SANDBOX_POOL_READY,
+    SANDBOX_POOL_WARMING,
+    SandboxPoolEntry,
+)
+from ...models.task import Task
+from ...platform.config import settings
+from ...platform.database import SessionLocal
+from .repository import ensure_utc, utcnow
+from .task_snapshot import task_view_for_assessment
+
+logger = logging.getLogger("taali.assessments.sandbox_pool")
+
+# Ready entries tried per start before falling back to a cold sandbox.
+_CLAIM_ATTEMPTS = 3
+
+
+def pool_enabled() -> bool:
+    return bool(settings.SANDBOX_POOL_ENABLED)
+
+
+def _max_age() -> timedelta:
+    return timedelta(seconds=max(60, int(settings.SANDBOX_POOL_MAX_AGE_SECONDS or 0)))
+
+
+def _close_by_id(provider: Any, sandbox_id: str) -> None:
+    try:
+        provider.close_sandbox(provider.connect_sandbox(sandbox_id))
+    except Exception:
+        # Already gone (provider timeout) or unreachable; the provider-side
+        # timeout is the backstop either way.
+        logger.info("Pooled sandbox %s was not closable; leaving it to expire", sandbox_id)
+
+
+def _take_entry(db: Session, entry_id: int, status: str) -> bool:
+    """Compare-and-delete one entry; True when this caller now owns its sandbox."""
+    taken = (
+        db.query(SandboxPoolEntry)
+        .filter(SandboxPoolEntry.id == entry_id, SandboxPoolEntry.status == status)
+        .delete(synchronize_session=False)
+    )
+    db.commit()
+    return taken == 1
+
+
+def _request_replenish() -> None:
+    try:
+        from ...tasks.sandbox_pool_tasks import replenish_sandbox_pool
+
+        replenish_sandbox_pool.delay()
+    except Exception:
+        logger.warning("Could not enqueue sandbox pool replenish", exc_info=True)
+
+
+def claim_pooled_sandbox(
+    provider: Any, task: Any, snapshot_sha256: Optional[str],
+) -> Optional[Tuple[Any, Dict[str, Any]]]:
+    """Hand out a ready sandbox for ``snapshot_sha256``, or None.
+
+    Returns the connected sandbox and the bootstrap result recorded while it
+    was warmed. The caller owns the sandbox from here on (and closes it on a
+    later start failure, as it would a freshly created one).
+    """
+    if not pool_enabled() or not snapshot_sha256:
+        return None
+    from . import service as assessment_service
+
+    cutoff = utcnow() - _max_age()
+    with SessionLocal() as pool_db:
+        candidates = [
+            (entry.id, entry.sandbox_id, entry.bootstrap)
+            for entry in (
+                pool_db.query(SandboxPoolEntry)
+                .filter(
+                    SandboxPoolEntry.task_snapshot_sha256 == snapshot_sha256,
+                    SandboxPoolEntry.status == SANDBOX_POOL_READY,
+                )
+                .order_by(SandboxPoolEntry.created_at, SandboxPoolEntry.id)
+                .all()
+            )
+            if ensure_utc(entry.created_at) > cutoff
+        ]
+        for entry_id, sandbox_id, bootstrap in candidates[:_CLAIM_ATTEMPTS]:
+            if not _take_entry(pool_db, entry_id, SANDBOX_POOL_READY):
+                continue  # another start claimed it first
+            try:
+                sandbox = provider.connect_sandbox(sandbox_id)
+            except Exception:
+                logger.warning("Pooled sandbox %s could not be reconnected", sandbox_id)
+                continue
+            if not assessment_service._sandbox_workspace_is_ready(sandbox, task):
+                logger.warning("Pooled sandbox %s failed workspace verification", sandbox_id)
+                try:
+                    provider.close_sandbox(sandbox)
+                except Exception:
+                    logger.exception("Failed to close rejected pooled sandbox %s", sandbox_id)
+                continue
+            logger.info(
+                "Claimed pooled sandbox %s snapshot=%s", sandbox_id, snapshot_sha256[:12],
+            )
+            _request_replenish()
+            return sandbox, dict(bootstrap or {})
+    return None
+
+
+def warm_pool_entry(
+    db: Session,
+    provider: Any,
+    task: Any,
+    *,
+    organization_id: int,
+    snapshot_sha256: str,
+) -> bool:
+    """Create, materialize and bootstrap one pooled sandbox for ``task``.
+
+    The ``warming`` row is committed before the slow work so the replenisher
+    does not double-warm and the reaper can close a sandbox orphaned by a
+    crashed worker.
+    """
+    from . import service as assessment_service
+
+    sandbox = provider.create_sandbox()
+    entry = SandboxPoolEntry(
+        organization_id=int(organization_id),
+        task_id=int(task.id),
+        task_snapshot_sha256=snapshot_sha256,
+        sandbox_id=provider.get_sandbox_id(sandbox),
+        status=SANDBOX_POOL_WARMING,
+        created_at=utcnow(),
+    )
+    db.add(entry)
+    db.commit()
+    try:
+        assessment_service._materialize_task_repository(sandbox, task)
+        bootstrap = assessment_service._run_workspace_bootstrap(
+            provider, sandbox, task, assessment_service._workspace_repo_root(task),
+        )
+        if bootstrap.get("must_succeed") and not bootstrap.get("success"):
+            raise RuntimeError("required workspace bootstrap failed")
+    except Exception:
+        logger.exception(
+            "Failed to warm pooled sandbox task=%s snapshot=%s", task.id, snapshot_sha256[:12],
+        )
+        if _take_entry(db, entry.id, SANDBOX_POOL_WARMING):
+            try:
+                provider.close_sandbox(sandbox)
+            except Exception:
+                logger.exception("Failed to close failed pooled sandbox task=%s", task.id)
+        return False
+    entry.status = SANDBOX_POOL_READY
+    entry.bootstrap = bootstrap
+    entry.ready_at = utcnow()
+    db.commit()
+    return True
+
+
+def pool_demand(db: Session, *, limit: int) -> List[Tuple[int, str, int]]:
+    """``(task_id, snapshot_sha256, pending_invites)``, most-pending first."""
+    now = utcnow()
+    pending = func.count(Assessment.id)
+    rows = (
+        db.query(Assessment.task_id, Assessment.task_spec_snapshot_sha256, pending)
+        .filter(
+            Assessment.status == AssessmentStatus.PENDING,
+            Assessment.is_demo.is_(False),
+            Assessment.task_spec_snapshot_sha256.isnot(None),
+            (Assessment.expires_at.is_(None)) | (Assessment.expires_at > now),
+        )
+        .group_by(Assessment.task_id, Assessment.task_spec_snapshot_sha256)
+        .order_by(pending.desc(), Assessment.task_id)
+        .limit(max(0, int(limit)))
+        .all()
+    )
+    return [(int(task_id), str(sha), int(count)) for task_id, sha, count in rows]
+
+
+def _task_view_for_snapshot(
+    db: Session, task_id: int, snapshot_sha256: str,
+) -> Tuple[Any, Optional[int]]:
+    """The digest-verified frozen task a pending assessment on this snapshot uses."""
+    assessment = (
+        db.query(Assessment)
+        .filter(
+            Assessment.task_id == task_id,
+            Assessment.task_spec_snapshot_sha256 == snapshot_sha256,
+        )
+        .first()
+    )
+    task = db.get(Task, task_id)
+    if assessment is None or task is None:
+        return None, None
+    return task_view_for_assessment(assessment, task), int(assessment.organization_id)
+
+
+@contextmanager
+def _replenish_lock(db: Session) -> Iterator[bool]:
+    """Single-flight guard: yields whether this run holds the replenish lock.
+
+    ``warm_pool_entry`` commits ``db`` per sandbox, which would end a
+    transaction-scoped lock taken on it, so the advisory lock lives in its own
+    transaction on a second connection for the whole run. Postgres only; other
+    dialects (sqlite tests) always run.
+    """
+    bind = db.get_bind()
+    if bind.dialect.name != "postgresql":
+        yield True
+        return
+    with bind.connect() as connection, connection.begin():
+        yield bool(
+            connection.execute(
+                text("SELECT pg_try_advisory_xact_lock(hashtext('sandbox_pool_replenish'), 0)")
+            ).scalar()
+        )
+
+
+def replenish_sandbox_pool(db: Session, provider: Any) -> Dict[str, Any]:
+    """Top every in-demand snapshot up to its target number of sandboxes."""
+    if not pool_enabled():
+        return {"skipped": "disabled"}
+    with _replenish_lock(db) as acquired:
+        if not acquired:
+            return {"skipped": "in_progress"}
+        return _replenish(db, provider)
+
+
+def _replenish(db: Session, provider: Any) -> Dict[str, Any]:
+    size = max(0, int(settings.SANDBOX_POOL_SIZE_PER_TASK or 0))
+    summary: Dict[str, Any] = {"warmed": 0, "failed": 0, "snapshots": 0}
+    for task_id, snapshot_sha256, pending in pool_demand(
+        db, limit=int(settings.SANDBOX_POOL_MAX_TASKS or 0),
+    ):
+        pooled = (
+            db.query(func.count(SandboxPoolEntry.id))
+            .filter(SandboxPoolEntry.task_snapshot_sha256 == snapshot_sha256)
+            .scalar()
+        )
+        deficit = min(size, pending) - int(pooled or 0)
+        if deficit <= 0:
+            continue
+        try:
+            task, organization_id = _task_view_for_snapshot(db, task_id, snapshot_sha256)
+        except RuntimeError:
+            logger.exception("Skipping unverifiable task snapshot task=%s", task_id)
+            continue
+        if task is None:
+            continue
+        summary["snapshots"] += 1
+        for _ in range(deficit):
+            ok = warm_pool_entry(
+                db, provider, task,
+                organization_id=organization_id, snapshot_sha256=snapshot_sha256,
+            )
+            summary["warmed" if ok else "failed"] += 1
+            if not ok:
+                break  # a failing bootstrap will fail again; retry next sweep
+    return summary
+
+
+def reap_sandbox_pool(db: Session, provider: Any) -> Dict[str, int]:
+    """Close aged-out entries, and idle ones nobody is waiting for."""
+    cutoff = utcnow() - _max_age()
+    wanted = (
+        {sha for _task_id, sha, _count in pool_demand(
+            db, limit=int(settings.SANDBOX_POOL_MAX_TASKS or 0),
+        )}
+        if pool_enabled()
+        else set()
+    )
+    summary = {"expired": 0, "unwanted": 0}
+    entries = [
+        (entry.id, entry.status, entry.sandbox_id, entry.task_snapshot_sha256, entry.created_at)
+        for entry in db.query(SandboxPoolEntry).all()
+    ]
+    for entry_id, status, sandbox_id, snapshot_sha256, created_at in entries:
+        if ensure_utc(created_at) <= cutoff:
+            reason = "expired"
+        elif status == SANDBOX_POOL_READY and snapshot_sha256 not in wanted:
+            reason = "unwanted"
+        else:
+            continue
+        if _take_entry(db, entry_id, status):
+            _close_by_id(provider, sandbox_id)
+            summary[reason] += 1
+    return summary
+
+
+__all__ = [
+    "claim_pooled_sandbox",
+    "pool_demand",
+    "pool_enabled",
+    "reap_sandbox_pool",
+    "replenish_sandbox_pool",
+    "warm_pool_entry",
+]
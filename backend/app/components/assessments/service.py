@@ -32,6 +32,8 @@ from ...domains.assessments_runtime.pipeline_service import (
 from ...domains.assessments_runtime.role_support import refresh_application_score_cache
 from .claude_budget import build_claude_budget_snapshot, resolve_effective_budget_limit_usd
 from .interrogation import render_opener
+from .repo_snapshot import read_repo_snapshot
+from .sandbox_pool import claim_pooled_sandbox
 from .submission_runtime import submit_assessment_impl
 from .task_snapshot import freeze_assessment_task, task_view_for_assessment
 from .terminal_runtime import resolve_ai_mode, terminal_capabilities
@@ -55,6 +57,12 @@ from .repository import (
 
 logger = logging.getLogger(__name__)
 
+# Generated / vendored directories hidden from the candidate's file explorer.
+_EDITOR_EXCLUDED_DIRS = frozenset({
+    ".git", ".venv", "venv", ".tox", ".mypy_cache", ".pytest_cache", ".ruff_cache",
+    "__pycache__", "node_modules", ".next", "dist", "build", ".idea", ".vscode",
+})
+
 INSUFFICIENT_CREDITS_DETAIL = "Insufficient credits. Purchase credits to start this assessment."
 CANDIDATE_INSUFFICIENT_CREDITS_MESSAGE = (
     "This assessment is not available yet. Please contact the hiring team to continue."
@@ -205,62 +213,41 @@ def _sandbox_workspace_is_ready(sandbox: Any, task: Task) -> bool:
         return False
 
 
-def _read_sandbox_repo_files(sandbox: Any, repo_root: str, max_files: int = 200, max_bytes: int = 500_000) -> Dict[str, Any] | None:
+def _read_sandbox_repo_files(
+    sandbox: Any,
+    repo_root: str,
+    max_files: int = 200,
+    max_bytes: int = 500_000,
+    *,
+    assessment: Assessment | None = None,
+    task: Task | None = None,
+) -> Dict[str, Any] | None:
     """Read the live repo file tree from the sandbox.
 
     Returns a `repo_structure` dict matching the shape of `task.repo_structure`
     (so the candidate UI can rehydrate the editor with the latest content),
-    or `None` on failure.
+    or `None` on failure. With an assessment and task the read is incremental:
+    only files changed since the last snapshot leave the sandbox.
     """
     try:
         # Exclude generated / vendored content. Without this, ``.venv/``
         # bytecode + pip cache leaks into the candidate's file explorer
         # and drowns the actual repo content (assessment 77,
         # 2026-05-26 — 100+ ``.cpython-312.pyc`` rows in the tree).
-        result = sandbox.run_code(
-            "import json, os, pathlib\n"
-            f"repo_root = pathlib.Path({repo_root!r})\n"
-            f"MAX_FILES = {int(max_files)}\n"
-            f"MAX_BYTES = {int(max_bytes)}\n"
-            "EXCLUDE_DIR_NAMES = {\n"
-            "  '.git', '.venv', 'venv', '.tox', '.mypy_cache',\n"
-            "  '.pytest_cache', '.ruff_cache', '__pycache__',\n"
-            "  'node_modules', '.next', 'dist', 'build', '.idea',\n"
-            "  '.vscode',\n"
-            "}\n"
-            "EXCLUDE_SUFFIXES = ('.pyc', '.pyo', '.pyd')\n"
-            "EXCLUDE_NAMES = {'.DS_Store'}\n"
-            "files = {}\n"
-            "skipped = []\n"
-            "if repo_root.exists():\n"
-            "  for path in sorted(repo_root.rglob('*')):\n"
-            "    if not path.is_file():\n"
-            "      continue\n"
-            "    rel = path.relative_to(repo_root).as_posix()\n"
-            "    parts = rel.split('/')\n"
-            "    if any(p in EXCLUDE_DIR_NAMES for p in parts[:-1]):\n"
-            "      continue\n"
-            "    if path.name in EXCLUDE_NAMES or rel.endswith(EXCLUDE_SUFFIXES):\n"
-            "      continue\n"
-            "    if len(files) >= MAX_FILES:\n"
-            "      skipped.append(rel)\n"
-            "      continue\n"
-            "    try:\n"
-            "      raw = path.read_bytes()\n"
-            "      if len(raw) > MAX_BYTES:\n"
-            "        skipped.append(rel)\n"
-            "        continue\n"
-            "      files[rel] = raw.decode('utf-8', 'replace')\n"
-            "    except Exception:\n"
-            "      skipped.append(rel)\n"
-            "print(json.dumps({'files': files, 'skipped': skipped}))\n"
+        snapshot = read_repo_snapshot(
+            sandbox,
+            repo_root,
+            assessment=assessment,
+            task=task,
+            strict=False,
+            max_files=max_files,
+            max_file_bytes=max_bytes,
+            skip_dirs=_EDITOR_EXCLUDED_DIRS,
+            skip_suffixes=(".pyc", ".pyo", ".pyd"),
+            skip_names={".DS_Store"},
         )
-        out = _execution_stdout_text(result).strip().splitlines()
-        if not out:
-            return None
-        payload = json.loads(out[-1])
-        files = payload.get("files") or {}
-        if not isinstance(files, dict) or not files:
+        files = snapshot.get("files") or {}
+        if snapshot.get("error") or not files:
             return None
         return {"files": files}
     except Exception:
@@ -829,6 +816,7 @@ def start_or_resume_assessment(
     sandbox = None
     sandbox_id = None
     created_sandbox = False
+    pooled = None
     task = db.query(Task).filter(Task.id == assessment.task_id).first()
     if not task:
         raise HTTPException(status_code=404, detail="Task not found")
@@ -870,7 +858,8 @@ def start_or_resume_assessment(
                     detail="The existing workspace could not be reconnected. Please retry; no replacement workspace was created.",
                 ) from exc
         else:
-            sandbox = e2b.create_sandbox()
+            pooled = claim_pooled_sandbox(e2b, task, assessment.task_spec_snapshot_sha256)
+            sandbox = pooled[0] if pooled else e2b.create_sandbox()
             created_sandbox = True
         sandbox_id = e2b.get_sandbox_id(sandbox)
     except HTTPException:
@@ -901,14 +890,15 @@ def start_or_resume_assessment(
     }
     if was_pending:
         try:
-            if not _clone_assessment_branch_into_workspace(sandbox, assessment, task):
+            if pooled:
+                # Materialized and bootstrapped from this snapshot while warming.
+                bootstrap_result = pooled[1]
+            elif not _clone_assessment_branch_into_workspace(sandbox, assessment, task):
                 raise RuntimeError("local workspace provisioning failed")
-            bootstrap_result = _run_workspace_bootstrap(
-                e2b,
-                sandbox,
-                task,
-                _workspace_repo_root(task),
-            )
+            else:
+                bootstrap_result = _run_workspace_bootstrap(
+                    e2b, sandbox, task, _workspace_repo_root(task),
+                )
             if bootstrap_result.get("ran"):
                 append_assessment_timeline_event(
                     assessment,
@@ -1097,7 +1087,9 @@ def start_or_resume_assessment(
     # edits as missing.
     repo_structure_for_response = task.repo_structure
     if not started_now:
-        live_repo_structure = _read_sandbox_repo_files(sandbox, _workspace_repo_root(task))
+        live_repo_structure = _read_sandbox_repo_files(
+            sandbox, _workspace_repo_root(task), assessment=assessment, task=task,
+        )
         if live_repo_structure:
             repo_structure_for_response = live_repo_structure
 
@@ -47,6 +47,7 @@ from ...services.taali_scoring import (
     compute_role_fit_score,
     compute_taali_score,
 )
+from .repo_snapshot import read_repo_snapshot
 from .repository import (
     append_assessment_timeline_event,
     build_timeline,
@@ -225,87 +226,35 @@ def _capture_submission_artifact(
     max_files: int = _MAX_SUBMISSION_FILES,
     max_file_bytes: int = _MAX_SUBMISSION_FILE_BYTES,
     max_total_bytes: int = _MAX_SUBMISSION_TOTAL_BYTES,
+    assessment: Assessment | None = None,
+    task: Task | None = None,
 ) -> Dict[str, Any]:
     """Freeze regular text files from the live candidate workspace.
 
     Control directories, symlinks, special files, binaries and paths escaping
     ``repo_root`` are excluded. Limit violations fail closed instead of silently
-    grading a truncated repository.
+    grading a truncated repository. With an assessment and task only files
+    changed since the last snapshot are transferred (``repo_snapshot``).
     """
-    snippet = (
-        "import os, json, stat\n"
-        f"configured_root = os.path.abspath({repo_root!r})\n"
-        "root = os.path.realpath(configured_root)\n"
-        f"skip_dirs = {set(_ARTIFACT_DENIED_PARTS)!r}\n"
-        "out = {}\n"
-        "total = 0\n"
-        "error = None\n"
-        "try:\n"
-        "    root_info = os.lstat(configured_root)\n"
-        "    if not stat.S_ISDIR(root_info.st_mode) or stat.S_ISLNK(root_info.st_mode) or root != configured_root:\n"
-        "        error = 'unsafe_repo_root'\n"
-        "except OSError:\n"
-        "    error = 'unsafe_repo_root'\n"
-        "if error:\n"
-        "    print(json.dumps({'files': out, 'error': error}, ensure_ascii=False))\n"
-        "    raise SystemExit(0)\n"
-        "for dirpath, dirnames, filenames in os.walk(root):\n"
-        "    dirnames[:] = sorted(d for d in dirnames if d.casefold().rstrip(' .') not in skip_dirs)\n"
-        "    for fn in sorted(filenames):\n"
-        f"        if len(out) >= {max_files}:\n"
-        "            error = 'file_count_limit_exceeded'\n"
-        "            break\n"
-        "        full = os.path.join(dirpath, fn)\n"
-        "        rel = os.path.relpath(full, root)\n"
-        "        try:\n"
-        "            info = os.lstat(full)\n"
-        "            if not stat.S_ISREG(info.st_mode) or os.path.islink(full) or info.st_nlink != 1:\n"
-        "                continue\n"
-        "            resolved = os.path.realpath(full)\n"
-        "            if os.path.commonpath([root, resolved]) != root:\n"
-        "                continue\n"
-        f"            if info.st_size > {max_file_bytes}:\n"
-        "                error = 'file_size_limit_exceeded:' + rel\n"
-        "                break\n"
-        "            with open(full, 'rb') as fh:\n"
-        "                raw = fh.read()\n"
-        "            if b'\\x00' in raw:\n"
-        "                continue\n"
-        "            text = raw.decode('utf-8')\n"
-        "            total += len(raw)\n"
-        f"            if total > {max_total_bytes}:\n"
-        "                error = 'total_size_limit_exceeded'\n"
-        "                break\n"
-        "            out[rel.replace(os.sep, '/')] = text\n"
-        "        except UnicodeDecodeError:\n"
-        "            continue\n"
-        "        except Exception as exc:\n"
-        "            error = 'capture_failed:' + rel + ':' + type(exc).__name__\n"
-        "            break\n"
-        "    if error:\n"
-        "        break\n"
-        "print(json.dumps({'files': out, 'error': error}, ensure_ascii=False))\n"
-    )
     try:
-        result = sandbox.run_code(snippet)
-        text = _execution_stdout_text(result).strip().splitlines()
-        if not text:
-            raise RuntimeError("Submission artifact capture returned no output")
-        payload = json.loads(text[-1])
-        if not isinstance(payload, dict):
-            raise RuntimeError("Submission artifact capture returned an invalid payload")
-        if payload.get("error"):
-            raise RuntimeError(f"Submission artifact capture failed: {payload['error']}")
-        raw_files = payload.get("files")
-        if not isinstance(raw_files, dict):
-            raise RuntimeError("Submission artifact capture returned no files")
-        return _build_submission_artifact(
-            {str(path): str(content) for path, content in raw_files.items()}
+        snapshot = read_repo_snapshot(
+            sandbox,
+            repo_root,
+            assessment=assessment,
+            task=task,
+            strict=True,
+            max_files=max_files,
+            max_file_bytes=max_file_bytes,
+            max_total_bytes=max_total_bytes,
+            skip_dirs=_ARTIFACT_DENIED_PARTS,
         )
-    except RuntimeError:
-        raise
     except Exception as exc:
         raise RuntimeError("Submission artifact capture failed") from exc
+    if snapshot.get("error"):
+        raise RuntimeError(f"Submission artifact capture failed: {snapshot['error']}")
+    return _build_submission_artifact(
+        {str(path): str(content) for path, content in snapshot["files"].items()}
+    )
 
 
 def _materialize_submission_artifact(
@@ -1297,7 +1246,9 @@ def submit_assessment_impl(
     source_is_fresh_artifact = frozen_artifact is not None
     try:
         if frozen_artifact is None:
-            frozen_artifact = _capture_submission_artifact(source_sandbox, repo_root)
+            frozen_artifact = _capture_submission_artifact(
+                source_sandbox, repo_root, assessment=assessment, task=task,
+            )
             artifact_delta = _submission_artifact_delta(task, frozen_artifact)
             artifact_work_present = bool(artifact_delta["work_present"])
             evidence = collect_git_evidence_fn(source_sandbox, repo_root)
@@ -1901,6 +1852,7 @@ def submit_assessment_impl(
                     "model_used": rubric_result.model_used,
                     "fully_graded": rubric_fully_graded,
                     "failed_dimension_ids": rubric_result.failed_dimension_ids,
+                    "cached_dimension_ids": rubric_result.cached_dimension_ids,
                     "dimensions": [
                         {
                             "id": d.dimension_id,
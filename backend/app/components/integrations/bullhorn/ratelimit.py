@@ -8,7 +8,8 @@ breaker that opens well before the disable threshold (~500 429s / rolling 5 min,
 ~18x under the 9,000 limit) so a runaway can never brick the customer's API user.
 
 All three pieces are pure, deterministic logic (clock + sleep injected) so they
-unit-test without a network. One limiter instance is shared per ``client_id``
+unit-test without a network; the token bucket itself is the shared
+``platform.token_bucket.TokenBucket``. One limiter instance is shared per ``client_id``
 (process-global, same rationale as the Workable per-subdomain limiter): a single
 org sync fans out across threads that share the one Bullhorn budget.
 """
@@ -22,6 +23,8 @@ from typing import Callable
 
 import httpx
 
+from ....platform.token_bucket import TokenBucket
+
 # Token bucket: refill rate + burst capacity. 5 req/s * 60 = 300 req/min, ~5x
 # under Bullhorn's 1,500 req/min so cross-process callers on the same client_id
 # still have headroom.
@@ -54,50 +57,6 @@ def retry_after_seconds(response: httpx.Response | None, attempt: int) -> float:
     )
 
 
-class TokenBucket:
-    """Process-global token bucket, one instance per Bullhorn ``client_id``.
-
-    ``acquire`` blocks until a token is available. Refills continuously at
-    ``rate_per_sec`` up to ``burst`` capacity. Clock + sleep are injectable so
-    the pacing is testable without wall-clock waits.
-    """
-
-    def __init__(
-        self,
-        rate_per_sec: float = BULLHORN_RATE_PER_SEC,
-        burst: int = BULLHORN_RATE_BURST,
-        *,
-        monotonic: Callable[[], float] = time.monotonic,
-        sleep: Callable[[float], None] = time.sleep,
-    ):
-        self._rate = max(0.001, float(rate_per_sec))
-        self._capacity = float(max(1, int(burst)))
-        self._tokens = self._capacity
-        self._last = monotonic()
-        self._monotonic = monotonic
-        self._sleep = sleep
-        self._lock = threading.Lock()
-
-    def _refill_locked(self, now: float) -> None:
-        elapsed = now - self._last
-        if elapsed > 0:
-            self._tokens = min(self._capacity, self._tokens + elapsed * self._rate)
-            self._last = now
-
-    def acquire(self) -> None:
-        while True:
-            with self._lock:
-                now = self._monotonic()
-                self._refill_locked(now)
-                if self._tokens >= 1.0:
-                    self._tokens -= 1.0
-                    return
-                deficit = 1.0 - self._tokens
-                wait = deficit / self._rate
-            if wait > 0:
-                self._sleep(wait)
-
-
 class CircuitBreaker:
     """Rolling-window 429 counter that opens before the user-disable threshold.
 
@@ -147,7 +106,7 @@ def get_bucket(client_id: str) -> TokenBucket:
     with _registry_lock:
         bucket = _buckets.get(key)
         if bucket is None:
-            bucket = TokenBucket()
+            bucket = TokenBucket(BULLHORN_RATE_PER_SEC, BULLHORN_RATE_BURST)
             _buckets[key] = bucket
         return bucket
 
@@ -0,0 +1,114 @@
+"""In-process stand-in for ``E2BService`` (tests and local development).
+
+Implements the slice of the E2B service surface the assessment start path and
+the sandbox pool use — create / connect / close, ids, timeouts, commands —
+without the E2B SDK or network. Sandboxes live in a registry shared by every
+provider instance, like the remote service, so a sandbox created by one
+"process" (the pool replenisher) can be connected by another (a start
+request).
+
+Workspace operations are not executed: ``run_code`` reports success for the
+JSON-payload scripts the provisioning helpers send, and ``files.write`` keeps
+contents in memory. Use it to exercise orchestration, not workspace contents.
+"""
+
+from __future__ import annotations
+
+import itertools
+import json
+import threading
+from types import SimpleNamespace
+from typing import Any
+
+_OK_PAYLOAD = json.dumps({"success": True, "ready": True, "returncode": 0})
+
+
+class LocalSandboxFiles:
+    def __init__(self) -> None:
+        self.written: dict[str, str] = {}
+
+    def write(self, path: str, content: str) -> None:
+        self.written[str(path)] = content
+
+
+class LocalSandbox:
+    def __init__(self, sandbox_id: str) -> None:
+        self.sandbox_id = sandbox_id
+        self.files = LocalSandboxFiles()
+        self.code_runs: list[str] = []
+        self.commands: list[str] = []
+        self.timeout_seconds: int | None = None
+
+    def run_code(self, code: str) -> dict[str, Any]:
+        self.code_runs.append(code)
+        return {"stdout": _OK_PAYLOAD, "stderr": "", "error": None}
+
+    def set_timeout(self, seconds: int) -> None:
+        self.timeout_seconds = int(seconds)
+
+
+class LocalSandboxProvider:
+    """E2BService-compatible provider backed by in-memory sandboxes."""
+
+    _lock = threading.Lock()
+    _ids = itertools.count(1)
+    _live: dict[str, LocalSandbox] = {}
+    created: list[str] = []
+    closed: list[str] = []
+
+    def __init__(self, api_key: str = "", template: str | None = None) -> None:
+        self.api_key = api_key
+        self.template = template
+        self.sandbox_timeout_seconds = 3600
+
+    @classmethod
+    def reset(cls) -> None:
+        with cls._lock:
+            cls._live = {}
+            cls.created = []
+            cls.closed = []
+
+    @classmethod
+    def live_sandbox_ids(cls) -> list[str]:
+        with cls._lock:
+            return sorted(cls._live)
+
+    @classmethod
+    def expire(cls, sandbox_id: str) -> None:
+        """Simulate the provider timing a sandbox out behind our back."""
+        with cls._lock:
+            cls._live.pop(sandbox_id, None)
+
+    def get_sandbox_id(self, sandbox: LocalSandbox) -> str:
+        return sandbox.sandbox_id
+
+    def create_sandbox(self) -> LocalSandbox:
+        sandbox = LocalSandbox(f"local-sandbox-{next(self._ids)}")
+        sandbox.set_timeout(self.sandbox_timeout_seconds)
+        with self._lock:
+            self._live[sandbox.sandbox_id] = sandbox
+            self.created.append(sandbox.sandbox_id)
+        return sandbox
+
+    def connect_sandbox(self, sandbox_id: str) -> LocalSandbox:
+        with self._lock:
+            sandbox = self._live.get(sandbox_id)
+        if sandbox is None:
+            raise RuntimeError(f"sandbox {sandbox_id} is not running")
+        sandbox.set_timeout(self.sandbox_timeout_seconds)
+        return sandbox
+
+    def touch_sandbox(self, sandbox: LocalSandbox) -> None:
+        sandbox.set_timeout(self.sandbox_timeout_seconds)
+
+    def run_command(self, sandbox: LocalSandbox, command: str, **_kwargs: Any):
+        sandbox.commands.append(command)
+        return SimpleNamespace(stdout="", stderr="", exit_code=0)
+
+    def close_sandbox(self, sandbox: LocalSandbox) -> None:
+        with self._lock:
+            self._live.pop(sandbox.sandbox_id, None)
+            self.closed.append(sandbox.sandbox_id)
+
+
+__all__ = ["LocalSandbox", "LocalSandboxProvider"]
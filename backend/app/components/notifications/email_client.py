@@ -436,6 +436,7 @@ class EmailService:
         reply_to: str,
         unsubscribe_url: str,
         display_name: str | None = None,
+        idempotency_key: str | None = None,
     ) -> dict:
         """Send ONE outreach-campaign message. The single send path for campaigns.
 
@@ -451,7 +452,9 @@ class EmailService:
         Both ``text_body`` and ``html_body`` are passed through verbatim — the
         caller is responsible for having appended the unsubscribe footer and
         replaced the CTA placeholder before calling. ``display_name`` sets the
-        inbox from-name (the org's outbound brand)."""
+        inbox from-name (the org's outbound brand). ``idempotency_key`` (one per
+        message) makes a re-send after a lost response or worker restart a
+        no-op at the provider."""
         try:
             payload: dict = {
                 "from": _compose_from(base=self.from_email, display_name=display_name),
@@ -465,7 +468,9 @@ class EmailService:
                     "List-Unsubscribe-Post": "List-Unsubscribe=One-Click",
                 },
             }
-            email = _send_resend_email(payload, recipient=to_email)
+            email = _send_resend_email(
+                payload, recipient=to_email, idempotency_key=idempotency_key
+            )
             email_id = email.get("id", "") if isinstance(email, dict) else str(email)
             logger.info("Outreach email sent (email_id=%s, to=%s)", email_id, to_email)
             return {"success": True, "email_id": email_id}
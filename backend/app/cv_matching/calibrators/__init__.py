@@ -15,18 +15,23 @@ training pipeline and unpickled in production.
 Public surface:
 
     from app.cv_matching.calibrators import (
-        fit_calibrator, apply_calibrator,
+        fit_calibrator, apply_calibrator, apply_calibrator_many,
     )
 
     cal = fit_calibrator(role_family="aws_glue", dimension="cv_fit",
                          X=raw_scores, y=advance_labels)
     p_advance = apply_calibrator(role_family, dimension, raw_score)
+    p_many = apply_calibrator_many(role_family, dimension, raw_scores)
+
+Lookups go through a process-wide registry of parsed calibrators that
+re-checks snapshot versions in the background (see ``registry``).
 """
 
 from __future__ import annotations
 
 from .api import (
     apply_calibrator,
+    apply_calibrator_many,
     fit_calibrator,
     load_calibrator,
     save_calibrator,
@@ -34,13 +39,17 @@ from .api import (
 from .isotonic import IsotonicCalibrator
 from .judge import judge_advance_probability
 from .platt import PlattCalibrator
+from .registry import get_calibrator, refresh_calibrators
 
 __all__ = [
     "IsotonicCalibrator",
     "PlattCalibrator",
     "apply_calibrator",
+    "apply_calibrator_many",
     "fit_calibrator",
+    "get_calibrator",
     "judge_advance_probability",
     "load_calibrator",
+    "refresh_calibrators",
     "save_calibrator",
 ]
@@ -11,7 +11,8 @@ Persistence layout:
 The "latest" copy means the runtime always reads a stable filename.
 ``apply_calibrator`` returns None when no snapshot exists for the
 requested (role_family, dimension) — caller falls back to the raw
-score.
+score. It reads through the process-wide registry in ``registry.py``,
+so the hot path never touches the snapshot store.
 """
 
 from __future__ import annotations
@@ -25,6 +26,7 @@ from typing import Sequence
 
 from .isotonic import IsotonicCalibrator
 from .platt import PlattCalibrator
+from .registry import get_calibrator, invalidate_calibrator
 
 logger = logging.getLogger("taali.cv_match.calibrators")
 
@@ -32,6 +34,7 @@ _SNAPSHOT_DIR = Path(__file__).resolve().parent / "snapshots"
 _PLATT_THRESHOLD = 1000  # N < this → Platt; otherwise Isotonic
 _REMOTE_REFRESH_SECONDS = 300.0
 _remote_checked_at: dict[tuple[str, str], float] = {}
+_remote_etags: dict[tuple[str, str], str] = {}
 
 
 def _remote_key(role_family: str, dimension: str) -> str:
@@ -50,7 +53,11 @@ def _remote_enabled() -> bool:
 
 
 def _refresh_from_remote(role_family: str, dimension: str, latest: Path) -> None:
-    """Refresh a worker's local read-through cache at most every five minutes."""
+    """Refresh a worker's local read-through cache at most every five minutes.
+
+    The object's ETag is checked first, so an unchanged remote snapshot is a
+    HEAD request rather than a download and a rewrite of ``latest``.
+    """
     if not _remote_enabled():
         return
     key = (role_family, dimension)
@@ -59,15 +66,21 @@ def _refresh_from_remote(role_family: str, dimension: str, latest: Path) -> None
         return
     _remote_checked_at[key] = now
     try:
-        from ...services.s3_service import download_from_s3
+        from ...services.s3_service import download_from_s3, s3_object_etag
 
-        body = download_from_s3(_remote_key(role_family, dimension))
+        remote_key = _remote_key(role_family, dimension)
+        etag = s3_object_etag(remote_key)
+        if etag is not None and etag == _remote_etags.get(key) and latest.exists():
+            return
+        body = download_from_s3(remote_key)
         if body:
             # Validate before replacing the local cache so corrupt remote data
             # cannot take a working calibrator offline.
             json.loads(body.decode("utf-8"))
             latest.parent.mkdir(parents=True, exist_ok=True)
             latest.write_bytes(body)
+            if etag is not None:
+                _remote_etags[key] = etag
     except Exception as exc:  # pragma: no cover - remote store is best effort
         logger.warning("Calibrator remote refresh failed for %s/%s: %s", role_family, dimension, exc)
 
@@ -121,6 +134,7 @@ def save_calibrator(role_family: str, dimension: str, cal) -> Path:
     body = json.dumps(payload, indent=2)
     timestamped.write_text(body, encoding="utf-8")
     latest.write_text(body, encoding="utf-8")
+    invalidate_calibrator(role_family, dimension)
     if _remote_enabled():
         try:
             from ...services.s3_service import upload_bytes_to_s3
@@ -143,10 +157,8 @@ def save_calibrator(role_family: str, dimension: str, cal) -> Path:
     return latest
 
 
-def load_calibrator(role_family: str, dimension: str):
-    """Load the latest calibrator for (role_family, dimension), or None."""
-    path = _calibrator_path(role_family, dimension)
-    _refresh_from_remote(role_family, dimension, path)
+def _read_calibrator(path: Path):
+    """Parse one snapshot file, or None when it is missing or unreadable."""
     if not path.exists():
         return None
     try:
@@ -163,6 +175,17 @@ def load_calibrator(role_family: str, dimension: str):
     return None
 
 
+def load_calibrator(role_family: str, dimension: str):
+    """Load the latest calibrator for (role_family, dimension), or None.
+
+    Always goes to the snapshot store; scoring reads through the in-process
+    registry (``calibrators.registry``) instead.
+    """
+    path = _calibrator_path(role_family, dimension)
+    _refresh_from_remote(role_family, dimension, path)
+    return _read_calibrator(path)
+
+
 def apply_calibrator(
     role_family: str, dimension: str, raw_score: float
 ) -> float | None:
@@ -173,7 +196,17 @@ def apply_calibrator(
     dimension scores; that's fine because Platt standardises and
     Isotonic is scale-equivariant.
     """
-    cal = load_calibrator(role_family, dimension)
+    cal = get_calibrator(role_family, dimension)
     if cal is None:
         return None
     return float(cal.predict(raw_score))
+
+
+def apply_calibrator_many(
+    role_family: str, dimension: str, raw_scores: Sequence[float]
+) -> list[float] | None:
+    """``apply_calibrator`` for a batch of raw scores (batch scoring, sweeps)."""
+    cal = get_calibrator(role_family, dimension)
+    if cal is None:
+        return None
+    return cal.predict_many(raw_scores)
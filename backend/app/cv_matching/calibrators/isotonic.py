@@ -4,14 +4,16 @@ Pure-Python implementation. Produces a non-decreasing piecewise-constant
 mapping raw → P(advance). Used for the large-data regime (N >= 1000) where
 the additional flexibility over a logistic curve buys real signal.
 
-Predict: linear interpolation between fitted breakpoints, clamped at the
-endpoints.
+Predict: linear interpolation between fitted breakpoints (located by
+bisection), clamped at the endpoints.
 """
 
 from __future__ import annotations
 
+from bisect import bisect_left
 from dataclasses import dataclass, field
-from typing import Sequence
+from operator import itemgetter
+from typing import Iterable, Sequence
 
 
 def _pav(x: list[float], y: list[float]) -> list[tuple[float, float]]:
@@ -25,24 +27,27 @@ def _pav(x: list[float], y: list[float]) -> list[tuple[float, float]]:
     """
     if not x:
         return []
-    # Each block: (sum_y, count, last_x).
-    blocks: list[list[float]] = []
+    # Blocks as parallel stacks: sum of y, count, rightmost x.
+    sums: list[float] = []
+    counts: list[float] = []
+    rights: list[float] = []
     for xi, yi in zip(x, y):
-        blocks.append([yi, 1.0, xi])
-        # Merge while previous block's mean violates monotonicity.
-        while len(blocks) >= 2 and (
-            blocks[-2][0] / blocks[-2][1] > blocks[-1][0] / blocks[-1][1]
-        ):
-            sy2, c2, _ = blocks.pop()
-            sy1, c1, lx1 = blocks.pop()
-            blocks.append([sy1 + sy2, c1 + c2, max(lx1, xi)])
-
-    # Convert blocks to (rightmost_x, mean_y) breakpoints. Note multiple
-    # x values may share a single y when they were pooled together.
-    breakpoints: list[tuple[float, float]] = []
-    for sum_y, count, right_x in blocks:
-        breakpoints.append((right_x, sum_y / count))
-    return breakpoints
+        block_sum, block_count, block_right = yi, 1.0, xi
+        # Merge while the previous block's mean violates monotonicity.
+        while sums and sums[-1] / counts[-1] > block_sum / block_count:
+            block_sum += sums.pop()
+            block_count += counts.pop()
+            block_right = max(rights.pop(), xi)
+        sums.append(block_sum)
+        counts.append(block_count)
+        rights.append(block_right)
+
+    # Blocks become (rightmost_x, mean_y) breakpoints. Note multiple x values
+    # may share a single y when they were pooled together.
+    return [
+        (right_x, sum_y / count)
+        for right_x, sum_y, count in zip(rights, sums, counts)
+    ]
 
 
 @dataclass
@@ -70,21 +75,34 @@ class IsotonicCalibrator:
     def predict(self, x: float) -> float:
         if not self.breakpoints:
             return 0.0
+        return self._interpolate(float(x))
+
+    def predict_many(self, X: Iterable[float]) -> list[float]:
+        """``predict`` over a batch, sharing one breakpoint index."""
+        if not self.breakpoints:
+            return [0.0 for _ in X]
+        xs = [bp[0] for bp in self.breakpoints]
+        return [self._interpolate(float(x), xs) for x in X]
+
+    def _interpolate(self, x: float, xs: list[float] | None = None) -> float:
         # Clamp at endpoints.
         if x <= self.breakpoints[0][0]:
             return float(self.breakpoints[0][1])
         if x >= self.breakpoints[-1][0]:
             return float(self.breakpoints[-1][1])
-        # Linear interpolation between adjacent breakpoints.
-        for i in range(1, len(self.breakpoints)):
-            x0, y0 = self.breakpoints[i - 1]
-            x1, y1 = self.breakpoints[i]
-            if x <= x1:
-                if x1 == x0:
-                    return float(y1)
-                t = (x - x0) / (x1 - x0)
-                return float(y0 + t * (y1 - y0))
-        return float(self.breakpoints[-1][1])  # pragma: no cover
+        # Linear interpolation between the adjacent breakpoints around x:
+        # breakpoints[i - 1].x < x <= breakpoints[i].x.
+        i = (
+            bisect_left(xs, x)
+            if xs is not None
+            else bisect_left(self.breakpoints, x, key=itemgetter(0))
+        )
+        x0, y0 = self.breakpoints[i - 1]
+        x1, y1 = self.breakpoints[i]
+        if x1 == x0:
+            return float(y1)
+        t = (x - x0) / (x1 - x0)
+        return float(y0 + t * (y1 - y0))
 
     def to_dict(self) -> dict:
         return {
@@ -110,7 +110,7 @@ def _fit_one(
     y = [p[1] for p in pairs]
     cal = fit_calibrator(role_family=role_family, dimension=dimension, X=X, y=y)
 
-    preds = [cal.predict(x) for x in X]
+    preds = cal.predict_many(X)
     brier = _brier_score(preds, y)
     ece = _expected_calibration_error(preds, y)
     alerted = ece > ECE_ALERT_THRESHOLD
@@ -0,0 +1,140 @@
+"""Process-wide registry of parsed calibrators.
+
+Scoring needs one calibrated probability per application, and
+``load_calibrator`` pays for a stat, a possible S3 refresh, a file read and a
+JSON parse each time. The registry parses each (role_family, dimension)
+snapshot once and keys it by snapshot version — the ``latest`` file's
+``(mtime_ns, size)``, which changes whenever ``save_calibrator`` or the remote
+refresh writes a new snapshot.
+
+Only the first lookup of a key loads synchronously. After that lookups never
+touch the store: an entry older than ``_REFRESH_SECONDS`` schedules one
+background re-check (S3 ETag, then the local version) and keeps serving the
+parsed calibrator until a newer version has been parsed. ``save_calibrator``
+invalidates its key, so a fit is visible to its own process immediately.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from dataclasses import dataclass, replace
+from pathlib import Path
+from typing import Any
+
+logger = logging.getLogger("taali.cv_match.calibrators")
+
+_REFRESH_SECONDS = 60.0
+
+_Key = tuple[str, str]
+
+
+@dataclass(frozen=True)
+class _Entry:
+    version: tuple[int, int] | None
+    calibrator: Any
+    checked_at: float
+
+
+_entries: dict[_Key, _Entry] = {}
+_refreshing: set[_Key] = set()
+_lock = threading.Lock()
+
+
+def _snapshot_version(path: Path) -> tuple[int, int] | None:
+    try:
+        stat = path.stat()
+    except FileNotFoundError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+def _load(key: _Key, previous: _Entry | None) -> _Entry:
+    from .api import _calibrator_path, _read_calibrator, _refresh_from_remote
+
+    path = _calibrator_path(*key)
+    _refresh_from_remote(*key, path)
+    version = _snapshot_version(path)
+    now = time.monotonic()
+    if previous is not None and version == previous.version:
+        return replace(previous, checked_at=now)
+    calibrator = _read_calibrator(path) if version is not None else None
+    if calibrator is None and previous is not None and version is not None:
+        # An unreadable new snapshot never takes a working calibrator offline.
+        return replace(previous, checked_at=now)
+    return _Entry(version=version, calibrator=calibrator, checked_at=now)
+
+
+def _refresh(key: _Key, previous: _Entry) -> None:
+    try:
+        entry = _load(key, previous)
+        with _lock:
+            # A concurrent invalidate/reload wins over this (older) check.
+            if _entries.get(key) is previous:
+                _entries[key] = entry
+    except Exception as exc:  # pragma: no cover - keep serving the old entry
+        logger.warning("Calibrator refresh failed for %s/%s: %s", *key, exc)
+    finally:
+        with _lock:
+            _refreshing.discard(key)
+
+
+def _schedule_refresh(key: _Key, entry: _Entry) -> None:
+    with _lock:
+        if key in _refreshing:
+            return
+        _refreshing.add(key)
+    threading.Thread(
+        target=_refresh,
+        args=(key, entry),
+        name="calibrator-refresh",
+        daemon=True,
+    ).start()
+
+
+def get_calibrator(role_family: str, dimension: str):
+    """The parsed calibrator for (role_family, dimension), or None."""
+    key = (role_family, dimension)
+    entry = _entries.get(key)
+    if entry is None:
+        entry = _load(key, None)
+        with _lock:
+            entry = _entries.setdefault(key, entry)
+        return entry.calibrator
+    if time.monotonic() - entry.checked_at >= _REFRESH_SECONDS:
+        _schedule_refresh(key, entry)
+    return entry.calibrator
+
+
+def invalidate_calibrator(role_family: str, dimension: str) -> None:
+    """Drop a key so its next lookup reloads the snapshot."""
+    with _lock:
+        _entries.pop((role_family, dimension), None)
+
+
+def refresh_calibrators() -> int:
+    """Re-check every cached key now. Returns how many changed version."""
+    with _lock:
+        current = dict(_entries)
+    changed = 0
+    for key, previous in current.items():
+        entry = _load(key, previous)
+        with _lock:
+            if _entries.get(key) is previous:
+                _entries[key] = entry
+                changed += entry.version != previous.version
+    return changed
+
+
+def reset_calibrator_registry() -> None:
+    with _lock:
+        _entries.clear()
+
+
+__all__ = [
+    "get_calibrator",
+    "invalidate_calibrator",
+    "refresh_calibrators",
+    "reset_calibrator_registry",
+]
@@ -32,6 +32,7 @@ from __future__ import annotations
 import hashlib
 import logging
 import uuid
+from dataclasses import dataclass
 from typing import Any, Callable
 
 from pydantic import BaseModel, ConfigDict, Field
@@ -347,16 +348,9 @@ def _cached_system(text: str) -> list[dict]:
 
 
 def _redis():
-    try:
-        import redis
-
-        from ..platform.config import settings
+    from ..platform.redis_cache import cache_redis
 
-        return redis.Redis.from_url(
-            settings.REDIS_URL, socket_connect_timeout=2, socket_timeout=2
-        )
-    except Exception:  # pragma: no cover — cache is best-effort
-        return None
+    return cache_redis()
 
 
 def derive_requirements(
@@ -424,36 +418,33 @@ def derive_requirements(
     return deriv
 
 
-def run_holistic_match(
+@dataclass(frozen=True)
+class HolisticInputs:
+    """The sanitised text one holistic score sees, plus its shared-cache key."""
+
+    cv: str
+    jd: str
+    workable_context: str
+    hygiene: Any
+    cache_key: str
+
+
+def prepare_holistic_inputs(
     cv_text: str,
     job_spec_text: str,
     *,
-    client: Any,
-    metering_context: dict | None = None,
     workable_context: str | None = None,
-    before_provider_call: Callable[[str], None] | None = None,
-) -> CVMatchOutput:
-    """Score one candidate + produce the complete report (two Sonnet calls).
+) -> HolisticInputs | None:
+    """Sanitise the CV and key the shared-result cache. None on missing input.
 
-    Call 1 is the calibrated holistic score; call 2 is the descriptive
-    report (snapshot + dimensions + per-requirement grades). They're split
-    so the report's itemisation can't inflate the score. Mirrors the slice
-    of ``run_cv_match`` the orchestrator calls, so it is a drop-in branch.
-    Never raises — failures come back as a ``CVMatchOutput`` with
-    ``scoring_status=FAILED``. A failed report (call 2) still yields a valid
-    scored output, just without the report detail.
+    Shared by the sync path and the Batches API path
+    (``cv_matching.holistic_batch``) so both see the same CV text and look up
+    / write the same ``cv_score_cache`` row.
     """
-    trace_id = uuid.uuid4().hex
-    mc = metering_context or {}
-    org_id = mc.get("organization_id")
-    role_id = mc.get("role_id")
-    entity_id = mc.get("entity_id")
-    require_role_authority = bool(mc.get("require_role_authority", False))
-
     cv = (cv_text or "").strip()
     jd = (job_spec_text or "").strip()
     if not cv or not jd:
-        return _failed_output("missing_inputs", trace_id)
+        return None
 
     from ..platform.config import settings
 
@@ -490,13 +481,102 @@ def run_holistic_match(
         model_version=HOLISTIC_MODEL,
         workable_context=workable_context or "",
     )
-    cached = _cache_get(cache_key)
+    return HolisticInputs(
+        cv=cv,
+        jd=jd,
+        workable_context=workable_context or "",
+        hygiene=hygiene,
+        cache_key=cache_key,
+    )
+
+
+def cached_holistic_output(inputs: HolisticInputs) -> CVMatchOutput | None:
+    """The shared-cache result for these inputs, flagged as a cache hit."""
+    cached = _cache_get(inputs.cache_key)
     if cached is not None:
         cached.cache_hit = True
+    return cached
+
+
+def holistic_calls(inputs: HolisticInputs, deriv: _Derivation) -> dict[str, dict]:
+    """Request parameters of the score (call 1) and report (call 2) calls.
+
+    The single source for both call shapes: the sync path passes them to
+    ``generate_structured`` and the batch path renders them into Message
+    Batches requests, so the two are bit-identical.
+    """
+    core = deriv.core_capability or "(infer from the job spec and requirements)"
+    reqblock = "\n".join(
+        f"{i}: ({r.importance}{'/CORE' if r.is_core else ''}) {r.requirement}"
+        for i, r in enumerate(deriv.requirements)
+    ) or "0: Overall fit to the role as described."
+    wk = (
+        f"WORKABLE CONTEXT (recruiter notes, questionnaire answers):\n{inputs.workable_context[:_WK_CHARS]}\n\n"
+        if inputs.workable_context
+        else ""
+    )
+    cv = inputs.cv[:_CV_CHARS]
+    # Stable rubric + requirements ride a cached system block; only the CV +
+    # Workable context vary per candidate.
+    return {
+        "score": {
+            "model": HOLISTIC_MODEL,
+            "messages": [{"role": "user", "content": _SCORE_USER.format(workable=wk, cv=cv)}],
+            "output_model": _LeanScore,
+            "max_tokens": 2000,
+            "system": _cached_system(_SCORE_SYS.format(core=core, reqs=reqblock)),
+            "temperature": 0.0,
+            "tool_name": "score_candidate",
+        },
+        "report": {
+            "model": HOLISTIC_MODEL,
+            "messages": [{"role": "user", "content": _REPORT_USER.format(workable=wk, cv=cv)}],
+            "output_model": _Report,
+            "max_tokens": 5000,
+            "system": _cached_system(_REPORT_SYS.format(core=core, reqs=reqblock)),
+            "temperature": 0.0,
+            "tool_name": "emit_report_facts",
+        },
+    }
+
+
+def run_holistic_match(
+    cv_text: str,
+    job_spec_text: str,
+    *,
+    client: Any,
+    metering_context: dict | None = None,
+    workable_context: str | None = None,
+    before_provider_call: Callable[[str], None] | None = None,
+) -> CVMatchOutput:
+    """Score one candidate + produce the complete report (two Sonnet calls).
+
+    Call 1 is the calibrated holistic score; call 2 is the descriptive
+    report (snapshot + dimensions + per-requirement grades). They're split
+    so the report's itemisation can't inflate the score. Mirrors the slice
+    of ``run_cv_match`` the orchestrator calls, so it is a drop-in branch.
+    Never raises — failures come back as a ``CVMatchOutput`` with
+    ``scoring_status=FAILED``. A failed report (call 2) still yields a valid
+    scored output, just without the report detail.
+    """
+    trace_id = uuid.uuid4().hex
+    mc = metering_context or {}
+    org_id = mc.get("organization_id")
+    role_id = mc.get("role_id")
+    entity_id = mc.get("entity_id")
+    require_role_authority = bool(mc.get("require_role_authority", False))
+
+    inputs = prepare_holistic_inputs(
+        cv_text, job_spec_text, workable_context=workable_context
+    )
+    if inputs is None:
+        return _failed_output("missing_inputs", trace_id)
+    cached = cached_holistic_output(inputs)
+    if cached is not None:
         return cached
 
     deriv = derive_requirements(
-        jd,
+        inputs.jd,
         client=client,
         organization_id=org_id,
         role_id=role_id,
@@ -504,16 +584,7 @@ def run_holistic_match(
         require_role_authority=require_role_authority,
         before_provider_call=before_provider_call,
     )
-    core = deriv.core_capability or "(infer from the job spec and requirements)"
-    reqblock = "\n".join(
-        f"{i}: ({r.importance}{'/CORE' if r.is_core else ''}) {r.requirement}"
-        for i, r in enumerate(deriv.requirements)
-    ) or "0: Overall fit to the role as described."
-    wk = (
-        f"WORKABLE CONTEXT (recruiter notes, questionnaire answers):\n{workable_context[:_WK_CHARS]}\n\n"
-        if workable_context
-        else ""
-    )
+    calls = holistic_calls(inputs, deriv)
 
     def _meter():
         return (
@@ -524,14 +595,9 @@ def run_holistic_match(
             else MeteringContext.skipped(metered_by="holistic_direct", trace_id=trace_id)
         )
 
-    # Call 1 — calibrated score. Stable rubric + requirements ride a cached
-    # system block; only the CV + Workable context vary per candidate.
+    # Call 1 — calibrated score.
     score_res = generate_structured(
-        client, model=HOLISTIC_MODEL,
-        messages=[{"role": "user", "content": _SCORE_USER.format(workable=wk, cv=cv[:_CV_CHARS])}],
-        output_model=_LeanScore, metering=_meter(), max_tokens=2000,
-        system=_cached_system(_SCORE_SYS.format(core=core, reqs=reqblock)),
-        temperature=0.0, use_tool_use=True, tool_name="score_candidate",
+        client, metering=_meter(), use_tool_use=True, **calls["score"],
         before_provider_call=(
             (
                 lambda attempt: before_provider_call(
@@ -552,11 +618,7 @@ def run_holistic_match(
     # Call 2 — descriptive report (best-effort; never fails the score). Same
     # cached-system / per-candidate-user split as call 1.
     report_res = generate_structured(
-        client, model=HOLISTIC_MODEL,
-        messages=[{"role": "user", "content": _REPORT_USER.format(workable=wk, cv=cv[:_CV_CHARS])}],
-        output_model=_Report, metering=_meter(), max_tokens=5000,
-        system=_cached_system(_REPORT_SYS.format(core=core, reqs=reqblock)),
-        temperature=0.0, use_tool_use=True, tool_name="emit_report_facts",
+        client, metering=_meter(), use_tool_use=True, **calls["report"],
         before_provider_call=(
             (
                 lambda attempt: before_provider_call(
@@ -569,8 +631,27 @@ def run_holistic_match(
             else None
         ),
     )
-    report = report_res.value if (report_res.ok and report_res.value) else _Report()
+    return finalize_holistic_output(inputs, deriv, score_res, report_res, trace_id)
+
+
+def finalize_holistic_output(
+    inputs: HolisticInputs,
+    deriv: _Derivation,
+    score_res: Any,
+    report_res: Any,
+    trace_id: str,
+) -> CVMatchOutput:
+    """Turn a successful score (+ best-effort report) into the cached output.
+
+    Applies the hidden-text cap, quote grounding and the grounding-coverage
+    discount, then writes the shared-result cache. ``score_res`` /
+    ``report_res`` are ``StructuredResult``-shaped (``value``, ``ok``,
+    ``usage``); the batch path builds them from Message Batches results.
+    """
+    from ..platform.config import settings
 
+    report = report_res.value if (report_res is not None and report_res.ok and report_res.value) else _Report()
+    hygiene = inputs.hygiene
     out = _to_output(score_res.value, report, deriv, trace_id, score_res, report_res, hygiene=hygiene)
     if (
         hygiene is not None
@@ -579,7 +660,7 @@ def run_holistic_match(
     ):
         out = _cap_for_hidden_text(out, settings.FRAUD_PENALTY_CAP_SCORE)
     try:
-        _ground_quotes(out, cv)
+        _ground_quotes(out, inputs.cv)
     except Exception:  # pragma: no cover — never fail a score on grounding
         logger.warning("holistic grounding pass failed", exc_info=True)
 
@@ -619,7 +700,7 @@ def run_holistic_match(
     else:
         out = out.model_copy(update={"integrity_signals": sig})
 
-    _cache_set(cache_key, out)
+    _cache_set(inputs.cache_key, out)
     return out
 
 
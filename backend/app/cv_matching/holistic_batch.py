@@ -0,0 +1,624 @@
+"""Bulk holistic CV scoring via the Anthropic Message Batches API.
+
+Role-wide re-scores (``batch_score_role``, ``sweep_stale_scores``) are
+background work nobody is waiting on, so their holistic Sonnet calls are a
+fit for the Batches API's 50% discount. They enqueue with
+``enqueue_score(..., batch=True)``; the score worker runs as usual (fences,
+pre-screen gate, shared-cache lookup) and only a holistic cache MISS is
+parked (``ScoreParkedForBatch``) instead of making the two synchronous calls.
+
+Flow (both halves are Celery beat tasks in ``tasks/anthropic_batch_tasks``):
+
+* :func:`sweep_parked_score_jobs` — render each parked job's score + report
+  requests (``hscore-<job_id>-score|report``), reserve credits, submit one
+  Message Batch per organization and mark the jobs ``running`` with an
+  ``in_batch:<batch_id>`` marker.
+* :func:`apply_score_batch_results` — validate each job's results with the
+  same tool schemas, run ``finalize_holistic_output`` (grounding, hidden-
+  text cap, shared ``cv_score_cache`` write) and put the job back to
+  ``pending`` with ``batch_trace_id`` set. The re-dispatched worker then hits
+  the cache and persists through the normal ``_execute_scoring_v3`` path, so
+  every fence and follow-up (auto-reject, decisions, corroboration) is shared
+  with live scoring. Errored or invalid results hand the job to the live path.
+
+Requests are rendered from ``holistic.holistic_calls`` — the same params the
+sync path passes to ``generate_structured`` — so the result and cache key are
+interchangeable. Metering is done by ``MeteredAnthropicClient`` at
+``service_tier="batch"``; the persisting run skips the cache-hit fee.
+
+Two other bulk callers of ``run_holistic_match`` stay synchronous on purpose:
+
+* ``tasks/pool_rescore_tasks`` scores against a recruiter's free-text
+  requirement, not a role, and the recruiter polls the ``PoolRescoreJob``
+  for the answer. There is no ``cv_score_jobs`` row to park, and a batch can
+  take up to 24h.
+* ``services/prescreen_calibration`` shadow scores must never reach the
+  application. The apply step here re-dispatches a score job that persists
+  onto ``candidate_applications``. The weekly run is also capped at 50
+  samples, and the admin trigger returns its counts inline.
+"""
+
+from __future__ import annotations
+
+import logging
+import uuid
+from datetime import datetime, timezone
+from typing import Any, Optional
+
+from ..llm import (
+    CallUsage,
+    StructuredResult,
+    ValidationFailure,
+    extract_structured_tool_input,
+    structured_tool_params,
+)
+from .holistic import (
+    HolisticInputs,
+    _Derivation,
+    cached_holistic_output,
+    derive_requirements,
+    finalize_holistic_output,
+    holistic_calls,
+)
+
+logger = logging.getLogger("taali.cv_matching.holistic_batch")
+
+CUSTOM_ID_PREFIX = "hscore"
+
+# Cap on parked jobs per sweep (two requests each); leftovers are picked up
+# by the next sweep.
+DEFAULT_SWEEP_LIMIT = 250
+
+_CALLS = ("score", "report")
+
+
+def custom_id_for(job_id: int, call: str) -> str:
+    return f"{CUSTOM_ID_PREFIX}-{int(job_id)}-{call}"
+
+
+def parse_custom_id(custom_id: str) -> Optional[tuple[int, str]]:
+    """``(job_id, call)`` for a holistic score custom_id, else None."""
+    prefix = f"{CUSTOM_ID_PREFIX}-"
+    if not (custom_id or "").startswith(prefix):
+        return None
+    job_part, _, call = custom_id[len(prefix):].partition("-")
+    if call not in _CALLS:
+        return None
+    try:
+        return int(job_part), call
+    except ValueError:
+        return None
+
+
+def build_holistic_batch_requests(
+    job_id: int, inputs: HolisticInputs, deriv: _Derivation
+) -> list[dict]:
+    """Render a job's score + report requests, bit-identical to the sync calls."""
+    requests = []
+    for call, spec in holistic_calls(inputs, deriv).items():
+        tools, tool_choice, _ = structured_tool_params(
+            spec["output_model"], spec["tool_name"]
+        )
+        requests.append(
+            {
+                "custom_id": custom_id_for(job_id, call),
+                "params": {
+                    "model": spec["model"],
+                    "max_tokens": spec["max_tokens"],
+                    "temperature": spec["temperature"],
+                    "system": spec["system"],
+                    "messages": spec["messages"],
+                    "tools": tools,
+                    "tool_choice": tool_choice,
+                },
+            }
+        )
+    return requests
+
+
+def in_flight_score_job_ids(db: Any) -> set[int]:
+    """Score job ids already sitting in an open score batch."""
+    from ..models.anthropic_batch_job import AnthropicBatchJob
+
+    ids: set[int] = set()
+    rows = (
+        db.query(AnthropicBatchJob)
+        .filter(
+            AnthropicBatchJob.feature == "score",
+            AnthropicBatchJob.status == "submitted",
+        )
+        .all()
+    )
+    for row in rows:
+        for custom_id in (row.context or {}):
+            parsed = parse_custom_id(custom_id)
+            if parsed is not None:
+                ids.add(parsed[0])
+    return ids
+
+
+def _rerun(job: Any, *, live: bool) -> None:
+    """Put a job back to ``pending`` for a worker re-run (``live`` drops it
+    out of batch delivery for good)."""
+    from ..models.cv_score_job import SCORE_DELIVERY_LIVE, SCORE_JOB_PENDING
+
+    if live:
+        job.delivery = SCORE_DELIVERY_LIVE
+        job.batch_trace_id = None
+    job.status = SCORE_JOB_PENDING
+    job.error_message = None
+    job.queued_at = datetime.now(timezone.utc)
+    job.started_at = None
+    job.finished_at = None
+
+
+def _repark(job: Any) -> None:
+    from ..models.cv_score_job import SCORE_BATCH_AWAITING_SUBMIT, SCORE_JOB_PENDING
+
+    job.status = SCORE_JOB_PENDING
+    job.error_message = SCORE_BATCH_AWAITING_SUBMIT
+    job.started_at = None
+
+
+def _parked_jobs(db: Any, *, limit: int) -> list:
+    from ..models.cv_score_job import (
+        CvScoreJob,
+        SCORE_BATCH_AWAITING_SUBMIT,
+        SCORE_DELIVERY_BATCH,
+        SCORE_JOB_PENDING,
+    )
+
+    return (
+        db.query(CvScoreJob)
+        .filter(
+            CvScoreJob.status == SCORE_JOB_PENDING,
+            CvScoreJob.delivery == SCORE_DELIVERY_BATCH,
+            CvScoreJob.error_message == SCORE_BATCH_AWAITING_SUBMIT,
+        )
+        .order_by(CvScoreJob.id.asc())
+        .limit(limit)
+        .all()
+    )
+
+
+def release_parked_score_jobs(db: Any, *, limit: int = DEFAULT_SWEEP_LIMIT) -> dict:
+    """Hand every parked job to the live path (``HOLISTIC_SCORE_BATCH_ENABLED``
+    turned off). The caller commits, then :func:`dispatch_score_jobs`."""
+    jobs = _parked_jobs(db, limit=limit)
+    for job in jobs:
+        _rerun(job, live=True)
+    return {"released": len(jobs), "dispatch": [int(job.id) for job in jobs]}
+
+
+def sweep_parked_score_jobs(db: Any, *, limit: int = DEFAULT_SWEEP_LIMIT) -> dict:
+    """Submit parked batch-delivery score jobs as per-org Message Batches.
+
+    Per job: agent held / inputs gone → handed to the live path (whose
+    fences settle it); a cache hit that landed since parking → re-run now;
+    otherwise both requests are bundled into that org's batch. Credits are
+    reserved per request before submit, exactly as the cv_parse sweep does;
+    a job refused admission goes live, where the refusal is recorded.
+
+    The caller owns the transaction and must call :func:`dispatch_score_jobs`
+    with ``summary["dispatch"]`` after committing.
+    """
+    from sqlalchemy.orm import joinedload
+
+    from ..models.candidate_application import CandidateApplication
+    from ..models.cv_score_job import SCORE_BATCH_IN_FLIGHT_PREFIX, SCORE_JOB_RUNNING
+    from ..platform.database import SessionLocal
+    from ..services.claude_client_resolver import get_metered_client
+    from ..services.cv_score_orchestrator import (
+        AutonomousScoringDeferred,
+        _authorize_autonomous_scoring_phase,
+        holistic_inputs_for,
+    )
+    from ..services.pricing_service import Feature
+    from ..services.usage_credit_reservations import (
+        InsufficientRoleBudgetError,
+        release_credit_reservation,
+        reserve_credits,
+    )
+    from ..services.usage_metering_service import InsufficientCreditsError
+
+    summary: dict[str, Any] = {
+        "scanned": 0,
+        "in_flight": 0,
+        "released_live": 0,
+        "cache_hits": 0,
+        "admission_blocked": 0,
+        "admission_failed": 0,
+        "lock_contended": False,
+        "batches": [],
+        "dispatch": [],
+    }
+
+    bind = getattr(db, "bind", None)
+    if bind is not None and getattr(bind.dialect, "name", None) == "postgresql":
+        from sqlalchemy import text
+
+        try:
+            acquired = bool(
+                db.execute(
+                    text(
+                        "SELECT pg_try_advisory_xact_lock("
+                        "hashtext('holistic_score_batch_sweep'), 0)"
+                    )
+                ).scalar()
+            )
+        except Exception:
+            logger.exception("holistic score batch sweep lock failed")
+            summary["admission_failed"] = 1
+            return summary
+        if not acquired:
+            summary["lock_contended"] = True
+            return summary
+
+    in_flight = in_flight_score_job_ids(db)
+    jobs = _parked_jobs(db, limit=limit)
+    summary["scanned"] = len(jobs)
+
+    def to_live(job: Any) -> None:
+        _rerun(job, live=True)
+        summary["released_live"] += 1
+        summary["dispatch"].append(int(job.id))
+
+    derivations: dict[tuple[int, str], _Derivation] = {}
+    pending_by_org: dict[int, list[tuple[Any, list[dict], dict[str, dict]]]] = {}
+    for job in jobs:
+        if job.id in in_flight:
+            summary["in_flight"] += 1
+            continue
+        application = (
+            db.query(CandidateApplication)
+            .options(
+                joinedload(CandidateApplication.candidate),
+                joinedload(CandidateApplication.role),
+            )
+            .filter(
+                CandidateApplication.id == job.application_id,
+                CandidateApplication.deleted_at.is_(None),
+            )
+            .first()
+        )
+        if application is None:
+            to_live(job)
+            continue
+        try:
+            _authorize_autonomous_scoring_phase(
+                db, application=application, job=job, phase="full_score.batch"
+            )
+        except AutonomousScoringDeferred:
+            to_live(job)
+            continue
+        inputs = holistic_inputs_for(db, application)
+        if inputs is None:
+            to_live(job)
+            continue
+        if cached_holistic_output(inputs) is not None:
+            _rerun(job, live=False)
+            summary["cache_hits"] += 1
+            summary["dispatch"].append(int(job.id))
+            continue
+
+        org_id = int(application.organization_id)
+        # Requirements are derived once per spec (and Redis-cached across
+        # sweeps); every job on a role shares the derivation.
+        deriv_key = (org_id, inputs.jd)
+        deriv = derivations.get(deriv_key)
+        if deriv is None:
+            deriv = derive_requirements(
+                inputs.jd,
+                client=get_metered_client(organization_id=org_id),
+                organization_id=org_id,
+                role_id=application.role_id,
+            )
+            derivations[deriv_key] = deriv
+        trace_id = uuid.uuid4().hex
+        requests = build_holistic_batch_requests(int(job.id), inputs, deriv)
+        context = {
+            request["custom_id"]: {
+                "organization_id": org_id,
+                "role_id": application.role_id,
+                "entity_id": f"application:{application.id}",
+                "job_id": int(job.id),
+                # Apply re-derives the inputs and compares keys so a CV or
+                # spec edited mid-flight is re-submitted, not persisted stale.
+                "cache_key": inputs.cache_key,
+                "trace_id": trace_id,
+            }
+            for request in requests
+        }
+        context[custom_id_for(job.id, "score")]["derivation"] = deriv.model_dump(
+            mode="json"
+        )
+        pending_by_org.setdefault(org_id, []).append((job, requests, context))
+
+    for org_id, items in pending_by_org.items():
+        admitted: list[tuple[Any, list[dict], dict[str, dict]]] = []
+        reservations: dict[str, Any] = {}
+        meter_db = SessionLocal()
+        try:
+            for job, requests, context in items:
+                held: dict[str, Any] = {}
+                for request in requests:
+                    custom_id = request["custom_id"]
+                    per = context[custom_id]
+                    try:
+                        held[custom_id] = reserve_credits(
+                            meter_db,
+                            organization_id=org_id,
+                            feature=Feature.SCORE,
+                            external_ref=(
+                                f"usage-hold:holistic-score-batch:{custom_id}:"
+                                f"{uuid.uuid4().hex}"
+                            ),
+                            metadata={
+                                "sub_feature": "holistic_score_batch",
+                                "role_id": per["role_id"],
+                                "entity_id": per["entity_id"],
+                                "custom_id": custom_id,
+                            },
+                            role_id=per["role_id"],
+                            enforce_role_budget=True,
+                        )
+                    except (InsufficientCreditsError, InsufficientRoleBudgetError):
+                        break
+                if len(held) != len(requests):
+                    for reservation in held.values():
+                        release_credit_reservation(
+                            meter_db,
+                            reservation=reservation,
+                            reason="holistic_score_batch_admission_partial",
+                        )
+                    summary["admission_blocked"] += 1
+                    to_live(job)
+                    continue
+                reservations.update(held)
+                admitted.append((job, requests, context))
+            meter_db.commit()
+        except Exception:
+            meter_db.rollback()
+            summary["admission_failed"] += len(items)
+            logger.exception(
+                "holistic score batch admission failed org=%s; provider submit skipped",
+                org_id,
+            )
+            admitted = []
+        finally:
+            meter_db.close()
+
+        if not admitted:
+            continue
+        batch_requests = [request for _, requests, _ in admitted for request in requests]
+        by_custom_id = {
+            custom_id: {
+                **per,
+                "credit_reservation": reservations[custom_id].as_metering_payload(),
+            }
+            for _, _, context in admitted
+            for custom_id, per in context.items()
+        }
+        try:
+            client = get_metered_client(organization_id=org_id)
+            batch = client.messages.batches.create(
+                requests=batch_requests,
+                metering={
+                    "feature": Feature.SCORE,
+                    "organization_id": org_id,
+                    "by_custom_id": by_custom_id,
+                },
+            )
+        except Exception:
+            # Jobs stay parked for a later sweep; return every committed hold.
+            release_db = SessionLocal()
+            try:
+                for reservation in reservations.values():
+                    release_credit_reservation(
+                        release_db,
+                        reservation=reservation,
+                        reason="holistic_score_batch_submit_failed",
+                    )
+                release_db.commit()
+            except Exception:
+                release_db.rollback()
+                logger.exception(
+                    "holistic score batch reservation release failed org=%s", org_id
+                )
+            finally:
+                release_db.close()
+            logger.exception(
+                "holistic score batch submission failed org=%s (%d jobs)",
+                org_id,
+                len(admitted),
+            )
+            continue
+
+        batch_id = str(getattr(batch, "id", "") or "")
+        now = datetime.now(timezone.utc)
+        for job, _, _ in admitted:
+            job.status = SCORE_JOB_RUNNING
+            job.started_at = now
+            job.error_message = f"{SCORE_BATCH_IN_FLIGHT_PREFIX}{batch_id}"
+        summary["batches"].append(
+            {"batch_id": batch_id, "organization_id": org_id, "jobs": len(admitted)}
+        )
+        logger.info(
+            "holistic score batch submitted org=%s batch_id=%s jobs=%d",
+            org_id,
+            batch_id,
+            len(admitted),
+        )
+
+    return summary
+
+
+def _structured_result(entry: Any, spec: dict, trace_id: str) -> StructuredResult:
+    """A ``StructuredResult`` for one batch entry (``ok=False`` on failure)."""
+    result = getattr(entry, "result", None) if entry is not None else None
+    if getattr(result, "type", None) != "succeeded":
+        return StructuredResult(
+            value=None,
+            ok=False,
+            error_reason=f"batch_result:{getattr(result, 'type', None) or 'missing'}",
+            trace_id=trace_id,
+        )
+    usage = CallUsage()
+    usage.add_response(result.message)
+    try:
+        value = extract_structured_tool_input(
+            result.message, spec["output_model"], tool_name=spec["tool_name"]
+        )
+    except ValidationFailure as exc:
+        return StructuredResult(
+            value=None,
+            ok=False,
+            error_reason=f"validation_failed: {exc}",
+            usage=usage,
+            trace_id=trace_id,
+            validation_failures=1,
+        )
+    return StructuredResult(value=value, ok=True, usage=usage, trace_id=trace_id)
+
+
+def apply_score_batch_results(
+    db: Any, entries: Any, context: Optional[dict] = None
+) -> dict:
+    """Apply one ended score batch: cache each job's output and queue its re-run.
+
+    Succeeded + valid score → output finalised into the shared score cache,
+    job back to ``pending`` with ``batch_trace_id``; a failed report only
+    drops the report detail, as on the sync path. A failed/invalid score
+    hands the job to the live path (which owns retries). A job whose inputs
+    changed mid-flight is re-parked for the next sweep. Jobs that are no
+    longer in this batch (reaped, superseded) are skipped.
+
+    The caller commits, then :func:`dispatch_score_jobs` with
+    ``summary["dispatch"]``.
+    """
+    from ..models.candidate_application import CandidateApplication
+    from ..models.cv_score_job import (
+        CvScoreJob,
+        SCORE_BATCH_IN_FLIGHT_PREFIX,
+        SCORE_JOB_RUNNING,
+    )
+    from ..services.cv_score_orchestrator import holistic_inputs_for
+
+    context = context if isinstance(context, dict) else {}
+    summary: dict[str, Any] = {
+        "applied": 0,
+        "requeued": 0,
+        "stale_reparked": 0,
+        "skipped": 0,
+        "dispatch": [],
+    }
+
+    by_job: dict[int, dict[str, Any]] = {}
+    for entry in entries:
+        parsed = parse_custom_id(str(getattr(entry, "custom_id", "")))
+        if parsed is None:
+            summary["skipped"] += 1
+            continue
+        by_job.setdefault(parsed[0], {})[parsed[1]] = entry
+
+    for job_id, results in by_job.items():
+        job = db.get(CvScoreJob, job_id)
+        if (
+            job is None
+            or job.status != SCORE_JOB_RUNNING
+            or not str(job.error_message or "").startswith(SCORE_BATCH_IN_FLIGHT_PREFIX)
+        ):
+            summary["skipped"] += 1
+            continue
+        per = context.get(custom_id_for(job_id, "score")) or {}
+        application = db.get(CandidateApplication, job.application_id)
+        inputs = (
+            holistic_inputs_for(db, application) if application is not None else None
+        )
+        if inputs is None or not per.get("derivation"):
+            _rerun(job, live=True)
+            summary["requeued"] += 1
+            summary["dispatch"].append(int(job.id))
+            continue
+        if per.get("cache_key") != inputs.cache_key:
+            logger.info(
+                "holistic score batch result stale for job_id=%s (inputs changed "
+                "mid-flight) — re-parking.",
+                job_id,
+            )
+            _repark(job)
+            summary["stale_reparked"] += 1
+            continue
+
+        deriv = _Derivation.model_validate(per["derivation"])
+        trace_id = str(per.get("trace_id") or uuid.uuid4().hex)
+        calls = holistic_calls(inputs, deriv)
+        score_res = _structured_result(results.get("score"), calls["score"], trace_id)
+        if not (score_res.ok and score_res.value):
+            logger.info(
+                "holistic score batch result failed job_id=%s: %s",
+                job_id,
+                score_res.error_reason,
+            )
+            _rerun(job, live=True)
+            summary["requeued"] += 1
+            summary["dispatch"].append(int(job.id))
+            continue
+        report_res = _structured_result(results.get("report"), calls["report"], trace_id)
+        output = finalize_holistic_output(inputs, deriv, score_res, report_res, trace_id)
+        # The cache keeps the first writer; settle against whatever it holds
+        # so the persisting run recognises this batch's result.
+        stored = cached_holistic_output(inputs)
+        _rerun(job, live=False)
+        job.batch_trace_id = str((stored or output).trace_id)
+        summary["applied"] += 1
+        summary["dispatch"].append(int(job.id))
+
+    return summary
+
+
+def dispatch_score_jobs(db: Any, job_ids: list[int]) -> int:
+    """Re-dispatch committed ``pending`` score jobs to the score worker.
+
+    A broker failure marks the job ``broker_dispatch_failed`` so the stuck-
+    job reaper retries it, mirroring ``enqueue_score``.
+    """
+    from ..models.cv_score_job import CvScoreJob, SCORE_JOB_ERROR, SCORE_JOB_PENDING
+    from ..tasks.scoring_tasks import score_application_job
+
+    dispatched = 0
+    for job_id in job_ids:
+        job = db.get(CvScoreJob, int(job_id))
+        if job is None or job.status != SCORE_JOB_PENDING:
+            continue
+        try:
+            async_result = score_application_job.delay(
+                int(job.application_id),
+                job_id=int(job.id),
+                force_full_score=bool(job.force_full_score),
+            )
+        except Exception as exc:
+            job.status = SCORE_JOB_ERROR
+            job.error_message = f"broker_dispatch_failed: {exc}"[:1000]
+            job.finished_at = datetime.now(timezone.utc)
+            db.commit()
+            logger.exception("holistic score re-dispatch failed job_id=%s", job_id)
+            continue
+        job.celery_task_id = str(async_result.id)
+        db.commit()
+        dispatched += 1
+    return dispatched
+
+
+__all__ = [
+    "CUSTOM_ID_PREFIX",
+    "DEFAULT_SWEEP_LIMIT",
+    "apply_score_batch_results",
+    "build_holistic_batch_requests",
+    "custom_id_for",
+    "dispatch_score_jobs",
+    "in_flight_score_job_ids",
+    "parse_custom_id",
+    "release_parked_score_jobs",
+    "sweep_parked_score_jobs",
+]
@@ -5,8 +5,9 @@ Single endpoint:
   GET /api/v1/roles/{role_id}/agent/cohort-signals
 
 Returns the cached payload on ``role.agent_cohort_signals`` if it's
-fresh, otherwise computes and caches. ``?force_recompute=true`` skips
-the cache. The agent's get_cohort_signals tool uses the same caching
+fresh, otherwise reads the maintained feature counts
+(``cohort_feature_store``) and caches. ``?force_recompute=true`` skips
+the cache and rebuilds the counts from the full pool. The agent's get_cohort_signals tool uses the same caching
 logic; this endpoint exists so recruiters (via the role detail page)
 can see the same numbers the agent reasons over.
 
@@ -26,7 +27,7 @@ from ...deps import get_current_user
 from ...models.role import Role
 from ...models.user import User
 from ...platform.database import get_db
-from ...services import cohort_signals_service
+from ...services import cohort_feature_store, cohort_signals_service
 
 
 router = APIRouter(tags=["agentic"])
@@ -151,8 +152,11 @@ def get_cohort_signals(
         cached = role.agent_cohort_signals or {}
         return _build_response(role_id=int(role.id), payload=cached, from_cache=True)
 
-    payload = cohort_signals_service.compute_cohort_signals(
-        db, role_id=int(role.id), organization_id=int(current_user.organization_id)
+    payload = cohort_feature_store.cohort_signals(
+        db,
+        role_id=int(role.id),
+        organization_id=int(current_user.organization_id),
+        rebuild=force_recompute,
     )
     role.agent_cohort_signals = payload
     role.agent_cohort_signals_at = datetime.now(timezone.utc)
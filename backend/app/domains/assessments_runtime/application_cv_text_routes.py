@@ -0,0 +1,214 @@
+"""Lazy CV-text hydration for the CV viewer.
+
+``include_cv_text=true`` on the roster/pipeline lists inlines every row's full
+CV into one JSON body that is built (and then gzipped) in memory. The viewer
+only ever shows the CVs a recruiter opens, so it can instead fetch them here:
+
+- ``GET /applications/cv-text?ids=1,2,3`` streams one NDJSON line per visible
+  application, ``{"application_id", "etag", "cv_text"}``, reading the texts in
+  small chunks so neither the rows nor the body are held in memory at once.
+  ``GZipMiddleware`` compresses the stream as it goes.
+- ``GET /applications/{id}/cv-text`` returns a single CV as plain text.
+
+Every CV carries a strong content-hash ETag. The viewer caches CVs by it and
+sends the ones it holds in ``If-None-Match``: the single endpoint answers a
+match with an empty 304, the batch with ``"not_modified": true`` and no text.
+
+Mounted under the ``/roles`` router assembly ahead of ``applications_routes``
+so ``/applications/cv-text`` is not captured by ``/applications/{id}``.
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+from collections.abc import Iterator
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
+from fastapi.responses import StreamingResponse
+from sqlalchemy.orm import Session
+
+from ...candidate_search.population import apply_searchable_candidate_scope
+from ...candidate_search.role_scope import resolve_candidate_role_scope
+from ...deps import get_current_user
+from ...models.candidate import Candidate
+from ...models.candidate_application import CandidateApplication
+from ...models.user import User
+from ...platform.database import SessionLocal, get_db
+from .application_search_support import parse_int_csv_filter
+
+router = APIRouter(tags=["Roles"])
+
+# One viewer page of rows; larger batches should be split by the client.
+MAX_CV_TEXT_BATCH = 200
+# Rows whose CV text is read per query while streaming a batch.
+_STREAM_CHUNK = 25
+
+
+def cv_text_etag(cv_text: str | None) -> str | None:
+    """Strong ETag of a resolved CV text; None when there is no CV."""
+    if not cv_text:
+        return None
+    return f'"{hashlib.sha256(cv_text.encode("utf-8")).hexdigest()[:32]}"'
+
+
+def _requested_etags(if_none_match: str | None) -> set[str]:
+    etags: set[str] = set()
+    for candidate in (if_none_match or "").split(","):
+        candidate = candidate.strip()
+        if candidate.startswith("W/"):
+            candidate = candidate[2:]
+        if candidate:
+            etags.add(candidate)
+    return etags
+
+
+def _resolved_cv_text(application_cv: str | None, candidate_cv: str | None) -> str | None:
+    # Same precedence as ``application_list_payload``/``application_detail_payload``.
+    cv = (application_cv or "").strip()
+    if not cv:
+        cv = (candidate_cv or "").strip()
+    return cv or None
+
+
+def _visible_application_ids(
+    db: Session,
+    *,
+    organization_id: int,
+    application_ids: list[int],
+    role_id: int | None,
+) -> set[int]:
+    """The requested ids the caller may read, under the list endpoints' rules.
+
+    With ``role_id`` the role's visible roster decides (a related role keeps
+    rows whose source application was soft-deleted); without it only live
+    applications of the organization are visible.
+    """
+    query = db.query(CandidateApplication.id).filter(
+        CandidateApplication.organization_id == organization_id,
+        CandidateApplication.id.in_(application_ids),
+    )
+    if role_id is not None:
+        try:
+            role_scope = resolve_candidate_role_scope(
+                db,
+                organization_id=organization_id,
+                role_id=int(role_id),
+            )
+        except ValueError as exc:
+            raise HTTPException(status_code=404, detail="Role not found") from exc
+        query = role_scope.scope_visible_roster(query)
+    else:
+        query = apply_searchable_candidate_scope(
+            query.filter(CandidateApplication.deleted_at.is_(None)),
+            organization_id=organization_id,
+        )
+    return {int(application_id) for (application_id,) in query.all()}
+
+
+def _cv_texts(db: Session, application_ids: list[int]) -> dict[int, str | None]:
+    rows = (
+        db.query(CandidateApplication.id, CandidateApplication.cv_text, Candidate.cv_text)
+        .outerjoin(Candidate, Candidate.id == CandidateApplication.candidate_id)
+        .filter(CandidateApplication.id.in_(application_ids))
+        .all()
+    )
+    return {
+        int(application_id): _resolved_cv_text(application_cv, candidate_cv)
+        for application_id, application_cv, candidate_cv in rows
+    }
+
+
+def _stream_cv_texts(application_ids: list[int], known_etags: set[str]) -> Iterator[bytes]:
+    # The request session is closed before a streamed body is sent, so the
+    # (already authorized) ids are read on a session of the stream's own.
+    db = SessionLocal()
+    try:
+        for start in range(0, len(application_ids), _STREAM_CHUNK):
+            chunk = application_ids[start : start + _STREAM_CHUNK]
+            texts = _cv_texts(db, chunk)
+            db.expunge_all()
+            for application_id in chunk:
+                if application_id not in texts:
+                    continue
+                cv_text = texts[application_id]
+                etag = cv_text_etag(cv_text)
+                line: dict = {"application_id": application_id, "etag": etag}
+                if etag is not None and etag in known_etags:
+                    line["cv_text"] = None
+                    line["not_modified"] = True
+                else:
+                    line["cv_text"] = cv_text
+                yield json.dumps(line, ensure_ascii=False, separators=(",", ":")).encode("utf-8") + b"\n"
+    finally:
+        db.close()
+
+
+@router.get("/applications/cv-text")
+def batch_application_cv_text(
+    request: Request,
+    ids: str = Query(..., description="Comma-separated application ids"),
+    role_id: int | None = Query(
+        default=None,
+        ge=1,
+        description="Resolve visibility against this role's roster (needed for related roles)",
+    ),
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+    """Stream the CV texts of the requested applications as NDJSON.
+
+    Lines follow the order of ``ids``; ids that are unknown or not visible to
+    the caller are omitted.
+    """
+    requested = list(dict.fromkeys(parse_int_csv_filter(ids, field_name="ids")))
+    if not requested:
+        raise HTTPException(status_code=422, detail="ids must name at least one application")
+    if len(requested) > MAX_CV_TEXT_BATCH:
+        raise HTTPException(
+            status_code=422,
+            detail=f"At most {MAX_CV_TEXT_BATCH} applications per request",
+        )
+    visible = _visible_application_ids(
+        db,
+        organization_id=int(current_user.organization_id),
+        application_ids=requested,
+        role_id=role_id,
+    )
+    return StreamingResponse(
+        _stream_cv_texts(
+            [application_id for application_id in requested if application_id in visible],
+            _requested_etags(request.headers.get("if-none-match")),
+        ),
+        media_type="application/x-ndjson",
+        headers={"Cache-Control": "private, no-cache"},
+    )
+
+
+@router.get("/applications/{application_id}/cv-text")
+def get_application_cv_text(
+    application_id: int,
+    request: Request,
+    role_id: int | None = Query(default=None, ge=1),
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+    """One application's CV text as ``text/plain`` with a content-hash ETag."""
+    visible = _visible_application_ids(
+        db,
+        organization_id=int(current_user.organization_id),
+        application_ids=[int(application_id)],
+        role_id=role_id,
+    )
+    if int(application_id) not in visible:
+        raise HTTPException(status_code=404, detail="Application not found")
+    cv_text = _cv_texts(db, [int(application_id)]).get(int(application_id))
+    etag = cv_text_etag(cv_text)
+    if etag is None:
+        raise HTTPException(status_code=404, detail="No CV text for this application")
+    headers = {"ETag": etag, "Cache-Control": "private, no-cache"}
+    if etag in _requested_etags(request.headers.get("if-none-match")):
+        return Response(status_code=304, headers=headers)
+    return Response(content=cv_text, media_type="text/plain; charset=utf-8", headers=headers)
+
+
+__all__ = ["MAX_CV_TEXT_BATCH", "cv_text_etag", "router"]
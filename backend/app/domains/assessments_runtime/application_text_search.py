@@ -0,0 +1,189 @@
+"""Org-scoped candidate text search shared by the application list routes.
+
+The pipeline search box queries on every keystroke. Instead of joining the
+whole role roster to ``candidates`` and filtering with ``ILIKE '%term%'``,
+the match is a semi-join against the organization's candidates so PostgreSQL
+can answer it from the indexes added in migration 191:
+
+* terms of ``MIN_TRIGRAM_TERM_LENGTH`` or more characters use a contains
+  match served by the ``pg_trgm`` GIN indexes on ``lower(column)``;
+* shorter terms match at the start of any word (so "li" still finds
+  "Grace Li" and "jenny.li@…"): the column prefix is served by the
+  ``(organization_id, lower(column) text_pattern_ops)`` B-tree indexes, the
+  word-start patterns (``% li%``) by the trigram indexes, which extract the
+  word-boundary trigrams from them.
+
+Matches are ranked exact name, then name/email prefix, then any other
+contains match; PostgreSQL additionally breaks ties by trigram similarity.
+The rank is the default ordering while searching; an explicit ``sort_by``
+keeps its primary key and the rank only breaks its ties. SQLite evaluates the
+same predicates without indexes.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+from sqlalchemy import case, func, or_, select
+from sqlalchemy.orm import Query, Session
+
+from ...models.candidate import Candidate
+from ...models.candidate_application import CandidateApplication
+from ...models.role import Role
+
+
+MIN_TRIGRAM_TERM_LENGTH = 3
+_LIKE_ESCAPE = "\\"
+# What starts a "word" for short terms: spaces in names and titles, the
+# separators inside email local parts.
+_WORD_SEPARATORS = (" ", ".", "_", "-")
+
+
+def _escape_like(value: str) -> str:
+    return (
+        value.replace(_LIKE_ESCAPE, _LIKE_ESCAPE * 2)
+        .replace("%", f"{_LIKE_ESCAPE}%")
+        .replace("_", f"{_LIKE_ESCAPE}_")
+    )
+
+
+@dataclass(frozen=True)
+class ApplicationTextSearch:
+    """A normalized recruiter search term plus its LIKE patterns."""
+
+    term: str
+
+    @property
+    def prefix_only(self) -> bool:
+        return len(self.term) < MIN_TRIGRAM_TERM_LENGTH
+
+    @property
+    def prefix_pattern(self) -> str:
+        return f"{_escape_like(self.term)}%"
+
+    @property
+    def match_patterns(self) -> tuple[str, ...]:
+        if self.prefix_only:
+            return (
+                self.prefix_pattern,
+                *(f"%{_escape_like(separator + self.term)}%" for separator in _WORD_SEPARATORS),
+            )
+        return (f"%{_escape_like(self.term)}%",)
+
+    def matches(self, column):
+        lowered = func.lower(column)
+        return or_(*(lowered.like(pattern, escape=_LIKE_ESCAPE) for pattern in self.match_patterns))
+
+    def candidate_clause(self):
+        return or_(
+            self.matches(Candidate.full_name),
+            self.matches(Candidate.email),
+            self.matches(Candidate.position),
+        )
+
+    def matching_candidate_ids(self, *, organization_id: int):
+        return select(Candidate.id).where(
+            Candidate.organization_id == int(organization_id),
+            self.candidate_clause(),
+        )
+
+    def matching_role_ids(self, *, organization_id: int):
+        return select(Role.id).where(
+            Role.organization_id == int(organization_id),
+            self.matches(Role.name),
+        )
+
+    def rank_expression(self, *, dialect_name: str | None = None):
+        """Lower is better; correlated to ``CandidateApplication.candidate_id``."""
+
+        full_name = func.lower(Candidate.full_name)
+        email = func.lower(Candidate.email)
+        tier = case(
+            (full_name == self.term, 0),
+            (
+                or_(
+                    full_name.like(self.prefix_pattern, escape=_LIKE_ESCAPE),
+                    email.like(self.prefix_pattern, escape=_LIKE_ESCAPE),
+                ),
+                1,
+            ),
+            else_=2,
+        )
+        if dialect_name == "postgresql":
+            # similarity() is in [0, 1], so it only reorders within a tier.
+            tier = tier - func.greatest(
+                func.similarity(func.coalesce(full_name, ""), self.term),
+                func.similarity(func.coalesce(email, ""), self.term),
+            )
+        return (
+            select(tier)
+            .where(Candidate.id == CandidateApplication.candidate_id)
+            .correlate(CandidateApplication)
+            .scalar_subquery()
+        )
+
+
+def parse_application_text_search(raw_value: str | None) -> ApplicationTextSearch | None:
+    term = " ".join(str(raw_value or "").split()).lower()
+    if not term:
+        return None
+    return ApplicationTextSearch(term=term)
+
+
+def apply_application_text_search(
+    query: Query,
+    search: ApplicationTextSearch,
+    *,
+    organization_id: int,
+    logical_role_id_expression=None,
+) -> Query:
+    """Restrict ``query`` to applications whose candidate matches ``search``.
+
+    When ``logical_role_id_expression`` is given, applications whose (logical)
+    role name matches are included too, as the global search has always done.
+    """
+
+    clauses = [
+        CandidateApplication.candidate_id.in_(
+            search.matching_candidate_ids(organization_id=organization_id)
+        )
+    ]
+    if logical_role_id_expression is not None:
+        clauses.append(
+            logical_role_id_expression.in_(
+                search.matching_role_ids(organization_id=organization_id)
+            )
+        )
+    return query.filter(or_(*clauses))
+
+
+def search_rank_order_column(db: Session, search: ApplicationTextSearch):
+    bind = db.get_bind()
+    dialect_name = bind.dialect.name if bind is not None else None
+    return search.rank_expression(dialect_name=dialect_name).asc()
+
+
+def search_order_columns(
+    db: Session,
+    search: ApplicationTextSearch,
+    order_columns,
+    *,
+    explicit_sort: bool,
+) -> tuple:
+    """Lead with the search rank unless the caller chose ``sort_by``; then
+    the chosen key stays primary and the rank breaks its ties."""
+    rank = search_rank_order_column(db, search)
+    columns = tuple(order_columns)
+    if not explicit_sort:
+        return (rank, *columns)
+    return (*columns[:1], rank, *columns[1:])
+
+
+__all__ = [
+    "ApplicationTextSearch",
+    "MIN_TRIGRAM_TERM_LENGTH",
+    "apply_application_text_search",
+    "parse_application_text_search",
+    "search_order_columns",
+    "search_rank_order_column",
+]
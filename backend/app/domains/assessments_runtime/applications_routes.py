@@ -147,7 +147,6 @@ from .application_search_support import (
     PIPELINE_STAGE_VALUES,
     application_order_columns as _application_order_columns,
     apply_application_source_filter as _apply_application_source_filter,
-    build_stage_counts as _build_stage_counts,
     effective_application_outcome_sql as _effective_application_outcome_sql,
     effective_pipeline_stage_sql as _effective_pipeline_stage_sql,
     empty_stage_counts as _empty_stage_counts,
@@ -156,7 +155,17 @@ from .application_search_support import (
 )
 from . import batch_runtime_state as _batch_runtime_state
 from . import role_process_scope as _role_process_scope
+from .application_text_search import (
+    apply_application_text_search,
+    parse_application_text_search,
+    search_order_columns,
+)
 from .global_application_search_service import list_applications_global_data
+from .role_stage_count_projection import (
+    live_stage_counts,
+    open_roster_query,
+    projected_stage_counts,
+)
 from .search_canary_auth import SearchCanaryPrincipal, get_applications_search_principal
 from .role_support import (
     application_list_payload,
@@ -886,7 +895,13 @@ def list_role_applications(
     status: str | None = Query(default=None, description="Filter by application status (e.g. applied, shortlisted)"),
     pipeline_stage: str | None = Query(default=None),
     application_outcome: str | None = Query(default=None),
-    include_cv_text: bool = Query(False, description="Include full CV text for each application (for viewer)"),
+    include_cv_text: bool = Query(
+        False,
+        description=(
+            "Include full CV text for each application. Prefer fetching opened "
+            "rows from /applications/cv-text."
+        ),
+    ),
     limit: int = Query(default=500, ge=1, le=2000),
     offset: int = Query(default=0, ge=0),
     db: Session = Depends(get_db),
@@ -1867,9 +1882,10 @@ def list_applications_global(
         description="Opt in to bounded deep verification of qualitative criteria.",
     ),
     provider_mode: str = Query(default="auto", pattern="^(auto|forbid)$"),
-    sort_by: str = Query(
-        default="pre_screen_score",
+    sort_by: str | None = Query(
+        default=None,
         pattern="^(pre_screen_score|pipeline_stage_updated_at|created_at|taali_score|cv_match_score|cv_match_scored_at)$",
+        description="Defaults to pre_screen_score, or to search relevance while searching.",
     ),
     sort_order: str = Query(default="desc", pattern="^(asc|desc)$"),
     min_pre_screen_score: float | None = Query(default=None, ge=0, le=100),
@@ -1915,9 +1931,10 @@ def get_role_pipeline(
     stages: str | None = Query(default=None),
     source: str | None = Query(default=None, pattern="^(manual|workable)$"),
     search: str | None = Query(default=None),
-    sort_by: str = Query(
-        default="pre_screen_score",
+    sort_by: str | None = Query(
+        default=None,
         pattern="^(pre_screen_score|pipeline_stage_updated_at|created_at|taali_score|cv_match_score|cv_match_scored_at)$",
+        description="Defaults to pre_screen_score, or to search relevance while searching.",
     ),
     sort_order: str = Query(default="desc", pattern="^(asc|desc)$"),
     min_pre_screen_score: float | None = Query(default=None, ge=0, le=100),
@@ -1930,6 +1947,8 @@ def get_role_pipeline(
     current_user: User = Depends(get_current_user),
 ):
     started_at = perf_counter()
+    explicit_sort = sort_by is not None
+    sort_by = sort_by or "pre_screen_score"
     role = get_role(role_id, current_user.organization_id, db)
     role_scope = resolve_candidate_role_scope(
         db,
@@ -1937,32 +1956,19 @@ def get_role_pipeline(
         role_id=int(role.id),
     )
     is_sister = role_scope.is_related
-    base_query = (
-        db.query(CandidateApplication)
-        .filter(
-            CandidateApplication.organization_id == current_user.organization_id,
-        )
-    )
-    if is_sister:
-        base_query = role_scope.scope_roster(base_query)
-    else:
-        base_query = role_scope.scope_roster(base_query).filter(
-            CandidateApplication.deleted_at.is_(None)
-        )
-    base_query = base_query.filter(
-        _effective_application_outcome_sql(is_sister=is_sister) == "open"
+    base_query = open_roster_query(
+        db,
+        organization_id=int(current_user.organization_id),
+        role_scope=role_scope,
     )
     effective_stage = _effective_pipeline_stage_sql(is_sister=is_sister)
     base_query = _apply_application_source_filter(base_query, source)
-    if search:
-        term = f"%{search.strip()}%"
-        base_query = (
-            base_query.join(Candidate, Candidate.id == CandidateApplication.candidate_id)
-            .filter(
-                Candidate.full_name.ilike(term)
-                | Candidate.email.ilike(term)
-                | Candidate.position.ilike(term)
-            )
+    text_search = parse_application_text_search(search)
+    if text_search is not None:
+        base_query = apply_application_text_search(
+            base_query,
+            text_search,
+            organization_id=int(current_user.organization_id),
         )
     threshold = _normalize_taali_score_for_filter(min_taali_score)
     if threshold is not None:
@@ -1984,15 +1990,22 @@ def get_role_pipeline(
 
     stage_counts = _empty_stage_counts()
     if include_stage_counts:
-        stage_rows = (
-            base_query.with_entities(
-                effective_stage,
-                func.count(CandidateApplication.id),
+        # Only the unfiltered roster is maintained in role_stage_counts.
+        filters_applied = (
+            bool(source)
+            or text_search is not None
+            or threshold is not None
+            or pre_screen_threshold is not None
+        )
+        stage_counts = (
+            live_stage_counts(base_query, is_sister=is_sister)
+            if filters_applied
+            else projected_stage_counts(
+                db,
+                organization_id=int(current_user.organization_id),
+                role_scope=role_scope,
             )
-            .group_by(effective_stage)
-            .all()
         )
-        stage_counts = _build_stage_counts(stage_rows)
 
     requested_stages = _parse_choice_csv_filter(
         stages,
@@ -2031,6 +2044,10 @@ def get_role_pipeline(
         )
     else:
         order_columns = _application_order_columns(sort_by, sort_order)
+    if text_search is not None:
+        order_columns = search_order_columns(
+            db, text_search, order_columns, explicit_sort=explicit_sort
+        )
     page_ids = [
         int(row_id)
         for (row_id,) in (
@@ -2047,7 +2064,9 @@ def get_role_pipeline(
         fetched = (
             db.query(CandidateApplication)
             .options(
-                joinedload(CandidateApplication.candidate),
+                # Same 1:1 graph-sync load as the roster list; without it each
+                # card lazy-loads its candidate's row (one query per row).
+                joinedload(CandidateApplication.candidate).joinedload(Candidate.graph_sync_state),
                 joinedload(CandidateApplication.organization),
                 joinedload(CandidateApplication.role),
                 # selectinload avoids the multi-collection cartesian product.
@@ -2125,7 +2144,7 @@ def get_role_pipeline(
         current_user.organization_id,
         role.id,
         ",".join(requested_stages) or stage,
-        bool(search and search.strip()),
+        text_search is not None,
         total,
         limit,
         offset,
@@ -14,9 +14,7 @@ from ...candidate_search.logical_application_scope import (
     resolve_logical_application_selection,
 )
 from ...models.assessment import Assessment, AssessmentStatus
-from ...models.candidate import Candidate
 from ...models.candidate_application import CandidateApplication
-from ...models.role import Role
 from ...platform.request_context import get_request_id
 from .application_search_support import (
     APPLICATION_OUTCOME_VALUES,
@@ -34,6 +32,11 @@ from .application_search_support import (
     release_metadata,
     run_search_for_route,
 )
+from .application_text_search import (
+    apply_application_text_search,
+    parse_application_text_search,
+    search_order_columns,
+)
 from .global_application_runtime_projection import project_global_application_runtime
 
 logger = logging.getLogger("taali.applications")
@@ -47,12 +50,14 @@ def list_applications_global_data(
     application_outcome: str | None, application_outcomes: str | None,
     assessment_status: str | None, search: str | None, nl_query: str | None,
     view: str, rerank: bool, provider_mode: str,
-    sort_by: str, sort_order: str,
+    sort_by: str | None, sort_order: str,
     min_pre_screen_score: float | None, min_taali_score: float | None,
     include_stage_counts: bool, include_cv_text: bool,
     limit: int, offset: int,
 ) -> dict[str, Any]:
     started_at = perf_counter()
+    explicit_sort = sort_by is not None
+    sort_by = sort_by or "pre_screen_score"
     requested_role_ids = parse_int_csv_filter(role_ids, field_name="role_ids")
     if role_id is not None:
         requested_role_ids = [int(role_id), *requested_role_ids]
@@ -137,28 +142,21 @@ def list_applications_global_data(
         base_scope_query = base_scope_query.filter(
             outcome_expression.in_(requested_outcomes)
         )
-    if search and not (nl_query or "").strip():
-        term = f"%{search.strip()}%"
-        base_scope_query = (
-            base_scope_query.join(
-                Candidate,
-                Candidate.id == CandidateApplication.candidate_id,
-            )
-            .outerjoin(
-                Role,
-                Role.id
-                == (
-                    logical_selection.logical_role_id_expression()
-                    if logical_selection.active
-                    else CandidateApplication.role_id
-                ),
-            )
-            .filter(
-                Candidate.full_name.ilike(term)
-                | Candidate.email.ilike(term)
-                | Candidate.position.ilike(term)
-                | Role.name.ilike(term)
-            )
+    text_search = (
+        parse_application_text_search(search)
+        if not (nl_query or "").strip()
+        else None
+    )
+    if text_search is not None:
+        base_scope_query = apply_application_text_search(
+            base_scope_query,
+            text_search,
+            organization_id=int(current_user.organization_id),
+            logical_role_id_expression=(
+                logical_selection.logical_role_id_expression()
+                if logical_selection.active
+                else CandidateApplication.role_id
+            ),
         )
     if threshold is not None:
         base_scope_query = base_scope_query.filter(
@@ -370,6 +368,15 @@ def list_applications_global_data(
             )
     else:
         total = filtered_query.order_by(None).count()
+        order_columns = application_order_columns(
+            sort_by,
+            sort_order,
+            logical_selection=logical_selection,
+        )
+        if text_search is not None:
+            order_columns = search_order_columns(
+                db, text_search, order_columns, explicit_sort=explicit_sort
+            )
         page_keys = [
             (int(logical_role_id), int(application_id))
             for application_id, logical_role_id in (
@@ -377,13 +384,7 @@ def list_applications_global_data(
                     CandidateApplication.id,
                     logical_role_expression,
                 )
-                .order_by(
-                    *application_order_columns(
-                        sort_by,
-                        sort_order,
-                        logical_selection=logical_selection,
-                    )
-                )
+                .order_by(*order_columns)
                 .offset(offset)
                 .limit(limit)
                 .all()
@@ -0,0 +1,240 @@
+"""Serve role pipeline stage counts from the ``role_stage_counts`` projection.
+
+Unfiltered pipeline loads read the maintained row for the role; a missing or
+stale row (see :mod:`app.models.role_stage_count`) is recomputed from the same
+live GROUP BY the route has always used and written back with a version guard.
+Filtered loads (source, search, score floors) keep using the live aggregate
+because their counts are specific to the request.
+"""
+
+from __future__ import annotations
+
+import logging
+from datetime import datetime, timezone
+from typing import Any
+
+from sqlalchemy import func, select, text, update
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import Query, Session
+
+from ...candidate_search.role_scope import CandidateRoleScope, resolve_candidate_role_scope
+from ...models.candidate_application import CandidateApplication
+from ...models.role import Role
+from ...models.role_stage_count import RoleStageCount
+from .application_search_support import (
+    build_stage_counts,
+    effective_application_outcome_sql,
+    effective_pipeline_stage_sql,
+)
+
+logger = logging.getLogger("taali.role_stage_counts")
+
+_RECONCILE_BATCH_SIZE = 500
+_INSERT_FRESH_SQL = text(
+    "INSERT INTO role_stage_counts "
+    "(role_id, organization_id, applied, invited, in_assessment, review, total, "
+    "version, stale, refreshed_at, updated_at) "
+    "VALUES (:role_id, :organization_id, :applied, :invited, :in_assessment, "
+    ":review, :total, 0, :stale, :now, :now) "
+    "ON CONFLICT (role_id) DO NOTHING"
+)
+
+
+def open_roster_query(
+    db: Session,
+    *,
+    organization_id: int,
+    role_scope: CandidateRoleScope,
+) -> Query:
+    """The open application roster ``get_role_pipeline`` counts and pages over."""
+
+    is_sister = role_scope.is_related
+    query = db.query(CandidateApplication).filter(
+        CandidateApplication.organization_id == int(organization_id),
+    )
+    query = role_scope.scope_roster(query)
+    if not is_sister:
+        query = query.filter(CandidateApplication.deleted_at.is_(None))
+    return query.filter(effective_application_outcome_sql(is_sister=is_sister) == "open")
+
+
+def live_stage_counts(base_query: Query, *, is_sister: bool) -> dict[str, int]:
+    effective_stage = effective_pipeline_stage_sql(is_sister=is_sister)
+    stage_rows = (
+        base_query.with_entities(effective_stage, func.count(CandidateApplication.id))
+        .group_by(effective_stage)
+        .all()
+    )
+    return build_stage_counts(stage_rows)
+
+
+def _counts_params(counts: dict[str, int]) -> dict[str, int]:
+    return {
+        "applied": int(counts.get("applied", 0)),
+        "invited": int(counts.get("invited", 0)),
+        "in_assessment": int(counts.get("in_assessment", 0)),
+        "review": int(counts.get("review", 0)),
+        "total": int(counts.get("all", 0)),
+    }
+
+
+def _store_counts(
+    db: Session,
+    *,
+    role_id: int,
+    organization_id: int,
+    counts: dict[str, int],
+    seen_version: int | None,
+) -> bool:
+    """Write ``counts`` unless a writer bumped the row after we read it."""
+
+    now = datetime.now(timezone.utc)
+    if seen_version is None:
+        result = db.execute(
+            _INSERT_FRESH_SQL,
+            {
+                "role_id": int(role_id),
+                "organization_id": int(organization_id),
+                "stale": False,
+                "now": now,
+                **_counts_params(counts),
+            },
+        )
+    else:
+        result = db.execute(
+            update(RoleStageCount)
+            .where(
+                RoleStageCount.role_id == int(role_id),
+                RoleStageCount.version == int(seen_version),
+            )
+            .values(
+                organization_id=int(organization_id),
+                stale=False,
+                refreshed_at=now,
+                updated_at=now,
+                **_counts_params(counts),
+            )
+            .execution_options(synchronize_session=False)
+        )
+    return bool(result.rowcount)
+
+
+def _projection_row(db: Session, role_id: int):
+    return db.execute(
+        select(RoleStageCount).where(RoleStageCount.role_id == int(role_id))
+    ).scalar_one_or_none()
+
+
+def projected_stage_counts(
+    db: Session,
+    *,
+    organization_id: int,
+    role_scope: CandidateRoleScope,
+) -> dict[str, int]:
+    """Unfiltered open-roster stage counts for one role, served from the projection.
+
+    A refresh is written in a short session of its own, so the caller's
+    session (typically a GET handler's) is neither flushed nor committed.
+    """
+
+    role_id = int(role_scope.role_id)
+    row = _projection_row(db, role_id)
+    if row is not None and not row.stale:
+        return row.as_stage_counts()
+    seen_version = int(row.version) if row is not None else None
+    counts = live_stage_counts(
+        open_roster_query(db, organization_id=organization_id, role_scope=role_scope),
+        is_sister=role_scope.is_related,
+    )
+    bind = db.get_bind(RoleStageCount)
+    with Session(bind=getattr(bind, "engine", bind)) as refresh:
+        try:
+            _store_counts(
+                refresh,
+                role_id=role_id,
+                organization_id=organization_id,
+                counts=counts,
+                seen_version=seen_version,
+            )
+            refresh.commit()
+        except SQLAlchemyError:
+            # The live counts are correct for this response; the next read retries.
+            refresh.rollback()
+            logger.warning("role_stage_counts refresh failed role_id=%s", role_id, exc_info=True)
+    return counts
+
+
+def reconcile_role_stage_counts(
+    db: Session,
+    *,
+    batch_size: int = _RECONCILE_BATCH_SIZE,
+) -> dict[str, Any]:
+    """Recompute the least recently refreshed projection rows and repair drift.
+
+    Covers writes that bypass the ORM hooks (bulk ``UPDATE`` statements,
+    database triggers) and removes rows for hard- or soft-deleted roles.
+    """
+
+    rows = (
+        db.execute(
+            select(RoleStageCount)
+            .order_by(
+                RoleStageCount.refreshed_at.is_not(None),
+                RoleStageCount.refreshed_at.asc(),
+                RoleStageCount.role_id.asc(),
+            )
+            .limit(int(batch_size))
+        )
+        .scalars()
+        .all()
+    )
+    checked = repaired = removed = 0
+    for row in rows:
+        role_id = int(row.role_id)
+        organization_id = db.execute(
+            select(Role.organization_id).where(
+                Role.id == role_id,
+                Role.deleted_at.is_(None),
+            )
+        ).scalar_one_or_none()
+        if organization_id is None:
+            db.delete(row)
+            removed += 1
+            continue
+        try:
+            role_scope = resolve_candidate_role_scope(
+                db,
+                organization_id=int(organization_id),
+                role_id=role_id,
+            )
+        except ValueError:
+            db.delete(row)
+            removed += 1
+            continue
+        checked += 1
+        counts = live_stage_counts(
+            open_roster_query(db, organization_id=int(organization_id), role_scope=role_scope),
+            is_sister=role_scope.is_related,
+        )
+        if row.stale or row.as_stage_counts() != counts:
+            repaired += 1
+        _store_counts(
+            db,
+            role_id=role_id,
+            organization_id=int(organization_id),
+            counts=counts,
+            seen_version=int(row.version),
+        )
+    db.commit()
+    summary = {"checked": checked, "repaired": repaired, "removed": removed}
+    if repaired or removed:
+        logger.info("role_stage_counts reconcile %s", summary)
+    return summary
+
+
+__all__ = [
+    "live_stage_counts",
+    "open_roster_query",
+    "projected_stage_counts",
+    "reconcile_role_stage_counts",
+]
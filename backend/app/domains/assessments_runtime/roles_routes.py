@@ -3,6 +3,7 @@
 from fastapi import APIRouter
 
 from ...platform.config import settings
+from .application_cv_text_routes import router as application_cv_text_router
 from .applications_routes import router as applications_router
 from .interview_feedback_routes import router as interview_feedback_router
 from .roles_management_routes import router as roles_management_router
@@ -10,6 +11,8 @@ from .sister_role_routes import router as sister_role_router
 
 router = APIRouter(tags=["Roles"])
 router.include_router(roles_management_router)
+# Before applications_router: ``/applications/cv-text`` vs ``/applications/{id}``.
+router.include_router(application_cv_text_router)
 router.include_router(applications_router)
 router.include_router(interview_feedback_router)
 router.include_router(sister_role_router)
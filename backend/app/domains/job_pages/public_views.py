@@ -0,0 +1,363 @@
+"""Rendering + caching for the public job page and careers board.
+
+These are the highest-traffic unauthenticated endpoints: a syndicated job
+board can hit one page or board thousands of times in a few minutes. Each
+render used to cost several queries: the page, then brief → role and
+screening questions per view, and on the board a role resolution plus a
+workspace-pause lookup per listed page.
+
+- The board now resolves every page's role in ONE outer-joined query and
+  reads the workspace pause from the organization row it has already loaded.
+- Rendered payloads (the exact JSON bytes) are cached per process, keyed by
+  the org's public content version (``models.public_content_version``). The
+  version is bumped on commit of any page, brief, role, screening-question or
+  public organization change, so a cache hit costs one Redis GET and no SQL.
+  Without Redis nothing is cached.
+- Every response carries a strong ETag (hash of the body) and
+  ``Cache-Control: public, max-age=PUBLIC_CAREERS_CACHE_SECONDS``, and a
+  matching ``If-None-Match`` gets an empty 304.
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any
+
+from fastapi import HTTPException, Request, Response
+from sqlalchemy import and_
+from sqlalchemy.orm import Session
+
+from ...models.job_page import JOB_PAGE_STATUS_OPEN, JobPage
+from ...models.organization import Organization
+from ...models.public_content_version import public_content_version
+from ...models.role import Role
+from ...models.role_brief import RoleBrief
+from ...platform.config import settings
+from ...services.job_page_lifecycle import role_accepts_native_applications
+from .screening_service import list_role_questions
+
+_MAX_ENTRIES = 4096
+
+
+def _public_screening_questions(db: Session, org_id: int, role_id: int) -> list[dict]:
+    """Public-safe screening-question subset for the apply form. NEVER exposes
+    ``knockout`` / ``knockout_expected`` — the passing answer must not leak to
+    the applicant."""
+    return [
+        {
+            "id": q.id,
+            "prompt": q.prompt,
+            "kind": q.kind,
+            "options": q.options,
+            "required": q.required,
+        }
+        for q in list_role_questions(db, org_id, role_id)
+    ]
+
+
+def _resolve_role_for_page(db: Session, page: JobPage) -> Role | None:
+    """The materialized Role behind a published page: page → brief → role. A
+    published page always has a materialized role (publish runs after
+    ``materialize_brief_to_role``); returns None defensively if not."""
+    brief = (
+        db.query(RoleBrief).filter(RoleBrief.id == page.brief_id).first()
+        if page.brief_id is not None
+        else None
+    )
+    if brief is None or brief.role_id is None:
+        return None
+    return (
+        db.query(Role)
+        .filter(
+            Role.id == brief.role_id,
+            Role.organization_id == page.organization_id,
+        )
+        .first()
+    )
+
+
+def _role_accepts_public_applications(
+    role: Role | None,
+    *,
+    db: Session | None = None,
+) -> bool:
+    """Whether the materialized role is live for native public intake.
+
+    Requisition publish deliberately creates a DRAFT role; Turn on is the
+    explicit go-live transition.  The shared lifecycle policy also makes
+    Turn off/Pause and a non-live linked Workable job fail closed. It keys on
+    ``job_status`` rather than ``source`` because Workable adoption changes the
+    latter while retaining the same requisition page.
+    """
+    return role_accepts_native_applications(role, db=db)
+
+
+def _role_requires_resume(role: Role | None) -> bool:
+    """Resume policy for a public application.
+
+    A managed requisition always requires a readable CV whenever it is accepting
+    applications. Turn off/Pause now closes intake entirely, so no unscorable or
+    unexpectedly billable applications accumulate between agent runs. Preserve
+    the existing gate for any other agent-enabled role.
+    """
+    if role is None:
+        return False
+    return bool(
+        getattr(role, "source", None) == "requisition"
+        or getattr(role, "agentic_mode_enabled", False)
+    )
+
+
+def _job_page_url(token: str) -> str:
+    """Public job-page URL. ``/job/{token}`` relative when FRONTEND_URL is empty."""
+    base = (settings.FRONTEND_URL or "").rstrip("/")
+    return f"{base}/job/{token}" if base else f"/job/{token}"
+
+
+def format_salary_band(
+    salary_min: int | None,
+    salary_max: int | None,
+    currency: str | None,
+) -> str:
+    """Format a public-facing comp band, e.g. ``"AED 20,000–28,000 / year"``.
+
+    Currency defaults to AED (UAE-based org). Returns ``""`` when there is no
+    band at all (neither min nor max). A one-sided band renders the value it
+    has ("AED 20,000+ / year" for a floor only, "up to AED 28,000 / year" for
+    a ceiling only). Always per year (the only period the public page shows).
+    """
+    cur = (currency or "AED").strip() or "AED"
+    if salary_min and salary_max:
+        return f"{cur} {salary_min:,}–{salary_max:,} / year"
+    if salary_min:
+        return f"{cur} {salary_min:,}+ / year"
+    if salary_max:
+        return f"up to {cur} {salary_max:,} / year"
+    return ""
+
+
+# --------------------------------------------------------------------------- #
+# Rendered-payload cache
+# --------------------------------------------------------------------------- #
+
+
+@dataclass(frozen=True)
+class _Rendered:
+    organization_id: int
+    version: int | None
+    etag: str
+    body: bytes
+    rendered_at: float
+
+
+_rendered: OrderedDict[tuple[str, str], _Rendered] = OrderedDict()
+_lock = threading.Lock()
+
+
+def _cached(key: tuple[str, str]) -> _Rendered | None:
+    with _lock:
+        entry = _rendered.get(key)
+    if entry is None:
+        return None
+    expired = time.monotonic() - entry.rendered_at >= settings.PUBLIC_CAREERS_CACHE_SECONDS
+    if expired or public_content_version(entry.organization_id) != entry.version:
+        with _lock:
+            if _rendered.get(key) is entry:
+                del _rendered[key]
+        return None
+    with _lock:
+        if key in _rendered:
+            _rendered.move_to_end(key)
+    return entry
+
+
+def _store(
+    key: tuple[str, str], organization_id: int, version: int | None, payload: dict
+) -> _Rendered:
+    # Same serialization as FastAPI's JSONResponse, so the bytes (and the ETag
+    # computed over them) are exactly what the uncached path used to send.
+    body = json.dumps(payload, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+    entry = _Rendered(
+        organization_id=int(organization_id),
+        version=version,
+        etag=f'"{hashlib.sha256(body).hexdigest()[:32]}"',
+        body=body,
+        rendered_at=time.monotonic(),
+    )
+    if version is not None and settings.PUBLIC_CAREERS_CACHE_SECONDS > 0:
+        with _lock:
+            _rendered[key] = entry
+            _rendered.move_to_end(key)
+            while len(_rendered) > _MAX_ENTRIES:
+                _rendered.popitem(last=False)
+    return entry
+
+
+def _etag_matches(if_none_match: str | None, etag: str) -> bool:
+    for candidate in (if_none_match or "").split(","):
+        candidate = candidate.strip()
+        if candidate.startswith("W/"):
+            candidate = candidate[2:]
+        if candidate in ("*", etag):
+            return True
+    return False
+
+
+def _respond(request: Request, entry: _Rendered) -> Response:
+    max_age = max(0, int(settings.PUBLIC_CAREERS_CACHE_SECONDS))
+    headers = {"ETag": entry.etag, "Cache-Control": f"public, max-age={max_age}"}
+    if _etag_matches(request.headers.get("if-none-match"), entry.etag):
+        return Response(status_code=304, headers=headers)
+    return Response(content=entry.body, media_type="application/json", headers=headers)
+
+
+def reset_public_view_cache() -> None:
+    with _lock:
+        _rendered.clear()
+
+
+# --------------------------------------------------------------------------- #
+# Renderers
+# --------------------------------------------------------------------------- #
+
+
+def _render_job_page(db: Session, token: str) -> _Rendered:
+    page = db.query(JobPage).filter(JobPage.token == token).first()
+    # 404 for both "no such page" and a closed page — a closed listing should
+    # read as gone, not as "exists but unavailable".
+    if page is None or page.status != JOB_PAGE_STATUS_OPEN:
+        raise HTTPException(status_code=404, detail="Job not found")
+    # Read before the role/questions so a change committed mid-render leaves
+    # this entry already stale rather than cached under the newer version.
+    version = public_content_version(page.organization_id)
+
+    org = page.organization
+    # Public-safe screening questions (apply-form fields) + whether the page is
+    # actually taking applications. Both additive — a page renders unchanged when
+    # apply is off (empty questions, ``accepts_applications`` false).
+    role = _resolve_role_for_page(db, page)
+    screening_questions = (
+        _public_screening_questions(db, page.organization_id, role.id)
+        if role is not None
+        else []
+    )
+    accepts_applications = bool(
+        settings.ATS_PUBLIC_APPLY_ENABLED
+        and page.status == JOB_PAGE_STATUS_OPEN
+        and _role_accepts_public_applications(role, db=db)
+    )
+    resume_required = bool(
+        accepts_applications
+        and _role_requires_resume(role)
+    )
+    payload = {
+        "title": page.title,
+        "jd_markdown": page.jd_markdown,
+        "location": page.location,
+        "workplace_type": page.workplace_type,
+        "employment_type": page.employment_type,
+        "seniority": page.seniority,
+        "salary_min": page.salary_min,
+        "salary_max": page.salary_max,
+        "salary_currency": page.salary_currency,
+        "status": page.status,
+        "organization_name": org.name if org else None,
+        "accepts_applications": accepts_applications,
+        "resume_required": resume_required,
+        "screening_questions": screening_questions,
+    }
+    return _store(("job", token), page.organization_id, version, payload)
+
+
+def _open_pages_with_roles(db: Session, org: Organization) -> list[tuple[JobPage, Role | None]]:
+    """Every OPEN page of the org with its materialized role, newest first —
+    one query (page → brief → role, outer-joined) for the whole board."""
+    return (
+        db.query(JobPage, Role)
+        .outerjoin(RoleBrief, RoleBrief.id == JobPage.brief_id)
+        .outerjoin(
+            Role,
+            and_(
+                Role.id == RoleBrief.role_id,
+                Role.organization_id == JobPage.organization_id,
+            ),
+        )
+        .filter(
+            JobPage.organization_id == org.id,
+            JobPage.status == JOB_PAGE_STATUS_OPEN,
+        )
+        .order_by(JobPage.published_at.desc(), JobPage.id.desc())
+        .all()
+    )
+
+
+def _render_careers_board(db: Session, slug: str) -> _Rendered:
+    org = (
+        db.query(Organization).filter(Organization.slug == slug).first()
+        if slug
+        else None
+    )
+    if org is None:
+        raise HTTPException(status_code=404, detail="Careers page not found")
+    version = public_content_version(org.id)
+
+    # Publishing creates a previewable page while the requisition Role remains
+    # DRAFT. Keep previews reachable by direct token, but do not advertise them
+    # on the public board until the durable Turn-on workflow makes the role OPEN
+    # with an enabled, unpaused agent. Every listed role belongs to this org, so
+    # its workspace pause is read once from the row already loaded (equivalent
+    # to the per-role check ``role_accepts_native_applications(db=...)`` does).
+    pages: list[JobPage] = []
+    if settings.ATS_PUBLIC_APPLY_ENABLED and org.agent_workspace_paused_at is None:
+        pages = [
+            page
+            for page, role in _open_pages_with_roles(db, org)
+            if _role_accepts_public_applications(role)
+        ]
+
+    payload: dict[str, Any] = {
+        "organization_name": org.name,
+        "slug": org.slug,
+        "jobs": [
+            {
+                "token": page.token,
+                "url": _job_page_url(page.token),
+                "title": page.title,
+                "location": page.location,
+                "workplace_type": page.workplace_type,
+                "employment_type": page.employment_type,
+                "seniority": page.seniority,
+                "salary": format_salary_band(
+                    page.salary_min, page.salary_max, page.salary_currency
+                ),
+                "published_at": page.published_at.isoformat()
+                if page.published_at
+                else None,
+            }
+            for page in pages
+        ],
+    }
+    return _store(("careers", slug), org.id, version, payload)
+
+
+def job_page_response(request: Request, db: Session, token: str) -> Response:
+    entry = _cached(("job", token)) or _render_job_page(db, token)
+    return _respond(request, entry)
+
+
+def careers_board_response(request: Request, db: Session, slug: str) -> Response:
+    slug = (slug or "").strip()
+    entry = _cached(("careers", slug)) or _render_careers_board(db, slug)
+    return _respond(request, entry)
+
+
+__all__ = [
+    "careers_board_response",
+    "format_salary_band",
+    "job_page_response",
+    "reset_public_view_cache",
+]
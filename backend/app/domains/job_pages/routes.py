@@ -24,14 +24,11 @@ from ...deps import get_optional_current_user
 from ...cv_parsing.origins import CV_PARSE_ORIGIN_NATIVE_APPLY
 from ...models.candidate_application import CandidateApplication
 from ...models.job_page import JOB_PAGE_STATUS_OPEN, JobPage
-from ...models.organization import Organization
-from ...models.role import Role
-from ...models.role_brief import RoleBrief
 from ...models.user import User
 from ...platform.config import settings
 from ...platform.database import get_db
 from ...services.rate_limit import check_rate_limit
-from ...services.job_page_lifecycle import lock_native_intake_authority, role_accepts_native_applications
+from ...services.job_page_lifecycle import lock_native_intake_authority
 from .apply_service import submit_application
 from .public_apply_support import (
     APPLY_EMAIL_REQUIRED_MESSAGE as _APPLY_EMAIL_REQUIRED_MESSAGE,
@@ -41,7 +38,13 @@ from .public_apply_support import (
     role_requires_email as _role_requires_email,
     usable_email as _usable_email,
 )
-from .screening_service import list_role_questions
+from .public_views import (
+    _resolve_role_for_page,
+    _role_accepts_public_applications,
+    _role_requires_resume,
+    careers_board_response,
+    job_page_response,
+)
 
 public_router = APIRouter(prefix="/api/v1/public", tags=["Job pages"])
 
@@ -51,155 +54,22 @@ _APPLY_RECEIVED_MESSAGE = "Thanks for applying — we've received your applicati
 _APPLY_CLOSED_MESSAGE = "This job isn't accepting applications right now."
 
 
-def _public_screening_questions(db: Session, org_id: int, role_id: int) -> list[dict]:
-    """Public-safe screening-question subset for the apply form. NEVER exposes
-    ``knockout`` / ``knockout_expected`` — the passing answer must not leak to
-    the applicant."""
-    return [
-        {
-            "id": q.id,
-            "prompt": q.prompt,
-            "kind": q.kind,
-            "options": q.options,
-            "required": q.required,
-        }
-        for q in list_role_questions(db, org_id, role_id)
-    ]
-
-
-def _resolve_role_for_page(db: Session, page: JobPage) -> Role | None:
-    """The materialized Role behind a published page: page → brief → role. A
-    published page always has a materialized role (publish runs after
-    ``materialize_brief_to_role``); returns None defensively if not."""
-    brief = (
-        db.query(RoleBrief).filter(RoleBrief.id == page.brief_id).first()
-        if page.brief_id is not None
-        else None
-    )
-    if brief is None or brief.role_id is None:
-        return None
-    return (
-        db.query(Role)
-        .filter(
-            Role.id == brief.role_id,
-            Role.organization_id == page.organization_id,
-        )
-        .first()
-    )
-
-
-def _role_accepts_public_applications(
-    role: Role | None,
-    *,
-    db: Session | None = None,
-) -> bool:
-    """Whether the materialized role is live for native public intake.
-
-    Requisition publish deliberately creates a DRAFT role; Turn on is the
-    explicit go-live transition.  The shared lifecycle policy also makes
-    Turn off/Pause and a non-live linked Workable job fail closed. It keys on
-    ``job_status`` rather than ``source`` because Workable adoption changes the
-    latter while retaining the same requisition page.
-    """
-    return role_accepts_native_applications(role, db=db)
-
-
-def _role_requires_resume(role: Role | None) -> bool:
-    """Resume policy for a public application.
-
-    A managed requisition always requires a readable CV whenever it is accepting
-    applications. Turn off/Pause now closes intake entirely, so no unscorable or
-    unexpectedly billable applications accumulate between agent runs. Preserve
-    the existing gate for any other agent-enabled role.
-    """
-    if role is None:
-        return False
-    return bool(
-        getattr(role, "source", None) == "requisition"
-        or getattr(role, "agentic_mode_enabled", False)
-    )
-
-
-def _job_page_url(token: str) -> str:
-    """Public job-page URL. ``/job/{token}`` relative when FRONTEND_URL is empty."""
-    base = (settings.FRONTEND_URL or "").rstrip("/")
-    return f"{base}/job/{token}" if base else f"/job/{token}"
-
-
-def format_salary_band(
-    salary_min: int | None,
-    salary_max: int | None,
-    currency: str | None,
-) -> str:
-    """Format a public-facing comp band, e.g. ``"AED 20,000–28,000 / year"``.
-
-    Currency defaults to AED (UAE-based org). Returns ``""`` when there is no
-    band at all (neither min nor max). A one-sided band renders the value it
-    has ("AED 20,000+ / year" for a floor only, "up to AED 28,000 / year" for
-    a ceiling only). Always per year (the only period the public page shows).
-    """
-    cur = (currency or "AED").strip() or "AED"
-    if salary_min and salary_max:
-        return f"{cur} {salary_min:,}–{salary_max:,} / year"
-    if salary_min:
-        return f"{cur} {salary_min:,}+ / year"
-    if salary_max:
-        return f"up to {cur} {salary_max:,} / year"
-    return ""
-
-
 @public_router.get("/job/{token}")
 def view_job_page(
     token: str,
+    request: Request,
     db: Session = Depends(get_db),
     _user: User | None = Depends(get_optional_current_user),
 ):
-    page = db.query(JobPage).filter(JobPage.token == token).first()
-    # 404 for both "no such page" and a closed page — a closed listing should
-    # read as gone, not as "exists but unavailable".
-    if page is None or page.status != JOB_PAGE_STATUS_OPEN:
-        raise HTTPException(status_code=404, detail="Job not found")
-
-    org = page.organization
-    # Public-safe screening questions (apply-form fields) + whether the page is
-    # actually taking applications. Both additive — a page renders unchanged when
-    # apply is off (empty questions, ``accepts_applications`` false).
-    role = _resolve_role_for_page(db, page)
-    screening_questions = (
-        _public_screening_questions(db, page.organization_id, role.id)
-        if role is not None
-        else []
-    )
-    accepts_applications = bool(
-        settings.ATS_PUBLIC_APPLY_ENABLED
-        and page.status == JOB_PAGE_STATUS_OPEN
-        and _role_accepts_public_applications(role, db=db)
-    )
-    resume_required = bool(
-        accepts_applications
-        and _role_requires_resume(role)
-    )
-    return {
-        "title": page.title,
-        "jd_markdown": page.jd_markdown,
-        "location": page.location,
-        "workplace_type": page.workplace_type,
-        "employment_type": page.employment_type,
-        "seniority": page.seniority,
-        "salary_min": page.salary_min,
-        "salary_max": page.salary_max,
-        "salary_currency": page.salary_currency,
-        "status": page.status,
-        "organization_name": org.name if org else None,
-        "accepts_applications": accepts_applications,
-        "resume_required": resume_required,
-        "screening_questions": screening_questions,
-    }
+    """A single published page (404 when unknown or closed). Cached and
+    ETag'd per org content version — see ``public_views``."""
+    return job_page_response(request, db, token)
 
 
 @public_router.get("/careers/{slug}")
 def view_careers_board(
     slug: str,
+    request: Request,
     db: Session = Depends(get_db),
     _user: User | None = Depends(get_optional_current_user),
 ):
@@ -212,63 +82,7 @@ def view_careers_board(
     Each job carries only the public-safe snapshot (title / location / comp
     band / type) — NEVER any client / rate / margin. Newest first.
     """
-    slug = (slug or "").strip()
-    org = (
-        db.query(Organization).filter(Organization.slug == slug).first()
-        if slug
-        else None
-    )
-    if org is None:
-        raise HTTPException(status_code=404, detail="Careers page not found")
-
-    pages = (
-        db.query(JobPage)
-        .filter(
-            JobPage.organization_id == org.id,
-            JobPage.status == JOB_PAGE_STATUS_OPEN,
-        )
-        .order_by(JobPage.published_at.desc(), JobPage.id.desc())
-        .all()
-    )
-    # Publishing creates a previewable page while the requisition Role remains
-    # DRAFT. Keep previews reachable by direct token, but do not advertise them
-    # on the public board until the durable Turn-on workflow makes the role OPEN
-    # with an enabled, unpaused agent.
-    pages = (
-        [
-            page
-            for page in pages
-            if _role_accepts_public_applications(
-                _resolve_role_for_page(db, page),
-                db=db,
-            )
-        ]
-        if settings.ATS_PUBLIC_APPLY_ENABLED
-        else []
-    )
-
-    return {
-        "organization_name": org.name,
-        "slug": org.slug,
-        "jobs": [
-            {
-                "token": page.token,
-                "url": _job_page_url(page.token),
-                "title": page.title,
-                "location": page.location,
-                "workplace_type": page.workplace_type,
-                "employment_type": page.employment_type,
-                "seniority": page.seniority,
-                "salary": format_salary_band(
-                    page.salary_min, page.salary_max, page.salary_currency
-                ),
-                "published_at": page.published_at.isoformat()
-                if page.published_at
-                else None,
-            }
-            for page in pages
-        ],
-    }
+    return careers_board_response(request, db, slug)
 
 
 # --------------------------------------------------------------------------- #
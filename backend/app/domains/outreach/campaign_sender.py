@@ -0,0 +1,100 @@
+"""Outreach campaign send engine — concurrent, rate-shaped provider calls.
+
+``send_campaign_messages`` used to send one message, commit, then sleep half a
+second, so provider latency and the sleep were paid serially per recipient.
+``deliver`` instead runs the provider calls on a small thread pool behind one
+token bucket shaped to the provider's request limit (Resend: ~2 req/s by
+default, see ``OUTREACH_SEND_RATE_PER_SECOND``) and yields results as they
+land. Workers only call the provider; every status write stays on the caller's
+thread and session, committed in batches.
+
+Each send carries an idempotency key derived from the message id, so a task
+redelivered after a worker restart (``task_acks_late``) re-sends the rows it
+had not yet committed as ``sent`` without the provider delivering them twice.
+"""
+from __future__ import annotations
+
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextvars import copy_context
+from dataclasses import dataclass, field
+from typing import Any, Callable, Iterable, Iterator
+
+from ...platform.token_bucket import TokenBucket
+
+
+@dataclass(frozen=True)
+class OutreachSend:
+    """One rendered message, ready for ``EmailService.send_outreach_email``."""
+
+    message_id: int
+    email_kwargs: dict[str, Any]
+
+    @property
+    def idempotency_key(self) -> str:
+        return f"outreach-message-{self.message_id}"
+
+
+@dataclass
+class SendThroughput:
+    """Counters + wall time for one send run (returned by the task)."""
+
+    sent: int = 0
+    failed: int = 0
+    suppressed: int = 0
+    started_at: float = field(default_factory=time.monotonic)
+
+    def as_dict(self) -> dict[str, Any]:
+        elapsed = max(time.monotonic() - self.started_at, 1e-9)
+        attempted = self.sent + self.failed
+        return {
+            "sent": self.sent,
+            "suppressed": self.suppressed,
+            "failed": self.failed,
+            "elapsed_seconds": round(elapsed, 3),
+            "sends_per_second": round(attempted / elapsed, 2),
+        }
+
+
+def deliver(
+    sends: Iterable[OutreachSend],
+    *,
+    send_one: Callable[..., dict],
+    rate_per_second: float,
+    burst: int,
+    concurrency: int,
+    bucket: TokenBucket | None = None,
+) -> Iterator[tuple[OutreachSend, dict]]:
+    """Send concurrently under a token bucket; yield ``(send, result)``.
+
+    ``send_one(**email_kwargs, idempotency_key=...)`` returns the
+    ``{"success": ..., ...}`` dict of ``send_outreach_email``. An exception is
+    isolated to its message as a failure result. Results arrive in completion
+    order. ``bucket`` overrides the one built from ``rate_per_second`` and
+    ``burst`` (tests inject a fake clock).
+    """
+    pending = list(sends)
+    if not pending:
+        return
+    if bucket is None:
+        bucket = TokenBucket(rate_per_second, burst)
+
+    def _send(send: OutreachSend) -> dict:
+        bucket.acquire()
+        try:
+            return send_one(**send.email_kwargs, idempotency_key=send.idempotency_key)
+        except Exception as exc:  # noqa: BLE001 — isolate this message
+            return {"success": False, "error": str(exc)}
+
+    workers = max(1, min(int(concurrency), len(pending)))
+    with ThreadPoolExecutor(
+        max_workers=workers, thread_name_prefix="outreach-send"
+    ) as pool:
+        futures = {
+            pool.submit(copy_context().run, _send, send): send for send in pending
+        }
+        for future in as_completed(futures):
+            yield futures[future], future.result()
+
+
+__all__ = ["OutreachSend", "SendThroughput", "deliver"]
@@ -0,0 +1,292 @@
+"""Outreach campaign drafts via the Anthropic Message Batches API.
+
+A recruiter who queues a few hundred recipients doesn't need the drafts
+within seconds. Campaigns at or above ``OUTREACH_DRAFT_BATCH_MIN_RECIPIENTS``
+pending messages are submitted as ONE batch (a campaign is single-org by
+construction) at 50% of live pricing. The requests use the same model, cached
+campaign prefix, per-recipient prompt and forced tool-use schema as the live
+path, so a batch draft is indistinguishable from a live one.
+
+* :func:`submit_draft_batch` — holds one OUTREACH_DRAFT estimate per request,
+  then submits. Any refusal or submit failure releases every hold and returns
+  None, and the caller drafts live instead. A campaign never stalls because a
+  batch could not be placed.
+* :func:`apply_draft_batch_results` — for an ended batch (polled by
+  ``tasks.anthropic_batch_tasks.poll_outreach_draft_batches``), writes each
+  succeeded draft through the same rails as the live path, fails the rest, and
+  flips a campaign to ready once none of its messages are still drafting.
+
+Metering is handled by ``MeteredAnthropicClient`` (batch tier), exactly as for
+the cv_parse and holistic-score batches.
+"""
+from __future__ import annotations
+
+import logging
+import uuid
+from typing import Any, Optional
+
+from ...llm import (
+    ValidationFailure,
+    extract_structured_tool_input,
+    structured_tool_params,
+)
+from .draft_pipeline import DRAFT_MAX_TOKENS, DRAFT_TEMPERATURE, DraftOutput
+
+logger = logging.getLogger("taali.outreach.draft_batch")
+
+CUSTOM_ID_PREFIX = "outreach-draft"
+BATCH_FEATURE = "outreach_draft"
+
+
+def custom_id_for(message_id: int) -> str:
+    return f"{CUSTOM_ID_PREFIX}-{int(message_id)}"
+
+
+def message_id_from(custom_id: str) -> Optional[int]:
+    prefix = f"{CUSTOM_ID_PREFIX}-"
+    if not (custom_id or "").startswith(prefix):
+        return None
+    try:
+        return int(custom_id[len(prefix):])
+    except ValueError:
+        return None
+
+
+def build_draft_request(
+    message_id: int, *, model: str, system: list[dict], prompt: str
+) -> dict:
+    """One batch request with params identical to the live forced-tool call."""
+    tools, tool_choice, _ = structured_tool_params(DraftOutput)
+    return {
+        "custom_id": custom_id_for(message_id),
+        "params": {
+            "model": model,
+            "max_tokens": DRAFT_MAX_TOKENS,
+            "temperature": DRAFT_TEMPERATURE,
+            "system": system,
+            "messages": [{"role": "user", "content": prompt}],
+            "tools": tools,
+            "tool_choice": tool_choice,
+        },
+    }
+
+
+def in_flight_message_ids(db: Any) -> set[int]:
+    """Message ids sitting in an open outreach-draft batch. The live path
+    skips them when it resumes a campaign's ``drafting`` rows."""
+    from ...models.anthropic_batch_job import AnthropicBatchJob
+
+    ids: set[int] = set()
+    rows = (
+        db.query(AnthropicBatchJob)
+        .filter(
+            AnthropicBatchJob.feature == BATCH_FEATURE,
+            AnthropicBatchJob.status == "submitted",
+        )
+        .all()
+    )
+    for row in rows:
+        for custom_id in (row.context or {}):
+            message_id = message_id_from(custom_id)
+            if message_id is not None:
+                ids.add(message_id)
+    return ids
+
+
+def submit_draft_batch(
+    campaign: Any,
+    jobs: list[tuple[int, str]],
+    *,
+    client: Any,
+    model: str,
+    system: list[dict],
+) -> Optional[str]:
+    """Submit ``(message_id, prompt)`` jobs as one batch; return its id.
+
+    Returns None (with every hold released) when the campaign has no role to
+    budget against, any request is refused admission, or the submit fails.
+    The caller commits its own state afterwards.
+    """
+    from ...platform.database import SessionLocal
+    from ...services.pricing_service import Feature
+    from ...services.usage_credit_reservations import (
+        InsufficientRoleBudgetError,
+        release_credit_reservation,
+        reserve_credits,
+    )
+    from ...services.usage_metering_service import InsufficientCreditsError
+
+    if campaign.role_id is None or not jobs:
+        return None
+    org_id = int(campaign.organization_id)
+    role_id = int(campaign.role_id)
+    requests = [
+        build_draft_request(message_id, model=model, system=system, prompt=prompt)
+        for message_id, prompt in jobs
+    ]
+
+    def _release(reservations: dict[str, Any], reason: str) -> None:
+        release_db = SessionLocal()
+        try:
+            for reservation in reservations.values():
+                release_credit_reservation(
+                    release_db, reservation=reservation, reason=reason
+                )
+            release_db.commit()
+        except Exception:
+            release_db.rollback()
+            logger.exception(
+                "outreach draft batch reservation release failed campaign=%s",
+                campaign.id,
+            )
+        finally:
+            release_db.close()
+
+    reservations: dict[str, Any] = {}
+    meter_db = SessionLocal()
+    try:
+        for request in requests:
+            custom_id = request["custom_id"]
+            reservations[custom_id] = reserve_credits(
+                meter_db,
+                organization_id=org_id,
+                feature=Feature.OUTREACH_DRAFT,
+                external_ref=(
+                    f"usage-hold:outreach-draft-batch:{custom_id}:{uuid.uuid4().hex}"
+                ),
+                metadata={
+                    "sub_feature": "outreach_draft_batch",
+                    "role_id": role_id,
+                    "entity_id": f"outreach_msg:{message_id_from(custom_id)}",
+                    "custom_id": custom_id,
+                },
+                role_id=role_id,
+                enforce_role_budget=True,
+            )
+        meter_db.commit()
+    except (InsufficientCreditsError, InsufficientRoleBudgetError):
+        # Partial admission: hand the whole campaign to the live path, which
+        # admits (and fails) message by message.
+        meter_db.rollback()
+        return None
+    except Exception:
+        meter_db.rollback()
+        logger.exception(
+            "outreach draft batch admission failed campaign=%s", campaign.id
+        )
+        return None
+    finally:
+        meter_db.close()
+
+    by_custom_id = {
+        request["custom_id"]: {
+            "organization_id": org_id,
+            "role_id": role_id,
+            "entity_id": f"outreach_msg:{message_id_from(request['custom_id'])}",
+            "campaign_id": int(campaign.id),
+            "credit_reservation": reservations[request["custom_id"]].as_metering_payload(),
+        }
+        for request in requests
+    }
+    try:
+        batch = client.messages.batches.create(
+            requests=requests,
+            metering={
+                "feature": Feature.OUTREACH_DRAFT,
+                "organization_id": org_id,
+                "by_custom_id": by_custom_id,
+            },
+        )
+    except Exception:
+        _release(reservations, "outreach_draft_batch_submit_failed")
+        logger.exception(
+            "outreach draft batch submission failed campaign=%s (%d requests)",
+            campaign.id,
+            len(requests),
+        )
+        return None
+    batch_id = str(getattr(batch, "id", "") or "")
+    logger.info(
+        "outreach draft batch submitted campaign=%s batch_id=%s requests=%d",
+        campaign.id,
+        batch_id,
+        len(requests),
+    )
+    return batch_id
+
+
+def apply_draft_batch_results(
+    db: Any, entries: Any, context: Optional[dict] = None
+) -> dict:
+    """Apply one ended batch's results to its campaign's messages.
+
+    Only rows still ``drafting`` are touched. Errored/expired/canceled entries
+    and schema failures mark the message failed, as a live failure would; the
+    recruiter can regenerate it. The caller commits.
+    """
+    from ...models.outreach_campaign import (
+        CAMPAIGN_STATUS_READY,
+        MESSAGE_STATUS_DRAFTING,
+        MESSAGE_STATUS_FAILED,
+        OutreachCampaign,
+        OutreachMessage,
+    )
+    from .campaign_service import compute_counts
+    from .draft_pipeline import apply_draft
+
+    _, _, tool_name = structured_tool_params(DraftOutput)
+    summary = {"drafted": 0, "failed": 0, "skipped": 0}
+    campaign_ids: set[int] = set()
+
+    for entry in entries:
+        message_id = message_id_from(str(getattr(entry, "custom_id", "")))
+        message = db.get(OutreachMessage, message_id) if message_id is not None else None
+        if message is None or message.status != MESSAGE_STATUS_DRAFTING:
+            summary["skipped"] += 1
+            continue
+        campaign_ids.add(int(message.campaign_id))
+        result = getattr(entry, "result", None)
+        if getattr(result, "type", None) != "succeeded":
+            message.status = MESSAGE_STATUS_FAILED
+            message.error = f"batch_{getattr(result, 'type', None) or 'failed'}"
+            summary["failed"] += 1
+            continue
+        try:
+            value = extract_structured_tool_input(
+                result.message, DraftOutput, tool_name=tool_name
+            )
+        except ValidationFailure as exc:
+            message.status = MESSAGE_STATUS_FAILED
+            message.error = str(exc)[:500]
+            summary["failed"] += 1
+            continue
+        apply_draft(message, value)
+        summary["drafted"] += 1
+
+    db.flush()
+    for campaign_id in campaign_ids:
+        still_drafting = (
+            db.query(OutreachMessage.id)
+            .filter(
+                OutreachMessage.campaign_id == campaign_id,
+                OutreachMessage.status == MESSAGE_STATUS_DRAFTING,
+            )
+            .first()
+        )
+        campaign = db.get(OutreachCampaign, campaign_id)
+        if campaign is None:
+            continue
+        if still_drafting is None:
+            campaign.status = CAMPAIGN_STATUS_READY
+        campaign.counts = compute_counts(db, campaign_id)
+    return summary
+
+
+__all__ = [
+    "apply_draft_batch_results",
+    "build_draft_request",
+    "custom_id_for",
+    "in_flight_message_ids",
+    "message_id_from",
+    "submit_draft_batch",
+]
@@ -24,6 +24,7 @@ from ...models.candidate import Candidate
 from ...models.candidate_application import CandidateApplication
 from ...models.organization import Organization
 from ...models.role import Role
+from ...models.role_stage_count import mark_org_role_stage_counts_stale_on_commit
 from ...models.user import User
 from ...models.workable_sync_run import WorkableSyncRun
 from ...platform.admin_auth import require_admin_secret
@@ -1083,6 +1084,8 @@ def clear_workable_data(
         )
         if was_live:
             roles_updated += 1
+    # The bulk UPDATEs below bypass the ORM stage-count hooks.
+    mark_org_role_stage_counts_stale_on_commit(db, org_id)
     apps_updated = (
         db.query(CandidateApplication)
         .filter(
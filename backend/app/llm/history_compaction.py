@@ -0,0 +1,146 @@
+"""Compact and cache-mark replayed chat history.
+
+Both chat engines replay the stored transcript on every turn, including every
+earlier tool result — candidate lists, CV excerpts, pipeline dumps — so input
+tokens grow with the length of the conversation rather than the question.
+
+``compact_settled_tool_results`` shortens tool results from turns that are
+``keep_recent_turns`` or more recruiter messages old. The rewrite is a pure
+function of the block and idempotent, so a compacted turn renders byte-for-byte
+the same on every later replay and stays inside a cached prompt prefix.
+``with_cache_breakpoints`` marks stable history positions with
+``cache_control`` on in-memory copies; stored rows are never touched.
+"""
+
+from __future__ import annotations
+
+import json
+from typing import Any, Iterable
+
+# Tool output kept verbatim from a settled turn (~1k tokens).
+COMPACTED_TOOL_RESULT_CHARS = 4000
+KEEP_RECENT_TURNS = 2
+
+_COMPACTED_TAG = "[compacted from an earlier turn"
+
+
+def is_user_text_message(message: dict[str, Any]) -> bool:
+    """True for a recruiter message (not a tool_result carrier turn)."""
+
+    if message.get("role") != "user":
+        return False
+    content = message.get("content")
+    if isinstance(content, str):
+        return True
+    return any(
+        isinstance(block, dict) and block.get("type") == "text"
+        for block in (content or [])
+    )
+
+
+def settled_boundary(
+    messages: list[dict[str, Any]], *, keep_recent_turns: int = KEEP_RECENT_TURNS
+) -> int:
+    """Index of the first message of the ``keep_recent_turns`` latest turns."""
+
+    if keep_recent_turns <= 0:
+        return len(messages)
+    seen = 0
+    for index in range(len(messages) - 1, -1, -1):
+        if is_user_text_message(messages[index]):
+            seen += 1
+            if seen >= keep_recent_turns:
+                return index
+    return 0
+
+
+def _compact_text(text: str, max_chars: int) -> str:
+    if len(text) <= max_chars or _COMPACTED_TAG in text[max_chars:]:
+        return text
+    omitted = len(text) - max_chars
+    return (
+        f"{text[:max_chars]}\n{_COMPACTED_TAG}: {omitted} more characters "
+        "omitted; call the tool again if the full result is needed]"
+    )
+
+
+def compact_tool_result(block: dict[str, Any], *, max_chars: int) -> dict[str, Any]:
+    content = block.get("content")
+    if isinstance(content, str):
+        compacted = _compact_text(content, max_chars)
+        return block if compacted is content else {**block, "content": compacted}
+    if isinstance(content, list):
+        parts = [
+            {**part, "text": _compact_text(str(part.get("text") or ""), max_chars)}
+            if isinstance(part, dict) and part.get("type") == "text"
+            else part
+            for part in content
+        ]
+        return {**block, "content": parts}
+    return block
+
+
+def compact_settled_tool_results(
+    messages: list[dict[str, Any]],
+    *,
+    keep_recent_turns: int = KEEP_RECENT_TURNS,
+    max_chars: int = COMPACTED_TOOL_RESULT_CHARS,
+) -> list[dict[str, Any]]:
+    """Shorten tool results older than the ``keep_recent_turns`` latest turns."""
+
+    boundary = settled_boundary(messages, keep_recent_turns=keep_recent_turns)
+    out: list[dict[str, Any]] = []
+    for index, message in enumerate(messages):
+        content = message.get("content")
+        if index >= boundary or not isinstance(content, list):
+            out.append(message)
+            continue
+        out.append(
+            {
+                **message,
+                "content": [
+                    compact_tool_result(block, max_chars=max_chars)
+                    if isinstance(block, dict) and block.get("type") == "tool_result"
+                    else block
+                    for block in content
+                ],
+            }
+        )
+    return out
+
+
+def with_cache_breakpoints(
+    messages: list[dict[str, Any]], indexes: Iterable[int]
+) -> list[dict[str, Any]]:
+    """Copy of ``messages`` with ``cache_control`` on each indexed message."""
+
+    out = list(messages)
+    for index in sorted({i for i in indexes if 0 <= i < len(out)}):
+        message = out[index]
+        content = message.get("content")
+        if isinstance(content, str):
+            content = [{"type": "text", "text": content}]
+        if not isinstance(content, list) or not content or not isinstance(content[-1], dict):
+            continue
+        last = {**content[-1], "cache_control": {"type": "ephemeral"}}
+        out[index] = {**message, "content": [*content[:-1], last]}
+    return out
+
+
+def estimate_tokens(value: Any) -> int:
+    """Rough (~4 chars/token) size of a JSON-like payload, for accounting."""
+
+    encoded = json.dumps(value, default=str, ensure_ascii=False, separators=(",", ":"))
+    return len(encoded) // 4
+
+
+__all__ = [
+    "COMPACTED_TOOL_RESULT_CHARS",
+    "KEEP_RECENT_TURNS",
+    "compact_settled_tool_results",
+    "compact_tool_result",
+    "estimate_tokens",
+    "is_user_text_message",
+    "settled_boundary",
+    "with_cache_breakpoints",
+]
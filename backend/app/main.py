@@ -14,7 +14,8 @@ from .platform.admin_auth import require_admin_secret
 from .platform.brand import BRAND_APP_DESCRIPTION, BRAND_NAME
 from .platform.config import settings
 from .platform.logging import setup_logging
-from .platform.middleware import EnterpriseAccessMiddleware, RateLimitMiddleware, RequestLoggingMiddleware, SecurityHeadersMiddleware, is_candidate_assessment_path, redact_sensitive_request_path, scrub_sentry_candidate_request as _scrub_sentry_candidate_request  # noqa: E501
+from .platform.middleware import EnterpriseAccessMiddleware, RateLimitMiddleware, SecurityHeadersMiddleware, is_candidate_assessment_path, redact_sensitive_request_path, scrub_sentry_candidate_request as _scrub_sentry_candidate_request  # noqa: E501
+from .platform.observability import install_request_observability, metrics_router, shutdown_observability
 from .platform.release import runtime_release_sha
 from .platform.startup_validation import collect_startup_failures, is_production_like
 from .services.task_catalog_startup import sync_canonical_task_specs_on_startup
@@ -104,6 +105,7 @@ async def _lifespan(_app: FastAPI):
         close()
     except Exception:  # pragma: no cover — defensive
         logger.exception("Failed to close Graphiti on shutdown")
+    shutdown_observability()
 
 
 app = FastAPI(
@@ -260,8 +262,8 @@ app.add_middleware(RateLimitMiddleware)
 # Enterprise access controls (SSO enforcement on password-auth endpoints)
 app.add_middleware(EnterpriseAccessMiddleware)
 
-# Request logging
-app.add_middleware(RequestLoggingMiddleware)
+# Request logging and metrics, with opt-in SQL profiling (SQL_PROFILING_ENABLED)
+install_request_observability(app, production=_is_production)
 
 
 # Sentry (optional)
@@ -647,6 +649,9 @@ def readiness_check():
     )
 
 
+app.include_router(metrics_router)
+
+
 @app.get("/healthz/graphiti")
 def graphiti_health():
     """Per-component health probe used by the Railway setup verification step.
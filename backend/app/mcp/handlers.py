@@ -12,8 +12,9 @@ Org-scoping is enforced inside every handler via ``user.organization_id``.
 from __future__ import annotations
 
 import logging
+import time
 from datetime import datetime, timezone
-from typing import Any, Iterable
+from typing import Any, Callable, Iterable
 
 from sqlalchemy import and_, func, or_
 from sqlalchemy.orm import Session, joinedload
@@ -230,6 +231,45 @@ def _stage_counts_for_role(
     return counts
 
 
+# MCP clients poll list_roles; stage counts for an unchanged role set are
+# served from a short per-org memo instead of re-running the grouped query.
+_STAGE_COUNTS_MEMO_TTL_SECONDS = 15.0
+_stage_counts_memo: dict[int, tuple[float, tuple[int, ...], dict[int, dict[str, int]]]] = {}
+
+
+def _stage_counts_for_roles(
+    db: Session,
+    *,
+    organization_id: int,
+    selection: Any,
+    role_ids: list[int],
+    memoize: bool = False,
+) -> dict[int, dict[str, int]]:
+    """Zero-filled open stage counts for every role, from one grouped query."""
+    key = tuple(sorted(int(role_id) for role_id in role_ids))
+    cached = _stage_counts_memo.get(int(organization_id)) if memoize else None
+    if (
+        cached is not None
+        and cached[1] == key
+        and time.monotonic() - cached[0] < _STAGE_COUNTS_MEMO_TTL_SECONDS
+    ):
+        return cached[2]
+    grouped = selection.open_stage_counts(db)
+    counts: dict[int, dict[str, int]] = {}
+    for role_id in key:
+        role_counts = {stage: 0 for stage in PIPELINE_STAGES}
+        role_counts.update(grouped.get(role_id, {}))
+        counts[role_id] = role_counts
+    if memoize:
+        _stage_counts_memo[int(organization_id)] = (time.monotonic(), key, counts)
+    return counts
+
+
+def reset_stage_counts_memo() -> None:
+    """Test helper: drop memoized list_roles stage counts."""
+    _stage_counts_memo.clear()
+
+
 def _applications_count(
     db: Session,
     *,
@@ -347,6 +387,7 @@ def list_roles(
     user: User,
     *,
     include_stage_counts: bool = False,
+    memoize_stage_counts: bool = False,
 ) -> list[dict[str, Any]]:
     roles = (
         db.query(Role)
@@ -379,26 +420,27 @@ def list_roles(
         .group_by(logical_role_id)
         .all()
     }
-    out: list[dict[str, Any]] = []
-    for role in roles:
-        stage_counts = (
-            _stage_counts_for_role(
-                db,
-                organization_id=user.organization_id,
-                role_id=role.id,
-                role=role,
-            )
-            if include_stage_counts
-            else None
-        )
-        out.append(
-            role_summary(
-                role,
-                applications_count=counts.get(int(role.id), 0),
-                stage_counts=stage_counts,
-            )
+    stage_counts = (
+        _stage_counts_for_roles(
+            db,
+            organization_id=int(user.organization_id),
+            selection=logical_selection,
+            role_ids=[int(role.id) for role in roles],
+            memoize=memoize_stage_counts,
+        )
+        if include_stage_counts
+        else {}
+    )
+    return [
+        role_summary(
+            role,
+            applications_count=counts.get(int(role.id), 0),
+            stage_counts=(
+                dict(stage_counts[int(role.id)]) if include_stage_counts else None
+            ),
         )
-    return out
+        for role in roles
+    ]
 
 
 def get_role(db: Session, user: User, *, role_id: int) -> dict[str, Any]:
@@ -1147,6 +1189,7 @@ def find_top_candidates(
     rank_by: str = "taali",
     role_id: int | None = None,
     _search_context: dict[str, Any] | None = None,
+    _on_progress: Callable[[dict[str, Any]], None] | None = None,
 ) -> dict[str, Any]:
     """Evidence-aware bounded candidate discovery and top-N ranking.
 
@@ -1201,6 +1244,10 @@ def find_top_candidates(
         )
     if getattr(user, "require_role_authority", False) is True:
         engine_args["require_role_authority"] = True
+    if _on_progress is not None:
+        # Server-owned like ``_search_context``: streaming surfaces receive the
+        # provisional shortlist and per-candidate verdicts while grounding runs.
+        engine_args["on_progress"] = _on_progress
     result = _engine(**engine_args)
 
     if scoped_role is not None:
@@ -188,6 +188,7 @@ def list_roles(
             db,
             user,
             include_stage_counts=args["include_stage_counts"] and can_read_applications,
+            memoize_stage_counts=True,
         )
         if not can_read_applications:
             roles = [_strip_application_counts(r) for r in roles]
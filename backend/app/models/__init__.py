@@ -11,6 +11,8 @@ from .role import ROLE_KIND_SISTER, ROLE_KIND_STANDARD, Role, role_tasks
 from .role_change_event import RoleChangeEvent
 from .workspace_agent_control_event import WorkspaceAgentControlEvent
 from .sister_role_evaluation import SisterRoleEvaluation
+from .role_stage_count import RoleStageCount
+from .role_cohort_feature import RoleCohortFeatureCount, RoleCohortMember, RoleCohortState
 from .role_brief import BRIEF_SOURCES, BRIEF_STATUSES, RoleBrief
 from .client import (
     CLIENT_STATUS_ACTIVE,
@@ -25,6 +27,7 @@ from .job_page import (
     JobPage,
 )
 from .screening_question import QUESTION_KINDS, ScreeningQuestion
+from . import public_content_version  # noqa: F401 — registers its session hooks
 from .eeo_response import EEOResponse
 from .data_subject_request import (
     DSR_STATUS_COMPLETED,
@@ -53,6 +56,7 @@ from .role_criterion import (
 from .cv_match_override import CvMatchOverride
 from .cv_parse_cache import CvParseCache
 from .cv_score_cache import CvScoreCache
+from .rubric_grade_cache import RubricGradeCache
 from .prescreen_calibration_sample import PrescreenCalibrationSample
 from .pool_rescore_job import PoolRescoreJob
 from .cv_score_job import (
@@ -65,6 +69,8 @@ from .cv_score_job import (
     SCORE_JOB_STATUSES,
 )
 from .task import Task
+from .sandbox_pool_entry import SandboxPoolEntry
+from .repo_snapshot import AssessmentRepoManifest, RepoBlobRef, RepoFileBlob
 from .assessment_experiment import (
     ASSIGNMENT_METHOD_FORCED,
     ASSIGNMENT_METHOD_NO_EXPERIMENT,
@@ -108,6 +114,7 @@ from .background_job_run import (
     SCOPE_KIND_ROLE,
 )
 from .taali_chat_conversation import TaaliChatConversation
+from .taali_chat_history_checkpoint import TaaliChatHistoryCheckpoint
 from .taali_chat_message import (
     ROLE_ASSISTANT,
     ROLE_USER,
@@ -193,11 +200,7 @@ from .share_link import (
 from .top_candidates_report import TopCandidatesReport
 from .submittal_pack import SubmittalPack
 from .threshold_calibration import ThresholdCalibration
-from .api_key import (
-    API_KEY_SCOPES,
-    DEFAULT_API_KEY_SCOPES,
-    ApiKey,
-)
+from .api_key import API_KEY_SCOPES, DEFAULT_API_KEY_SCOPES, ApiKey
 from .workable_webhook_outbox import (
     WORKABLE_OUTBOX_KINDS,
     WORKABLE_OUTBOX_STATUSES,
@@ -237,6 +240,10 @@ __all__ = [
     "INTERVIEW_RECOMMENDATIONS",
     "Role",
     "RoleChangeEvent",
+    "RoleStageCount",
+    "RoleCohortFeatureCount",
+    "RoleCohortMember",
+    "RoleCohortState",
     "WorkspaceAgentControlEvent",
     "role_tasks",
     "ScreeningQuestion",
@@ -265,6 +272,7 @@ __all__ = [
     "CvMatchOverride",
     "CvParseCache",
     "CvScoreCache",
+    "RubricGradeCache",
     "PrescreenCalibrationSample",
     "CvScoreJob",
     "PoolRescoreJob",
@@ -275,6 +283,10 @@ __all__ = [
     "SCORE_JOB_STALE",
     "SCORE_JOB_STATUSES",
     "Task",
+    "SandboxPoolEntry",
+    "RepoFileBlob",
+    "RepoBlobRef",
+    "AssessmentRepoManifest",
     "AssessmentExperiment",
     "AssessmentExperimentArm",
     "EXPERIMENT_STATUS_DRAFT",
@@ -313,6 +325,7 @@ __all__ = [
     "SCOPE_KIND_ROLE",
     "SCOPE_KIND_ORG",
     "TaaliChatConversation",
+    "TaaliChatHistoryCheckpoint",
     "TaaliChatMessage",
     "TAALI_CHAT_ROLES",
     "ROLE_USER",
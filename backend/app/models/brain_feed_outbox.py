@@ -60,7 +60,9 @@ BRAIN_FEED_STATUSES = (
 class BrainFeedOutbox(Base):
     __tablename__ = "brain_feed_outbox"
 
-    id = Column(BigInteger, primary_key=True)
+    # INTEGER on SQLite so the sweep's Core ``INSERT ... ON CONFLICT`` gets a
+    # rowid-backed id there too (Postgres uses the BIGINT sequence).
+    id = Column(BigInteger().with_variant(Integer, "sqlite"), primary_key=True)
     # One of BRAIN_FEED_KINDS — selects the mainspring ingest path at drain time.
     record_kind = Column(String(16), nullable=False)
     # Client-stable idempotency key (e.g. "decision-123", "outcome-45",
@@ -88,8 +90,31 @@ class BrainFeedOutbox(Base):
     sent_at = Column(DateTime(timezone=True), nullable=True)
 
 
+class BrainFeedSweepCursor(Base):
+    """Per-source high-water mark of the brain-feed sweep.
+
+    ``(last_seen_at, last_seen_id)`` is the keyset position of the newest
+    source row already enqueued, so each sweep only pages over rows after it
+    (less a small overlap the sweep re-reads for late-committing writers).
+    """
+
+    __tablename__ = "brain_feed_sweep_cursors"
+
+    # Record kind of the swept source ("decision" / "outcome").
+    source = Column(String(16), primary_key=True)
+    last_seen_at = Column(DateTime(timezone=True), nullable=False)
+    last_seen_id = Column(BigInteger, nullable=False, server_default="0")
+    updated_at = Column(
+        DateTime(timezone=True),
+        nullable=False,
+        server_default=func.now(),
+        onupdate=func.now(),
+    )
+
+
 __all__ = [
     "BrainFeedOutbox",
+    "BrainFeedSweepCursor",
     "BRAIN_FEED_KIND_DECISION",
     "BRAIN_FEED_KIND_OUTCOME",
     "BRAIN_FEED_KIND_USAGE",
@@ -14,6 +14,18 @@ SCORE_JOB_ERROR = "error"
 SCORE_JOB_STALE = "stale"
 
 
+# How the full-score provider call is made. ``batch`` jobs park on a
+# holistic cache miss and are submitted through the Message Batches API
+# (``cv_matching.holistic_batch``); everything else runs synchronously.
+SCORE_DELIVERY_LIVE = "live"
+SCORE_DELIVERY_BATCH = "batch"
+
+# ``error_message`` markers for a batch job's two waiting states (the same
+# field carries the ``deferred_*`` markers of stale rows).
+SCORE_BATCH_AWAITING_SUBMIT = "awaiting_batch_submit"
+SCORE_BATCH_IN_FLIGHT_PREFIX = "in_batch:"
+
+
 SCORE_JOB_STATUSES = {
     SCORE_JOB_PENDING,
     SCORE_JOB_RUNNING,
@@ -67,6 +79,15 @@ class CvScoreJob(Base):
         default=False,
         server_default=sql_false(),
     )
+    delivery = Column(
+        String,
+        nullable=False,
+        default=SCORE_DELIVERY_LIVE,
+        server_default=SCORE_DELIVERY_LIVE,
+    )
+    # Trace of the batch result written to the shared score cache; the
+    # persisting run recognises it and skips the cache-hit fee.
+    batch_trace_id = Column(String, nullable=True)
     queued_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
     started_at = Column(DateTime(timezone=True), nullable=True)
     finished_at = Column(DateTime(timezone=True), nullable=True)
@@ -0,0 +1,145 @@
+"""Per-organization content version for the public careers surfaces.
+
+The public job page and careers board render from a handful of rows: the
+``JobPage`` snapshot, the brief → role link, the role's intake state, the
+role's screening questions and the organization's name/slug/workspace pause.
+``domains.job_pages.public_views`` caches the rendered payloads keyed by this
+version. ORM writes to the rendered columns of those rows stage their
+organization in ``session.info`` on flush. After commit the org's version is bumped in Redis,
+so every API process drops its cached payloads on the next hit.
+
+No table: the counter lives in the shared cache Redis. When Redis is
+unavailable ``public_content_version`` returns None and callers render
+uncached. A bump lost to a Redis blip, or a write made outside the ORM, is
+bounded by the payload TTL (``PUBLIC_CAREERS_CACHE_SECONDS``).
+"""
+
+from __future__ import annotations
+
+import logging
+from itertools import chain
+from typing import Iterable
+
+from sqlalchemy import event, inspect
+from sqlalchemy.orm import Session
+
+from .job_page import JobPage
+from .organization import Organization
+from .role import Role
+from .role_brief import RoleBrief
+from .screening_question import ScreeningQuestion
+
+logger = logging.getLogger("taali.models.public_content_version")
+
+_SESSION_STALE_ORGS_KEY = "_public_content_stale_orgs"
+_VERSION_KEY = "public-content-version:{organization_id}"
+
+# Only the columns a public payload renders or filters on bump the version:
+# roles and organizations are written constantly (scoring, stage counts,
+# credits, usage rollups) and most of those writes never reach the careers
+# surfaces. Roles count their intake gate (``job_page_lifecycle`` and the ATS
+# mirror state it reads); questions never count their knockout answer.
+_PUBLIC_FIELDS: dict[type, tuple[str, ...]] = {
+    Organization: ("name", "slug", "agent_workspace_paused_at"),
+    JobPage: (
+        "organization_id", "brief_id", "token", "title", "jd_markdown", "location",
+        "workplace_type", "employment_type", "seniority", "salary_min",
+        "salary_max", "salary_currency", "status", "published_at",
+    ),
+    Role: (
+        "organization_id", "deleted_at", "source", "job_status",
+        "agentic_mode_enabled", "agent_paused_at", "workable_job_id",
+        "workable_job_data", "bullhorn_job_order_id", "bullhorn_job_data",
+    ),
+    RoleBrief: ("organization_id", "role_id"),
+    ScreeningQuestion: (
+        "organization_id", "role_id", "prompt", "kind", "options", "required",
+        "position", "is_active",
+    ),
+}
+
+def _redis():
+    from ..platform.redis_cache import cache_redis
+
+    return cache_redis()
+
+
+def public_content_version(organization_id: int) -> int | None:
+    """The org's current public content version, or None without Redis."""
+    r = _redis()
+    if r is None:
+        return None
+    try:
+        value = r.get(_VERSION_KEY.format(organization_id=int(organization_id)))
+    except Exception:  # pragma: no cover — cache is best-effort
+        from ..platform.redis_cache import mark_cache_redis_failed
+
+        mark_cache_redis_failed()
+        return None
+    return int(value or 0)
+
+
+def bump_public_content_versions(organization_ids: Iterable[int]) -> None:
+    """Invalidate every cached public payload of these organizations."""
+    org_ids = sorted({int(org_id) for org_id in organization_ids})
+    r = _redis() if org_ids else None
+    if r is None:
+        return
+    try:
+        pipe = r.pipeline(transaction=False)
+        for org_id in org_ids:
+            pipe.incr(_VERSION_KEY.format(organization_id=org_id))
+        pipe.execute()
+    except Exception:  # pragma: no cover — bounded by the payload TTL
+        from ..platform.redis_cache import mark_cache_redis_failed
+
+        mark_cache_redis_failed()
+        logger.warning("public content version bump failed orgs=%s", org_ids)
+
+
+def _public_org_ids(session: Session, target) -> set[int]:
+    fields = _PUBLIC_FIELDS.get(type(target))
+    if fields is None:
+        return set()
+    is_org = isinstance(target, Organization)
+    if target in session.new or target in session.deleted:
+        org_id = target.id if is_org else getattr(target, "organization_id", None)
+        return {org_id} if org_id is not None else set()
+    state = inspect(target)
+    if not any(state.attrs[field].history.has_changes() for field in fields):
+        return set()
+    if is_org:
+        return {target.id}
+    # A row moved between organizations leaves both payloads stale.
+    previous = state.attrs["organization_id"].history.deleted or ()
+    return {
+        org_id
+        for org_id in (getattr(target, "organization_id", None), *previous)
+        if org_id is not None
+    }
+
+
+@event.listens_for(Session, "after_flush")
+def _stage_public_content_changes(session: Session, _flush_context) -> None:
+    org_ids = {
+        int(org_id)
+        for target in chain(session.new, session.dirty, session.deleted)
+        for org_id in _public_org_ids(session, target)
+    }
+    if org_ids:
+        session.info.setdefault(_SESSION_STALE_ORGS_KEY, set()).update(org_ids)
+
+
+@event.listens_for(Session, "after_commit")
+def _bump_committed_public_content(session: Session) -> None:
+    org_ids = session.info.pop(_SESSION_STALE_ORGS_KEY, None)
+    if org_ids:
+        bump_public_content_versions(org_ids)
+
+
+@event.listens_for(Session, "after_rollback")
+def _drop_rolled_back_public_content(session: Session) -> None:
+    session.info.pop(_SESSION_STALE_ORGS_KEY, None)
+
+
+__all__ = ["bump_public_content_versions", "public_content_version"]
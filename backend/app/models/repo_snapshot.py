@@ -0,0 +1,143 @@
+"""Content-addressed storage behind incremental sandbox repo snapshots.
+
+Reading a candidate workspace used to ship every file's content out of the
+sandbox on each editor rehydrate and submission capture. The snapshot engine
+(``components/assessments/repo_snapshot``) instead remembers the per-file
+hashes of an assessment's previous snapshot and transfers only the files that
+changed; unchanged content is served from ``RepoFileBlob``.
+
+Blobs are scoped to a task and keyed by the sha256 of the stored UTF-8 text,
+so identical content is stored once and shared by every assessment of that
+task. Rows are immutable. ``RepoBlobRef`` records which assessments'
+manifests list each blob; replacing a manifest and deleting an assessment
+move those references and delete the blobs left with none.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Iterable
+
+from sqlalchemy import (
+    JSON, Column, DateTime, ForeignKey, Integer, String, Text, delete, event, exists, insert, select,
+)
+from sqlalchemy.sql import func
+
+from ..platform.database import Base
+from .assessment import Assessment
+
+
+class RepoFileBlob(Base):
+    __tablename__ = "repo_file_blobs"
+
+    task_id = Column(Integer, ForeignKey("tasks.id", ondelete="CASCADE"), primary_key=True)
+    sha256 = Column(String(64), primary_key=True)
+    # UTF-8 text as the editor / artifact sees it (``errors="replace"``);
+    # ``sha256`` is the digest of exactly this text.
+    content = Column(Text, nullable=False)
+    size_bytes = Column(Integer, nullable=False)
+    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+
+
+class AssessmentRepoManifest(Base):
+    """Path -> blob sha256 of an assessment's most recent workspace snapshot."""
+
+    __tablename__ = "assessment_repo_manifests"
+
+    assessment_id = Column(
+        Integer, ForeignKey("assessments.id", ondelete="CASCADE"), primary_key=True
+    )
+    task_id = Column(Integer, ForeignKey("tasks.id", ondelete="CASCADE"), nullable=False)
+    manifest = Column(JSON, nullable=False)
+    updated_at = Column(
+        DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False
+    )
+
+
+class RepoBlobRef(Base):
+    """A blob digest listed by an assessment's current manifest."""
+
+    __tablename__ = "repo_blob_refs"
+
+    task_id = Column(Integer, ForeignKey("tasks.id", ondelete="CASCADE"), primary_key=True)
+    sha256 = Column(String(64), primary_key=True)
+    assessment_id = Column(
+        Integer, ForeignKey("assessments.id", ondelete="CASCADE"), primary_key=True, index=True
+    )
+
+
+def release_repo_blobs(executor: Any, task_id: int, shas: Iterable[str]) -> None:
+    """Delete those of ``shas`` that no assessment of ``task_id`` references.
+
+    ``executor`` is a ``Session`` or ``Connection``; the delete joins the
+    caller's transaction and probes ``repo_blob_refs`` by primary key.
+    """
+    released = sorted({sha for sha in shas if isinstance(sha, str)})
+    if not released:
+        return
+    executor.execute(
+        delete(RepoFileBlob).where(
+            RepoFileBlob.task_id == int(task_id),
+            RepoFileBlob.sha256.in_(released),
+            ~exists().where(
+                RepoBlobRef.task_id == RepoFileBlob.task_id,
+                RepoBlobRef.sha256 == RepoFileBlob.sha256,
+            ),
+        )
+    )
+
+
+def reference_repo_blobs(
+    executor: Any,
+    task_id: int,
+    assessment_id: int,
+    previous: Iterable[str],
+    current: Iterable[str],
+) -> None:
+    """Move ``assessment_id``'s references from ``previous`` to ``current`` digests.
+
+    Blobs that only ``previous`` referenced are released.
+    """
+    old, new = set(previous), set(current)
+    dropped, added = sorted(old - new), sorted(new - old)
+    if dropped:
+        executor.execute(
+            delete(RepoBlobRef).where(
+                RepoBlobRef.task_id == int(task_id),
+                RepoBlobRef.assessment_id == int(assessment_id),
+                RepoBlobRef.sha256.in_(dropped),
+            )
+        )
+    if added:
+        executor.execute(
+            insert(RepoBlobRef),
+            [
+                {"task_id": int(task_id), "sha256": sha, "assessment_id": int(assessment_id)}
+                for sha in added
+            ],
+        )
+    release_repo_blobs(executor, task_id, dropped)
+
+
+@event.listens_for(Assessment, "before_delete")
+def _release_deleted_assessment_snapshot(_mapper, connection, target) -> None:
+    refs = connection.execute(
+        select(RepoBlobRef.task_id, RepoBlobRef.sha256).where(
+            RepoBlobRef.assessment_id == target.id
+        )
+    ).all()
+    connection.execute(
+        delete(AssessmentRepoManifest).where(AssessmentRepoManifest.assessment_id == target.id)
+    )
+    if not refs:
+        return
+    connection.execute(delete(RepoBlobRef).where(RepoBlobRef.assessment_id == target.id))
+    release_repo_blobs(connection, refs[0].task_id, [ref.sha256 for ref in refs])
+
+
+__all__ = [
+    "AssessmentRepoManifest",
+    "RepoBlobRef",
+    "RepoFileBlob",
+    "reference_repo_blobs",
+    "release_repo_blobs",
+]
@@ -0,0 +1,275 @@
+"""Maintained per-role cohort feature counts ("do high scorers cluster?").
+
+``cohort_signals_service.compute_cohort_signals`` recounts skills, companies,
+titles and schools over every scored applicant with their candidate loaded.
+These tables keep those counts so a read costs O(features):
+
+- ``RoleCohortMember``: one row per roster application with the score and
+  normalized features it currently contributes, and whether it sits in the
+  top set.
+- ``RoleCohortFeatureCount``: per ``(category, feature)`` the number of pool
+  members and top members holding it. ``rest_n`` is ``pool_n - top_n``.
+- ``RoleCohortState``: pool size, top size and top threshold for the role.
+
+Freshness works like ``role_stage_counts``. Once a role has been read, ORM
+writes that can change a member's score, membership or profile (application
+score/lifecycle, related-role evaluation, candidate skills/experience/
+education/erasure) bump that member's ``version`` in the same flush. The next
+read applies just the stale members as count deltas and rebalances the top
+set (``services.cohort_feature_store``). A periodic full rebuild repairs drift
+from writers that bypass the ORM and from score inputs these hooks do not
+see, such as related-role assessment truth.
+"""
+
+from __future__ import annotations
+
+from sqlalchemy import (
+    JSON,
+    Boolean,
+    Column,
+    DateTime,
+    Float,
+    Index,
+    Integer,
+    String,
+    event,
+    select,
+    text,
+)
+from sqlalchemy.orm import Session, object_session
+from sqlalchemy.sql import func
+
+from ..platform.database import Base
+from .candidate import Candidate
+from .candidate_application import CandidateApplication
+from .sister_role_evaluation import SisterRoleEvaluation
+
+
+class RoleCohortState(Base):
+    """Pool/top summary of one role's maintained cohort.
+
+    Not a foreign key to ``roles`` for the same reason as ``RoleStageCount``:
+    rows of deleted roles are dropped by the reconciler.
+    """
+
+    __tablename__ = "role_cohort_states"
+
+    role_id = Column(Integer, primary_key=True, autoincrement=False)
+    organization_id = Column(Integer, nullable=True, index=True)
+    pool_size = Column(Integer, nullable=False, default=0, server_default="0")
+    top_size = Column(Integer, nullable=False, default=0, server_default="0")
+    top_threshold_score = Column(Float, nullable=True)
+    rebuilt_at = Column(DateTime(timezone=True), nullable=True)
+    refreshed_at = Column(DateTime(timezone=True), nullable=True)
+
+
+class RoleCohortMember(Base):
+    """What one roster application currently contributes to the counts.
+
+    ``score`` is None for an application outside the scored pool (unscored,
+    withdrawn from the roster, or not yet applied). A member is stale while
+    ``version != applied_version``.
+    """
+
+    __tablename__ = "role_cohort_members"
+    __table_args__ = (
+        Index("ix_role_cohort_members_role_top_score", "role_id", "in_top", "score"),
+    )
+
+    role_id = Column(Integer, primary_key=True, autoincrement=False)
+    application_id = Column(Integer, primary_key=True, autoincrement=False)
+    score = Column(Float, nullable=True)
+    in_top = Column(Boolean, nullable=False, default=False, server_default="false")
+    # {"skills": [...], "companies": [...], "titles": [...], "schools": [...]}
+    features = Column(JSON, nullable=True)
+    version = Column(Integer, nullable=False, default=0, server_default="0")
+    applied_version = Column(Integer, nullable=False, default=0, server_default="0")
+
+
+class RoleCohortFeatureCount(Base):
+    __tablename__ = "role_cohort_feature_counts"
+
+    role_id = Column(Integer, primary_key=True, autoincrement=False)
+    category = Column(String(16), primary_key=True)
+    feature = Column(String, primary_key=True)
+    pool_n = Column(Integer, nullable=False, default=0, server_default="0")
+    top_n = Column(Integer, nullable=False, default=0, server_default="0")
+    updated_at = Column(
+        DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=True
+    )
+
+
+_SESSION_STALE_MEMBERS_KEY = "role_cohort_stale_members"
+_APPLICATION_FIELDS = (
+    "taali_score_cache_100",
+    "deleted_at",
+    "role_id",
+    "candidate_id",
+    "organization_id",
+)
+_EVALUATION_FIELDS = (
+    "role_fit_score",
+    "deleted_at",
+    "role_id",
+    "source_application_id",
+)
+
+# Rows per multi-row upsert; three binds each keeps a statement well under
+# SQLite's bind-parameter limit.
+_MARK_STALE_CHUNK = 300
+_MARK_STALE_SQL = (
+    "INSERT INTO role_cohort_members (role_id, application_id, in_top, version, applied_version) "
+    "VALUES {rows} "
+    "ON CONFLICT (role_id, application_id) DO UPDATE SET "
+    "version = role_cohort_members.version + 1"
+)
+
+def _changed_members(target, fields: tuple[str, ...], application_field: str) -> set[tuple[int, int]]:
+    """Current plus previous ``(role_id, application_id)`` when a field changed."""
+
+    from sqlalchemy import inspect
+
+    state = inspect(target)
+    if not any(state.attrs[field].history.has_changes() for field in fields):
+        return set()
+    role_ids = {int(v) for v in state.attrs["role_id"].history.deleted if v is not None}
+    application_ids = {
+        int(v) for v in state.attrs[application_field].history.deleted if v is not None
+    }
+    if target.role_id is not None:
+        role_ids.add(int(target.role_id))
+    current = getattr(target, application_field)
+    if current is not None:
+        application_ids.add(int(current))
+    return {(r, a) for r in role_ids for a in application_ids}
+
+
+def _stage_stale_members(target, members: set[tuple[int, int]]) -> None:
+    if not members:
+        return
+    session = object_session(target)
+    if session is None:
+        return
+    session.info.setdefault(_SESSION_STALE_MEMBERS_KEY, set()).update(members)
+
+
+def mark_cohort_members_stale(connection, members) -> None:
+    """Bump ``(role_id, application_id)`` member rows on ``connection``.
+
+    Only roles with a maintained cohort (a state row, created by the first
+    read) get member rows; any other role is built from scratch when first
+    read. One lookup finds those roles, then each chunk of members is a single
+    multi-row upsert.
+    """
+
+    members = sorted({(int(r), int(a)) for r, a in members})
+    if not members:
+        return
+    maintained = {
+        int(role_id)
+        for (role_id,) in connection.execute(
+            select(RoleCohortState.role_id).where(
+                RoleCohortState.role_id.in_(sorted({r for r, _a in members}))
+            )
+        )
+    }
+    members = [(r, a) for r, a in members if r in maintained]
+    for start in range(0, len(members), _MARK_STALE_CHUNK):
+        chunk = members[start:start + _MARK_STALE_CHUNK]
+        params: dict[str, object] = {"in_top": False}
+        rows = []
+        for index, (role_id, application_id) in enumerate(chunk):
+            params[f"r{index}"] = role_id
+            params[f"a{index}"] = application_id
+            rows.append(f"(:r{index}, :a{index}, :in_top, 1, 0)")
+        connection.execute(text(_MARK_STALE_SQL.format(rows=", ".join(rows))), params)
+
+
+@event.listens_for(CandidateApplication, "after_insert")
+@event.listens_for(CandidateApplication, "after_delete")
+def _application_added_or_removed(_mapper, _connection, target) -> None:
+    if target.role_id is not None and target.id is not None:
+        _stage_stale_members(target, {(int(target.role_id), int(target.id))})
+
+
+@event.listens_for(SisterRoleEvaluation, "after_insert")
+@event.listens_for(SisterRoleEvaluation, "after_delete")
+def _evaluation_added_or_removed(_mapper, _connection, target) -> None:
+    if target.role_id is not None and target.source_application_id is not None:
+        _stage_stale_members(
+            target, {(int(target.role_id), int(target.source_application_id))}
+        )
+
+
+@event.listens_for(CandidateApplication, "after_update")
+def _application_member_may_change(_mapper, _connection, target) -> None:
+    _stage_stale_members(target, _changed_members(target, _APPLICATION_FIELDS, "id"))
+
+
+@event.listens_for(SisterRoleEvaluation, "after_update")
+def _evaluation_member_may_change(_mapper, _connection, target) -> None:
+    _stage_stale_members(
+        target, _changed_members(target, _EVALUATION_FIELDS, "source_application_id")
+    )
+
+
+def _cohort_profile_changed(state) -> bool:
+    """Whether an updated candidate's cohort membership or features changed.
+
+    Profile columns are rewritten wholesale by CV parsing and ATS sync, often
+    with only dates or descriptions different; compare the normalized
+    features instead. An unloaded previous value counts as a change.
+    """
+
+    from types import SimpleNamespace
+
+    from ..services.cohort_signals_service import candidate_features
+
+    if any(state.attrs[field].history.has_changes() for field in ("deleted_at", "organization_id")):
+        return True
+    profile_fields = ("skills", "experience_entries", "education_entries")
+    histories = {field: state.attrs[field].history for field in profile_fields}
+    if not any(history.has_changes() for history in histories.values()):
+        return False
+    previous = {}
+    for field, history in histories.items():
+        if not history.has_changes():
+            previous[field] = getattr(state.object, field)
+        elif history.deleted:
+            previous[field] = history.deleted[0]
+        else:
+            return True
+    return candidate_features(SimpleNamespace(**previous)) != candidate_features(state.object)
+
+
+@event.listens_for(Candidate, "after_update")
+def _profile_may_change(_mapper, connection, target) -> None:
+    """A profile edit changes the features of every roster row of the person."""
+
+    from sqlalchemy import inspect
+
+    if not _cohort_profile_changed(inspect(target)):
+        return
+    rows = connection.execute(
+        text(
+            "SELECT role_id, id FROM candidate_applications WHERE candidate_id = :candidate_id "
+            "UNION SELECT role_id, source_application_id FROM sister_role_evaluations "
+            "WHERE candidate_id = :candidate_id"
+        ),
+        {"candidate_id": int(target.id)},
+    )
+    _stage_stale_members(
+        target,
+        {
+            (int(role_id), int(application_id))
+            for role_id, application_id in rows
+            if role_id is not None and application_id is not None
+        },
+    )
+
+
+@event.listens_for(Session, "after_flush")
+def _mark_flushed_members_stale(session: Session, _flush_context) -> None:
+    members = session.info.pop(_SESSION_STALE_MEMBERS_KEY, None)
+    if members:
+        mark_cohort_members_stale(session.connection(), members)
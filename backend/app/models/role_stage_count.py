@@ -0,0 +1,228 @@
+"""Maintained per-role pipeline stage counts.
+
+``get_role_pipeline`` polls, and its unfiltered stage counts are a GROUP BY
+over the role's whole open roster (including the related-role membership
+join). This projection stores the last computed counts per role so repeated
+polls read one row.
+
+Freshness: ORM writes that can move an application in or out of a stage
+bucket (stage, outcome, soft delete, role/membership and person erasure)
+collect the affected role ids on the session as they flush. Once the writer's
+transaction commits, the roles' ``version`` is bumped and the rows marked
+``stale`` in a short transaction of their own, so the writer never holds the
+role's count row locked: Workable sync, scoring workers and recruiter actions
+on the same role do not serialize on it, and writers touching several roles
+cannot deadlock on them (marks go in role-id order). A rolled-back writer
+marks nothing. A stale row is recomputed from the live aggregate on the next
+read (see ``role_stage_count_projection``), and the periodic reconciler
+repairs drift from writers that bypass the ORM or die between commit and mark.
+"""
+
+from __future__ import annotations
+
+import logging
+from datetime import datetime, timezone
+
+from sqlalchemy import (
+    Boolean,
+    Column,
+    DateTime,
+    Integer,
+    event,
+    text,
+)
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import Session, SessionTransaction, object_session
+from sqlalchemy.sql import func
+
+from ..platform.database import Base
+from .candidate import Candidate
+from .candidate_application import CandidateApplication
+from .sister_role_evaluation import SisterRoleEvaluation
+
+logger = logging.getLogger("taali.role_stage_counts")
+
+class RoleStageCount(Base):
+    """Open-roster stage counts for one role, as ``get_role_pipeline`` reports them.
+
+    Deliberately not a foreign key to ``roles``: invalidation upserts run after
+    arbitrary writers commit, and a hard-deleted role's row is removed by the
+    reconciler instead of blocking that delete.
+    """
+
+    __tablename__ = "role_stage_counts"
+
+    role_id = Column(Integer, primary_key=True, autoincrement=False)
+    organization_id = Column(Integer, nullable=True, index=True)
+    applied = Column(Integer, nullable=False, default=0, server_default="0")
+    invited = Column(Integer, nullable=False, default=0, server_default="0")
+    in_assessment = Column(Integer, nullable=False, default=0, server_default="0")
+    review = Column(Integer, nullable=False, default=0, server_default="0")
+    total = Column(Integer, nullable=False, default=0, server_default="0")
+    # Writers bump ``version``; a reader only stores counts if the version it
+    # read is still current, so a concurrent stage change is never overwritten
+    # by counts computed from the older snapshot.
+    version = Column(Integer, nullable=False, default=0, server_default="0")
+    stale = Column(Boolean, nullable=False, default=True, server_default="true")
+    refreshed_at = Column(DateTime(timezone=True), nullable=True)
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=True)
+
+    def as_stage_counts(self) -> dict[str, int]:
+        return {
+            "all": int(self.total or 0),
+            "applied": int(self.applied or 0),
+            "invited": int(self.invited or 0),
+            "in_assessment": int(self.in_assessment or 0),
+            "review": int(self.review or 0),
+        }
+
+
+_SESSION_STALE_ROLES_KEY = "role_stage_counts_stale_role_ids"
+_APPLICATION_COUNT_FIELDS = (
+    "pipeline_stage",
+    "application_outcome",
+    "deleted_at",
+    "role_id",
+    "candidate_id",
+    "organization_id",
+    "source",
+)
+_EVALUATION_COUNT_FIELDS = (
+    "pipeline_stage",
+    "application_outcome",
+    "deleted_at",
+    "role_id",
+    "source_application_id",
+    "candidate_id",
+)
+_CANDIDATE_COUNT_FIELDS = ("deleted_at", "organization_id")
+
+_MARK_STALE_SQL = text(
+    "INSERT INTO role_stage_counts (role_id, version, stale, updated_at) "
+    "VALUES (:role_id, 1, :stale, :now) "
+    "ON CONFLICT (role_id) DO UPDATE SET "
+    "version = role_stage_counts.version + 1, stale = :stale, updated_at = :now"
+)
+
+
+def _changed_role_ids(target, fields: tuple[str, ...]) -> set[int]:
+    """Current plus previous ``role_id`` when any counted field changed."""
+
+    from sqlalchemy import inspect
+
+    state = inspect(target)
+    changed = False
+    role_ids: set[int] = set()
+    for field in fields:
+        history = state.attrs[field].history
+        if history.has_changes():
+            changed = True
+            if field == "role_id":
+                role_ids.update(int(value) for value in history.deleted if value is not None)
+    if not changed:
+        return set()
+    if target.role_id is not None:
+        role_ids.add(int(target.role_id))
+    return role_ids
+
+
+def _stage_stale_roles(target, role_ids: set[int]) -> None:
+    session = object_session(target)
+    if session is not None:
+        mark_role_stage_counts_stale_on_commit(session, role_ids)
+
+
+def mark_role_stage_counts_stale_on_commit(session: Session, role_ids) -> None:
+    """Mark ``role_ids`` stale once ``session``'s transaction commits.
+
+    For writers that bypass the ORM hooks (bulk ``UPDATE``/``DELETE``).
+    """
+
+    role_ids = {int(role_id) for role_id in role_ids if role_id is not None}
+    if role_ids:
+        session.info.setdefault(_SESSION_STALE_ROLES_KEY, set()).update(role_ids)
+
+
+def mark_org_role_stage_counts_stale_on_commit(session: Session, organization_id: int) -> None:
+    """Mark every role with a roster in the organization stale on commit."""
+
+    rows = session.execute(
+        text(
+            "SELECT role_id FROM candidate_applications WHERE organization_id = :org_id "
+            "UNION SELECT role_id FROM sister_role_evaluations WHERE organization_id = :org_id"
+        ),
+        {"org_id": int(organization_id)},
+    )
+    mark_role_stage_counts_stale_on_commit(session, (role_id for (role_id,) in rows))
+
+
+def mark_role_stage_counts_stale(connection, role_ids) -> None:
+    """Bump and mark stale the projection rows for ``role_ids`` on ``connection``."""
+
+    now = datetime.now(timezone.utc)
+    params = [
+        {"role_id": role_id, "stale": True, "now": now}
+        for role_id in sorted({int(role_id) for role_id in role_ids})
+    ]
+    if params:
+        connection.execute(_MARK_STALE_SQL, params)
+
+
+@event.listens_for(CandidateApplication, "after_insert")
+@event.listens_for(CandidateApplication, "after_delete")
+@event.listens_for(SisterRoleEvaluation, "after_insert")
+@event.listens_for(SisterRoleEvaluation, "after_delete")
+def _membership_row_added_or_removed(_mapper, _connection, target) -> None:
+    if target.role_id is not None:
+        _stage_stale_roles(target, {int(target.role_id)})
+
+
+@event.listens_for(CandidateApplication, "after_update")
+def _application_counts_may_change(_mapper, _connection, target) -> None:
+    _stage_stale_roles(target, _changed_role_ids(target, _APPLICATION_COUNT_FIELDS))
+
+
+@event.listens_for(SisterRoleEvaluation, "after_update")
+def _evaluation_counts_may_change(_mapper, _connection, target) -> None:
+    _stage_stale_roles(target, _changed_role_ids(target, _EVALUATION_COUNT_FIELDS))
+
+
+@event.listens_for(Candidate, "after_update")
+def _person_lifecycle_may_change(_mapper, connection, target) -> None:
+    """Erasing a person removes them from every role roster they sit on."""
+
+    from sqlalchemy import inspect
+
+    state = inspect(target)
+    if not any(state.attrs[field].history.has_changes() for field in _CANDIDATE_COUNT_FIELDS):
+        return
+    rows = connection.execute(
+        text(
+            "SELECT role_id FROM candidate_applications WHERE candidate_id = :candidate_id "
+            "UNION SELECT role_id FROM sister_role_evaluations WHERE candidate_id = :candidate_id"
+        ),
+        {"candidate_id": int(target.id)},
+    )
+    _stage_stale_roles(target, {int(role_id) for (role_id,) in rows if role_id is not None})
+
+
+@event.listens_for(Session, "after_commit")
+def _mark_committed_roles_stale(session: Session) -> None:
+    role_ids = session.info.pop(_SESSION_STALE_ROLES_KEY, None)
+    if not role_ids:
+        return
+    bind = session.get_bind(RoleStageCount)
+    try:
+        with getattr(bind, "engine", bind).begin() as connection:
+            mark_role_stage_counts_stale(connection, role_ids)
+    except SQLAlchemyError:
+        # The reconciler repairs rows whose mark was lost.
+        logger.warning("role_stage_counts stale mark failed role_ids=%s", sorted(role_ids), exc_info=True)
+
+
+@event.listens_for(Session, "after_transaction_end")
+def _discard_rolled_back_roles(session: Session, transaction: SessionTransaction) -> None:
+    # Runs after ``after_commit`` has taken the roles of a committed
+    # transaction; anything left belongs to a rolled-back one.
+    if transaction.parent is None:
+        session.info.pop(_SESSION_STALE_ROLES_KEY, None)
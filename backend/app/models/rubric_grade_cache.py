@@ -0,0 +1,32 @@
+"""Content-addressed cache of model-graded rubric dimensions."""
+
+from __future__ import annotations
+
+from sqlalchemy import Column, DateTime, Integer, JSON, String
+from sqlalchemy.sql import func
+
+from ..platform.database import Base
+
+
+class RubricGradeCache(Base):
+    """One successful rubric dimension grade, keyed on everything it saw.
+
+    The key is a sha256 over (organization, dimension, criteria spec, lens,
+    model, grader prompt version, system prompt and the rendered evidence
+    prompt — i.e. the submission artifact and transcript excerpts). Grading
+    runs at temperature 0, so an identical key is an identical grade: retries
+    and re-scores of an unchanged submission are served from here instead of
+    a paid grader call. Rows are immutable and lookups are read-only; any
+    input change is a new key. Hit rates come from the process counters in
+    ``components/assessments/rubric_grade_cache``.
+    """
+
+    __tablename__ = "rubric_grade_cache"
+
+    cache_key = Column(String, primary_key=True)
+    organization_id = Column(Integer, nullable=False, index=True)
+    dimension_id = Column(String, nullable=False)
+    prompt_version = Column(String, nullable=False)
+    model = Column(String, nullable=False)
+    result = Column(JSON, nullable=False)
+    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
@@ -0,0 +1,45 @@
+"""Pre-bootstrapped assessment sandboxes waiting to be handed to a candidate.
+
+Starting an assessment used to create an E2B sandbox, materialize the task
+repository and run the task's workspace bootstrap inside the candidate's
+start request. The sandbox pool (``components/assessments/sandbox_pool``)
+does that work ahead of time for task snapshots with pending invites; one row
+per pooled sandbox.
+
+A row is keyed by the assessment task-snapshot digest, so a candidate only
+ever receives a workspace built from the exact frozen task definition their
+assessment is bound to. Handing a sandbox out deletes its row with a
+compare-and-delete on ``status``; whoever deletes the row owns the sandbox.
+"""
+
+from __future__ import annotations
+
+from sqlalchemy import JSON, Column, DateTime, ForeignKey, Integer, String
+from sqlalchemy.sql import func
+
+from ..platform.database import Base
+
+SANDBOX_POOL_WARMING = "warming"
+SANDBOX_POOL_READY = "ready"
+
+
+class SandboxPoolEntry(Base):
+    __tablename__ = "sandbox_pool_entries"
+
+    id = Column(Integer, primary_key=True, index=True)
+    organization_id = Column(Integer, ForeignKey("organizations.id"), nullable=False, index=True)
+    task_id = Column(Integer, ForeignKey("tasks.id", ondelete="CASCADE"), nullable=False)
+    task_snapshot_sha256 = Column(String(64), nullable=False, index=True)
+    sandbox_id = Column(String, unique=True, nullable=False)
+    # warming (bootstrap in progress) | ready (can be claimed).
+    status = Column(String, nullable=False, default=SANDBOX_POOL_WARMING)
+    # ``_run_workspace_bootstrap`` result, replayed onto the claiming
+    # assessment's timeline exactly as a cold start would record it.
+    bootstrap = Column(JSON, nullable=True)
+    # Sandbox lifetime is counted from creation (the provider timeout starts
+    # then), so the reaper ages entries on this clock, not ``ready_at``.
+    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+    ready_at = Column(DateTime(timezone=True), nullable=True)
+
+
+__all__ = ["SANDBOX_POOL_READY", "SANDBOX_POOL_WARMING", "SandboxPoolEntry"]
@@ -0,0 +1,33 @@
+from sqlalchemy import Column, DateTime, ForeignKey, Integer, JSON
+from sqlalchemy.sql import func
+
+from ..platform.database import Base
+
+
+class TaaliChatHistoryCheckpoint(Base):
+    """Compacted replay prefix of one Taali Chat conversation.
+
+    ``messages`` is the sanitized, tool-result-compacted transcript through
+    ``through_message_id``. A turn replays this prefix plus only the
+    ``TaaliChatMessage`` rows after it, and the prefix is byte-stable between
+    folds so it stays under a prompt-cache breakpoint. Derived data: deleting
+    the row only makes the next turn replay the full transcript.
+    """
+
+    __tablename__ = "taali_chat_history_checkpoints"
+
+    conversation_id = Column(
+        Integer,
+        ForeignKey("taali_chat_conversations.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    through_message_id = Column(Integer, nullable=False)
+    messages = Column(JSON, nullable=False)
+    # Estimated prompt tokens removed by compaction inside the prefix.
+    compacted_tokens_saved = Column(Integer, nullable=False, server_default="0")
+    updated_at = Column(
+        DateTime(timezone=True),
+        nullable=False,
+        server_default=func.now(),
+        onupdate=func.now(),
+    )
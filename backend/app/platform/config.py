@@ -170,6 +170,14 @@ class Settings(BaseSettings):
     # live path runs exactly as before. The poll task is not gated, so
     # flipping this off still drains in-flight batches.
     CV_PARSE_BATCH_ENABLED: bool = False
+    # Bulk holistic CV scoring via the Message Batches API (50% pricing).
+    # When ON, bulk re-scores (role batch score, stale-score sweep) park
+    # holistic cache misses for the batch submit beat instead of holding a
+    # scoring worker on two Sonnet calls; results are persisted by the normal
+    # scoring worker via the shared score cache. Interactive/single scores
+    # always stay live. When OFF, parked jobs are handed back to the live
+    # path on the next sweep.
+    HOLISTIC_SCORE_BATCH_ENABLED: bool = False
     E2B_COST_PER_HOUR_USD: float = 0.30
     EMAIL_COST_PER_SEND_USD: float = 0.01
     STORAGE_COST_PER_GB_MONTH_USD: float = 0.023
@@ -287,6 +295,12 @@ class Settings(BaseSettings):
     ATS_PUBLIC_APPLY_ENABLED: bool = False
     # Per client-IP + role fixed-window cap on public applications (1 hour).
     ATS_APPLY_RATE_LIMIT_PER_HOUR: int = 20
+    # Public job page / careers board payloads: cached per process under the
+    # org's public content version (domains/job_pages/public_views), and served
+    # with an ETag + ``Cache-Control: public, max-age=N`` so a CDN can absorb
+    # syndication spikes. N also bounds staleness for writes that bypass the
+    # ORM version bump.
+    PUBLIC_CAREERS_CACHE_SECONDS: int = 60
 
     # Workable
     WORKABLE_CLIENT_ID: str = ""
@@ -307,9 +321,40 @@ class Settings(BaseSettings):
     # unset the /webhooks/resend endpoint 503s — delivery/open/bounce tracking
     # is simply off until configured in the Resend dashboard.
     RESEND_WEBHOOK_SECRET: str = ""
+    # Outreach campaign sends (domains/outreach/campaign_sender): a token
+    # bucket shaped to the Resend account's request limit (default ~2 req/s),
+    # a few concurrent provider calls to hide latency, and status commits
+    # every N results.
+    OUTREACH_SEND_RATE_PER_SECOND: float = 2.0
+    OUTREACH_SEND_BURST: int = 2
+    OUTREACH_SEND_CONCURRENCY: int = 4
+    OUTREACH_SEND_COMMIT_EVERY: int = 25
+    # Outreach campaign drafts (domains/outreach/draft_pipeline): concurrent
+    # Haiku calls sharing one cached campaign prefix, draft commits every N
+    # results. Campaigns with at least OUTREACH_DRAFT_BATCH_MIN_RECIPIENTS
+    # pending messages go through the Message Batches API instead (50%
+    # pricing, results within minutes to hours); 0 keeps every campaign live.
+    OUTREACH_DRAFT_CONCURRENCY: int = 4
+    OUTREACH_DRAFT_COMMIT_EVERY: int = 25
+    OUTREACH_DRAFT_BATCH_MIN_RECIPIENTS: int = 0
 
     # Redis
     REDIS_URL: str = "redis://localhost:6379"
+    # Operational metrics (platform/metrics, served at /metrics). Each web and
+    # worker process's flush thread adds buffered counter/histogram
+    # increments to shared Redis totals this often, and republishes its shared
+    # gauges (which expire after three missed flushes), so any process can
+    # report fleet-wide numbers.
+    METRICS_FLUSH_SECONDS: float = 10.0
+    # Opt-in per-request SQL profiling (platform/sql_profiler). Outside
+    # production every request is profiled and gets X-DB-* headers; in
+    # production only a SAMPLE_RATE fraction is profiled and logged. A
+    # statement fingerprint repeated DUPLICATE_THRESHOLD times in one request
+    # is reported as a likely N+1; WARN_QUERIES escalates the log line.
+    SQL_PROFILING_ENABLED: bool = False
+    SQL_PROFILING_SAMPLE_RATE: float = 0.01
+    SQL_PROFILING_DUPLICATE_THRESHOLD: int = 5
+    SQL_PROFILING_WARN_QUERIES: int = 50
 
     # Neo4j (optional). Powers the candidate knowledge-graph view and
     # graph predicates in natural-language search. When NEO4J_URI is
@@ -501,6 +546,38 @@ class Settings(BaseSettings):
     # is invisible to a human reader, or a direct instruction to the model).
     CV_DOCUMENT_HYGIENE_ENABLED: bool = True
     CV_HIDDEN_TEXT_STRIP_ENABLED: bool = True
+    # PDF text extraction (services/pdf_extraction). CPU-bound parses run in a
+    # spawn-context process pool of this many workers; 0 (or running inside a
+    # daemonic Celery prefork child, which cannot fork) parses inline. A parse
+    # past the timeout returns "" instead of pinning the worker. Extracted text
+    # is cached by content SHA-256 in Redis for the TTL (0 disables) so
+    # re-synced Workable/Bullhorn resumes are never re-parsed.
+    PDF_EXTRACT_WORKERS: int = 2
+    PDF_EXTRACT_TIMEOUT_SECONDS: float = 30.0
+    PDF_TEXT_CACHE_TTL: int = 30 * 24 * 3600
+    # Pre-warmed assessment sandboxes (components/assessments/sandbox_pool).
+    # Off by default: a pooled sandbox bills E2B time while it idles. When on,
+    # the replenisher keeps up to SIZE bootstrapped sandboxes per frozen task
+    # snapshot for the MAX_TASKS snapshots with the most pending invites, and
+    # the reaper closes any older than MAX_AGE (kept under the E2B sandbox
+    # timeout, which runs from creation).
+    SANDBOX_POOL_ENABLED: bool = False
+    SANDBOX_POOL_SIZE_PER_TASK: int = 2
+    SANDBOX_POOL_MAX_TASKS: int = 10
+    SANDBOX_POOL_MAX_AGE_SECONDS: int = 1800
+    # Rubric grading (components/assessments/rubric_scoring). Model-graded
+    # dimensions of one submission are graded on up to this many threads;
+    # the org cap bounds concurrent grader calls across every submission an
+    # org is scoring in this process. 1 restores strictly sequential grading.
+    RUBRIC_GRADING_CONCURRENCY: int = 4
+    RUBRIC_GRADING_ORG_CONCURRENCY: int = 8
+    # Successful dimension grades are cached by content (rubric_grade_cache),
+    # so retries re-grade only failed dimensions and unchanged re-scores are free.
+    RUBRIC_GRADE_CACHE_ENABLED: bool = True
+    # Taali Chat tool rounds (taali_chat/tool_execution). Read-only tools of
+    # one round run on up to this many threads, each on its own DB session;
+    # writes stay sequential on the request session. 1 = strictly sequential.
+    TAALI_CHAT_TOOL_CONCURRENCY: int = 4
     # What a confirmed hidden-text / injection hit DOES to the score:
     #   "off"  — detect + persist only
     #   "flag" — detect + persist + surface a recruiter reject option (default)
@@ -6,6 +6,7 @@ from sqlalchemy.orm import sessionmaker, DeclarativeBase
 
 from .config import settings
 from .database_url import runtime_database_url
+from .db_pool_metrics import instrument_engine
 
 # Deployed Railway replicas use the private network; local ``railway run``
 # processes use the public proxy because ``*.railway.internal`` is unreachable.
@@ -16,6 +17,8 @@ _sync_engine_kw: dict = {}
 if "sqlite" not in _sync_database_url:
     _sync_engine_kw = {"pool_pre_ping": True, "pool_size": 10, "max_overflow": 20}
 engine = create_engine(_sync_database_url, **_sync_engine_kw)
+# Checkout wait / timeouts / occupancy at /metrics (platform/db_pool_metrics).
+instrument_engine(engine)
 
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
@@ -0,0 +1,110 @@
+"""Connection-pool metrics for the sync SQLAlchemy engine (served at ``/metrics``).
+
+The sync engine's QueuePool (``pool_size`` 10 + ``max_overflow`` 20 per
+process) is shared by every sync route, the ``copy_context`` fan-out pools and
+the request-scoped sessions. When it runs dry, requests queue inside
+``pool.connect()`` and show up only as unexplained latency. This records:
+
+- checkout wait: time from asking the engine for a connection until the pool
+  hands one over (queueing for a free slot, plus opening a new connection when
+  the pool grows or pre-ping replaces a stale one);
+- checkout timeouts (``sqlalchemy.exc.TimeoutError`` after ``pool_timeout``);
+- occupancy of the serving process's pool, sampled at scrape.
+
+SQLAlchemy has no pool event that fires *before* a checkout (``checkout``
+fires once the connection is in hand), so the wait is timed around
+``Engine.raw_connection`` — the single call through which ``Connection``,
+``Session`` and ``engine.connect()`` reach ``pool.connect()``. The wrapper is
+an instance attribute on the engine, so it survives ``engine.dispose()``
+recreating the pool.
+"""
+from __future__ import annotations
+
+import time
+
+from sqlalchemy import exc
+from sqlalchemy.engine import Engine
+
+from .metrics import registry
+
+# Seconds; a healthy checkout is sub-millisecond, a starved one waits up to
+# ``pool_timeout`` (30s by default).
+POOL_WAIT_BUCKETS = (
+    0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5,
+    1.0, 2.5, 5.0, 10.0, 30.0,
+)
+_INSTRUMENTED_ATTR = "_taali_pool_metrics"
+
+checkout_wait_seconds = registry.histogram(
+    "taali_db_pool_checkout_wait_seconds",
+    "Time spent waiting for a pooled database connection.",
+    ("engine",),
+    buckets=POOL_WAIT_BUCKETS,
+    shared=True,
+)
+checkout_timeouts_total = registry.counter(
+    "taali_db_pool_checkout_timeouts_total",
+    "Connection checkouts that gave up after pool_timeout.",
+    ("engine",),
+    shared=True,
+)
+pool_checked_out = registry.gauge(
+    "taali_db_pool_checked_out_connections",
+    "Connections checked out of the serving process's pool, sampled at scrape.",
+    ("engine",),
+)
+pool_overflow = registry.gauge(
+    "taali_db_pool_overflow_connections",
+    "Connections open beyond pool_size in the serving process's pool, sampled at scrape.",
+    ("engine",),
+)
+
+_engines: dict[str, Engine] = {}
+
+
+def instrument_engine(engine: Engine, *, name: str = "primary") -> Engine:
+    """Time connection checkouts on ``engine`` and sample its pool at scrape."""
+    if getattr(engine, _INSTRUMENTED_ATTR, None):
+        return engine
+    raw_connection = engine.raw_connection
+
+    def timed_raw_connection():
+        started = time.perf_counter()
+        try:
+            return raw_connection()
+        except exc.TimeoutError:
+            checkout_timeouts_total.inc(engine=name)
+            raise
+        finally:
+            checkout_wait_seconds.observe(time.perf_counter() - started, engine=name)
+
+    engine.raw_connection = timed_raw_connection  # type: ignore[method-assign]
+    setattr(engine, _INSTRUMENTED_ATTR, name)
+    _engines[name] = engine
+    return engine
+
+
+def sample_pool_usage() -> None:
+    """Set the occupancy gauges from each instrumented engine's current pool."""
+    for name, engine in list(_engines.items()):
+        pool = engine.pool
+        # Only QueuePool tracks occupancy; NullPool / StaticPool (sqlite) do not.
+        checkedout = getattr(pool, "checkedout", None)
+        overflow = getattr(pool, "overflow", None)
+        if checkedout is None or overflow is None:
+            continue
+        pool_checked_out.set(checkedout(), engine=name)
+        pool_overflow.set(max(0, overflow()), engine=name)
+
+
+registry.add_collector(sample_pool_usage)
+
+__all__ = [
+    "POOL_WAIT_BUCKETS",
+    "checkout_timeouts_total",
+    "checkout_wait_seconds",
+    "instrument_engine",
+    "pool_checked_out",
+    "pool_overflow",
+    "sample_pool_usage",
+]
@@ -0,0 +1,526 @@
+"""Lightweight metrics registry for operational numbers, served at ``/metrics``.
+
+The tree has no Prometheus client or OpenTelemetry. This registry keeps
+counters, gauges and fixed-bucket histograms in process and renders them in
+the Prometheus text exposition format, so a scraper or a plain ``curl`` can
+read them.
+
+Web and worker processes are many (uvicorn workers, Celery prefork children),
+so one process's numbers alone would be partial. A counter or histogram
+declared ``shared`` buffers its increments, and a background thread adds them
+to a Redis hash every ``METRICS_FLUSH_SECONDS``, so recording a value never
+waits on Redis. A shared gauge instead publishes this process's absolute
+values under a per-process key that expires after a few missed flushes:
+``render`` sums the live processes, so a worker that dies mid-request drops
+out rather than leaving a phantom count behind. Without Redis (tests, local
+dev) everything stays in process. Flushing is best effort: a failed flush
+drops that batch of increments.
+
+A histogram declared with ``quantiles`` also renders a ``<name>_quantile``
+gauge family (e.g. p50/p95/p99) estimated from its buckets, so a plain
+``curl`` shows latency percentiles; they cover everything since the totals
+started; use ``histogram_quantile`` over ``rate()`` for a recent window.
+
+Tests read values directly (``counter.value(...)``, ``histogram.count(...)``)
+and call ``registry.reset()`` between cases.
+"""
+from __future__ import annotations
+
+import bisect
+import json
+import logging
+import math
+import os
+import socket
+import threading
+import weakref
+from collections.abc import Callable, Iterable
+
+from .config import settings
+
+logger = logging.getLogger("taali.platform.metrics")
+
+# Seconds; spans a fast request through an hour-long sync task.
+DEFAULT_BUCKETS = (
+    0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0,
+    30.0, 60.0, 120.0, 300.0, 600.0, 1800.0, 3600.0,
+)
+_SHARED_KEY = "taali:metrics:v1:{name}"
+# Shared gauges: one hash per process plus a set indexing the live ones.
+_PROCESS_KEY = "taali:metrics:v1:{name}:proc:{process}"
+_PROCESS_INDEX = "taali:metrics:v1:{name}:procs"
+# A process's gauge values expire after this many missed flushes.
+_PROCESS_TTL_FLUSHES = 3
+_MIN_PROCESS_TTL_SECONDS = 30
+
+LabelKey = tuple[str, ...]
+
+
+def _redis():
+    from .redis_cache import cache_redis
+
+    return cache_redis()
+
+
+def _process_id() -> str:
+    return f"{socket.gethostname()}:{os.getpid()}"
+
+
+def _format_value(value: float) -> str:
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+def _escape(value: str) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _label_text(pairs: Iterable[tuple[str, str]]) -> str:
+    pairs = list(pairs)
+    if not pairs:
+        return ""
+    return "{" + ",".join(f'{name}="{_escape(value)}"' for name, value in pairs) + "}"
+
+
+def bucket_quantile(buckets: tuple[float, ...], counts: list[float], q: float) -> float | None:
+    """Estimate the ``q`` quantile from non-cumulative bucket counts.
+
+    ``counts`` has one entry per upper bound in ``buckets`` plus a final
+    overflow (+Inf) bucket. Interpolates linearly inside the bucket holding
+    the rank, like Prometheus ``histogram_quantile``; a rank in the overflow
+    bucket reports the highest finite bound.
+    """
+    total = sum(counts)
+    if total <= 0:
+        return None
+    rank = q * total
+    cumulative = 0.0
+    for index, count in enumerate(counts):
+        if count and cumulative + count >= rank:
+            if index >= len(buckets):
+                return float(buckets[-1])
+            lower = float(buckets[index - 1]) if index else 0.0
+            upper = float(buckets[index])
+            return lower + (upper - lower) * ((rank - cumulative) / count)
+        cumulative += count
+    return float(buckets[-1])
+
+
+class _Metric:
+    kind = ""
+
+    def __init__(
+        self,
+        registry: "MetricsRegistry",
+        name: str,
+        documentation: str,
+        labelnames: Iterable[str],
+        shared: bool,
+    ) -> None:
+        self._registry = registry
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self.shared = shared
+        # {(label values, part): value}. ``part`` is "" for counters and
+        # gauges; histograms use "b<i>" per bucket (non-cumulative) and "sum".
+        self._values: dict[tuple[LabelKey, str], float] = {}
+
+    def _key(self, labels: dict[str, object]) -> LabelKey:
+        if len(labels) != len(self.labelnames) or set(labels) != set(self.labelnames):
+            raise ValueError(
+                f"{self.name} expects labels {self.labelnames}, got {tuple(sorted(labels))}"
+            )
+        return tuple(str(labels[name]) for name in self.labelnames)
+
+    def _add(self, key: LabelKey, part: str, amount: float) -> None:
+        self._registry._add(self, key, part, amount)
+
+    def _lines(self, values: dict[tuple[LabelKey, str], float]) -> list[str]:
+        return [
+            f"{self.name}{_label_text(zip(self.labelnames, key))} {_format_value(value)}"
+            for (key, _part), value in sorted(values.items())
+        ]
+
+
+class Counter(_Metric):
+    kind = "counter"
+
+    def inc(self, amount: float = 1.0, **labels: object) -> None:
+        if amount < 0:
+            raise ValueError("counters only go up")
+        self._add(self._key(labels), "", float(amount))
+
+    def value(self, **labels: object) -> float:
+        return self._values.get((self._key(labels), ""), 0.0)
+
+
+class Gauge(_Metric):
+    kind = "gauge"
+
+    def set(self, value: float, **labels: object) -> None:
+        self._registry._set(self, self._key(labels), float(value))
+
+    def inc(self, amount: float = 1.0, **labels: object) -> None:
+        self._add(self._key(labels), "", float(amount))
+
+    def dec(self, amount: float = 1.0, **labels: object) -> None:
+        self._add(self._key(labels), "", -float(amount))
+
+    def value(self, **labels: object) -> float:
+        return self._values.get((self._key(labels), ""), 0.0)
+
+
+class Histogram(_Metric):
+    kind = "histogram"
+
+    def __init__(
+        self,
+        *args,
+        buckets: Iterable[float] = DEFAULT_BUCKETS,
+        quantiles: Iterable[float] = (),
+        **kwargs,
+    ) -> None:
+        super().__init__(*args, **kwargs)
+        self.buckets = tuple(sorted(float(bound) for bound in buckets))
+        self.quantiles = tuple(sorted(float(q) for q in quantiles))
+        if any(not 0.0 < q < 1.0 for q in self.quantiles):
+            raise ValueError(f"{self.name} quantiles must be between 0 and 1")
+
+    def observe(self, value: float, **labels: object) -> None:
+        key = self._key(labels)
+        value = max(0.0, float(value))
+        index = bisect.bisect_left(self.buckets, value)
+        self._registry._observe(self, key, f"b{index}", value)
+
+    def _counts(self, values: dict[tuple[LabelKey, str], float], key: LabelKey) -> list[float]:
+        return [values.get((key, f"b{index}"), 0.0) for index in range(len(self.buckets) + 1)]
+
+    def count(self, **labels: object) -> float:
+        return sum(self._counts(self._values, self._key(labels)))
+
+    def sum(self, **labels: object) -> float:
+        return self._values.get((self._key(labels), "sum"), 0.0)
+
+    def quantile(self, q: float, **labels: object) -> float | None:
+        return bucket_quantile(self.buckets, self._counts(self._values, self._key(labels)), q)
+
+    def _lines(self, values: dict[tuple[LabelKey, str], float]) -> list[str]:
+        lines: list[str] = []
+        for key in sorted({key for key, _part in values}):
+            pairs = list(zip(self.labelnames, key))
+            counts = self._counts(values, key)
+            cumulative = 0.0
+            for bound, count in zip((*self.buckets, math.inf), counts):
+                cumulative += count
+                le = ("le", _format_value(bound))
+                lines.append(f"{self.name}_bucket{_label_text([*pairs, le])} {_format_value(cumulative)}")
+            lines.append(
+                f"{self.name}_sum{_label_text(pairs)} {_format_value(values.get((key, 'sum'), 0.0))}"
+            )
+            lines.append(f"{self.name}_count{_label_text(pairs)} {_format_value(cumulative)}")
+        return lines
+
+    def _quantile_lines(self, values: dict[tuple[LabelKey, str], float]) -> list[str]:
+        name = f"{self.name}_quantile"
+        lines = [
+            f"# HELP {name} Quantiles of {self.name} estimated from its buckets.",
+            f"# TYPE {name} gauge",
+        ]
+        for key in sorted({key for key, _part in values}):
+            counts = self._counts(values, key)
+            for q in self.quantiles:
+                estimate = bucket_quantile(self.buckets, counts, q)
+                if estimate is None:
+                    continue
+                pairs = [*zip(self.labelnames, key), ("quantile", _format_value(q))]
+                lines.append(f"{name}{_label_text(pairs)} {_format_value(estimate)}")
+        return lines
+
+
+class MetricsRegistry:
+    def __init__(self) -> None:
+        self._metrics: dict[str, _Metric] = {}
+        self._collectors: list[Callable[[], None]] = []
+        self._pending: dict[tuple[str, str], float] = {}
+        self._fields: dict[tuple[LabelKey, str], str] = {}
+        self._lock = threading.Lock()
+        self._flusher_pid: int | None = None
+        self._stop = threading.Event()
+        _registries.add(self)
+
+    # -- definition --------------------------------------------------------
+
+    def _register(self, metric: _Metric) -> _Metric:
+        with self._lock:
+            existing = self._metrics.get(metric.name)
+            if existing is not None:
+                if existing.kind != metric.kind or existing.labelnames != metric.labelnames:
+                    raise ValueError(f"metric {metric.name} already registered differently")
+                return existing
+            self._metrics[metric.name] = metric
+            return metric
+
+    def counter(self, name: str, documentation: str, labelnames: Iterable[str] = (), *, shared: bool = False) -> Counter:
+        return self._register(Counter(self, name, documentation, labelnames, shared))  # type: ignore[return-value]
+
+    def gauge(self, name: str, documentation: str, labelnames: Iterable[str] = (), *, shared: bool = False) -> Gauge:
+        return self._register(Gauge(self, name, documentation, labelnames, shared))  # type: ignore[return-value]
+
+    def histogram(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Iterable[str] = (),
+        *,
+        buckets: Iterable[float] = DEFAULT_BUCKETS,
+        quantiles: Iterable[float] = (),
+        shared: bool = False,
+    ) -> Histogram:
+        metric = Histogram(
+            self, name, documentation, labelnames, shared, buckets=buckets, quantiles=quantiles
+        )
+        return self._register(metric)  # type: ignore[return-value]
+
+    def add_collector(self, collector: Callable[[], None]) -> None:
+        """Run ``collector`` before every render, e.g. to sample a gauge."""
+        with self._lock:
+            if collector not in self._collectors:
+                self._collectors.append(collector)
+
+    def get(self, name: str) -> _Metric | None:
+        return self._metrics.get(name)
+
+    # -- updates -----------------------------------------------------------
+
+    def _field(self, key: LabelKey, part: str) -> str:
+        field = self._fields.get((key, part))
+        if field is None:
+            field = json.dumps([*key, part], separators=(",", ":"))
+            self._fields[(key, part)] = field
+        return field
+
+    def _add_locked(self, metric: _Metric, key: LabelKey, part: str, amount: float) -> None:
+        slot = (key, part)
+        metric._values[slot] = metric._values.get(slot, 0.0) + amount
+        # Shared gauges publish absolute values at flush, not increments.
+        if metric.shared and metric.kind != "gauge":
+            pending = (metric.name, self._field(key, part))
+            self._pending[pending] = self._pending.get(pending, 0.0) + amount
+
+    def _add(self, metric: _Metric, key: LabelKey, part: str, amount: float) -> None:
+        with self._lock:
+            self._add_locked(metric, key, part, amount)
+        if metric.shared:
+            self._ensure_flusher()
+
+    def _observe(self, metric: _Metric, key: LabelKey, part: str, value: float) -> None:
+        with self._lock:
+            self._add_locked(metric, key, part, 1.0)
+            self._add_locked(metric, key, "sum", value)
+        if metric.shared:
+            self._ensure_flusher()
+
+    def _set(self, metric: _Metric, key: LabelKey, value: float) -> None:
+        with self._lock:
+            metric._values[(key, "")] = value
+        if metric.shared:
+            self._ensure_flusher()
+
+    # -- shared totals -----------------------------------------------------
+
+    def _ensure_flusher(self) -> None:
+        """Start this process's flush thread on its first shared update."""
+        pid = os.getpid()
+        if self._flusher_pid == pid:
+            return
+        with self._lock:
+            if self._flusher_pid == pid:
+                return
+            self._flusher_pid = pid
+            self._stop = threading.Event()
+            threading.Thread(
+                target=self._flush_loop, args=(self._stop,), name="metrics-flush", daemon=True
+            ).start()
+
+    def _flush_loop(self, stop: threading.Event) -> None:
+        while not stop.wait(settings.METRICS_FLUSH_SECONDS):
+            try:
+                self.flush()
+            except Exception:  # pragma: no cover — keep flushing on the next tick
+                logger.warning("metrics flush failed", exc_info=True)
+
+    def flush(self) -> bool:
+        """Add buffered shared increments to Redis and publish shared gauges."""
+        with self._lock:
+            pending, self._pending = self._pending, {}
+            gauges = {
+                metric.name: {
+                    self._field(key, part): value for (key, part), value in metric._values.items()
+                }
+                for metric in self._metrics.values()
+                if metric.shared and metric.kind == "gauge"
+            }
+        if not pending and not gauges:
+            return True
+        r = _redis()
+        if r is None:
+            return False
+        process = _process_id()
+        ttl = max(_MIN_PROCESS_TTL_SECONDS, int(settings.METRICS_FLUSH_SECONDS * _PROCESS_TTL_FLUSHES))
+        try:
+            pipe = r.pipeline(transaction=False)
+            for (name, field), amount in pending.items():
+                pipe.hincrbyfloat(_SHARED_KEY.format(name=name), field, amount)
+            for name, values in gauges.items():
+                key = _PROCESS_KEY.format(name=name, process=process)
+                pipe.delete(key)
+                if values:
+                    pipe.hset(key, mapping=values)
+                    pipe.expire(key, ttl)
+                    pipe.sadd(_PROCESS_INDEX.format(name=name), key)
+            pipe.execute()
+        except Exception:  # pragma: no cover — metrics are best-effort
+            from .redis_cache import mark_cache_redis_failed
+
+            mark_cache_redis_failed()
+            logger.warning("metrics flush failed; dropped %d increments", len(pending))
+            return False
+        return True
+
+    def shutdown(self) -> None:
+        """Stop the flush thread, push what is buffered and withdraw this process's gauges."""
+        with self._lock:
+            self._stop.set()
+            self._flusher_pid = None
+            for metric in self._metrics.values():
+                if metric.shared and metric.kind == "gauge":
+                    metric._values.clear()
+        self.flush()
+
+    @staticmethod
+    def _decode(fields) -> dict[tuple[LabelKey, str], float]:
+        values: dict[tuple[LabelKey, str], float] = {}
+        for field, value in (fields or {}).items():
+            try:
+                decoded = json.loads(field)
+                values[(tuple(decoded[:-1]), decoded[-1])] = float(value)
+            except (TypeError, ValueError):
+                continue
+        return values
+
+    def _process_gauge_values(self, r, metrics: list[_Metric]) -> dict[str, dict[tuple[LabelKey, str], float]]:
+        """Sum each shared gauge over the processes whose values have not expired."""
+        pipe = r.pipeline(transaction=False)
+        for metric in metrics:
+            pipe.smembers(_PROCESS_INDEX.format(name=metric.name))
+        members = pipe.execute()
+        for keys in members:
+            for key in keys:
+                pipe.hgetall(key)
+        raw = iter(pipe.execute())
+        shared: dict[str, dict[tuple[LabelKey, str], float]] = {}
+        for metric, keys in zip(metrics, members):
+            totals: dict[tuple[LabelKey, str], float] = {}
+            for key in keys:
+                fields = next(raw)
+                if not fields:
+                    # Expired: the process stopped flushing (exited or died).
+                    pipe.srem(_PROCESS_INDEX.format(name=metric.name), key)
+                for slot, value in self._decode(fields).items():
+                    totals[slot] = totals.get(slot, 0.0) + value
+            shared[metric.name] = totals
+        pipe.execute()
+        return shared
+
+    def _shared_values(self, metrics: list[_Metric]) -> dict[str, dict[tuple[LabelKey, str], float]]:
+        r = _redis() if metrics else None
+        if r is None:
+            return {}
+        totals = [metric for metric in metrics if metric.kind != "gauge"]
+        gauges = [metric for metric in metrics if metric.kind == "gauge"]
+        try:
+            pipe = r.pipeline(transaction=False)
+            for metric in totals:
+                pipe.hgetall(_SHARED_KEY.format(name=metric.name))
+            raw = pipe.execute()
+            shared = self._process_gauge_values(r, gauges) if gauges else {}
+        except Exception:  # pragma: no cover — fall back to process values
+            from .redis_cache import mark_cache_redis_failed
+
+            mark_cache_redis_failed()
+            return {}
+        for metric, fields in zip(totals, raw):
+            shared[metric.name] = self._decode(fields)
+        return shared
+
+    # -- exposition --------------------------------------------------------
+
+    def render(self) -> str:
+        """Prometheus text exposition of every metric (fleet-wide when shared)."""
+        for collector in list(self._collectors):
+            try:
+                collector()
+            except Exception:  # pragma: no cover — one sampler must not break /metrics
+                logger.warning("metrics collector %r failed", collector, exc_info=True)
+        self.flush()
+        metrics = sorted(self._metrics.values(), key=lambda metric: metric.name)
+        shared = self._shared_values([metric for metric in metrics if metric.shared])
+        lines: list[str] = []
+        for metric in metrics:
+            if metric.name in shared:
+                values = shared[metric.name]
+            else:
+                with self._lock:
+                    values = dict(metric._values)
+            lines.append(f"# HELP {metric.name} {metric.documentation}")
+            lines.append(f"# TYPE {metric.name} {metric.kind}")
+            lines.extend(metric._lines(values))
+            if isinstance(metric, Histogram) and metric.quantiles:
+                lines.extend(metric._quantile_lines(values))
+        return "\n".join(lines) + "\n"
+
+    def reset(self) -> None:
+        """Zero every process-local value and drop buffered increments."""
+        with self._lock:
+            for metric in self._metrics.values():
+                metric._values.clear()
+            self._pending.clear()
+
+    def _forget_in_child(self) -> None:
+        # The parent's buffered increments and gauge values are the parent's
+        # to publish; its flush thread did not survive the fork.
+        self._lock = threading.Lock()
+        self._pending = {}
+        self._flusher_pid = None
+        self._stop = threading.Event()
+        for metric in self._metrics.values():
+            if metric.shared and metric.kind == "gauge":
+                metric._values.clear()
+
+
+_registries: "weakref.WeakSet[MetricsRegistry]" = weakref.WeakSet()
+
+
+def _forget_in_child() -> None:
+    """Start a forked child (prefork Celery, gunicorn) without the parent's metric state."""
+    for metrics_registry in list(_registries):
+        metrics_registry._forget_in_child()
+
+
+os.register_at_fork(after_in_child=_forget_in_child)
+
+registry = MetricsRegistry()
+
+__all__ = [
+    "Counter",
+    "DEFAULT_BUCKETS",
+    "Gauge",
+    "Histogram",
+    "MetricsRegistry",
+    "bucket_quantile",
+    "registry",
+]
@@ -1,22 +1,36 @@
+"""Pure ASGI middleware for the API app.
+
+Each class wraps ``send`` (and, for the SSO check, ``receive``) directly
+instead of subclassing ``BaseHTTPMiddleware``, so no middleware adds an extra
+task or response stream per request and streaming responses pass through
+untouched.
+"""
+
+import json
 import time
 import uuid
 import logging
+import random
 import re
-from collections import defaultdict
 from urllib.parse import parse_qs, urlparse, urlsplit, urlunsplit
 from fastapi import Request
-from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.concurrency import run_in_threadpool
+from starlette.datastructures import MutableHeaders
 from starlette.responses import JSONResponse
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+from .metrics import registry
 from .request_context import set_client_meta, set_request_id
+from .sql_profiler import profile_queries
 from .config import settings
 from ..domains.identity_access.access_policy import evaluate_login_access
 from ..models.api_key import KEY_PREFIX_LIVE, KEY_PREFIX_TEST
+from ..services.rate_limit import consume_rate_limits, rate_limit_may_block
 
 logger = logging.getLogger("tali.middleware")
 
-# In-memory rate limit: key -> list of request timestamps (pruned to last window_sec)
-_rate_limit_store = defaultdict(list)
 _RATE_WINDOW_SEC = 60
+# Namespace for the middleware's buckets in the shared limiter store.
+_RATE_KEY_PREFIX = "http:"
 
 _API_KEY_PREFIXES = (KEY_PREFIX_LIVE, KEY_PREFIX_TEST)
 # Bucket a tali_* key on a stable slice of the token (never the whole secret,
@@ -62,41 +76,57 @@ def is_candidate_assessment_path(path: str) -> bool:
     )
 
 
-def apply_candidate_security_headers(response):
-    """Apply the cache/browser policy shared by candidate API responses."""
-    response.headers["Cache-Control"] = "private, no-store, max-age=0, must-revalidate"
-    response.headers["Pragma"] = "no-cache"
-    response.headers["Expires"] = "0"
-    response.headers["Referrer-Policy"] = "no-referrer"
-    response.headers["Content-Security-Policy"] = (
+_CANDIDATE_SECURITY_HEADERS = {
+    "Cache-Control": "private, no-store, max-age=0, must-revalidate",
+    "Pragma": "no-cache",
+    "Expires": "0",
+    "Referrer-Policy": "no-referrer",
+    "Content-Security-Policy": (
         "default-src 'none'; base-uri 'none'; form-action 'none'; frame-ancestors 'none'"
-    )
-    response.headers["Permissions-Policy"] = (
+    ),
+    "Permissions-Policy": (
         "camera=(), microphone=(), geolocation=(), payment=(), usb=(), "
         "serial=(), bluetooth=(), browsing-topics=(), clipboard-read=(), "
         "clipboard-write=(), display-capture=()"
-    )
+    ),
+}
+
+
+def apply_candidate_security_headers(response):
+    """Apply the cache/browser policy shared by candidate API responses."""
+    for name, value in _CANDIDATE_SECURITY_HEADERS.items():
+        response.headers[name] = value
     return response
 
 
-class SecurityHeadersMiddleware(BaseHTTPMiddleware):
+class SecurityHeadersMiddleware:
     """Add global headers plus stricter cache/browser policy to candidate APIs."""
 
-    def __init__(self, app, *, production: bool = False):
-        super().__init__(app)
+    def __init__(self, app: ASGIApp, *, production: bool = False):
+        self.app = app
         self.production = bool(production)
 
-    async def dispatch(self, request: Request, call_next):
-        response = await call_next(request)
-        response.headers["X-Content-Type-Options"] = "nosniff"
-        response.headers["X-Frame-Options"] = "DENY"
-        response.headers["Referrer-Policy"] = "strict-origin-when-cross-origin"
-        response.headers["Permissions-Policy"] = "camera=(), microphone=(), geolocation=()"
-        if is_candidate_assessment_path(request.url.path):
-            apply_candidate_security_headers(response)
-        if self.production:
-            response.headers["Strict-Transport-Security"] = "max-age=63072000; includeSubDomains"
-        return response
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        candidate_path = is_candidate_assessment_path(scope["path"])
+
+        async def send_with_headers(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                headers = MutableHeaders(scope=message)
+                headers["X-Content-Type-Options"] = "nosniff"
+                headers["X-Frame-Options"] = "DENY"
+                headers["Referrer-Policy"] = "strict-origin-when-cross-origin"
+                headers["Permissions-Policy"] = "camera=(), microphone=(), geolocation=()"
+                if candidate_path:
+                    for name, value in _CANDIDATE_SECURITY_HEADERS.items():
+                        headers[name] = value
+                if self.production:
+                    headers["Strict-Transport-Security"] = "max-age=63072000; includeSubDomains"
+            await send(message)
+
+        await self.app(scope, receive, send_with_headers)
 
 
 def scrub_sentry_candidate_request(event: dict, _hint: dict | None = None) -> dict:
@@ -237,146 +267,329 @@ def _rate_limit_max(key: str) -> int:
     return 0
 
 
-class RateLimitMiddleware(BaseHTTPMiddleware):
-    """Return 429 when too many requests per IP for auth and assessment endpoints."""
+class RateLimitMiddleware:
+    """Return 429 when too many requests per IP for auth and assessment endpoints.
+
+    Buckets are counted in the shared limiter (:mod:`app.services.rate_limit`),
+    so limits hold across replicas when Redis is available.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
 
-    async def dispatch(self, request: Request, call_next):
-        ip = _get_client_ip(request)
-        path = request.url.path
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        path = scope["path"]
+        request = Request(scope)
         if path == "/mcp" or path.startswith("/mcp/"):
             # Public MCP mount (JWT or tali_* API key). Multi-bucket: per
             # unverified-key-prefix scoped by IP, plus a per-IP guard.
-            buckets = _mcp_buckets(request, ip)
+            buckets = _mcp_buckets(request, _get_client_ip(request))
         else:
-            key = _rate_limit_key(ip, path)
+            key = _rate_limit_key(_get_client_ip(request), path)
             buckets = [(key, _rate_limit_max(key))] if key else []
+        buckets = [(f"{_RATE_KEY_PREFIX}{key}", limit) for key, limit in buckets if limit > 0]
+        if not buckets:
+            await self.app(scope, receive, send)
+            return
+
+        if rate_limit_may_block():
+            # Keep the (blocking) Redis round trip off the event loop.
+            denied = await run_in_threadpool(
+                consume_rate_limits, buckets, window_seconds=_RATE_WINDOW_SEC
+            )
+        else:
+            denied = consume_rate_limits(buckets, window_seconds=_RATE_WINDOW_SEC)
+        if denied is None:
+            await self.app(scope, receive, send)
+            return
+        logger.warning(
+            "Rate limit exceeded key=%s path=%s",
+            denied[len(_RATE_KEY_PREFIX):],
+            redact_sensitive_request_path(path),
+        )
+        response = JSONResponse(
+            status_code=429,
+            content={"detail": "Too many requests. Please try again later."},
+        )
+        if is_candidate_assessment_path(path):
+            apply_candidate_security_headers(response)
+        await response(scope, receive, send)
 
-        now = time.time()
-        window_start = now - _RATE_WINDOW_SEC
-        counted = []
-        for key, max_allowed in buckets:
-            if max_allowed <= 0:
-                # Disabled bucket (e.g. MCP_RATE_LIMIT_PER_MINUTE=0).
-                continue
-            store = _rate_limit_store[key]
-            store[:] = [t for t in store if t > window_start]
-            if len(store) >= max_allowed:
-                logger.warning(
-                    "Rate limit exceeded key=%s path=%s",
-                    key,
-                    redact_sensitive_request_path(path),
-                )
-                response = JSONResponse(
-                    status_code=429,
-                    content={"detail": "Too many requests. Please try again later."},
-                )
-                if is_candidate_assessment_path(path):
-                    apply_candidate_security_headers(response)
-                return response
-            counted.append(store)
-        for store in counted:
-            store.append(now)
-        return await call_next(request)
-
-
-class RequestLoggingMiddleware(BaseHTTPMiddleware):
-    """Log every request with method, path, status, and duration."""
-
-    async def dispatch(self, request: Request, call_next):
-        start_time = time.time()
+
+# Seconds; request latency up to the proxy's timeout.
+HTTP_LATENCY_BUCKETS = (
+    0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0,
+)
+_METRIC_METHODS = frozenset({"GET", "HEAD", "POST", "PUT", "PATCH", "DELETE", "OPTIONS"})
+# Requests no route matched (404s, scanners) share one series.
+_UNMATCHED_ROUTE = "<unmatched>"
+
+http_request_duration_seconds = registry.histogram(
+    "taali_http_request_duration_seconds",
+    "Time to response start, by route template and status class.",
+    ("method", "route", "status_class"),
+    buckets=HTTP_LATENCY_BUCKETS,
+    quantiles=(0.5, 0.95, 0.99),
+    shared=True,
+)
+http_requests_in_flight = registry.gauge(
+    "taali_http_requests_in_flight",
+    "Requests currently being handled.",
+    ("method",),
+    shared=True,
+)
+
+
+def _route_label(scope: Scope, root_path: str) -> str:
+    """Route template for metrics labels, so ``/roles/12`` and ``/roles/13`` share a series."""
+    # A Mount (e.g. /mcp) extends root_path by its prefix; it sets no route
+    # itself, but a routed sub-app's templates are relative to that prefix.
+    current_root = str(scope.get("root_path", ""))
+    mount_prefix = current_root[len(root_path):] if current_root.startswith(root_path) else ""
+    route = scope.get("route")
+    template = getattr(route, "path_format", None) or getattr(route, "path", None)
+    if template:
+        return f"{mount_prefix}{template}"
+    return mount_prefix or _UNMATCHED_ROUTE
+
+
+class RequestLoggingMiddleware:
+    """Log every request with method, path, status, and duration.
+
+    Also feeds the request metrics at ``/metrics``: a latency histogram per
+    method, route template (never the raw path, which would explode label
+    cardinality) and status class, and an in-flight gauge. Both are shared
+    metrics, so the per-request cost is a locked dict update; the metrics
+    flush thread writes to Redis every ``METRICS_FLUSH_SECONDS``.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        start_time = time.perf_counter()
+        request = Request(scope)
         request_id = request.headers.get("X-Request-ID") or str(uuid.uuid4())
-        request.state.request_id = request_id
+        scope.setdefault("state", {})["request_id"] = request_id
         set_request_id(request_id)
         set_client_meta(_get_client_ip(request), request.headers.get("user-agent"))
-        response = await call_next(request)
-
-        duration_ms = (time.time() - start_time) * 1000
-
-        if request.url.path != "/health":
-            logger.info(
-                "method=%s path=%s status=%d duration=%.1fms",
-                request.method,
-                redact_sensitive_request_path(request.url.path),
-                response.status_code,
-                duration_ms,
-                extra={"request_id": request_id},
+        path = scope["path"]
+        root_path = scope.get("root_path", "")
+        method = scope["method"] if scope["method"] in _METRIC_METHODS else "OTHER"
+        observed = False
+
+        def observe(status_code: int, seconds: float) -> None:
+            nonlocal observed
+            observed = True
+            http_request_duration_seconds.observe(
+                seconds,
+                method=method,
+                route=_route_label(scope, root_path),
+                status_class=f"{status_code // 100}xx",
             )
 
-        response.headers["X-Process-Time-Ms"] = f"{duration_ms:.1f}"
-        response.headers["X-Request-ID"] = request_id
+        async def send_with_timing(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                elapsed = time.perf_counter() - start_time
+                observe(message["status"], elapsed)
+                duration_ms = elapsed * 1000
+                if path != "/health":
+                    logger.info(
+                        "method=%s path=%s status=%d duration=%.1fms",
+                        scope["method"],
+                        redact_sensitive_request_path(path),
+                        message["status"],
+                        duration_ms,
+                        extra={"request_id": request_id},
+                    )
+                headers = MutableHeaders(scope=message)
+                headers["X-Process-Time-Ms"] = f"{duration_ms:.1f}"
+                headers["X-Request-ID"] = request_id
+            await send(message)
 
-        return response
+        http_requests_in_flight.inc(method=method)
+        try:
+            await self.app(scope, receive, send_with_timing)
+        finally:
+            http_requests_in_flight.dec(method=method)
+            if not observed:
+                # Raised before responding; ServerErrorMiddleware answers 500.
+                observe(500, time.perf_counter() - start_time)
 
 
-class EnterpriseAccessMiddleware(BaseHTTPMiddleware):
-    """Enforce org-level SSO policy for password-based auth endpoints."""
+class SQLProfilingMiddleware:
+    """Opt-in per-request SQL profile: query count, DB time, N+1 fingerprints.
 
-    async def dispatch(self, request: Request, call_next):
-        path = request.url.path
-        if request.method != "POST":
-            return await call_next(request)
+    Off unless ``SQL_PROFILING_ENABLED``. Outside production every request is
+    profiled, answered with ``X-DB-Query-Count`` / ``X-DB-Time-Ms`` /
+    ``X-DB-Duplicate-Statements`` and logged (a warning with the repeated and
+    slowest statements when it looks like an N+1 or exceeds the query
+    budget). In production a sampled fraction is profiled and only logged, so
+    statement text never reaches a client.
+    """
 
-        if path not in {"/api/v1/auth/jwt/login", "/api/v1/auth/forgot-password"}:
-            return await call_next(request)
+    def __init__(self, app: ASGIApp, *, production: bool = False):
+        self.app = app
+        self.production = bool(production)
 
-        email = ""
-        try:
-            body = await request.body()
-            if not body:
-                return await call_next(request)
-            if path.endswith("/jwt/login"):
-                params = parse_qs(body.decode("utf-8", errors="ignore"))
-                email = (params.get("username") or [""])[0].strip().lower()
-            else:
-                import json as _json
-
-                payload = _json.loads(body.decode("utf-8", errors="ignore"))
-                if isinstance(payload, dict):
-                    email = str(payload.get("email") or "").strip().lower()
-        except Exception:
-            # If parsing fails, don't block endpoint behavior.
-            return await call_next(request)
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or not settings.SQL_PROFILING_ENABLED:
+            await self.app(scope, receive, send)
+            return
+        if self.production and random.random() >= settings.SQL_PROFILING_SAMPLE_RATE:
+            await self.app(scope, receive, send)
+            return
+        threshold = int(settings.SQL_PROFILING_DUPLICATE_THRESHOLD)
+        status_code = 500
+
+        with profile_queries() as profile:
+
+            async def send_with_profile(message: Message) -> None:
+                nonlocal status_code
+                if message["type"] == "http.response.start":
+                    status_code = message["status"]
+                    if not self.production:
+                        headers = MutableHeaders(scope=message)
+                        headers["X-DB-Query-Count"] = str(profile.query_count)
+                        headers["X-DB-Time-Ms"] = f"{profile.db_ms:.1f}"
+                        headers["X-DB-Duplicate-Statements"] = str(
+                            len(profile.duplicates(threshold))
+                        )
+                await send(message)
+
+            try:
+                await self.app(scope, receive, send_with_profile)
+            finally:
+                self._log(scope, status_code, profile, threshold)
+
+    def _log(self, scope: Scope, status_code: int, profile, threshold: int) -> None:
+        duplicates = profile.duplicates(threshold)
+        suspicious = bool(duplicates) or profile.query_count > settings.SQL_PROFILING_WARN_QUERIES
+        detailed = self.production or suspicious
+        logger.log(
+            logging.WARNING if suspicious else logging.INFO,
+            "sql_profile method=%s path=%s status=%d queries=%d db_ms=%.1f duplicates=%s slowest=%s",
+            scope["method"],
+            redact_sensitive_request_path(scope["path"]),
+            status_code,
+            profile.query_count,
+            profile.db_ms,
+            json.dumps([stats.as_dict() for stats in duplicates[:3]]) if detailed else len(duplicates),
+            json.dumps(profile.slowest()[:3]) if detailed else "-",
+        )
 
-        if not email:
-            return await call_next(request)
 
-        from ..platform.database import SessionLocal
-        from ..models.user import User
-        from ..models.organization import Organization
-        from ..domains.identity_access.access_policy import email_domain, normalize_allowed_domains
+_SSO_GUARDED_PATHS = frozenset({"/api/v1/auth/jwt/login", "/api/v1/auth/forgot-password"})
 
-        db = SessionLocal()
-        try:
-            user = db.query(User).filter(User.email == email).first()
-            if user and user.organization_id:
-                org = db.query(Organization).filter(Organization.id == user.organization_id).first()
-                decision = evaluate_login_access(
-                    email=email,
-                    sso_enforced=bool(getattr(org, "sso_enforced", False)) if org else False,
-                    organization_id=user.organization_id,
-                )
-                if not decision.allowed:
-                    return JSONResponse(
-                        status_code=403,
-                        content={"detail": decision.reason or "Access denied by organization policy."},
+
+async def _read_body(receive: Receive) -> tuple[bytes, list[Message]]:
+    """Drain the request body, keeping the raw messages for replay downstream."""
+    messages: list[Message] = []
+    chunks: list[bytes] = []
+    while True:
+        message = await receive()
+        messages.append(message)
+        if message["type"] != "http.request":
+            break
+        chunks.append(message.get("body", b""))
+        if not message.get("more_body", False):
+            break
+    return b"".join(chunks), messages
+
+
+def _replay_receive(messages: list[Message], receive: Receive) -> Receive:
+    pending = list(messages)
+
+    async def replay() -> Message:
+        if pending:
+            return pending.pop(0)
+        return await receive()
+
+    return replay
+
+
+def _login_email(path: str, body: bytes) -> str:
+    if path.endswith("/jwt/login"):
+        params = parse_qs(body.decode("utf-8", errors="ignore"))
+        return (params.get("username") or [""])[0].strip().lower()
+    payload = json.loads(body.decode("utf-8", errors="ignore"))
+    if isinstance(payload, dict):
+        return str(payload.get("email") or "").strip().lower()
+    return ""
+
+
+def _sso_denial_reason(email: str) -> str | None:
+    """Reason the org's SSO policy blocks password auth for ``email``, else None."""
+    from ..platform.database import SessionLocal
+    from ..models.user import User
+    from ..models.organization import Organization
+    from ..domains.identity_access.access_policy import email_domain, normalize_allowed_domains
+
+    db = SessionLocal()
+    try:
+        user = db.query(User).filter(User.email == email).first()
+        if user and user.organization_id:
+            org = db.query(Organization).filter(Organization.id == user.organization_id).first()
+            decision = evaluate_login_access(
+                email=email,
+                sso_enforced=bool(getattr(org, "sso_enforced", False)) if org else False,
+                organization_id=user.organization_id,
+            )
+            if not decision.allowed:
+                return decision.reason or "Access denied by organization policy."
+            return None
+        domain = email_domain(email)
+        if domain:
+            sso_orgs = db.query(Organization).filter(Organization.sso_enforced == True).all()  # noqa: E712
+            for org in sso_orgs:
+                allowed_domains = normalize_allowed_domains(getattr(org, "allowed_email_domains", None))
+                if allowed_domains and domain in allowed_domains:
+                    decision = evaluate_login_access(
+                        email=email,
+                        sso_enforced=True,
+                        organization_id=org.id,
                     )
-            else:
-                domain = email_domain(email)
-                if domain:
-                    sso_orgs = db.query(Organization).filter(Organization.sso_enforced == True).all()  # noqa: E712
-                    for org in sso_orgs:
-                        allowed_domains = normalize_allowed_domains(getattr(org, "allowed_email_domains", None))
-                        if allowed_domains and domain in allowed_domains:
-                            decision = evaluate_login_access(
-                                email=email,
-                                sso_enforced=True,
-                                organization_id=org.id,
-                            )
-                            return JSONResponse(
-                                status_code=403,
-                                content={"detail": decision.reason or "Access denied by organization policy."},
-                            )
-        finally:
-            db.close()
+                    return decision.reason or "Access denied by organization policy."
+        return None
+    finally:
+        db.close()
+
 
-        return await call_next(request)
+class EnterpriseAccessMiddleware:
+    """Enforce org-level SSO policy for password-based auth endpoints."""
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if (
+            scope["type"] != "http"
+            or scope["method"] != "POST"
+            or scope["path"] not in _SSO_GUARDED_PATHS
+        ):
+            await self.app(scope, receive, send)
+            return
+
+        body, messages = await _read_body(receive)
+        downstream_receive = _replay_receive(messages, receive)
+        try:
+            email = _login_email(scope["path"], body) if body else ""
+        except Exception:
+            # If parsing fails, don't block endpoint behavior.
+            email = ""
+        if not email:
+            await self.app(scope, downstream_receive, send)
+            return
+
+        reason = await run_in_threadpool(_sso_denial_reason, email)
+        if reason is not None:
+            response = JSONResponse(status_code=403, content={"detail": reason})
+            await response(scope, downstream_receive, send)
+            return
+        await self.app(scope, downstream_receive, send)
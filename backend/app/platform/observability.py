@@ -0,0 +1,37 @@
+"""Request metrics, SQL profiling and the ``/metrics`` endpoint, wired as one unit.
+
+``app.main`` composes the application; the observability pieces live here so
+the composition root only calls ``install_request_observability``, includes
+``metrics_router`` and calls ``shutdown_observability`` from its lifespan.
+"""
+from __future__ import annotations
+
+from fastapi import APIRouter, Depends, FastAPI
+from fastapi.responses import Response
+
+from .admin_auth import require_admin_secret
+from .metrics import registry
+from .middleware import RequestLoggingMiddleware, SQLProfilingMiddleware
+
+metrics_router = APIRouter()
+
+
+@metrics_router.get("/metrics", dependencies=[Depends(require_admin_secret)], include_in_schema=False)
+def metrics_exposition():
+    """Operational metrics (platform/metrics) in the Prometheus text format."""
+    return Response(registry.render(), media_type="text/plain; version=0.0.4; charset=utf-8")
+
+
+def install_request_observability(app: FastAPI, *, production: bool) -> None:
+    """Add request logging/metrics and, inside it, opt-in SQL profiling."""
+    # Starlette runs the last-added middleware outermost.
+    app.add_middleware(SQLProfilingMiddleware, production=production)
+    app.add_middleware(RequestLoggingMiddleware)
+
+
+def shutdown_observability() -> None:
+    """Push this worker's buffered shared metrics and withdraw its gauges."""
+    registry.shutdown()
+
+
+__all__ = ["install_request_observability", "metrics_router", "shutdown_observability"]
@@ -0,0 +1,96 @@
+"""Process-wide pooled Redis client for best-effort caches.
+
+Cache readers used to build a fresh ``redis.Redis.from_url`` client (and so a
+fresh TCP connection) on every call. This module hands out one shared client
+per process, backed by a blocking connection pool that is safe to use from the
+worker threads the search and scoring paths fan out to.
+
+Callers treat Redis as optional: ``cache_redis()`` returns None when no
+``REDIS_URL`` is configured or after a recent failure (reported with
+``mark_cache_redis_failed``), so an unreachable Redis costs one socket timeout
+per cooldown rather than one per lookup.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import threading
+import time
+
+from .config import settings
+
+logger = logging.getLogger("taali.platform.redis_cache")
+
+# Sized for the widest fan-out (the search grounding pool) plus headroom; a
+# thread that finds the pool exhausted waits up to the socket timeout.
+_MAX_CONNECTIONS = 32
+_SOCKET_TIMEOUT_SECONDS = 2.0
+_RETRY_COOLDOWN_SECONDS = 30.0
+
+_client = None
+_failed_at: float | None = None
+_lock = threading.Lock()
+
+
+def cache_redis():
+    """The shared cache client, or None when Redis is unconfigured / cooling off."""
+    global _client
+    url = getattr(settings, "REDIS_URL", None)
+    if not url:
+        return None
+    with _lock:
+        if _failed_at is not None and time.monotonic() - _failed_at < _RETRY_COOLDOWN_SECONDS:
+            return None
+        if _client is None:
+            try:
+                import redis
+
+                pool = redis.BlockingConnectionPool.from_url(
+                    url,
+                    max_connections=_MAX_CONNECTIONS,
+                    timeout=_SOCKET_TIMEOUT_SECONDS,
+                    socket_connect_timeout=_SOCKET_TIMEOUT_SECONDS,
+                    socket_timeout=_SOCKET_TIMEOUT_SECONDS,
+                )
+                _client = redis.Redis(connection_pool=pool)
+            except Exception:  # pragma: no cover — cache is best-effort
+                logger.debug("cache redis client init failed", exc_info=True)
+                return None
+        return _client
+
+
+def mark_cache_redis_failed() -> None:
+    """Skip the shared cache for a cooldown after a connection/command error."""
+    global _failed_at
+    with _lock:
+        _failed_at = time.monotonic()
+
+
+def reset_cache_redis() -> None:
+    """Drop the shared client and any failure cooldown (tests)."""
+    global _client, _failed_at
+    with _lock:
+        client, _client, _failed_at = _client, None, None
+    if client is not None:
+        try:
+            client.connection_pool.disconnect()
+        except Exception:  # pragma: no cover
+            pass
+
+
+def _forget_in_child() -> None:
+    """Start a forked child (prefork Celery, gunicorn) without the parent's client.
+
+    The pooled sockets belong to the parent, so they are dropped rather than
+    disconnected, and the lock is replaced in case a parent thread held it
+    across the fork.
+    """
+    global _client, _failed_at, _lock
+    _client, _failed_at, _lock = None, None, threading.Lock()
+
+
+os.register_at_fork(after_in_child=_forget_in_child)
+
+
+__all__ = ["cache_redis", "mark_cache_redis_failed", "reset_cache_redis"]
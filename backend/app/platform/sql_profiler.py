@@ -0,0 +1,200 @@
+"""Per-request SQL profiling and N+1 detection on SQLAlchemy engine events.
+
+Hot routes mix eager loads, per-row helpers and grouped queries, and query
+regressions (an N+1 loop, a joinedload cartesian product) used to be found
+by hand. ``before/after_cursor_execute`` listeners on every ``Engine`` time
+each statement into the active ``QueryProfile``:
+
+- query count and total DB time;
+- statements grouped by fingerprint (literals and IN-list lengths removed),
+  so the same statement run once per row shows up as one fingerprint with a
+  high count — the N+1 signature;
+- the slowest statements.
+
+A profile is active inside ``profile_queries()``. By default it follows the
+request's context (contextvars reach the threadpool a sync route runs in and
+the ``copy_context`` fan-out pools); ``capture_all=True`` records every
+statement in the process instead, which is what tests need because the
+TestClient runs the app in another thread. With no profile active a statement
+costs one ContextVar lookup.
+
+``platform.middleware.SQLProfilingMiddleware`` is the opt-in request wrapper
+(``SQL_PROFILING_ENABLED``); the ``query_budget`` pytest fixture asserts
+budgets for key endpoints.
+"""
+from __future__ import annotations
+
+import hashlib
+import heapq
+import re
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Iterator
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+_SLOWEST_KEPT = 5
+_STATEMENT_PREVIEW_CHARS = 300
+_START_STACK_KEY = "_sql_profile_started"
+
+_STRING_LITERAL_RE = re.compile(r"'(?:[^']|'')*'")
+_NUMBER_RE = re.compile(r"\b\d+(?:\.\d+)?\b")
+_PARAM_RE = re.compile(r"(?:%\(\w+\)s|\$\d+|:\w+|\?|%s)")
+_IN_LIST_RE = re.compile(r"\bIN\s*\(\s*\?(?:\s*,\s*\?)*\s*\)", re.IGNORECASE)
+_SPACE_RE = re.compile(r"\s+")
+
+
+def fingerprint(statement: str) -> str:
+    """Normalize a statement so executions differing only in values match."""
+    text = _STRING_LITERAL_RE.sub("?", statement)
+    text = _PARAM_RE.sub("?", text)
+    text = _NUMBER_RE.sub("?", text)
+    text = _IN_LIST_RE.sub("IN (...)", text)
+    return _SPACE_RE.sub(" ", text).strip()
+
+
+@dataclass
+class StatementStats:
+    statement: str
+    count: int = 0
+    total_seconds: float = 0.0
+
+    @property
+    def fingerprint_id(self) -> str:
+        return hashlib.sha1(self.statement.encode("utf-8")).hexdigest()[:12]
+
+    def as_dict(self) -> dict:
+        return {
+            "fingerprint": self.fingerprint_id,
+            "count": self.count,
+            "total_ms": round(self.total_seconds * 1000, 2),
+            "statement": self.statement[:_STATEMENT_PREVIEW_CHARS],
+        }
+
+
+@dataclass
+class QueryProfile:
+    query_count: int = 0
+    db_seconds: float = 0.0
+    statements: dict[str, StatementStats] = field(default_factory=dict)
+    _slowest: list[tuple[float, int, str]] = field(default_factory=list, repr=False)
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+
+    def record(self, statement: str, seconds: float) -> None:
+        key = fingerprint(statement)
+        with self._lock:
+            self.query_count += 1
+            self.db_seconds += seconds
+            stats = self.statements.get(key)
+            if stats is None:
+                stats = self.statements[key] = StatementStats(key)
+            stats.count += 1
+            stats.total_seconds += seconds
+            entry = (seconds, self.query_count, statement[:_STATEMENT_PREVIEW_CHARS])
+            if len(self._slowest) < _SLOWEST_KEPT:
+                heapq.heappush(self._slowest, entry)
+            elif seconds > self._slowest[0][0]:
+                heapq.heapreplace(self._slowest, entry)
+
+    @property
+    def db_ms(self) -> float:
+        return self.db_seconds * 1000
+
+    def duplicates(self, threshold: int) -> list[StatementStats]:
+        """Fingerprints executed at least ``threshold`` times, most first."""
+        with self._lock:
+            repeated = [s for s in self.statements.values() if s.count >= max(2, threshold)]
+        return sorted(repeated, key=lambda s: (-s.count, -s.total_seconds))
+
+    def slowest(self) -> list[dict]:
+        with self._lock:
+            ranked = sorted(self._slowest, reverse=True)
+        return [
+            {"ms": round(seconds * 1000, 2), "statement": statement}
+            for seconds, _order, statement in ranked
+        ]
+
+    def summary(self, *, duplicate_threshold: int) -> dict:
+        return {
+            "queries": self.query_count,
+            "db_ms": round(self.db_ms, 2),
+            "duplicates": [s.as_dict() for s in self.duplicates(duplicate_threshold)],
+            "slowest": self.slowest(),
+        }
+
+
+_current_profile: ContextVar[QueryProfile | None] = ContextVar("sql_query_profile", default=None)
+_global_profiles: list[QueryProfile] = []
+_global_lock = threading.Lock()
+
+
+def current_profile() -> QueryProfile | None:
+    return _current_profile.get()
+
+
+@contextmanager
+def profile_queries(*, capture_all: bool = False) -> Iterator[QueryProfile]:
+    """Record the statements run inside the block (or, with ``capture_all``,
+    anywhere in the process while it is open)."""
+    profile = QueryProfile()
+    if capture_all:
+        with _global_lock:
+            _global_profiles.append(profile)
+        try:
+            yield profile
+        finally:
+            with _global_lock:
+                _global_profiles.remove(profile)
+        return
+    token = _current_profile.set(profile)
+    try:
+        yield profile
+    finally:
+        _current_profile.reset(token)
+
+
+def _targets() -> list[QueryProfile]:
+    profile = _current_profile.get()
+    targets = [profile] if profile is not None else []
+    if _global_profiles:
+        with _global_lock:
+            targets.extend(p for p in _global_profiles if p is not profile)
+    return targets
+
+
+@event.listens_for(Engine, "before_cursor_execute")
+def _before_cursor_execute(conn, _cursor, _statement, _parameters, _context, _executemany) -> None:
+    if _current_profile.get() is None and not _global_profiles:
+        return
+    conn.info.setdefault(_START_STACK_KEY, []).append(time.perf_counter())
+
+
+@event.listens_for(Engine, "after_cursor_execute")
+def _after_cursor_execute(conn, _cursor, statement, _parameters, _context, _executemany) -> None:
+    stack = conn.info.get(_START_STACK_KEY)
+    if not stack:
+        return
+    seconds = time.perf_counter() - stack.pop()
+    for profile in _targets():
+        profile.record(statement, seconds)
+
+
+@event.listens_for(Engine, "handle_error")
+def _discard_failed_start(exception_context) -> None:
+    connection = exception_context.connection
+    stack = connection.info.get(_START_STACK_KEY) if connection is not None else None
+    if stack:
+        stack.pop()
+
+
+__all__ = [
+    "QueryProfile",
+    "StatementStats",
+    "current_profile",
+    "fingerprint",
+    "profile_queries",
+]
@@ -0,0 +1,62 @@
+"""Thread-safe token bucket for pacing outbound calls to a rate-limited API.
+
+Shared by integrations and domains that throttle a provider (the Bullhorn
+client per ``client_id``, outreach campaign sends). Clock and sleep are
+injectable so pacing is testable without wall-clock waits.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from typing import Callable
+
+# Refill arithmetic can land a hair under a whole token; a wait that small
+# would not advance a coarse (or fake) clock and the acquire loop would spin.
+_TOKEN_EPSILON = 1e-9
+
+
+class TokenBucket:
+    """``acquire`` blocks until a token is available.
+
+    Refills continuously at ``rate_per_sec`` up to ``burst`` capacity; the
+    bucket starts full.
+    """
+
+    def __init__(
+        self,
+        rate_per_sec: float,
+        burst: int,
+        *,
+        monotonic: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
+        self._rate = max(0.001, float(rate_per_sec))
+        self._capacity = float(max(1, int(burst)))
+        self._tokens = self._capacity
+        self._last = monotonic()
+        self._monotonic = monotonic
+        self._sleep = sleep
+        self._lock = threading.Lock()
+
+    def _refill_locked(self, now: float) -> None:
+        elapsed = now - self._last
+        if elapsed > 0:
+            self._tokens = min(self._capacity, self._tokens + elapsed * self._rate)
+            self._last = now
+
+    def acquire(self) -> None:
+        while True:
+            with self._lock:
+                now = self._monotonic()
+                self._refill_locked(now)
+                if self._tokens >= 1.0 - _TOKEN_EPSILON:
+                    self._tokens = max(0.0, self._tokens - 1.0)
+                    return
+                deficit = 1.0 - self._tokens
+                wait = deficit / self._rate
+            if wait > 0:
+                self._sleep(wait)
+
+
+__all__ = ["TokenBucket"]
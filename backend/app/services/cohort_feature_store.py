@@ -0,0 +1,470 @@
+"""Serve cohort signals from the maintained per-role feature counts.
+
+The first read for a role builds :class:`RoleCohortState`, one
+:class:`RoleCohortMember` per scored applicant and the
+:class:`RoleCohortFeatureCount` rows from the same pool
+``compute_cohort_signals`` counts. From then on a read:
+
+1. applies only the members the ORM hooks marked stale (re-reading those
+   applications' scores and profiles), as ``pool_n`` / ``top_n`` deltas;
+2. rebalances the top set, promoting or demoting one member at a time on the
+   ``(role_id, in_top, score)`` index until it is exactly the ``top_size``
+   highest scores;
+3. reads the feature rows that can still pass ``MIN_TOP_FREQ`` and computes
+   lift with the same ``signals_from_counts`` as the full recount.
+
+A read therefore costs O(changed members + features) rather than loading
+every applicant and candidate. When many members changed at once (a pool
+rescore) a rebuild is cheaper than deltas and is used instead. The periodic
+reconciler refreshes stale roles in the background, rebuilds the oldest
+cohorts and drops those of deleted roles.
+"""
+
+from __future__ import annotations
+
+import logging
+import math
+from collections import defaultdict
+from datetime import datetime, timedelta, timezone
+from typing import Any, Optional
+
+from sqlalchemy import distinct, insert
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import Session
+
+from ..models.role import Role
+from ..models.role_cohort_feature import (
+    RoleCohortFeatureCount,
+    RoleCohortMember,
+    RoleCohortState,
+)
+from .cohort_signals_service import (
+    MIN_POOL_SIZE,
+    MIN_TOP_FREQ,
+    candidate_features,
+    compute_cohort_signals,
+    insufficient_data_payload,
+    scored_pool,
+    signals_from_counts,
+    top_size_for,
+)
+
+logger = logging.getLogger("taali.cohort_feature_store")
+
+CATEGORIES = ("skills", "companies", "titles", "schools")
+
+# Above this share of the pool changed since the last read, rebuilding is
+# cheaper than applying every member as a delta.
+_REBUILD_STALE_FRACTION = 0.25
+_REBUILD_STALE_MIN = 50
+_RECONCILE_BATCH_SIZE = 200
+_REBUILD_AFTER = timedelta(hours=24)
+
+# (category, feature) -> [pool_n delta, top_n delta]
+_Deltas = dict[tuple[str, str], list[int]]
+
+
+def _add_features(
+    deltas: _Deltas, features: Optional[dict], *, pool: int = 0, top: int = 0
+) -> None:
+    for category, values in (features or {}).items():
+        for feature in values or []:
+            entry = deltas[(category, feature)]
+            entry[0] += pool
+            entry[1] += top
+
+
+def _threshold(db: Session, role_id: int) -> Optional[float]:
+    worst = _worst_inside(db, role_id)
+    return float(worst.score) if worst is not None else None
+
+
+def rebuild_role_cohort(
+    db: Session, *, role_id: int, organization_id: int
+) -> RoleCohortState:
+    """Recount the role's cohort from the full scored pool (flushes only)."""
+
+    role_id = int(role_id)
+    seen_versions = dict(
+        db.query(RoleCohortMember.application_id, RoleCohortMember.version)
+        .filter(RoleCohortMember.role_id == role_id)
+        .all()
+    )
+    pool = scored_pool(db, role_id=role_id, organization_id=int(organization_id))
+    pool.sort(key=lambda t: (-t[1], t[0]))
+    top_size = top_size_for(len(pool))
+
+    counts: _Deltas = defaultdict(lambda: [0, 0])
+    members: list[dict[str, Any]] = []
+    for index, (application_id, score, candidate) in enumerate(pool):
+        features = candidate_features(candidate)
+        in_top = index < top_size
+        _add_features(counts, features, pool=1, top=int(in_top))
+        version = int(seen_versions.get(application_id, 0))
+        members.append(
+            {
+                "role_id": role_id,
+                "application_id": application_id,
+                "score": score,
+                "in_top": in_top,
+                "features": features,
+                "version": version,
+                "applied_version": version,
+            }
+        )
+
+    db.query(RoleCohortMember).filter(RoleCohortMember.role_id == role_id).delete(
+        synchronize_session=False
+    )
+    db.query(RoleCohortFeatureCount).filter(
+        RoleCohortFeatureCount.role_id == role_id
+    ).delete(synchronize_session=False)
+    # The bulk delete bypasses the identity map; drop any loaded rows so the
+    # re-inserted ones are read fresh.
+    for instance in list(db.identity_map.values()):
+        if isinstance(instance, (RoleCohortMember, RoleCohortFeatureCount)):
+            db.expunge(instance)
+    if members:
+        db.execute(insert(RoleCohortMember), members)
+    if counts:
+        db.execute(
+            insert(RoleCohortFeatureCount),
+            [
+                {
+                    "role_id": role_id,
+                    "category": category,
+                    "feature": feature,
+                    "pool_n": pool_n,
+                    "top_n": top_n,
+                }
+                for (category, feature), (pool_n, top_n) in counts.items()
+            ],
+        )
+
+    now = datetime.now(timezone.utc)
+    state = db.get(RoleCohortState, role_id)
+    if state is None:
+        state = RoleCohortState(role_id=role_id)
+        db.add(state)
+    state.organization_id = int(organization_id)
+    state.pool_size = len(pool)
+    state.top_size = top_size
+    state.top_threshold_score = pool[top_size - 1][1] if top_size else None
+    state.rebuilt_at = now
+    state.refreshed_at = now
+    db.flush()
+    return state
+
+
+def _best_outside(db: Session, role_id: int) -> Optional[RoleCohortMember]:
+    return (
+        db.query(RoleCohortMember)
+        .filter(
+            RoleCohortMember.role_id == role_id,
+            RoleCohortMember.in_top.is_(False),
+            RoleCohortMember.score.isnot(None),
+        )
+        .order_by(RoleCohortMember.score.desc(), RoleCohortMember.application_id.asc())
+        .first()
+    )
+
+
+def _worst_inside(db: Session, role_id: int) -> Optional[RoleCohortMember]:
+    return (
+        db.query(RoleCohortMember)
+        .filter(
+            RoleCohortMember.role_id == role_id,
+            RoleCohortMember.in_top.is_(True),
+        )
+        .order_by(RoleCohortMember.score.asc(), RoleCohortMember.application_id.desc())
+        .first()
+    )
+
+
+def _move(
+    db: Session, state: RoleCohortState, member: RoleCohortMember, deltas: _Deltas, *, into_top: bool
+) -> None:
+    member.in_top = into_top
+    state.top_size += 1 if into_top else -1
+    _add_features(deltas, member.features, top=1 if into_top else -1)
+    db.flush()
+
+
+def _rebalance(db: Session, state: RoleCohortState, deltas: _Deltas) -> None:
+    """Make the top set exactly the ``top_size_for(pool)`` best members."""
+
+    role_id = int(state.role_id)
+    target = top_size_for(int(state.pool_size))
+    while state.top_size < target:
+        member = _best_outside(db, role_id)
+        if member is None:
+            break
+        _move(db, state, member, deltas, into_top=True)
+    while state.top_size > target:
+        member = _worst_inside(db, role_id)
+        if member is None:
+            break
+        _move(db, state, member, deltas, into_top=False)
+    # A rescored member can now outrank the weakest top member (or fall
+    # below the best of the rest): swap until the boundary is ordered.
+    while True:
+        worst, best = _worst_inside(db, role_id), _best_outside(db, role_id)
+        if worst is None or best is None:
+            break
+        if (worst.score, -worst.application_id) >= (best.score, -best.application_id):
+            break
+        _move(db, state, worst, deltas, into_top=False)
+        _move(db, state, best, deltas, into_top=True)
+    state.top_threshold_score = _threshold(db, role_id)
+
+
+def _apply_deltas(db: Session, role_id: int, deltas: _Deltas) -> None:
+    changed = {key: value for key, value in deltas.items() if value != [0, 0]}
+    by_category: dict[str, list[str]] = defaultdict(list)
+    for category, feature in changed:
+        by_category[category].append(feature)
+    existing: dict[tuple[str, str], RoleCohortFeatureCount] = {}
+    for category, features in by_category.items():
+        for row in db.query(RoleCohortFeatureCount).filter(
+            RoleCohortFeatureCount.role_id == role_id,
+            RoleCohortFeatureCount.category == category,
+            RoleCohortFeatureCount.feature.in_(features),
+        ):
+            existing[(row.category, row.feature)] = row
+    for (category, feature), (pool_delta, top_delta) in changed.items():
+        row = existing.get((category, feature))
+        if row is None:
+            if pool_delta > 0:
+                db.add(
+                    RoleCohortFeatureCount(
+                        role_id=role_id,
+                        category=category,
+                        feature=feature,
+                        pool_n=pool_delta,
+                        top_n=max(0, top_delta),
+                    )
+                )
+            continue
+        row.pool_n = int(row.pool_n) + pool_delta
+        row.top_n = int(row.top_n) + top_delta
+        if row.pool_n <= 0:
+            db.delete(row)
+    db.flush()
+
+
+def refresh_role_cohort(
+    db: Session, state: RoleCohortState, *, organization_id: int
+) -> int:
+    """Apply the role's stale members as deltas; return how many were applied.
+
+    Falls back to :func:`rebuild_role_cohort` when too much changed.
+    """
+
+    role_id = int(state.role_id)
+    stale = (
+        db.query(RoleCohortMember)
+        .filter(
+            RoleCohortMember.role_id == role_id,
+            RoleCohortMember.version != RoleCohortMember.applied_version,
+        )
+        .all()
+    )
+    if not stale:
+        return 0
+    if len(stale) > max(_REBUILD_STALE_MIN, int(state.pool_size) * _REBUILD_STALE_FRACTION):
+        rebuild_role_cohort(db, role_id=role_id, organization_id=organization_id)
+        return len(stale)
+
+    fresh = {
+        application_id: (score, candidate)
+        for application_id, score, candidate in scored_pool(
+            db,
+            role_id=role_id,
+            organization_id=int(organization_id),
+            application_ids=[int(member.application_id) for member in stale],
+        )
+    }
+    deltas: _Deltas = defaultdict(lambda: [0, 0])
+    for member in stale:
+        if member.score is not None:
+            state.pool_size -= 1
+            if member.in_top:
+                state.top_size -= 1
+            _add_features(deltas, member.features, pool=-1, top=-int(bool(member.in_top)))
+        # Writers bump ``version`` concurrently; only the version read here is
+        # applied, so a later bump leaves the member stale for the next read.
+        member.applied_version = member.version
+        member.in_top = False
+        hit = fresh.get(int(member.application_id))
+        if hit is None:
+            member.score = None
+            member.features = None
+            continue
+        member.score, candidate = hit
+        member.features = candidate_features(candidate)
+        state.pool_size += 1
+        _add_features(deltas, member.features, pool=1)
+    db.flush()
+    _rebalance(db, state, deltas)
+    _apply_deltas(db, role_id, deltas)
+    state.refreshed_at = datetime.now(timezone.utc)
+    db.flush()
+    return len(stale)
+
+
+def _signals_payload(db: Session, state: RoleCohortState) -> dict[str, Any]:
+    now = datetime.now(timezone.utc).isoformat()
+    pool_size = int(state.pool_size)
+    if pool_size < MIN_POOL_SIZE:
+        return insufficient_data_payload(pool_size, computed_at=now)
+    top_size = int(state.top_size)
+    # Only features that can reach MIN_TOP_FREQ are read.
+    min_top_n = max(1, math.ceil(MIN_TOP_FREQ * top_size - 1e-9))
+    rows = (
+        db.query(
+            RoleCohortFeatureCount.category,
+            RoleCohortFeatureCount.feature,
+            RoleCohortFeatureCount.pool_n,
+            RoleCohortFeatureCount.top_n,
+        )
+        .filter(
+            RoleCohortFeatureCount.role_id == int(state.role_id),
+            RoleCohortFeatureCount.top_n >= min_top_n,
+        )
+        .all()
+    )
+    top_counts: dict[str, dict[str, int]] = {category: {} for category in CATEGORIES}
+    rest_counts: dict[str, dict[str, int]] = {category: {} for category in CATEGORIES}
+    for category, feature, pool_n, top_n in rows:
+        if category not in top_counts:
+            continue
+        top_counts[category][feature] = int(top_n)
+        rest_counts[category][feature] = int(pool_n) - int(top_n)
+    threshold = state.top_threshold_score
+    return {
+        "computed_at": now,
+        "pool_size": pool_size,
+        "top_size": top_size,
+        "top_threshold_score": round(threshold, 2) if threshold is not None else None,
+        "signals": {
+            category: signals_from_counts(
+                top_counts=top_counts[category],
+                rest_counts=rest_counts[category],
+                top_size=top_size,
+                rest_size=pool_size - top_size,
+            )
+            for category in CATEGORIES
+        },
+        "insufficient_data": False,
+    }
+
+
+def cohort_signals(
+    db: Session, *, role_id: int, organization_id: int, rebuild: bool = False
+) -> dict[str, Any]:
+    """``compute_cohort_signals``' payload, served from the maintained counts.
+
+    Writes the maintenance into the caller's transaction (flushes only). If
+    the store cannot be maintained (e.g. two first reads racing to create the
+    state row) this degrades to the full recount for this call.
+    """
+
+    try:
+        with db.begin_nested():
+            state = (
+                db.query(RoleCohortState)
+                .filter(RoleCohortState.role_id == int(role_id))
+                .with_for_update()
+                .first()
+            )
+            if state is None or rebuild:
+                state = rebuild_role_cohort(
+                    db, role_id=int(role_id), organization_id=int(organization_id)
+                )
+            else:
+                refresh_role_cohort(db, state, organization_id=int(organization_id))
+            return _signals_payload(db, state)
+    except SQLAlchemyError:
+        logger.warning("cohort feature store unavailable role_id=%s", role_id, exc_info=True)
+        return compute_cohort_signals(
+            db, role_id=int(role_id), organization_id=int(organization_id)
+        )
+
+
+def _drop_role_cohort(db: Session, role_id: int) -> None:
+    for model in (RoleCohortMember, RoleCohortFeatureCount, RoleCohortState):
+        db.query(model).filter(model.role_id == role_id).delete(synchronize_session=False)
+
+
+def reconcile_role_cohorts(
+    db: Session,
+    *,
+    batch_size: int = _RECONCILE_BATCH_SIZE,
+    rebuild_after: timedelta = _REBUILD_AFTER,
+) -> dict[str, Any]:
+    """Refresh roles with stale members, rebuild the oldest cohorts and drop
+    those of deleted roles. Commits per role."""
+
+    stale_role_ids = [
+        int(role_id)
+        for (role_id,) in db.query(distinct(RoleCohortMember.role_id))
+        .filter(RoleCohortMember.version != RoleCohortMember.applied_version)
+        .limit(int(batch_size))
+        .all()
+    ]
+    cutoff = datetime.now(timezone.utc) - rebuild_after
+    due_role_ids = [
+        int(role_id)
+        for (role_id,) in db.query(RoleCohortState.role_id)
+        .filter(
+            (RoleCohortState.rebuilt_at.is_(None)) | (RoleCohortState.rebuilt_at < cutoff)
+        )
+        .order_by(RoleCohortState.rebuilt_at.is_not(None), RoleCohortState.rebuilt_at.asc())
+        .limit(int(batch_size))
+        .all()
+    ]
+    orphaned_role_ids = [
+        int(role_id)
+        for (role_id,) in db.query(RoleCohortState.role_id)
+        .outerjoin(Role, Role.id == RoleCohortState.role_id)
+        .filter(Role.id.is_(None) | Role.deleted_at.isnot(None))
+        .limit(int(batch_size))
+        .all()
+    ]
+    summary = {"refreshed": 0, "rebuilt": 0, "removed": 0}
+    for role_id in dict.fromkeys([*orphaned_role_ids, *due_role_ids, *stale_role_ids]):
+        organization_id = (
+            db.query(Role.organization_id)
+            .filter(Role.id == role_id, Role.deleted_at.is_(None))
+            .scalar()
+        )
+        try:
+            if organization_id is None:
+                _drop_role_cohort(db, role_id)
+                summary["removed"] += 1
+            elif role_id in due_role_ids:
+                rebuild_role_cohort(db, role_id=role_id, organization_id=int(organization_id))
+                summary["rebuilt"] += 1
+            else:
+                state = db.get(RoleCohortState, role_id)
+                if state is None:
+                    _drop_role_cohort(db, role_id)
+                    summary["removed"] += 1
+                else:
+                    refresh_role_cohort(db, state, organization_id=int(organization_id))
+                    summary["refreshed"] += 1
+            db.commit()
+        except (SQLAlchemyError, ValueError):
+            db.rollback()
+            logger.warning("cohort reconcile failed role_id=%s", role_id, exc_info=True)
+    if any(summary.values()):
+        logger.info("role cohort reconcile %s", summary)
+    return summary
+
+
+__all__ = [
+    "cohort_signals",
+    "rebuild_role_cohort",
+    "reconcile_role_cohorts",
+    "refresh_role_cohort",
+]
@@ -14,8 +14,11 @@ Used by:
   queueing an advance).
 - Future: recruiter UI panel showing "what does the top 10% look like".
 
-The function is read-only and pure — caching/persistence is the
-caller's responsibility (see ``role.agent_cohort_signals``).
+``compute_cohort_signals`` is read-only and pure — it recounts the whole
+pool. ``cohort_feature_store`` maintains the same counts incrementally so the
+agent tool and the recruiter panel read them in O(features); caching of the
+rendered payload is the caller's responsibility (see
+``role.agent_cohort_signals``).
 """
 
 from __future__ import annotations
@@ -102,32 +105,34 @@ _FEATURE_EXTRACTORS: dict[str, Any] = {
 }
 
 
-def _lift_signals(
-    *, top_candidates: list[Candidate], rest_candidates: list[Candidate], category: str
+def candidate_features(c: Candidate) -> dict[str, list[str]]:
+    """Normalized features of one candidate, per category."""
+    return {category: sorted(extract(c)) for category, extract in _FEATURE_EXTRACTORS.items()}
+
+
+def top_size_for(pool_size: int) -> int:
+    """Size of the "top performers" set for a pool of ``pool_size``."""
+    top_size = max(MIN_TOP_SIZE, int(round(pool_size * TOP_FRACTION)))
+    return min(top_size, pool_size)
+
+
+def signals_from_counts(
+    *,
+    top_counts: dict[str, int],
+    rest_counts: dict[str, int],
+    top_size: int,
+    rest_size: int,
 ) -> list[dict[str, Any]]:
-    """Compute lift = top_freq / rest_freq.
+    """Compute lift = top_freq / rest_freq from per-feature counts.
 
     Comparing top against the *rest* (pool minus top) rather than the full
     pool makes "exclusive to top scorers" a meaningful infinity: if a
     feature appears in top but never in rest, lift is unbounded — that's
     the strongest possible signal of clustering.
     """
-    extractor = _FEATURE_EXTRACTORS[category]
-    top_size = len(top_candidates)
-    rest_size = len(rest_candidates)
     if top_size == 0:
         return []
 
-    top_counts: Counter[str] = Counter()
-    for c in top_candidates:
-        for feat in extractor(c):
-            top_counts[feat] += 1
-
-    rest_counts: Counter[str] = Counter()
-    for c in rest_candidates:
-        for feat in extractor(c):
-            rest_counts[feat] += 1
-
     out: list[dict[str, Any]] = []
     for feat, top_n in top_counts.items():
         top_freq = top_n / top_size
@@ -156,35 +161,49 @@ def _lift_signals(
         )
 
     # Sort: exclusive-to-top first (most striking), then by descending lift.
-    def _sort_key(item: dict[str, Any]) -> tuple[int, float]:
+    # Feature name breaks ties so the maintained store and a recount agree.
+    def _sort_key(item: dict[str, Any]) -> tuple[int, float, str]:
         exclusive = 0 if item.get("exclusive_to_top") else 1
-        return (exclusive, -(item.get("lift") or 0.0))
+        return (exclusive, -(item.get("lift") or 0.0), item["feature"])
 
     out.sort(key=_sort_key)
     return out[:MAX_SIGNALS_PER_CATEGORY]
 
 
-def compute_cohort_signals(db: Session, *, role_id: int, organization_id: int) -> dict[str, Any]:
-    """Return cohort signals for ``role_id``.
+def _lift_signals(
+    *, top_candidates: list[Candidate], rest_candidates: list[Candidate], category: str
+) -> list[dict[str, Any]]:
+    extractor = _FEATURE_EXTRACTORS[category]
+    top_counts: Counter[str] = Counter()
+    for c in top_candidates:
+        for feat in extractor(c):
+            top_counts[feat] += 1
 
-    Output shape::
+    rest_counts: Counter[str] = Counter()
+    for c in rest_candidates:
+        for feat in extractor(c):
+            rest_counts[feat] += 1
 
-        {
-          "computed_at": "2026-05-07T12:00:00+00:00",
-          "pool_size": 47,
-          "top_size": 5,
-          "top_threshold_score": 78.5,
-          "signals": {
-            "skills": [{"feature": "kubernetes", "top_freq": 0.8, ...}, ...],
-            "companies": [...],
-            "titles": [...],
-            "schools": [...],
-          },
-          "insufficient_data": false,
-        }
+    return signals_from_counts(
+        top_counts=top_counts,
+        rest_counts=rest_counts,
+        top_size=len(top_candidates),
+        rest_size=len(rest_candidates),
+    )
 
-    When ``pool_size < MIN_POOL_SIZE`` returns
-    ``{"insufficient_data": true, "pool_size": N, ...}`` with empty signals.
+
+def scored_pool(
+    db: Session,
+    *,
+    role_id: int,
+    organization_id: int,
+    application_ids: Optional[list[int]] = None,
+) -> list[tuple[int, float, Candidate]]:
+    """``(application_id, score, candidate)`` for every scored roster member.
+
+    ``application_ids`` restricts the roster to those rows (the incremental
+    refresh in ``cohort_feature_store``); an id missing from the result is
+    not in the scored pool.
     """
     role_scope = resolve_candidate_role_scope(
         db,
@@ -198,6 +217,10 @@ def compute_cohort_signals(db: Session, *, role_id: int, organization_id: int) -
             CandidateApplication.organization_id == organization_id,
         )
     )
+    if application_ids is not None:
+        if not application_ids:
+            return []
+        query = query.filter(CandidateApplication.id.in_(application_ids))
     query = role_scope.scope_visible_roster(query)
     logical_score = score_expression(role_scope, "taali_score_cache_100")
     apps = query.filter(logical_score.isnot(None)).all()
@@ -213,7 +236,7 @@ def compute_cohort_signals(db: Session, *, role_id: int, organization_id: int) -
         evaluations,
         assessment_truth=assessment_truth,
     )
-    pool: list[tuple[float, Candidate]] = []
+    pool: list[tuple[int, float, Candidate]] = []
     for source_application in apps:
         application = (
             adapter(source_application)
@@ -226,31 +249,63 @@ def compute_cohort_signals(db: Session, *, role_id: int, organization_id: int) -
         score = application.taali_score_cache_100
         if score is None:
             continue
-        pool.append((float(score), cand))
+        pool.append((int(source_application.id), float(score), cand))
+    return pool
+
+
+def insufficient_data_payload(pool_size: int, *, computed_at: str) -> dict[str, Any]:
+    return {
+        "computed_at": computed_at,
+        "pool_size": pool_size,
+        "top_size": 0,
+        "top_threshold_score": None,
+        "signals": {category: [] for category in _FEATURE_EXTRACTORS},
+        "insufficient_data": True,
+        "min_pool_size": MIN_POOL_SIZE,
+    }
+
+
+def compute_cohort_signals(db: Session, *, role_id: int, organization_id: int) -> dict[str, Any]:
+    """Return cohort signals for ``role_id``, recounted from the full pool.
+
+    Output shape::
 
+        {
+          "computed_at": "2026-05-07T12:00:00+00:00",
+          "pool_size": 47,
+          "top_size": 5,
+          "top_threshold_score": 78.5,
+          "signals": {
+            "skills": [{"feature": "kubernetes", "top_freq": 0.8, ...}, ...],
+            "companies": [...],
+            "titles": [...],
+            "schools": [...],
+          },
+          "insufficient_data": false,
+        }
+
+    When ``pool_size < MIN_POOL_SIZE`` returns
+    ``{"insufficient_data": true, "pool_size": N, ...}`` with empty signals.
+
+    Readers on a hot path use ``cohort_feature_store.cohort_signals``, which
+    serves the same payload from maintained counts.
+    """
+    pool = scored_pool(db, role_id=role_id, organization_id=organization_id)
     pool_size = len(pool)
     now = datetime.now(timezone.utc).isoformat()
 
     if pool_size < MIN_POOL_SIZE:
-        return {
-            "computed_at": now,
-            "pool_size": pool_size,
-            "top_size": 0,
-            "top_threshold_score": None,
-            "signals": {category: [] for category in _FEATURE_EXTRACTORS},
-            "insufficient_data": True,
-            "min_pool_size": MIN_POOL_SIZE,
-        }
+        return insufficient_data_payload(pool_size, computed_at=now)
 
-    pool.sort(key=lambda t: t[0], reverse=True)
-    top_size = max(MIN_TOP_SIZE, int(round(pool_size * TOP_FRACTION)))
-    top_size = min(top_size, pool_size)
+    # Highest score first; application id breaks ties deterministically.
+    pool.sort(key=lambda t: (-t[1], t[0]))
+    top_size = top_size_for(pool_size)
     top_pairs = pool[:top_size]
     rest_pairs = pool[top_size:]
-    top_threshold = top_pairs[-1][0] if top_pairs else None
+    top_threshold = top_pairs[-1][1] if top_pairs else None
 
-    top_candidates = [c for _, c in top_pairs]
-    rest_candidates = [c for _, c in rest_pairs]
+    top_candidates = [c for _, _, c in top_pairs]
+    rest_candidates = [c for _, _, c in rest_pairs]
 
     signals: dict[str, list[dict[str, Any]]] = {}
     for category in _FEATURE_EXTRACTORS:
@@ -316,7 +371,12 @@ def render_summary_for_prompt(payload: dict[str, Any], *, max_chars: int = 1200)
 
 
 __all__ = [
+    "candidate_features",
     "compute_cohort_signals",
+    "insufficient_data_payload",
+    "scored_pool",
+    "signals_from_counts",
+    "top_size_for",
     "render_summary_for_prompt",
     "MIN_POOL_SIZE",
     "MIN_TOP_FREQ",
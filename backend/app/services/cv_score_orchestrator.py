@@ -34,6 +34,8 @@ from ..models.candidate_application import CandidateApplication
 from ..models.cv_score_cache import CvScoreCache
 from ..models.cv_score_job import (
     CvScoreJob,
+    SCORE_DELIVERY_BATCH,
+    SCORE_DELIVERY_LIVE,
     SCORE_JOB_DONE,
     SCORE_JOB_ERROR,
     SCORE_JOB_PENDING,
@@ -78,6 +80,20 @@ class AutonomousScoringDeferred(RuntimeError):
         self.detail = str(detail)
 
 
+class ScoreParkedForBatch(RuntimeError):
+    """A batch-delivery score missed the holistic cache.
+
+    Raised from ``_execute_scoring_v3`` in place of the synchronous Sonnet
+    calls. The worker keeps the pre-screen work, parks the job for the batch
+    submit sweep and returns; the job is re-run once the batch result has
+    been written to the shared score cache.
+    """
+
+    def __init__(self, *, cache_key: str) -> None:
+        super().__init__("holistic score parked for batch submission")
+        self.cache_key = str(cache_key)
+
+
 def _authorize_autonomous_scoring_phase(
     db: Session,
     *,
@@ -318,6 +334,7 @@ def enqueue_score(
     force: bool = False,
     bypass_pre_screen: bool = False,
     requires_active_agent: bool = False,
+    batch: bool = False,
 ) -> CvScoreJob | None:
     """Queue a CV score for an application.
 
@@ -340,6 +357,11 @@ def enqueue_score(
     queued job cannot begin after Pause or Turn off. Authenticated recruiter
     and administrator actions leave it ``False`` and may still run while the
     autonomous agent is held (subject to credits and the role cap).
+
+    ``batch`` marks a bulk re-score that nobody is waiting on. When
+    ``holistic_batch_eligible`` the job still runs the worker (pre-screen
+    gate, cache lookup) but a holistic cache miss is parked for the Message
+    Batches pipeline instead of a synchronous Sonnet call.
     """
     if not application or application.id is None:
         return None
@@ -589,6 +611,11 @@ def enqueue_score(
         status=SCORE_JOB_PENDING,
         requires_active_agent=bool(requires_active_agent),
         force_full_score=bool(bypass_pre_screen),
+        delivery=(
+            SCORE_DELIVERY_BATCH
+            if batch and holistic_batch_eligible(application)
+            else SCORE_DELIVERY_LIVE
+        ),
     )
     db.add(job)
     db.flush()  # populate job.id
@@ -780,6 +807,82 @@ def score_is_outdated(application: CandidateApplication) -> bool:
     )
 
 
+def holistic_batch_eligible(application: CandidateApplication) -> bool:
+    """True when a bulk score of this application may use the Batches API."""
+    return bool(getattr(settings, "HOLISTIC_SCORE_BATCH_ENABLED", False)) and (
+        _holistic_enabled_for(application)
+    )
+
+
+def _parks_for_batch(job: CvScoreJob) -> bool:
+    """A batch-delivery job whose batch result has not landed yet."""
+    return (
+        getattr(job, "delivery", SCORE_DELIVERY_LIVE) == SCORE_DELIVERY_BATCH
+        and not getattr(job, "batch_trace_id", None)
+        and bool(getattr(settings, "HOLISTIC_SCORE_BATCH_ENABLED", False))
+    )
+
+
+def _full_score_job_spec_text(
+    db: Session, role: Role | None, base_job_spec_text: str
+) -> str:
+    """The job spec the full score sees: the role spec plus the active
+    role-intent overlay."""
+    from ..components.scoring.role_intent_inputs import (
+        active_role_intent_scoring_payload,
+        append_role_intent_scoring_overlay,
+    )
+
+    role_intent_payload = (
+        active_role_intent_scoring_payload(db, role_id=int(role.id))
+        if role is not None and getattr(role, "id", None) is not None
+        else None
+    )
+    return append_role_intent_scoring_overlay(base_job_spec_text, role_intent_payload)
+
+
+def _full_score_workable_context(application: CandidateApplication) -> str:
+    # Workable metadata (questionnaire answers, recruiter comments, activity
+    # log) carries hard-constraint evidence the CV often lacks — e.g. a salary
+    # expectation given on a LinkedIn apply. Feed it so the full score assesses
+    # those requirements instead of leaving them "unknown". Same source the
+    # pre-screen gate already uses; empty string when there's no footprint.
+    try:
+        from .workable_context_service import format_workable_context
+
+        return format_workable_context(
+            candidate=getattr(application, "candidate", None),
+            application=application,
+        )
+    except Exception:  # pragma: no cover — scoring must not break on context render
+        logger.exception(
+            "format_workable_context failed for application=%s; scoring without it",
+            getattr(application, "id", None),
+        )
+        return ""
+
+
+def holistic_inputs_for(db: Session, application: CandidateApplication):
+    """The holistic inputs a full score of ``application`` would use now.
+
+    Lets the batch pipeline render, and later re-validate, exactly what
+    ``_execute_scoring_v3`` would send. None when the CV or spec is missing.
+    """
+    from ..cv_matching.holistic import prepare_holistic_inputs
+
+    role = application.role
+    cv_text = (application.cv_text or "").strip()
+    base_job_spec_text = ((role.job_spec_text if role else None) or "").strip()
+    if not cv_text or not base_job_spec_text:
+        return None
+    workable_context = _full_score_workable_context(application)
+    return prepare_holistic_inputs(
+        cv_text,
+        _full_score_job_spec_text(db, role, base_job_spec_text),
+        workable_context=workable_context or None,
+    )
+
+
 def _execute_scoring_v3(
     db: Session,
     *,
@@ -807,10 +910,6 @@ def _execute_scoring_v3(
         ScoringStatus,
     )
     from ..cv_matching.runner import run_cv_match
-    from ..components.scoring.role_intent_inputs import (
-        active_role_intent_scoring_payload,
-        append_role_intent_scoring_overlay,
-    )
 
     role = application.role
     cv_text = (application.cv_text or "").strip()
@@ -829,15 +928,7 @@ def _execute_scoring_v3(
         application.cv_match_scored_at = None
         return
 
-    role_intent_payload = (
-        active_role_intent_scoring_payload(db, role_id=int(role.id))
-        if role is not None and getattr(role, "id", None) is not None
-        else None
-    )
-    scoring_job_spec_text = append_role_intent_scoring_overlay(
-        base_job_spec_text,
-        role_intent_payload,
-    )
+    scoring_job_spec_text = _full_score_job_spec_text(db, role, base_job_spec_text)
 
     # Translate role_criterion rows into RequirementInput. The legacy v4
     # pathway uses integer criterion_ids; v3 uses string ids, so we prefix.
@@ -1051,19 +1142,8 @@ def _execute_scoring_v3(
     # expectation given on a LinkedIn apply. Feed it so the full score assesses
     # those requirements instead of leaving them "unknown". Same source the
     # pre-screen gate already uses; empty string when there's no footprint.
-    workable_context = ""
-    try:
-        from .workable_context_service import format_workable_context
+    workable_context = _full_score_workable_context(application)
 
-        workable_context = format_workable_context(
-            candidate=getattr(application, "candidate", None),
-            application=application,
-        )
-    except Exception:  # pragma: no cover — scoring must not break on context render
-        logger.exception(
-            "format_workable_context failed for application=%s; scoring without it",
-            getattr(application, "id", None),
-        )
     def authorize_full_score_provider(phase: str) -> None:
         _authorize_autonomous_scoring_phase(
             db,
@@ -1079,14 +1159,35 @@ def _execute_scoring_v3(
         # survivors" tier of the two-tier strategy.
         from ..cv_matching.holistic import run_holistic_match
 
-        output = run_holistic_match(
-            cv_text,
-            scoring_job_spec_text,
-            client=org_client,
-            metering_context=score_metering_context,
-            workable_context=workable_context or None,
-            before_provider_call=authorize_full_score_provider,
-        )
+        output = None
+        if getattr(job, "delivery", SCORE_DELIVERY_LIVE) == SCORE_DELIVERY_BATCH:
+            # Bulk re-score: serve a cached result (including the batch's
+            # own, once applied) as usual, but hand a miss to the Message
+            # Batches pipeline instead of holding this worker on two Sonnet
+            # calls (cv_matching.holistic_batch).
+            from ..cv_matching.holistic import (
+                cached_holistic_output,
+                prepare_holistic_inputs,
+            )
+
+            inputs = prepare_holistic_inputs(
+                cv_text,
+                scoring_job_spec_text,
+                workable_context=workable_context or None,
+            )
+            if inputs is not None:
+                output = cached_holistic_output(inputs)
+                if output is None and _parks_for_batch(job):
+                    raise ScoreParkedForBatch(cache_key=inputs.cache_key)
+        if output is None:
+            output = run_holistic_match(
+                cv_text,
+                scoring_job_spec_text,
+                client=org_client,
+                metering_context=score_metering_context,
+                workable_context=workable_context or None,
+                before_provider_call=authorize_full_score_provider,
+            )
     else:
         output = run_cv_match(
             cv_text,
@@ -1098,11 +1199,21 @@ def _execute_scoring_v3(
             before_provider_call=authorize_full_score_provider,
         )
     job.cache_hit = "hit" if getattr(output, "cache_hit", False) else "miss"
+    # A batch result reaches this run through the shared cache, but its spend
+    # was metered by the batch results stream at batch pricing — it is not a
+    # cache hit to bill.
+    batch_settled = bool(
+        getattr(output, "cache_hit", False)
+        and getattr(job, "batch_trace_id", None)
+        and getattr(output, "trace_id", None) == job.batch_trace_id
+    )
+    if batch_settled:
+        job.cache_hit = "batch"
     # CACHE HITS ONLY: a cache hit makes no Anthropic call, so the wrapper
     # never runs and never records. Record it here so cached scores still
     # bill (unchanged behaviour). Cache MISSES are already recorded by the
     # wrapper per-call above — recording them here too would double-count.
-    if bool(getattr(output, "cache_hit", False)):
+    if bool(getattr(output, "cache_hit", False)) and not batch_settled:
         # A cache hit makes no provider call, but it still carries the small
         # platform cache fee. Give that debit the same org+role hard-admission
         # contract as provider spend; the old soft enqueue preflight could race
@@ -14,7 +14,7 @@ from urllib.parse import urlparse
 
 from fastapi import HTTPException, UploadFile
 
-from .pdf_text import extract_text_from_pdf
+from .pdf_extraction import extract_pdf_text
 
 logger = logging.getLogger("taali.documents")
 
@@ -191,7 +191,7 @@ def extract_text(content: bytes, extension: str) -> str:
     """Route to the appropriate extractor based on file extension."""
     ext = extension.lower().lstrip(".")
     if ext == "pdf":
-        return sanitize_text_for_storage(extract_text_from_pdf(content))
+        return sanitize_text_for_storage(extract_pdf_text(content))
     elif ext == "docx":
         return sanitize_text_for_storage(extract_text_from_docx(content))
     elif ext == "txt":
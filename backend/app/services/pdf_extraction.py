@@ -0,0 +1,290 @@
+"""Cached, process-pooled front end for PDF text extraction.
+
+``pdf_text.extract_text_from_pdf`` is pure CPU work (pypdf parse plus layout
+heuristics) that used to run inline in upload requests and ATS sync loops.
+This module puts two things in front of it:
+
+- a content cache keyed by the SHA-256 of the PDF bytes: a small in-process
+  LRU plus a shared Redis copy (zlib-compressed, ``PDF_TEXT_CACHE_TTL``), so a
+  resume re-downloaded by a Workable/Bullhorn re-sync is never parsed again;
+- ``PDF_EXTRACT_WORKERS`` spawned worker processes so parses don't hold the
+  web process's GIL. Each parse gets ``PDF_EXTRACT_TIMEOUT_SECONDS`` of its
+  own run time (waiting for a free worker does not count); a worker that
+  hangs or dies on a pathological file is killed and replaced, and that one
+  file gets no text. ``concurrent.futures.ProcessPoolExecutor`` can do
+  neither: its timeout includes queueing, and losing one worker breaks the
+  pool for every queued caller.
+
+The cache is best-effort: its failures fall back to parsing, and so does a
+worker that cannot be started. Bump ``_CACHE_VERSION`` when extraction output
+changes so stale text is not served.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import multiprocessing
+import threading
+import zlib
+from collections import OrderedDict
+
+from ..platform.config import settings
+from ..platform.redis_cache import cache_redis, mark_cache_redis_failed
+from .pdf_text import extract_text_from_pdf
+
+logger = logging.getLogger("taali.documents")
+
+_CACHE_VERSION = "v1"
+_CACHE_PREFIX = f"pdf_text:{_CACHE_VERSION}:"
+_MEMORY_CACHE_MAX_ENTRIES = 256
+
+_memory_cache: OrderedDict[str, str] = OrderedDict()
+_memory_lock = threading.Lock()
+
+_pool: "_ExtractionPool | None" = None
+_pool_lock = threading.Lock()
+
+
+def pdf_content_digest(content: bytes) -> str:
+    return hashlib.sha256(content).hexdigest()
+
+
+# ---------------------------------------------------------------------------
+# Content cache
+# ---------------------------------------------------------------------------
+
+
+def _redis():
+    if int(settings.PDF_TEXT_CACHE_TTL or 0) <= 0:
+        return None
+    return cache_redis()
+
+
+def _memory_get(digest: str) -> str | None:
+    with _memory_lock:
+        text = _memory_cache.get(digest)
+        if text is not None:
+            _memory_cache.move_to_end(digest)
+        return text
+
+
+def _memory_put(digest: str, text: str) -> None:
+    with _memory_lock:
+        _memory_cache[digest] = text
+        _memory_cache.move_to_end(digest)
+        while len(_memory_cache) > _MEMORY_CACHE_MAX_ENTRIES:
+            _memory_cache.popitem(last=False)
+
+
+def cached_pdf_text(digest: str) -> str | None:
+    """Previously extracted text for a PDF digest, or None on a miss."""
+    text = _memory_get(digest)
+    if text is not None:
+        return text
+    client = _redis()
+    if client is None:
+        return None
+    try:
+        payload = client.get(_CACHE_PREFIX + digest)
+    except Exception:
+        logger.debug("pdf text cache read failed", exc_info=True)
+        mark_cache_redis_failed()
+        return None
+    if payload is None:
+        return None
+    try:
+        text = zlib.decompress(payload).decode("utf-8")
+    except Exception:
+        return None
+    _memory_put(digest, text)
+    return text
+
+
+def store_pdf_text(digest: str, text: str) -> None:
+    _memory_put(digest, text)
+    client = _redis()
+    if client is None:
+        return
+    try:
+        client.setex(
+            _CACHE_PREFIX + digest,
+            int(settings.PDF_TEXT_CACHE_TTL),
+            zlib.compress(text.encode("utf-8")),
+        )
+    except Exception:
+        logger.debug("pdf text cache write failed", exc_info=True)
+        mark_cache_redis_failed()
+
+
+def reset_pdf_text_cache() -> None:
+    """Test helper: drop the in-process cache."""
+    with _memory_lock:
+        _memory_cache.clear()
+
+
+# ---------------------------------------------------------------------------
+# Worker pool
+# ---------------------------------------------------------------------------
+
+
+def _worker_main(conn) -> None:
+    """Worker process loop: PDF bytes in, ``(ok, text | exception)`` out."""
+    while True:
+        try:
+            content = conn.recv()
+        except (EOFError, OSError):
+            return
+        try:
+            reply = (True, extract_text_from_pdf(content))
+        except Exception as exc:  # pragma: no cover — extract_text_from_pdf catches its own
+            reply = (False, RuntimeError(repr(exc)))
+        conn.send(reply)
+
+
+class _WorkerGone(Exception):
+    """The worker died, hung or stopped answering; it has been killed."""
+
+
+class _ExtractionWorker:
+    """One spawned extraction process, used by a single caller at a time."""
+
+    def __init__(self) -> None:
+        ctx = multiprocessing.get_context("spawn")
+        self._conn, child_conn = ctx.Pipe()
+        self._process = ctx.Process(
+            target=_worker_main, args=(child_conn,), name="pdf-extract", daemon=True
+        )
+        self._process.start()
+        child_conn.close()
+
+    def extract(self, content: bytes, timeout: float) -> str:
+        """Parse ``content``; the timeout covers this parse only."""
+        try:
+            self._conn.send(content)
+            if not self._conn.poll(timeout):
+                raise _WorkerGone(f"parse exceeded {timeout:.0f}s")
+            ok, value = self._conn.recv()
+        except (EOFError, OSError, ValueError) as exc:
+            raise _WorkerGone(f"worker exited: {exc!r}") from exc
+        if not ok:
+            raise value
+        return value
+
+    def kill(self) -> None:
+        self._process.kill()
+        self._process.join(timeout=5)
+        self._conn.close()
+
+
+class _ExtractionPool:
+    """Up to ``size`` workers handed out one caller at a time.
+
+    Callers beyond ``size`` wait for an idle worker; that wait is not part of
+    the parse timeout. A worker that hangs or dies is killed and replaced on
+    the next checkout, so other callers' parses are never cancelled.
+    """
+
+    def __init__(self, size: int) -> None:
+        self.size = size
+        self._idle: list[_ExtractionWorker] = []
+        self._started = 0
+        self._available = threading.Condition()
+
+    def _checkout(self) -> _ExtractionWorker | None:
+        with self._available:
+            while not self._idle and self._started >= self.size:
+                self._available.wait()
+            if self._idle:
+                return self._idle.pop()
+            self._started += 1
+        try:
+            return _ExtractionWorker()
+        except Exception:
+            self._release(None)
+            raise
+
+    def _release(self, worker: _ExtractionWorker | None) -> None:
+        with self._available:
+            if worker is None:
+                self._started -= 1
+            else:
+                self._idle.append(worker)
+            self._available.notify()
+
+    def extract(self, content: bytes, timeout: float) -> str:
+        worker = self._checkout()
+        try:
+            text = worker.extract(content, timeout)
+        except _WorkerGone:
+            worker.kill()
+            self._release(None)
+            raise
+        except BaseException:
+            self._release(worker)
+            raise
+        self._release(worker)
+        return text
+
+    def close(self) -> None:
+        """Kill the idle workers (busy ones finish with their callers)."""
+        with self._available:
+            idle, self._idle = self._idle, []
+            self._started -= len(idle)
+        for worker in idle:
+            worker.kill()
+
+
+def _extraction_pool() -> _ExtractionPool | None:
+    """The shared worker pool, or None when extraction should run inline."""
+    global _pool
+    workers = int(settings.PDF_EXTRACT_WORKERS or 0)
+    # Celery prefork children are daemonic and may not start child processes.
+    if workers <= 0 or multiprocessing.current_process().daemon:
+        return None
+    with _pool_lock:
+        if _pool is None or _pool.size != workers:
+            if _pool is not None:
+                _pool.close()
+            _pool = _ExtractionPool(workers)
+        return _pool
+
+
+def _extract_uncached(content: bytes) -> str | None:
+    """Parse in a worker process (inline without a pool). None means the
+    parse hung or killed its worker; the caller stores no text for it."""
+    pool = _extraction_pool()
+    if pool is None:
+        return extract_text_from_pdf(content)
+    try:
+        return pool.extract(content, float(settings.PDF_EXTRACT_TIMEOUT_SECONDS))
+    except _WorkerGone as exc:
+        logger.warning("PDF text extraction abandoned bytes=%d: %s", len(content), exc)
+        return None
+    except (OSError, RuntimeError) as exc:
+        logger.warning("PDF extraction worker unavailable, parsing inline: %s", exc)
+        return extract_text_from_pdf(content)
+
+
+def extract_pdf_text(content: bytes) -> str:
+    """Extract text from PDF bytes, served from the content cache when possible."""
+    if not content:
+        return extract_text_from_pdf(content)
+    digest = pdf_content_digest(content)
+    cached = cached_pdf_text(digest)
+    if cached is not None:
+        return cached
+    text = _extract_uncached(content)
+    if text is None:
+        return ""
+    store_pdf_text(digest, text)
+    return text
+
+
+__all__ = [
+    "cached_pdf_text",
+    "extract_pdf_text",
+    "pdf_content_digest",
+    "reset_pdf_text_cache",
+    "store_pdf_text",
+]
@@ -5,8 +5,13 @@ pushed that module over the file-size gate). These functions form a
 self-contained cluster: they depend only on ``io``, ``re``, and pypdf
 (imported lazily inside the functions that need it).
 
-``document_service.extract_text`` routes PDF bytes to
+``document_service.extract_text`` routes PDF bytes through the cached,
+process-pooled front end in ``pdf_extraction``, which calls
 ``extract_text_from_pdf`` here.
+
+The document is parsed once: a single ``extract_text`` pass per page yields
+both pypdf's default text and the positioned fragment stream, and the
+columnar, positional and default layouts are all derived from that.
 """
 
 from __future__ import annotations
@@ -14,6 +19,7 @@ from __future__ import annotations
 import io
 import logging
 import re
+from typing import NamedTuple
 
 logger = logging.getLogger("taali.documents")
 
@@ -120,40 +126,6 @@ def _join_pdf_fragments(fragments: list[tuple[float, str]]) -> str:
     return " ".join(pieces).strip()
 
 
-def _extract_text_from_pdf_with_layout(content: bytes) -> str:
-    from pypdf import PdfReader
-
-    reader = PdfReader(io.BytesIO(content))
-    pages_text: list[str] = []
-
-    for page in reader.pages:
-        fragments: list[tuple[float, float, str]] = []
-
-        def visitor_text(text, _cm, tm, _font_dict, _font_size):
-            value = re.sub(r"\s+", " ", str(text or "")).strip()
-            if not value:
-                return
-            fragments.append((float(tm[5]), float(tm[4]), value))
-
-        page.extract_text(visitor_text=visitor_text)
-        if not fragments:
-            continue
-
-        grouped_lines: list[tuple[float, list[tuple[float, str]]]] = []
-        for y, x, text in sorted(fragments, key=lambda item: (-item[0], item[1])):
-            if not grouped_lines or abs(grouped_lines[-1][0] - y) > 3.0:
-                grouped_lines.append((y, [(x, text)]))
-            else:
-                grouped_lines[-1][1].append((x, text))
-
-        lines = [_join_pdf_fragments(items) for _, items in grouped_lines]
-        page_text = "\n".join(line for line in lines if line)
-        if page_text.strip():
-            pages_text.append(page_text.strip())
-
-    return "\n\n".join(pages_text).strip()
-
-
 def _detect_column_split(frags: list[tuple[float, float, str, float]], page_w: float) -> float | None:
     """Return the x of a clean two-column gutter, or None for single-column.
 
@@ -206,23 +178,24 @@ def _fragments_to_lines(frags: list[tuple[float, float, str, float]]) -> list[st
     return [ln for ln in lines if ln]
 
 
-def _extract_text_from_pdf_columnar(content: bytes) -> tuple[str, bool]:
-    """Column-aware extraction. Returns ``(text, found_multicolumn)``.
+class _PdfPage(NamedTuple):
+    text: str  # pypdf's default top-to-bottom extraction
+    # (x, y, text, font_size); None when the fragment visitor failed on the page.
+    fragments: list[tuple[float, float, str, float]] | None
+    width: float
 
-    Multi-column CVs (a skills / education sidebar beside the main column)
-    confuse the default top-to-bottom reader: it interleaves the two columns
-    line-by-line, scrambling the reading order — which then mixes sections
-    (e.g. summary text becomes "skills", certifications absorb hobbies) and
-    mis-attributes project bullets to the wrong role. Here we detect a
-    vertical gutter and read each column independently, ordering columns so
-    the one carrying the title/name block (topmost fragment) comes first.
-    """
+    def positioned_fragments(self) -> list[tuple[float, float, str, float]]:
+        if self.fragments is None:
+            raise ValueError("PDF fragment visitor failed on this page")
+        return self.fragments
+
+
+def _read_pdf_pages(content: bytes) -> list[_PdfPage]:
+    """Parse the PDF once, collecting default text and fragments per page."""
     from pypdf import PdfReader
 
     reader = PdfReader(io.BytesIO(content))
-    pages_text: list[str] = []
-    found = False
-
+    pages: list[_PdfPage] = []
     for page in reader.pages:
         frags: list[tuple[float, float, str, float]] = []
 
@@ -236,12 +209,46 @@ def _extract_text_from_pdf_columnar(content: bytes) -> tuple[str, bool]:
                 size = 10.0
             frags.append((float(tm[4]), float(tm[5]), value, size))
 
-        page.extract_text(visitor_text=visitor_text)
+        try:
+            text = page.extract_text(visitor_text=visitor_text)
+        except Exception as visitor_exc:
+            # Only the fragment-based layouts depend on the visitor; keep
+            # pypdf's default text for this page.
+            logger.warning("PDF fragment extraction failed: %s", visitor_exc)
+            text, frags = page.extract_text(), None
+        pages.append(_PdfPage(text or "", frags, float(page.mediabox.width) or 540.0))
+    return pages
+
+
+def _positional_layout(pages: list[_PdfPage]) -> str:
+    """Fragments regrouped into visual lines, ignoring any column structure."""
+    pages_text: list[str] = []
+    for page in pages:
+        page_text = "\n".join(_fragments_to_lines(page.positioned_fragments()))
+        if page_text.strip():
+            pages_text.append(page_text.strip())
+    return "\n\n".join(pages_text).strip()
+
+
+def _columnar_layout(pages: list[_PdfPage]) -> tuple[str, bool]:
+    """Column-aware layout. Returns ``(text, found_multicolumn)``.
+
+    Multi-column CVs (a skills / education sidebar beside the main column)
+    confuse the default top-to-bottom reader: it interleaves the two columns
+    line-by-line, scrambling the reading order — which then mixes sections
+    (e.g. summary text becomes "skills", certifications absorb hobbies) and
+    mis-attributes project bullets to the wrong role. Here we detect a
+    vertical gutter and read each column independently, ordering columns so
+    the one carrying the title/name block (topmost fragment) comes first.
+    """
+    pages_text: list[str] = []
+    found = False
+
+    for page in pages:
+        frags = page.positioned_fragments()
         if not frags:
             continue
-
-        page_w = float(page.mediabox.width) or 540.0
-        split = _detect_column_split(frags, page_w)
+        split = _detect_column_split(frags, page.width)
         if split is not None:
             found = True
             left = [f for f in frags if f[0] < split]
@@ -258,8 +265,9 @@ def _extract_text_from_pdf_columnar(content: bytes) -> tuple[str, bool]:
 
 
 def extract_text_from_pdf(content: bytes) -> str:
-    """Extract text from PDF bytes using pypdf."""
+    """Extract text from PDF bytes using pypdf (one parse, three layouts)."""
     try:
+        pages = _read_pdf_pages(content)
         # Column-aware first. Multi-column CVs (sidebar + main column) get
         # scrambled by the default top-to-bottom reader. When a clean column
         # layout is detected we use that text directly — it's already in
@@ -267,24 +275,16 @@ def extract_text_from_pdf(content: bytes) -> str:
         # would re-merge the cleanly separated lines). Single-column CVs
         # detect no gutter and fall through to the original path unchanged.
         try:
-            columnar_text, multicolumn = _extract_text_from_pdf_columnar(content)
+            columnar_text, multicolumn = _columnar_layout(pages)
         except Exception as col_exc:
             logger.warning("Columnar PDF extraction failed: %s", col_exc)
             columnar_text, multicolumn = "", False
         if multicolumn and columnar_text:
             return columnar_text
 
-        from pypdf import PdfReader
-
-        reader = PdfReader(io.BytesIO(content))
-        pages = []
-        for page in reader.pages:
-            text = page.extract_text()
-            if text:
-                pages.append(text)
-        raw_text = "\n\n".join(pages).strip()
+        raw_text = "\n\n".join(page.text for page in pages if page.text).strip()
         try:
-            layout_text = _extract_text_from_pdf_with_layout(content)
+            layout_text = _positional_layout(pages)
         except Exception as layout_exc:
             logger.warning("Layout-aware PDF extraction failed: %s", layout_exc)
             layout_text = ""
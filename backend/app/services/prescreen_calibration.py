@@ -110,6 +110,9 @@ def sample_and_shadow_score_rejects(
                 from .claude_client_resolver import get_client_for_org
 
                 org_client = get_client_for_org(getattr(app, "organization", None))
+                # Synchronous, not the Batches API: its apply step persists
+                # onto the application, which a shadow score must never do
+                # (see cv_matching/holistic_batch).
                 out = run_holistic_match(
                     cv_text,
                     jd_text,
@@ -10,11 +10,19 @@ Redis init is retried after a cooldown: if Redis is unreachable on the first
 call the limiter degrades to in-process, but re-attempts the connection no more
 than once per ``_REDIS_RETRY_COOLDOWN_SECONDS`` so a transient Redis blip
 doesn't leave the process permanently degraded.
+
+``consume_rate_limits`` is the multi-bucket variant the HTTP middleware uses:
+a sliding-window *counter* (current window plus the previous window weighted
+by how much of it still overlaps) so each bucket is two integers rather than
+a list of timestamps, checked all-or-nothing across buckets. On Redis the
+check and the increments run in one Lua script, so concurrent requests on
+different replicas cannot all pass the check before any of them counts.
 """
 from __future__ import annotations
 
 import threading
 import time
+from collections.abc import Sequence
 
 from ..platform.config import settings
 
@@ -22,6 +30,8 @@ _memory_lock = threading.Lock()
 # key -> (window_index, count)
 _memory_buckets: dict[str, tuple[int, int]] = {}
 _MEMORY_MAX_KEYS = 50_000
+# key -> (window_index, current_count, previous_count)
+_sliding_buckets: dict[str, tuple[int, int, int]] = {}
 
 _redis_client = None
 # Monotonic timestamp of the last init attempt; None means "never tried".
@@ -29,6 +39,29 @@ _redis_last_attempt: float | None = None
 _REDIS_RETRY_COOLDOWN_SECONDS = 60.0
 _redis_lock = threading.Lock()
 
+# KEYS: (current, previous) window key per bucket. ARGV: elapsed fraction of
+# the current window, key TTL, then one limit per bucket. Returns 0 when the
+# request is counted in every bucket, else the 1-based index of the first
+# bucket over its limit (nothing is counted).
+_SLIDING_WINDOW_LUA = """
+local elapsed = tonumber(ARGV[1])
+local ttl = tonumber(ARGV[2])
+local buckets = #KEYS / 2
+for i = 1, buckets do
+  local current = tonumber(redis.call('GET', KEYS[2 * i - 1]) or '0')
+  local previous = tonumber(redis.call('GET', KEYS[2 * i]) or '0')
+  if previous * (1 - elapsed) + current + 1 > tonumber(ARGV[2 + i]) then
+    return i
+  end
+end
+for i = 1, buckets do
+  redis.call('INCR', KEYS[2 * i - 1])
+  redis.call('EXPIRE', KEYS[2 * i - 1], ttl)
+end
+return 0
+"""
+_sliding_script = None
+
 
 def _get_redis():
     """Return a live Redis client, or None if Redis is unavailable.
@@ -99,10 +132,101 @@ def check_rate_limit(key: str, *, limit: int, window_seconds: int) -> bool:
     return _check_memory(key, limit, window_seconds)
 
 
+def _sliding_estimate(current: int, previous: int, elapsed_fraction: float) -> float:
+    return previous * (1.0 - elapsed_fraction) + current
+
+
+def _window_position(window_seconds: int) -> tuple[int, float]:
+    now = time.time()
+    window = int(now) // window_seconds
+    return window, (now - window * window_seconds) / window_seconds
+
+
+def _consume_memory(
+    buckets: Sequence[tuple[str, int]], window_seconds: int
+) -> str | None:
+    window, elapsed = _window_position(window_seconds)
+    with _memory_lock:
+        if len(_sliding_buckets) > _MEMORY_MAX_KEYS:
+            idle = [k for k, (w, _, _) in _sliding_buckets.items() if w < window - 1]
+            for k in idle:
+                _sliding_buckets.pop(k, None)
+        rolled: list[tuple[str, int, int]] = []
+        for key, limit in buckets:
+            w, current, previous = _sliding_buckets.get(key, (window, 0, 0))
+            if w != window:
+                previous = current if w == window - 1 else 0
+                current = 0
+            if _sliding_estimate(current, previous, elapsed) + 1 > limit:
+                return key
+            rolled.append((key, current, previous))
+        for key, current, previous in rolled:
+            _sliding_buckets[key] = (window, current + 1, previous)
+    return None
+
+
+def _sliding_window_script(client):
+    global _sliding_script
+    script = _sliding_script
+    if script is None or script.registered_client is not client:
+        # EVALSHA with a transparent EVAL fallback on NOSCRIPT.
+        script = _sliding_script = client.register_script(_SLIDING_WINDOW_LUA)
+    return script
+
+
+def _consume_redis(
+    client, buckets: Sequence[tuple[str, int]], window_seconds: int
+) -> str | None:
+    window, elapsed = _window_position(window_seconds)
+    keys = []
+    for key, _limit in buckets:
+        keys.append(f"ratelimit:sw:{key}:{window}")
+        keys.append(f"ratelimit:sw:{key}:{window - 1}")
+    # Keep a key through the next window, where it is the "previous" count.
+    args = [repr(elapsed), window_seconds * 2, *(limit for _key, limit in buckets)]
+    denied = int(_sliding_window_script(client)(keys=keys, args=args) or 0)
+    return buckets[denied - 1][0] if denied else None
+
+
+def rate_limit_may_block() -> bool:
+    """Whether the next limiter call may do network I/O (a Redis round trip or a
+    reconnect attempt). Async callers run the limiter in a threadpool only then;
+    the in-process fallback is cheap enough to call inline."""
+    with _redis_lock:
+        if _redis_client is not None:
+            return True
+        return _redis_last_attempt is None or (
+            time.monotonic() - _redis_last_attempt >= _REDIS_RETRY_COOLDOWN_SECONDS
+        )
+
+
+def consume_rate_limits(
+    buckets: Sequence[tuple[str, int]], *, window_seconds: int
+) -> str | None:
+    """Count one request against every ``(key, limit)`` bucket, all-or-nothing.
+
+    Returns the first bucket key that is over its limit (nothing is counted),
+    or None when the request is allowed and has been counted in every bucket.
+    Buckets with ``limit <= 0`` are disabled and skipped. O(1) per bucket: one
+    atomic script call to Redis when available, else the in-process fallback.
+    """
+    active = [(key, int(limit)) for key, limit in buckets if int(limit) > 0]
+    if not active:
+        return None
+    client = _get_redis()
+    if client is not None:
+        try:  # pragma: no cover - requires a live Redis
+            return _consume_redis(client, active, window_seconds)
+        except Exception:
+            pass  # Redis hiccup -> degrade to in-process
+    return _consume_memory(active, window_seconds)
+
+
 def reset_memory_buckets() -> None:
     """Test helper: clear the in-process window state."""
     with _memory_lock:
         _memory_buckets.clear()
+        _sliding_buckets.clear()
 
 
 def reset_redis_state() -> None:
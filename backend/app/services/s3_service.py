@@ -285,6 +285,17 @@ def s3_object_exists(key: str) -> bool:
         return False
 
 
+def s3_object_etag(key: str) -> Optional[str]:
+    """HEAD the object's ETag — a cheap change check before a download."""
+    client, bucket = _get_client()
+    if client is None:
+        return None
+    try:
+        return client.head_object(Bucket=bucket, Key=key).get("ETag")
+    except Exception:
+        return None
+
+
 def download_from_s3(key: str) -> Optional[bytes]:
     """Download a file. Returns None when storage is unavailable."""
     client, bucket = _get_client()
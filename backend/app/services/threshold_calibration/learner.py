@@ -12,10 +12,12 @@ a role that clears its own floor, shrink its threshold toward the org anchor
 but only LOWER it slightly — the "don't let a weak role drag the bar down"
 guardrail. Finally clamp to the absolute quality band ``[50, 85]``.
 
-Pure Python (no numpy) — runs nightly, bounded by 101 integer cut points.
+Pure Python (no numpy) — runs nightly: one sort per class, then one bisection
+per class for each of the 101 integer cut points.
 """
 from __future__ import annotations
 
+from bisect import bisect_left
 from dataclasses import dataclass, field
 
 # Floors: never learn a threshold from too-few examples (fall through to the
@@ -63,11 +65,14 @@ def learn_threshold(
     if P < min_pos or N < min_neg:
         return None
 
+    # Sort once; the count of scores >= t is then one bisection per cut.
+    pos.sort()
+    neg.sort()
     best_t, best_j = 0, -2.0
     curve: list[dict] = []
     for t in range(0, 101):  # advance iff score >= t
-        tp = sum(1 for s in pos if s >= t)
-        fp = sum(1 for s in neg if s >= t)
+        tp = P - bisect_left(pos, t)
+        fp = N - bisect_left(neg, t)
         tpr = tp / P
         fpr = fp / N
         j = tpr - fpr
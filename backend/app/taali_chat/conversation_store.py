@@ -1,7 +1,8 @@
 """Role-scoped Taali Chat conversation persistence.
 
 Every chat turn uses these helpers to establish the organization, user, and
-immutable role boundary before a candidate tool can run.
+immutable role boundary before a candidate tool can run. Replay of the stored
+transcript lives in ``history``.
 """
 
 from __future__ import annotations
@@ -85,24 +86,6 @@ def ensure_conversation(
     return conversation
 
 
-def load_history(
-    db: Session, *, conversation: TaaliChatConversation
-) -> list[dict[str, Any]]:
-    """Load a transcript after removing orphaned provider tool-use pairs."""
-
-    from ..llm.tool_pairs import sanitize_tool_pairs
-
-    rows = (
-        db.query(TaaliChatMessage)
-        .filter(TaaliChatMessage.conversation_id == conversation.id)
-        .order_by(TaaliChatMessage.created_at.asc(), TaaliChatMessage.id.asc())
-        .all()
-    )
-    return sanitize_tool_pairs(
-        [{"role": row.role, "content": row.content} for row in rows]
-    )
-
-
 def persist_message(
     db: Session,
     *,
@@ -129,4 +112,4 @@ def persist_message(
     return message
 
 
-__all__ = ["ChatTurnInput", "ensure_conversation", "load_history", "persist_message"]
+__all__ = ["ChatTurnInput", "ensure_conversation", "persist_message"]
@@ -0,0 +1,172 @@
+"""Checkpointed, compacted history replay for Taali Chat turns.
+
+A conversation's replay is its ``TaaliChatHistoryCheckpoint`` prefix (the
+sanitized transcript through ``through_message_id``, with settled tool results
+compacted) followed by the raw ``TaaliChatMessage`` rows after it. Only that
+delta is read per turn. Once the delta holds ``CHECKPOINT_FOLD_MESSAGES`` rows,
+the turn's epilogue folds everything before the ``KEEP_RECENT_TURNS`` latest
+recruiter turns into the prefix.
+
+Two prompt-cache breakpoints go on the in-memory replay: the end of the prefix
+(byte-stable until the next fold, so it is a cache read across turns) and the
+end of the loaded history (a cache read for this turn's tool rounds). The
+system prompt uses at most two more, within the provider's limit of four.
+
+``TurnHistory.stats`` is the per-turn accounting. It rides on the metering
+metadata of every round and on the persisted assistant message's
+``token_usage``.
+"""
+
+from __future__ import annotations
+
+import logging
+from dataclasses import dataclass, field
+from typing import Any
+
+from sqlalchemy.orm import Session
+
+from ..llm.history_compaction import (
+    KEEP_RECENT_TURNS,
+    compact_settled_tool_results,
+    estimate_tokens,
+    is_user_text_message,
+    with_cache_breakpoints,
+)
+from ..llm.tool_pairs import sanitize_tool_pairs
+from ..models.taali_chat_conversation import TaaliChatConversation
+from ..models.taali_chat_history_checkpoint import TaaliChatHistoryCheckpoint
+from ..models.taali_chat_message import TaaliChatMessage
+
+logger = logging.getLogger("taali.taali_chat.history")
+
+# Raw rows after the checkpoint before the epilogue folds them in. A fold
+# re-bases the cached prefix, so it should be rare relative to turns.
+CHECKPOINT_FOLD_MESSAGES = 12
+
+
+@dataclass(frozen=True)
+class TurnHistory:
+    messages: list[dict[str, Any]]
+    stats: dict[str, int] = field(default_factory=dict)
+
+
+def _delta_rows(
+    db: Session, conversation_id: int, through_message_id: int
+) -> list[TaaliChatMessage]:
+    return (
+        db.query(TaaliChatMessage)
+        .filter(
+            TaaliChatMessage.conversation_id == conversation_id,
+            TaaliChatMessage.id > through_message_id,
+        )
+        .order_by(TaaliChatMessage.created_at.asc(), TaaliChatMessage.id.asc())
+        .all()
+    )
+
+
+def load_turn_history(
+    db: Session, *, conversation: TaaliChatConversation
+) -> TurnHistory:
+    """Checkpoint prefix + delta rows, compacted and cache-marked."""
+
+    checkpoint = db.get(TaaliChatHistoryCheckpoint, int(conversation.id))
+    prefix = list(checkpoint.messages or []) if checkpoint is not None else []
+    through = int(checkpoint.through_message_id) if checkpoint is not None else 0
+    delta = [
+        {"role": row.role, "content": row.content}
+        for row in _delta_rows(db, int(conversation.id), through)
+    ]
+    replay = sanitize_tool_pairs(prefix + delta)
+    compacted = compact_settled_tool_results(replay)
+    history_tokens = estimate_tokens(compacted)
+    saved_in_prefix = (
+        int(checkpoint.compacted_tokens_saved or 0) if checkpoint is not None else 0
+    )
+    stats = {
+        "checkpoint_messages": len(prefix),
+        "delta_messages": len(delta),
+        "history_tokens": history_tokens,
+        "compacted_tokens_saved": (
+            estimate_tokens(replay) - history_tokens + saved_in_prefix
+        ),
+    }
+    breakpoints = [len(prefix) - 1] if prefix else []
+    breakpoints.append(len(compacted) - 1)
+    return TurnHistory(
+        messages=with_cache_breakpoints(compacted, breakpoints),
+        stats=stats,
+    )
+
+
+def round_token_usage(usage: Any, history: TurnHistory) -> dict[str, int]:
+    """``token_usage`` for a persisted assistant message, with history stats."""
+
+    return {
+        "input": usage.input_tokens,
+        "output": usage.output_tokens,
+        "cache_read": usage.cache_read_tokens,
+        "cache_creation": usage.cache_creation_tokens,
+        **{f"history_{key}": value for key, value in history.stats.items()},
+    }
+
+
+def _fold(db: Session, conversation_id: int) -> bool:
+    checkpoint = db.get(TaaliChatHistoryCheckpoint, conversation_id)
+    through = int(checkpoint.through_message_id) if checkpoint is not None else 0
+    rows = _delta_rows(db, conversation_id, through)
+    if len(rows) < CHECKPOINT_FOLD_MESSAGES:
+        return False
+    turn_starts = [
+        index
+        for index, row in enumerate(rows)
+        if is_user_text_message({"role": row.role, "content": row.content})
+    ]
+    if len(turn_starts) <= KEEP_RECENT_TURNS:
+        return False
+    fold_end = turn_starts[-KEEP_RECENT_TURNS]
+    prefix = list(checkpoint.messages or []) if checkpoint is not None else []
+    raw = sanitize_tool_pairs(
+        prefix + [{"role": row.role, "content": row.content} for row in rows[:fold_end]]
+    )
+    # Every folded turn is settled: compact all of it.
+    folded = compact_settled_tool_results(raw, keep_recent_turns=0)
+    saved = estimate_tokens(raw) - estimate_tokens(folded)
+    if checkpoint is None:
+        checkpoint = TaaliChatHistoryCheckpoint(
+            conversation_id=conversation_id, compacted_tokens_saved=0
+        )
+        db.add(checkpoint)
+    checkpoint.messages = folded
+    checkpoint.through_message_id = int(rows[fold_end - 1].id)
+    checkpoint.compacted_tokens_saved = int(checkpoint.compacted_tokens_saved or 0) + saved
+    return True
+
+
+def advance_history_checkpoint(
+    db: Session, *, conversation: TaaliChatConversation
+) -> bool:
+    """Fold settled turns into the checkpoint once the delta is long enough.
+
+    Best-effort: the checkpoint is derived data, so a failure is logged and
+    the next turn simply replays a longer delta.
+    """
+
+    conversation_id = int(conversation.id)
+    try:
+        with db.begin_nested():
+            folded = _fold(db, conversation_id)
+        return folded
+    except Exception:
+        logger.exception(
+            "Failed to advance history checkpoint conversation=%s", conversation_id
+        )
+        return False
+
+
+__all__ = [
+    "CHECKPOINT_FOLD_MESSAGES",
+    "TurnHistory",
+    "advance_history_checkpoint",
+    "load_turn_history",
+    "round_token_usage",
+]
@@ -4,7 +4,8 @@ One call to ``run_chat_turn`` runs the full agent loop for one user
 message:
 
   1. Load (or create) the conversation.
-  2. Build the message history from persisted ``TaaliChatMessage`` rows.
+  2. Replay the compacted history checkpoint plus newer ``TaaliChatMessage``
+     rows (see ``history.py``).
   3. Stream the selected provider's response, yielding AI-SDK protocol frames.
   4. When the model requests a tool, dispatch to the canonical MCP handler,
      emit a ``tool_call_result`` frame, then continue the loop.
@@ -58,15 +59,15 @@ from . import streaming
 from .conversation_store import (
     ChatTurnInput,
     ensure_conversation as _ensure_conversation,
-    load_history as _load_history,
     persist_message as _persist_message,
 )
+from .history import advance_history_checkpoint, load_turn_history, round_token_usage
 from .route_setup import prepare_chat_route
 from .stream_round import _RunningUsage, _stream_one_round
 from .system_prompt import build_system_blocks
 from .tool_execution import (
     _arguments_with_role_scope as _arguments_with_role_scope,
-    execute_tool_round,
+    stream_tool_round,
 )
 
 logger = logging.getLogger("taali.taali_chat")
@@ -175,7 +176,7 @@ def _run_chat_turn(
     _persist_message(
         db, conversation=conversation, role=ROLE_USER, content=user_content
     )
-    history = _load_history(db, conversation=conversation)
+    history = load_turn_history(db, conversation=conversation)
 
     client = None
     running_usage = _RunningUsage()
@@ -192,9 +193,9 @@ def _run_chat_turn(
         current_user_id=user_id,
     )
 
-    # Anthropic-side message log: starts as the persisted history (which
+    # Anthropic-side message log: starts as the replayed history (which
     # already includes the just-added user message).
-    messages: list[dict[str, Any]] = list(history)
+    messages: list[dict[str, Any]] = list(history.messages)
 
     # Compose system blocks once per turn — the base SYSTEM_PROMPT plus
     # an optional role-context block when the conversation is role-scoped.
@@ -281,7 +282,11 @@ def _run_chat_turn(
                     "user_id": user_id,
                     "role_id": conversation_role_id,
                     "entity_id": str(conversation_db_id),
-                    "metadata": {"feature": "taali_chat", "round": round_index},
+                    "metadata": {
+                        "feature": "taali_chat",
+                        "round": round_index,
+                        "history": history.stats,
+                    },
                 },
                 tool_choice=(
                     required_read.tool_choice if required_read is not None else None
@@ -343,12 +348,7 @@ def _run_chat_turn(
                 content=assistant_blocks,
                 model=route.selected_model_id,
                 stop_reason=stop_reason,
-                token_usage={
-                    "input": round_usage.input_tokens,
-                    "output": round_usage.output_tokens,
-                    "cache_read": round_usage.cache_read_tokens,
-                    "cache_creation": round_usage.cache_creation_tokens,
-                },
+                token_usage=round_token_usage(round_usage, history),
             )
             workflow_succeeded = True
             break
@@ -378,14 +378,14 @@ def _run_chat_turn(
             final_stop_reason = "stop"
             break
 
-        with routing_scope(route):
-            round_result = execute_tool_round(
-                db=db,
-                user=user,
-                conversation=conversation,
-                assistant_blocks=assistant_blocks,
-                messages=messages,
-            )
+        round_result = yield from stream_tool_round(
+            route_scope=lambda: routing_scope(route),
+            db=db,
+            user=user,
+            conversation=conversation,
+            assistant_blocks=assistant_blocks,
+            messages=messages,
+        )
         tool_results = round_result.live_results
         stored_tool_results = round_result.stored_results
         tool_names_by_id = {
@@ -435,12 +435,7 @@ def _run_chat_turn(
             content=assistant_blocks,
             model=route.selected_model_id,
             stop_reason=stop_reason,
-            token_usage={
-                "input": round_usage.input_tokens,
-                "output": round_usage.output_tokens,
-                "cache_read": round_usage.cache_read_tokens,
-                "cache_creation": round_usage.cache_creation_tokens,
-            },
+            token_usage=round_token_usage(round_usage, history),
         )
         _persist_message(
             db,
@@ -482,9 +477,10 @@ def _run_chat_turn(
         )
         final_stop_reason = "stop"
 
-    # Bump conversation.updated_at + meter the call.
+    # Bump conversation.updated_at, fold settled turns, meter the call.
     conversation.updated_at = datetime.now(timezone.utc)
     db.flush()
+    advance_history_checkpoint(db, conversation=conversation)
     finish_route_with_transaction(db, route, succeeded=workflow_succeeded)
 
     aisdk_usage = {
@@ -128,6 +128,14 @@ def progress(*, round_index: int) -> Frame:
     )
 
 
+def tool_progress(*, tool_call_id: str, event: dict[str, Any]) -> Frame:
+    """Incremental, provisional output from a still-running tool (e.g. the
+    top-candidates shortlist, then per-candidate verdicts). The v3 protocol has
+    no partial tool-result frame, so it rides on ``2:`` like ``progress``; the
+    ``a:`` tool-result that follows supersedes it."""
+    return data({"tool_progress": {"tool_call_id": tool_call_id, **event}})
+
+
 def error(message: str) -> Frame:
     """``3:`` — terminal error string."""
     return Frame(_frame("3", message))
@@ -4,8 +4,14 @@ from __future__ import annotations
 
 import json
 import logging
+import queue
+import threading
+from contextlib import AbstractContextManager
+from concurrent.futures import ThreadPoolExecutor
+from contextvars import copy_context
 from dataclasses import dataclass
-from typing import Any
+from functools import partial
+from typing import Any, Callable, Generator
 
 from sqlalchemy.orm import Session
 
@@ -21,8 +27,11 @@ from ..candidate_search.tool_failure_contract import (
 from ..models.taali_chat_conversation import TaaliChatConversation
 from ..models.user import User
 from ..mcp.catalog import get_tool_spec
+from ..platform.config import settings
+from ..platform.database import SessionLocal
+from . import streaming
 from .persistence import result_for_storage
-from .tool_registry import dispatch_tool
+from .tool_registry import PROGRESSIVE_TOOLS, dispatch_tool, runs_concurrently
 
 logger = logging.getLogger("taali.taali_chat")
 
@@ -72,6 +81,144 @@ class ToolRoundResult:
     search_failure_incident: str | None
 
 
+def _run_tool(
+    db: Session,
+    name: str,
+    args: dict[str, Any],
+    *,
+    user: User,
+    conversation: TaaliChatConversation,
+    messages: list[dict[str, Any]],
+    on_progress: Callable[[dict[str, Any]], None] | None = None,
+) -> tuple[Any, bool, str | None]:
+    """Run one tool as one transaction on ``db``.
+
+    Returns ``(result, is_error, search_failure_incident)``.
+    """
+
+    progress_kwargs = (
+        {"on_progress": on_progress}
+        if on_progress is not None and name in PROGRESSIVE_TOOLS
+        else {}
+    )
+    try:
+        result = dispatch_tool(
+            name,
+            args,
+            db=db,
+            user=user,
+            conversation=conversation,
+            messages=messages,
+            **progress_kwargs,
+        )
+        if candidate_search_result_failed(name, result):
+            incident_id = new_candidate_search_incident_id()
+            logger.warning(
+                "Taali Chat candidate search returned an unavailable result "
+                "tool=%s incident_id=%s",
+                name,
+                incident_id,
+            )
+            db.rollback()
+            return (
+                candidate_search_failure_result(tool=name, incident_id=incident_id),
+                True,
+                incident_id,
+            )
+        # One tool is one durable transaction. Candidate reports can contain
+        # bearer URLs, and no later independent tool failure may roll back a
+        # result that has already been buffered.
+        db.commit()
+        return result, False, None
+    except Exception:
+        incident_id = new_candidate_search_incident_id()
+        logger.exception(
+            "Taali Chat tool failed tool=%s incident_id=%s",
+            name,
+            incident_id,
+        )
+        db.rollback()
+        if is_candidate_search_tool(name):
+            return (
+                candidate_search_failure_result(tool=name, incident_id=incident_id),
+                True,
+                incident_id,
+            )
+        return (
+            unexpected_tool_failure_result(tool=name, incident_id=incident_id),
+            True,
+            None,
+        )
+
+
+def _concurrent_blocks(assistant_blocks: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    """The round's tool calls that run side by side, or [] for a serial round."""
+
+    if int(settings.TAALI_CHAT_TOOL_CONCURRENCY or 1) <= 1:
+        return []
+    blocks = [
+        block
+        for block in candidate_search_tools_first(assistant_blocks)
+        if runs_concurrently(str(block.get("name") or ""))
+    ]
+    return blocks if len(blocks) > 1 else []
+
+
+def _run_concurrently(
+    db: Session,
+    blocks: list[tuple[str, str, dict[str, Any]]],
+    *,
+    user: User,
+    conversation: TaaliChatConversation,
+    messages: list[dict[str, Any]],
+    on_progress: Callable[[str, dict[str, Any]], None] | None,
+) -> list[tuple[Any, bool, str | None]]:
+    """Run ``(tool_call_id, name, args)`` reads on a bounded thread pool.
+
+    Each worker opens its own session on the request session's engine and
+    reloads the principal and conversation by id, so no ORM state is shared
+    across threads. Outcomes come back in ``blocks`` order.
+    """
+
+    # Workers must see this turn's rows, and the request session must not
+    # hold a write transaction while they run.
+    db.commit()
+    bind = db.get_bind()
+    user_id = int(user.id)
+    conversation_id = int(conversation.id)
+
+    def run(tool_call_id: str, name: str, args: dict[str, Any]):
+        if on_progress is not None:
+            on_progress(tool_call_id, {"phase": "running"})
+        worker_db = SessionLocal(bind=bind)
+        try:
+            outcome = _run_tool(
+                worker_db,
+                name,
+                args,
+                user=worker_db.get(User, user_id),
+                conversation=worker_db.get(TaaliChatConversation, conversation_id),
+                messages=messages,
+                on_progress=(
+                    partial(on_progress, tool_call_id) if on_progress else None
+                ),
+            )
+        finally:
+            worker_db.close()
+        if on_progress is not None:
+            on_progress(tool_call_id, {"phase": "done", "is_error": outcome[1]})
+        return outcome
+
+    workers = min(len(blocks), int(settings.TAALI_CHAT_TOOL_CONCURRENCY))
+    with ThreadPoolExecutor(
+        max_workers=workers, thread_name_prefix="taali-chat-tool"
+    ) as pool:
+        futures = [
+            pool.submit(copy_context().run, run, *block) for block in blocks
+        ]
+        return [future.result() for future in futures]
+
+
 def execute_tool_round(
     *,
     db: Session,
@@ -79,8 +226,19 @@ def execute_tool_round(
     conversation: TaaliChatConversation,
     assistant_blocks: list[dict[str, Any]],
     messages: list[dict[str, Any]],
+    on_progress: Callable[[str, dict[str, Any]], None] | None = None,
 ) -> ToolRoundResult:
-    """Dispatch a round, buffering results until every search is verified."""
+    """Dispatch a round, buffering results until every search is verified.
+
+    When a round holds several ``runs_concurrently`` reads they run first, side
+    by side on their own sessions (``TAALI_CHAT_TOOL_CONCURRENCY``); the rest
+    run after them, one at a time on ``db``. Results keep the model's order.
+
+    ``on_progress(tool_call_id, event)`` receives incremental events from
+    progressive tools (``PROGRESSIVE_TOOLS``) while they run, plus
+    ``running``/``done`` phases for concurrently run tools. Events are
+    provisional; the buffered results below stay the only durable output.
+    """
 
     tool_blocks = [
         block for block in assistant_blocks if block.get("type") == "tool_use"
@@ -89,14 +247,35 @@ def execute_tool_round(
     outcomes: dict[str, tuple[Any, bool, str]] = {}
     search_failure_incident: str | None = None
 
-    for block in candidate_search_tools_first(assistant_blocks):
-        tool_call_id = str(block.get("id") or "")
+    def call(block: dict[str, Any]) -> tuple[str, str, dict[str, Any]]:
         name = str(block.get("name") or "")
         args = _arguments_with_role_scope(
             name,
             block.get("input") or {},
             conversation_role_id=conversation_role_id,
         )
+        return str(block.get("id") or ""), name, args
+
+    concurrent = [call(block) for block in _concurrent_blocks(assistant_blocks)]
+    if concurrent:
+        results = _run_concurrently(
+            db,
+            concurrent,
+            user=user,
+            conversation=conversation,
+            messages=messages,
+            on_progress=on_progress,
+        )
+        for (tool_call_id, name, _), (result, is_error, incident) in zip(
+            concurrent, results
+        ):
+            outcomes[tool_call_id] = (result, is_error, name)
+            search_failure_incident = search_failure_incident or incident
+
+    for block in candidate_search_tools_first(assistant_blocks):
+        tool_call_id, name, args = call(block)
+        if tool_call_id in outcomes:
+            continue
         if search_failure_incident is not None:
             result = skipped_after_search_failure_result(
                 tool=name,
@@ -104,56 +283,17 @@ def execute_tool_round(
             )
             outcomes[tool_call_id] = (result, True, name)
             continue
-
-        try:
-            result = dispatch_tool(
-                name,
-                args,
-                db=db,
-                user=user,
-                conversation=conversation,
-                messages=messages,
-            )
-            is_error = False
-            if candidate_search_result_failed(name, result):
-                search_failure_incident = new_candidate_search_incident_id()
-                logger.warning(
-                    "Taali Chat candidate search returned an unavailable result "
-                    "tool=%s incident_id=%s",
-                    name,
-                    search_failure_incident,
-                )
-                db.rollback()
-                result = candidate_search_failure_result(
-                    tool=name,
-                    incident_id=search_failure_incident,
-                )
-                is_error = True
-            else:
-                # One tool is one durable transaction. Candidate reports can
-                # contain bearer URLs, and no later independent tool failure
-                # may roll back a result that has already been buffered.
-                db.commit()
-        except Exception:
-            incident_id = new_candidate_search_incident_id()
-            logger.exception(
-                "Taali Chat tool failed tool=%s incident_id=%s",
-                name,
-                incident_id,
-            )
-            db.rollback()
-            if is_candidate_search_tool(name):
-                search_failure_incident = incident_id
-                result = candidate_search_failure_result(
-                    tool=name,
-                    incident_id=incident_id,
-                )
-            else:
-                result = unexpected_tool_failure_result(
-                    tool=name,
-                    incident_id=incident_id,
-                )
-            is_error = True
+        result, is_error, search_failure_incident = _run_tool(
+            db,
+            name,
+            args,
+            user=user,
+            conversation=conversation,
+            messages=messages,
+            on_progress=(
+                partial(on_progress, tool_call_id) if on_progress else None
+            ),
+        )
         outcomes[tool_call_id] = (result, is_error, name)
 
     if search_failure_incident is not None:
@@ -214,4 +354,58 @@ def execute_tool_round(
     )
 
 
-__all__ = ["ToolRoundResult", "execute_tool_round"]
+def stream_tool_round(
+    *,
+    route_scope: Callable[[], AbstractContextManager[Any]],
+    **round_kwargs: Any,
+) -> Generator[streaming.Frame, None, ToolRoundResult]:
+    """``execute_tool_round`` that yields progress frames while it runs.
+
+    Rounds without a progressive tool or concurrent reads run inline.
+    Otherwise the round runs on a helper thread while this generator relays its
+    progress frames. The thread runs in a copy of this context, so routing
+    lineage carries over. The caller does not touch the session until the
+    round returns, so the session still has a single user at a time.
+    """
+    blocks = round_kwargs.get("assistant_blocks") or []
+    if not _concurrent_blocks(blocks) and not any(
+        block.get("type") == "tool_use" and block.get("name") in PROGRESSIVE_TOOLS
+        for block in blocks
+    ):
+        with route_scope():
+            return execute_tool_round(**round_kwargs)
+
+    frames: queue.Queue[streaming.Frame | None] = queue.Queue()
+    outcome: dict[str, Any] = {}
+
+    def _progress(tool_call_id: str, event: dict[str, Any]) -> None:
+        frames.put(streaming.tool_progress(tool_call_id=tool_call_id, event=event))
+
+    def _run() -> None:
+        try:
+            with route_scope():
+                outcome["result"] = execute_tool_round(
+                    **round_kwargs, on_progress=_progress
+                )
+        except BaseException as exc:  # re-raised on the streaming thread
+            outcome["error"] = exc
+        finally:
+            frames.put(None)
+
+    worker = threading.Thread(
+        target=copy_context().run, args=(_run,), name="taali-chat-tools", daemon=True
+    )
+    worker.start()
+    try:
+        while (frame := frames.get()) is not None:
+            yield frame
+    finally:
+        # A disconnected client closes this generator; the round still owns the
+        # session until it finishes.
+        worker.join()
+    if "error" in outcome:
+        raise outcome["error"]
+    return outcome["result"]
+
+
+__all__ = ["ToolRoundResult", "execute_tool_round", "stream_tool_round"]
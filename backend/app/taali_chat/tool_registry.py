@@ -52,6 +52,10 @@ _SHARED_TAALI_READ_NAMES = frozenset(
     spec.name for spec in _SHARED_TAALI_READ_SPECS
 )
 
+# Tools whose handlers publish provisional progress while they run (the
+# top-candidates shortlist before its evidence checks finish).
+PROGRESSIVE_TOOLS = frozenset({"find_top_candidates"})
+
 
 def _preview_with_receipt(
     db: Session,
@@ -219,6 +223,7 @@ def dispatch_tool(
     conversation: TaaliChatConversation | None = None,
     search_context: dict[str, Any] | None = None,
     messages: list[dict[str, Any]] | None = None,
+    on_progress: Callable[[dict[str, Any]], None] | None = None,
 ) -> Any:
     """Validate and run one Taali Chat tool call.
 
@@ -242,8 +247,11 @@ def dispatch_tool(
                     messages,
                     current_query=str(arguments.get("query") or ""),
                 )
+            handler_kwargs = {}
             if search_context:
-                handler_kwargs = {"_search_context": search_context}
+                handler_kwargs["_search_context"] = search_context
+            if on_progress is not None:
+                handler_kwargs["_on_progress"] = on_progress
         return dispatch_shared_read(
             name,
             arguments,
@@ -342,9 +350,31 @@ def persistence_policy_for(name: str) -> str:
     return spec.persistence
 
 
+def runs_concurrently(name: str) -> bool:
+    """True when a tool may run beside others of its round on its own session.
+
+    Only synchronous reads without a confirmation step qualify; anything that
+    writes, queues work or consumes a receipt keeps the request session and
+    runs sequentially after the reads.
+    """
+
+    try:
+        spec = get_tool_spec(name)
+    except KeyError:
+        return False
+    return (
+        TAALI_CHAT in spec.exposures
+        and spec.effect == "read"
+        and spec.execution == "synchronous"
+        and spec.confirmation == "none"
+    )
+
+
 __all__ = [
+    "PROGRESSIVE_TOOLS",
     "TAALI_CHAT_SPECS",
     "TAALI_CHAT_TOOLS",
     "dispatch_tool",
     "persistence_policy_for",
+    "runs_concurrently",
 ]
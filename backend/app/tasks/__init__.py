@@ -75,7 +75,10 @@ from .application_ingest_tasks import (
 # Batches submit/poll beat tasks — same unregistered-drop trap as above.
 from .anthropic_batch_tasks import (
     poll_cv_parse_batches,
+    poll_holistic_score_batches,
+    poll_outreach_draft_batches,
     submit_cv_parse_batches,
+    submit_holistic_score_batches,
 )
 # Eager-import workable_tasks so the worker registers the sync runner AND the
 # disqualify-retry task. Without this, the retry enqueued from the reject path
@@ -191,6 +194,12 @@ from .outreach_tasks import (
 # traverse this package layout, so otherwise accepted jobs are dropped as an
 # unregistered task.
 from .pool_rescore_tasks import rescore_pool_against_requirement
+# The role_stage_counts reconciler is referenced by the beat schedule; same
+# unregistered-drop trap as the imports above.
+from .pipeline_projection_tasks import reconcile_role_cohorts, reconcile_role_stage_counts
+# Sandbox pool replenish/reap are beat-scheduled and enqueued after every
+# pooled claim; same unregistered-drop trap as the imports above.
+from .sandbox_pool_tasks import reap_sandbox_pool, replenish_sandbox_pool
 
 __all__ = [
     "celery_app",
@@ -223,6 +232,9 @@ __all__ = [
     "sweep_application_created_outbox",
     "submit_cv_parse_batches",
     "poll_cv_parse_batches",
+    "submit_holistic_score_batches",
+    "poll_holistic_score_batches",
+    "poll_outreach_draft_batches",
     "run_workable_sync_run_task",
     "retry_workable_disqualify_task",
     "run_workable_op_task",
@@ -257,4 +269,8 @@ __all__ = [
     "flush_workable_provider",
     "generate_campaign_drafts",
     "send_campaign_messages",
+    "reconcile_role_cohorts",
+    "reconcile_role_stage_counts",
+    "reap_sandbox_pool",
+    "replenish_sandbox_pool",
 ]
@@ -1,21 +1,27 @@
 """Beat tasks driving the Message Batches API pipelines.
 
-Currently cv_parse only (the purest batch fit: background backfill /
-post-sync parsing nobody is waiting on, 50% of standard pricing).
-Prescreen and score are candidates to follow through the same
-submit/poll shape once their latency tradeoffs are signed off.
+cv_parse (background backfill / post-sync parsing nobody is waiting on) and
+bulk holistic scoring (role-wide re-scores parked by the score worker on a
+cache miss) — both at 50% of standard pricing. Prescreen is a candidate to
+follow through the same submit/poll shape.
 
-Two halves, both cheap no-ops when there's nothing to do:
+Two halves per pipeline, all cheap no-ops when there's nothing to do:
 
 * ``submit_cv_parse_batches`` — gated on ``CV_PARSE_BATCH_ENABLED``;
   sweeps parse-pending applications into per-org batch submissions.
-* ``poll_cv_parse_batches`` — deliberately NOT gated on the flag, so
-  flipping it off still drains any in-flight batches instead of
-  stranding their (already-paid-for) results.
+* ``submit_holistic_score_batches`` — gated on
+  ``HOLISTIC_SCORE_BATCH_ENABLED``; sweeps parked score jobs into per-org
+  batch submissions. With the flag off it hands parked jobs to the live
+  score path instead, so nothing waits on a pipeline that is switched off.
+* ``poll_cv_parse_batches`` / ``poll_holistic_score_batches`` /
+  ``poll_outreach_draft_batches`` — deliberately NOT gated on the flags, so
+  flipping one off still drains any in-flight batches instead of stranding
+  their (already-paid-for) results. Outreach drafts have no sweep: large
+  campaigns submit inline from ``generate_campaign_drafts``.
 
 Metering happens inside ``MeteredAnthropicClient`` (claude_call_log +
 usage_events at ``service_tier="batch"``, idempotent per batch) — these
-tasks only move application state.
+tasks only move application / score-job / outreach-message state.
 """
 
 from __future__ import annotations
@@ -81,14 +87,13 @@ def _retrieve_with_key_fallback(get_metered_client, row):
         return shared, shared.messages.batches.retrieve(row.batch_id)
 
 
-@celery_app.task(name="app.tasks.anthropic_batch_tasks.poll_cv_parse_batches")
-def poll_cv_parse_batches() -> dict:
-    """Poll open cv_parse batches; apply results for the ended ones.
+def _poll_open_batches(feature: str, apply_results, after_commit=None) -> dict:
+    """Poll one feature's open batches; apply results for the ended ones.
 
-    The metered client's ``results()`` records spend and flips the batch
-    row to ``ended`` (idempotently) before we apply, so a crash between
-    metering and applying leaves rows parse-pending — a later sweep
-    resubmits them — rather than ever losing the spend record.
+    ``apply_results(db, entries, context=...)`` returns a summary; the
+    caller's ``after_commit(db, summary)`` (if any) runs once that batch's
+    state changes are committed — e.g. to dispatch workers that must see
+    them.
     """
     from ..models.anthropic_batch_job import AnthropicBatchJob
     from ..platform.database import SessionLocal
@@ -99,7 +104,7 @@ def poll_cv_parse_batches() -> dict:
         rows = (
             db.query(AnthropicBatchJob)
             .filter(
-                AnthropicBatchJob.feature == "cv_parse",
+                AnthropicBatchJob.feature == feature,
                 AnthropicBatchJob.status == "submitted",
             )
             .all()
@@ -107,8 +112,6 @@ def poll_cv_parse_batches() -> dict:
         if not rows:
             return {"status": "ok", "open": 0}
 
-        from ..cv_parsing.batch import apply_batch_results
-
         polled = []
         for row in rows:
             try:
@@ -124,20 +127,106 @@ def poll_cv_parse_batches() -> dict:
                 # results() meters every entry and latches the batch row to
                 # status='ended' in its own session.
                 entries = client.messages.batches.results(row.batch_id)
-                summary = apply_batch_results(db, entries, context=row.context)
+                summary = apply_results(db, entries, context=row.context)
                 db.commit()
+                if after_commit is not None:
+                    after_commit(db, summary)
                 polled.append(
                     {"batch_id": row.batch_id, "status": "ended", **summary}
                 )
                 logger.info(
-                    "cv_parse batch %s applied: %s", row.batch_id, summary
+                    "%s batch %s applied: %s", feature, row.batch_id, summary
                 )
             except Exception:
                 db.rollback()
                 logger.exception(
-                    "cv_parse batch poll failed batch_id=%s", row.batch_id
+                    "%s batch poll failed batch_id=%s", feature, row.batch_id
                 )
                 polled.append({"batch_id": row.batch_id, "status": "error"})
         return {"status": "ok", "open": len(rows), "polled": polled}
     finally:
         db.close()
+
+
+@celery_app.task(name="app.tasks.anthropic_batch_tasks.poll_cv_parse_batches")
+def poll_cv_parse_batches() -> dict:
+    """Poll open cv_parse batches; apply results for the ended ones.
+
+    The metered client's ``results()`` records spend and flips the batch
+    row to ``ended`` (idempotently) before we apply, so a crash between
+    metering and applying leaves rows parse-pending — a later sweep
+    resubmits them — rather than ever losing the spend record.
+    """
+    from ..cv_parsing.batch import apply_batch_results
+
+    return _poll_open_batches("cv_parse", apply_batch_results)
+
+
+@celery_app.task(
+    name="app.tasks.anthropic_batch_tasks.submit_holistic_score_batches"
+)
+def submit_holistic_score_batches() -> dict:
+    """Submit parked bulk-score jobs as per-org batches (or release them to
+    the live path when ``HOLISTIC_SCORE_BATCH_ENABLED`` is off)."""
+    from ..cv_matching.holistic_batch import (
+        dispatch_score_jobs,
+        release_parked_score_jobs,
+        sweep_parked_score_jobs,
+    )
+    from ..platform.config import settings
+    from ..platform.database import SessionLocal
+
+    db = SessionLocal()
+    try:
+        if settings.HOLISTIC_SCORE_BATCH_ENABLED:
+            summary = sweep_parked_score_jobs(db)
+        else:
+            summary = release_parked_score_jobs(db)
+        db.commit()
+        # Workers claim pending rows on their own connection, so dispatch
+        # only after the hand-back is committed.
+        summary["dispatched"] = dispatch_score_jobs(db, summary.pop("dispatch"))
+        if summary.get("batches") or summary["dispatched"]:
+            logger.info("holistic score batch sweep: %s", summary)
+        status = "ok" if settings.HOLISTIC_SCORE_BATCH_ENABLED else "disabled"
+        return {"status": status, **summary}
+    except Exception:
+        db.rollback()
+        logger.exception("holistic score batch sweep failed")
+        return {"status": "error"}
+    finally:
+        db.close()
+
+
+@celery_app.task(
+    name="app.tasks.anthropic_batch_tasks.poll_holistic_score_batches"
+)
+def poll_holistic_score_batches() -> dict:
+    """Poll open holistic score batches; cache ended results and re-dispatch
+    their jobs to the score worker, which persists them.
+
+    A crash between metering and applying leaves the jobs ``in_batch`` until
+    the stuck-job reaper's batch window reclaims them.
+    """
+    from ..cv_matching.holistic_batch import (
+        apply_score_batch_results,
+        dispatch_score_jobs,
+    )
+
+    def _dispatch(db, summary: dict) -> None:
+        summary["dispatched"] = dispatch_score_jobs(db, summary.pop("dispatch"))
+
+    return _poll_open_batches("score", apply_score_batch_results, _dispatch)
+
+
+@celery_app.task(
+    name="app.tasks.anthropic_batch_tasks.poll_outreach_draft_batches"
+)
+def poll_outreach_draft_batches() -> dict:
+    """Poll open outreach-draft batches; write ended drafts and flip their
+    campaigns to ready. Submission happens inline in
+    ``generate_campaign_drafts`` (large campaigns only), so there is no sweep.
+    """
+    from ..domains.outreach.draft_batch import BATCH_FEATURE, apply_draft_batch_results
+
+    return _poll_open_batches(BATCH_FEATURE, apply_draft_batch_results)
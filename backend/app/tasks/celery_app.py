@@ -61,6 +61,9 @@ _TASK_ROUTES = {
     "app.tasks.assessment_tasks.battle_test_generated_task": {"queue": "scoring"},
     "app.tasks.rubric_retry_tasks.retry_incomplete_rubric_scoring": {"queue": "scoring"},
     "app.tasks.rubric_retry_tasks.sweep_incomplete_rubric_scoring": {"queue": "scoring"},
+    # Sandbox pool replenish/reap stay on the default queue: a warm run takes
+    # minutes and must not hold scoring slots that score jobs are waiting
+    # for. The replenisher is single-flight, so it occupies one slot at most.
 }
 
 celery_app.conf.update(
@@ -205,6 +208,24 @@ celery_app.conf.update(
             "task": "app.tasks.anthropic_batch_tasks.poll_cv_parse_batches",
             "schedule": 300.0,
         },
+        # Bulk holistic scoring through the same pipeline: submit parked
+        # score jobs every 10 min (hands them to the live path when
+        # HOLISTIC_SCORE_BATCH_ENABLED is off), poll ended batches every
+        # 5 min (never gated).
+        "submit-holistic-score-batches-every-10-minutes": {
+            "task": "app.tasks.anthropic_batch_tasks.submit_holistic_score_batches",
+            "schedule": 600.0,
+        },
+        "poll-holistic-score-batches-every-5-minutes": {
+            "task": "app.tasks.anthropic_batch_tasks.poll_holistic_score_batches",
+            "schedule": 300.0,
+        },
+        # Large outreach campaigns submit their draft batch inline from
+        # generate_campaign_drafts; this drains ended ones.
+        "poll-outreach-draft-batches-every-5-minutes": {
+            "task": "app.tasks.anthropic_batch_tasks.poll_outreach_draft_batches",
+            "schedule": 300.0,
+        },
         "assessment-expiry-reminders-daily": {
             "task": "app.tasks.assessment_tasks.send_assessment_expiry_reminders",
             "schedule": 86400.0,
@@ -434,6 +455,32 @@ celery_app.conf.update(
             "task": "app.tasks.graph_outbox_tasks.drain_graph_episode_outbox",
             "schedule": 300.0,
         },
+        # Safety net for the role_stage_counts pipeline projection. ORM writes
+        # mark affected roles stale in their own transaction; this repairs drift
+        # from bulk UPDATEs/triggers and drops rows of deleted roles. SQL only.
+        "reconcile-role-stage-counts-every-10-minutes": {
+            "task": "app.tasks.pipeline_projection_tasks.reconcile_role_stage_counts",
+            "schedule": 600.0,
+        },
+        # Cohort feature counts (get_cohort_signals): applies members marked
+        # stale by ORM writes ahead of the next read, rebuilds cohorts older
+        # than a day from the full pool and drops those of deleted roles.
+        "reconcile-role-cohorts-every-10-minutes": {
+            "task": "app.tasks.pipeline_projection_tasks.reconcile_role_cohorts",
+            "schedule": 600.0,
+        },
+        # Pre-warmed assessment sandbox pool: top up sandboxes for the task
+        # snapshots with the most pending invites, and close aged-out or
+        # unwanted ones. Replenish is a no-op unless SANDBOX_POOL_ENABLED; the
+        # reaper always runs so switching the pool off drains it.
+        "replenish-sandbox-pool-every-minute": {
+            "task": "app.tasks.sandbox_pool_tasks.replenish_sandbox_pool",
+            "schedule": 60.0,
+        },
+        "reap-sandbox-pool-every-5-minutes": {
+            "task": "app.tasks.sandbox_pool_tasks.reap_sandbox_pool",
+            "schedule": 300.0,
+        },
         # Outbound mainspring brain feed: sweep newly-resolved decisions /
         # teach outcomes / daily usage rollups (anonymized) into the
         # brain_feed_outbox and ship them to mainspring's ingest API. No-op
@@ -486,3 +533,6 @@ celery_app.conf.update(
 
 # Auto-discover tasks
 celery_app.autodiscover_tasks(["app.tasks"])
+
+# Per-task / per-queue metrics (signal handlers + broker depth sampler).
+from . import task_metrics  # noqa: E402,F401
@@ -0,0 +1,42 @@
+"""Celery tasks that reconcile the maintained per-role projections.
+
+``role_stage_counts`` and the cohort feature counts (``role_cohort_*``) are
+kept fresh transactionally: ORM writes mark the affected roles or members
+stale in the same flush. These sweeps are the safety net for writers that
+bypass the ORM and for rows of deleted roles; the cohort sweep also applies
+stale members ahead of the next read and periodically rebuilds each cohort
+from scratch. Pure SQL over existing rows — no provider spend.
+
+Scheduled by ``celery_app`` (see beat_schedule). Manual trigger:
+``celery -A app.tasks.celery_app call
+app.tasks.pipeline_projection_tasks.reconcile_role_stage_counts``.
+"""
+
+from __future__ import annotations
+
+from .celery_app import celery_app
+from ..platform.database import SessionLocal
+
+
+@celery_app.task(name="app.tasks.pipeline_projection_tasks.reconcile_role_stage_counts")
+def reconcile_role_stage_counts(batch_size: int = 500) -> dict:
+    """Recompute the least recently refreshed role stage-count rows."""
+    from ..domains.assessments_runtime.role_stage_count_projection import (
+        reconcile_role_stage_counts as reconcile,
+    )
+
+    with SessionLocal() as db:
+        return reconcile(db, batch_size=int(batch_size))
+
+
+
+@celery_app.task(name="app.tasks.pipeline_projection_tasks.reconcile_role_cohorts")
+def reconcile_role_cohorts(batch_size: int = 200) -> dict:
+    """Refresh stale cohort feature counts and rebuild the oldest cohorts."""
+    from ..services.cohort_feature_store import reconcile_role_cohorts as reconcile
+
+    with SessionLocal() as db:
+        return reconcile(db, batch_size=int(batch_size))
+
+
+__all__ = ["reconcile_role_cohorts", "reconcile_role_stage_counts"]
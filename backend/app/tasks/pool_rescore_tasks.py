@@ -86,6 +86,8 @@ def rescore_pool_against_requirement(job_id: int) -> dict:
                 except Exception:  # noqa: BLE001
                     workable_context = None
             try:
+                # Synchronous, not the Batches API: the recruiter is polling
+                # this job (see cv_matching/holistic_batch).
                 out = run_holistic_match(
                     cv or "",
                     requirement,
@@ -0,0 +1,45 @@
+"""Celery tasks that keep the pre-warmed assessment sandbox pool topped up.
+
+``replenish_sandbox_pool`` runs on Beat and is also kicked after every claim;
+overlapping runs return at once (single-flight advisory lock).
+``reap_sandbox_pool`` closes aged-out and unwanted sandboxes. Both are no-ops
+(the reaper drains) unless SANDBOX_POOL_ENABLED is set. See
+``components/assessments/sandbox_pool`` for the invariants.
+"""
+
+from __future__ import annotations
+
+from .celery_app import celery_app
+from ..platform.config import settings
+from ..platform.database import SessionLocal
+
+
+def _sandbox_provider():
+    from ..components.integrations.e2b.service import E2BService
+
+    return E2BService(settings.E2B_API_KEY)
+
+
+@celery_app.task(name="app.tasks.sandbox_pool_tasks.replenish_sandbox_pool")
+def replenish_sandbox_pool() -> dict:
+    """Warm sandboxes for the task snapshots with the most pending invites."""
+    from ..components.assessments.sandbox_pool import pool_enabled, replenish_sandbox_pool as replenish
+
+    if not pool_enabled() or not (settings.E2B_API_KEY or "").strip():
+        return {"skipped": "disabled"}
+    with SessionLocal() as db:
+        return replenish(db, _sandbox_provider())
+
+
+@celery_app.task(name="app.tasks.sandbox_pool_tasks.reap_sandbox_pool")
+def reap_sandbox_pool() -> dict:
+    """Close pooled sandboxes past their age limit or without pending demand."""
+    from ..components.assessments.sandbox_pool import reap_sandbox_pool as reap
+
+    if not (settings.E2B_API_KEY or "").strip():
+        return {"skipped": "unconfigured"}
+    with SessionLocal() as db:
+        return reap(db, _sandbox_provider())
+
+
+__all__ = ["reap_sandbox_pool", "replenish_sandbox_pool"]
@@ -24,6 +24,9 @@ logger = logging.getLogger(__name__)
 DEFAULT_PENDING_STALE_MINUTES = 360
 DEFAULT_RUNNING_STALE_MINUTES = 60
 DEFAULT_BROKER_FAILURE_RETRY_MINUTES = 1
+# A score submitted to the Message Batches API holds its running lease until
+# the batch ends, which Anthropic bounds at 24 hours.
+DEFAULT_BATCH_STALE_MINUTES = 26 * 60
 # Keep the hard worker limit below the running-lease expiry. This ordering is
 # what guarantees the reaper does not reclaim a task Celery still considers
 # live, even if an upstream SDK call hangs indefinitely.
@@ -41,6 +44,7 @@ def recover_stuck_score_jobs(
     pending_stale_minutes: int = DEFAULT_PENDING_STALE_MINUTES,
     running_stale_minutes: int = DEFAULT_RUNNING_STALE_MINUTES,
     broker_failure_retry_minutes: int = DEFAULT_BROKER_FAILURE_RETRY_MINUTES,
+    batch_stale_minutes: int = DEFAULT_BATCH_STALE_MINUTES,
 ) -> dict:
     """Recover score jobs whose dispatch/worker died without a terminal state.
 
@@ -53,12 +57,14 @@ def recover_stuck_score_jobs(
     """
     from datetime import timedelta
 
-    from sqlalchemy import and_, or_
+    from sqlalchemy import and_, func, or_
 
     from ..models.candidate import Candidate
     from ..models.candidate_application import CandidateApplication
     from ..models.cv_score_job import (
         CvScoreJob,
+        SCORE_BATCH_AWAITING_SUBMIT,
+        SCORE_BATCH_IN_FLIGHT_PREFIX,
         SCORE_JOB_ERROR,
         SCORE_JOB_PENDING,
         SCORE_JOB_RUNNING,
@@ -81,6 +87,14 @@ def recover_stuck_score_jobs(
         broker_failure_cutoff = now - timedelta(
             minutes=max(1, int(broker_failure_retry_minutes))
         )
+        batch_cutoff = now - timedelta(minutes=max(1, int(batch_stale_minutes)))
+        in_batch = func.coalesce(CvScoreJob.error_message, "").like(
+            f"{SCORE_BATCH_IN_FLIGHT_PREFIX}%"
+        )
+        # A job parked for batch submit is pending by design and belongs to
+        # submit_holistic_score_batches; re-enqueueing it live would drop the
+        # batch discount and race that sweep into a double score.
+        parked = func.coalesce(CvScoreJob.error_message, "") == SCORE_BATCH_AWAITING_SUBMIT
         rows = (
             db.query(
                 CvScoreJob.id,
@@ -94,11 +108,22 @@ def recover_stuck_score_jobs(
                     and_(
                         CvScoreJob.status == SCORE_JOB_PENDING,
                         CvScoreJob.queued_at < pending_cutoff,
+                        ~parked,
                     ),
                     and_(
                         CvScoreJob.status == SCORE_JOB_RUNNING,
                         CvScoreJob.started_at.isnot(None),
                         CvScoreJob.started_at < running_cutoff,
+                        ~in_batch,
+                    ),
+                    # A batch-submitted score is "running" until its batch
+                    # ends; only a batch that outlived the API's 24h window
+                    # is abandoned.
+                    and_(
+                        CvScoreJob.status == SCORE_JOB_RUNNING,
+                        CvScoreJob.started_at.isnot(None),
+                        CvScoreJob.started_at < batch_cutoff,
+                        in_batch,
                     ),
                     and_(
                         CvScoreJob.status == SCORE_JOB_ERROR,
@@ -148,7 +173,7 @@ def recover_stuck_score_jobs(
                 CvScoreJob.status == status,
             )
             if status == SCORE_JOB_PENDING:
-                claim = claim.filter(CvScoreJob.queued_at < pending_cutoff)
+                claim = claim.filter(CvScoreJob.queued_at < pending_cutoff, ~parked)
             else:
                 claim = claim.filter(
                     CvScoreJob.started_at.isnot(None),
@@ -224,6 +249,7 @@ def recover_stuck_score_jobs(
             "broker_failure_retry_minutes": max(
                 1, int(broker_failure_retry_minutes)
             ),
+            "batch_stale_minutes": max(1, int(batch_stale_minutes)),
         }
     finally:
         db.close()
@@ -273,6 +299,7 @@ def score_application_job(
     from ..platform.database import SessionLocal
     from ..services.cv_score_orchestrator import (
         AutonomousScoringDeferred,
+        ScoreParkedForBatch,
         _execute_scoring,
         _latest_job,
     )
@@ -898,6 +925,24 @@ def score_application_job(
                 "application_id": application_id,
                 "cache_hit": cache_hit,
             }
+        except ScoreParkedForBatch:
+            # Bulk re-score whose holistic call missed the cache. Keep the
+            # pre-screen work and park the attempt for the Message Batches
+            # submit sweep; it re-dispatches this task once the batch result
+            # sits in the shared score cache, and that run persists it.
+            from ..models.cv_score_job import SCORE_BATCH_AWAITING_SUBMIT
+
+            job.status = SCORE_JOB_PENDING
+            job.error_message = SCORE_BATCH_AWAITING_SUBMIT
+            job.queued_at = datetime.now(timezone.utc)
+            job.started_at = None
+            job.finished_at = None
+            db.commit()
+            return {
+                "status": "awaiting_batch",
+                "application_id": application_id,
+                "job_id": int(job.id),
+            }
         except AutonomousScoringDeferred as exc:
             # A workspace Pause committed between provider phases.  Discard
             # every tentative pre-screen/score/cache write from this attempt,
@@ -1226,6 +1271,7 @@ def batch_score_role(
                 app,
                 force=include_scored,
                 requires_active_agent=False,
+                batch=True,
             )
             if job is not None:
                 enqueued += 1
@@ -1396,6 +1442,7 @@ def sweep_stale_scores(
                         if explicit
                         else bool(stale_job.requires_active_agent)
                     ),
+                    batch=True,
                 )
                 if job is not None:
                     enqueued += 1
@@ -0,0 +1,215 @@
+"""Per-task Celery throughput and latency metrics (served at ``/metrics``).
+
+Queue health used to be inferred only from the heartbeat canaries
+(``health_tasks.queue_worker_heartbeat`` / ``services.agent_worker_health``),
+which say whether a queue is consumed at all but not how fast. These signal
+handlers record, per task name and queue:
+
+- queue wait: publish (or ETA) to start of execution, from a timestamp the
+  publisher stamps into the message headers;
+- run time and the final state of every execution (SUCCESS, FAILURE, RETRY…);
+- retries.
+
+Queue depth is sampled from the Redis broker on every scrape: pending
+messages per queue across Kombu's priority sub-queues, plus messages reserved
+by workers but not yet acknowledged (``task_acks_late``). Those are the
+numbers ``worker_prefetch_multiplier``, the queue split and concurrency are
+tuned against.
+
+Task metrics are ``shared`` (platform/metrics), so the prefork children's
+numbers add up in Redis and any web process reports the fleet-wide totals.
+"""
+from __future__ import annotations
+
+import threading
+import time
+from datetime import datetime, timezone
+
+from celery.signals import (
+    before_task_publish,
+    task_postrun,
+    task_prerun,
+    task_retry,
+    worker_process_shutdown,
+)
+
+from ..platform.metrics import registry
+from .celery_app import celery_app
+
+PUBLISHED_AT_HEADER = "taali_published_at"
+# Kombu keeps the broker's reservation bookkeeping for acks_late here.
+_UNACKED_KEY = "unacked"
+
+queue_wait_seconds = registry.histogram(
+    "taali_celery_task_queue_wait_seconds",
+    "Time from publish (or ETA) until a worker started the task.",
+    ("task", "queue"),
+    shared=True,
+)
+runtime_seconds = registry.histogram(
+    "taali_celery_task_runtime_seconds",
+    "Task execution time, by final state of the run.",
+    ("task", "queue", "state"),
+    shared=True,
+)
+runs_total = registry.counter(
+    "taali_celery_task_runs_total",
+    "Task executions, by final state of the run.",
+    ("task", "queue", "state"),
+    shared=True,
+)
+retries_total = registry.counter(
+    "taali_celery_task_retries_total",
+    "Task retries requested (self.retry / autoretry).",
+    ("task", "queue"),
+    shared=True,
+)
+queue_depth = registry.gauge(
+    "taali_celery_queue_depth",
+    "Messages waiting in the broker queue, sampled at scrape.",
+    ("queue",),
+)
+unacked_messages = registry.gauge(
+    "taali_celery_unacked_messages",
+    "Messages reserved by workers and not yet acknowledged, sampled at scrape.",
+)
+
+# task_id -> start stack; an eager retry re-runs the same id nested inside
+# the attempt that asked for it.
+_started: dict[str, list[tuple[float, str]]] = {}
+_started_lock = threading.Lock()
+
+
+def _queue_of(task) -> str:
+    delivery_info = getattr(task.request, "delivery_info", None) or {}
+    return str(
+        delivery_info.get("routing_key")
+        or getattr(task, "queue", None)
+        or celery_app.conf.task_default_queue
+    )
+
+
+def _timestamp(value) -> float | None:
+    if value is None:
+        return None
+    if isinstance(value, (int, float)):
+        return float(value)
+    try:
+        parsed = datetime.fromisoformat(str(value))
+    except ValueError:
+        return None
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed.timestamp()
+
+
+@before_task_publish.connect
+def _stamp_published_at(headers=None, **_kwargs) -> None:
+    if headers is not None:
+        headers.setdefault(PUBLISHED_AT_HEADER, time.time())
+
+
+@task_prerun.connect
+def _task_started(task_id=None, task=None, **_kwargs) -> None:
+    if task is None or task_id is None:
+        return
+    queue = _queue_of(task)
+    published_at = _timestamp(getattr(task.request, PUBLISHED_AT_HEADER, None))
+    if published_at is not None:
+        # A countdown/ETA task is not waiting before its ETA.
+        due_at = max(published_at, _timestamp(getattr(task.request, "eta", None)) or 0.0)
+        queue_wait_seconds.observe(time.time() - due_at, task=task.name, queue=queue)
+    with _started_lock:
+        _started.setdefault(task_id, []).append((time.perf_counter(), queue))
+
+
+@task_postrun.connect
+def _task_finished(task_id=None, task=None, state=None, **_kwargs) -> None:
+    if task is None or task_id is None:
+        return
+    with _started_lock:
+        stack = _started.get(task_id)
+        started = stack.pop() if stack else None
+        if not stack:
+            _started.pop(task_id, None)
+    if started is None:
+        return
+    started_at, queue = started
+    state = str(state or "UNKNOWN")
+    runtime_seconds.observe(
+        time.perf_counter() - started_at, task=task.name, queue=queue, state=state
+    )
+    runs_total.inc(task=task.name, queue=queue, state=state)
+
+
+@task_retry.connect
+def _task_retried(sender=None, request=None, **_kwargs) -> None:
+    if sender is None:
+        return
+    delivery_info = getattr(request, "delivery_info", None) or {}
+    queue = str(
+        delivery_info.get("routing_key")
+        or getattr(sender, "queue", None)
+        or celery_app.conf.task_default_queue
+    )
+    retries_total.inc(task=sender.name, queue=queue)
+
+
+@worker_process_shutdown.connect
+def _flush_on_shutdown(**_kwargs) -> None:
+    registry.flush()
+
+
+def _known_queues() -> set[str]:
+    queues = {str(celery_app.conf.task_default_queue)}
+    for route in (celery_app.conf.task_routes or {}).values():
+        if isinstance(route, dict) and route.get("queue"):
+            queues.add(str(route["queue"]))
+    return queues
+
+
+def _redis():
+    from ..platform.redis_cache import cache_redis
+
+    return cache_redis()
+
+
+def sample_queue_depths() -> None:
+    """Set the depth gauges from the broker (no-op without Redis)."""
+    r = _redis()
+    if r is None:
+        return
+    from kombu.transport.redis import Channel
+
+    queues = sorted(_known_queues())
+    try:
+        pipe = r.pipeline(transaction=False)
+        for queue in queues:
+            # Kombu stores priority levels as sibling lists "<queue><sep><step>".
+            for step in Channel.priority_steps:
+                pipe.llen(f"{queue}{Channel.sep}{step}" if step else queue)
+        pipe.hlen(_UNACKED_KEY)
+        counts = pipe.execute()
+    except Exception:  # pragma: no cover — depth is best-effort
+        from ..platform.redis_cache import mark_cache_redis_failed
+
+        mark_cache_redis_failed()
+        return
+    steps = len(Channel.priority_steps)
+    for index, queue in enumerate(queues):
+        queue_depth.set(sum(int(n or 0) for n in counts[index * steps : (index + 1) * steps]), queue=queue)
+    unacked_messages.set(int(counts[-1] or 0))
+
+
+registry.add_collector(sample_queue_depths)
+
+__all__ = [
+    "PUBLISHED_AT_HEADER",
+    "queue_depth",
+    "queue_wait_seconds",
+    "retries_total",
+    "runs_total",
+    "runtime_seconds",
+    "sample_queue_depths",
+    "unacked_messages",
+]
@@ -0,0 +1,133 @@
+"""Benchmark nightly calibration fitting over a large labelled-outcome set.
+
+Generates ``--pairs`` synthetic (raw score, advanced) pairs shaped like
+cv_match output (0-100, one decimal, a minority positive) and times, against the
+previous per-sample implementations kept inline below as references:
+
+- ``platt``: ``PlattCalibrator.fit`` (gradient descent over distinct scores
+  vs over every sample)
+- ``isotonic``: ``IsotonicCalibrator.fit`` (stack-based PAV)
+- ``threshold``: ``learn_threshold`` (sort + bisection vs a full scan per cut)
+
+Each pair of outputs is checked for equality before timings are printed::
+
+    python scripts/benchmark_calibration_fitting.py --pairs 100000
+"""
+
+from __future__ import annotations
+
+import argparse
+import math
+import random
+import sys
+import time
+from pathlib import Path
+
+
+def _pairs(count: int, seed: int) -> tuple[list[float], list[bool]]:
+    rng = random.Random(seed)
+    X = [round(rng.uniform(0.0, 100.0), 1) for _ in range(count)]
+    y = [rng.random() < 1.0 / (1.0 + math.exp(-(x - 82.0) / 6.0)) for x in X]
+    return X, y
+
+
+def _reference_platt(X, y, *, learning_rate=0.1, n_iterations=2000, l2=0.001):
+    from app.cv_matching.calibrators.platt import _sigmoid
+
+    n = len(X)
+    mean = sum(X) / n
+    scale = math.sqrt(sum((x - mean) ** 2 for x in X) / n) or 1.0
+    x_std = [(xi - mean) / scale for xi in X]
+    y_f = [1.0 if yi else 0.0 for yi in y]
+    a, b = 0.0, 0.0
+    for _ in range(n_iterations):
+        grad_a, grad_b = 0.0, 0.0
+        for xi, yi in zip(x_std, y_f):
+            err = _sigmoid(a * xi + b) - yi
+            grad_a += err * xi
+            grad_b += err
+        a -= learning_rate * (grad_a / n + l2 * a)
+        b -= learning_rate * (grad_b / n)
+    return a, b
+
+
+def _reference_pav(X, y):
+    pairs = sorted(zip(X, y), key=lambda t: t[0])
+    blocks: list[list[float]] = []
+    for xi, yi in pairs:
+        blocks.append([1.0 if yi else 0.0, 1.0, xi])
+        while len(blocks) >= 2 and (
+            blocks[-2][0] / blocks[-2][1] > blocks[-1][0] / blocks[-1][1]
+        ):
+            sy2, c2, _ = blocks.pop()
+            sy1, c1, lx1 = blocks.pop()
+            blocks.append([sy1 + sy2, c1 + c2, max(lx1, xi)])
+    return [(right_x, sum_y / count) for sum_y, count, right_x in blocks]
+
+
+def _reference_threshold(pairs):
+    pos = [s for s, label in pairs if label == 1]
+    neg = [s for s, label in pairs if label == 0]
+    best_t, best_j = 0, -2.0
+    for t in range(0, 101):
+        j = sum(1 for s in pos if s >= t) / len(pos) - sum(
+            1 for s in neg if s >= t
+        ) / len(neg)
+        if j > best_j:
+            best_j, best_t = j, t
+    return float(best_t), float(best_j)
+
+
+def _timed(fn, *args, **kwargs):
+    started = time.perf_counter()
+    result = fn(*args, **kwargs)
+    return result, time.perf_counter() - started
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--pairs", type=int, default=100_000)
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument(
+        "--platt-iterations",
+        type=int,
+        default=2000,
+        help="gradient steps for both Platt fits (the reference is O(N) per step)",
+    )
+    args = parser.parse_args()
+
+    sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+    from app.cv_matching.calibrators import IsotonicCalibrator, PlattCalibrator
+    from app.services.threshold_calibration.learner import learn_threshold
+
+    X, y = _pairs(args.pairs, args.seed)
+    print(f"{len(X)} pairs, {len(set(X))} distinct scores, {sum(y)} positive")
+
+    rows = []
+    platt, fast = _timed(
+        PlattCalibrator().fit, X, y, n_iterations=args.platt_iterations
+    )
+    (a, b), slow = _timed(_reference_platt, X, y, n_iterations=args.platt_iterations)
+    drift = max(abs(platt.a - a), abs(platt.b - b))
+    assert drift < 1e-9, f"platt drift {drift}"
+    rows.append(("platt", slow, fast, f"max |Δ| {drift:.1e}"))
+
+    isotonic, fast = _timed(IsotonicCalibrator().fit, X, y)
+    breakpoints, slow = _timed(_reference_pav, X, y)
+    assert isotonic.breakpoints == breakpoints, "isotonic breakpoints differ"
+    rows.append(("isotonic", slow, fast, f"{len(breakpoints)} breakpoints, identical"))
+
+    pairs = [(int(x), int(label)) for x, label in zip(X, y)]
+    fit, fast = _timed(learn_threshold, pairs)
+    (t, j), slow = _timed(_reference_threshold, pairs)
+    assert fit is not None and (fit.threshold, fit.youden_j) == (t, j)
+    rows.append(("threshold", slow, fast, f"t={t:.0f} J={j:.3f}, identical"))
+
+    print(f"{'fit':<10} {'reference s':>12} {'current s':>10} {'speedup':>8}  check")
+    for name, slow, fast, check in rows:
+        print(f"{name:<10} {slow:>12.3f} {fast:>10.3f} {slow / fast:>7.1f}x  {check}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
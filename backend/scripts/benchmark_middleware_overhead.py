@@ -0,0 +1,139 @@
+"""Microbenchmark the per-request overhead of the API middleware stack.
+
+Calls a trivial ASGI app directly (no sockets, no HTTP client) through three
+stacks and prints the mean and p95 cost per request:
+
+- ``bare``: the endpoint with no middleware
+- ``base_http``: four pass-through ``BaseHTTPMiddleware`` layers, the shape
+  the stack had before it moved to pure ASGI
+- ``pure_asgi``: the real ``SecurityHeaders`` / ``RateLimit`` /
+  ``EnterpriseAccess`` / ``RequestLogging`` middleware from
+  ``app.platform.middleware``
+
+The rate-limited variant hits a candidate-token path so the limiter runs on
+every request (with a limit high enough never to trip)::
+
+    python scripts/benchmark_middleware_overhead.py --requests 20000
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import logging
+import statistics
+import sys
+import time
+from pathlib import Path
+
+
+def _build_stacks():
+    from starlette.applications import Starlette
+    from starlette.middleware.base import BaseHTTPMiddleware
+    from starlette.responses import PlainTextResponse
+    from starlette.routing import Route
+
+    from app.platform import middleware as mw
+
+    async def endpoint(_request):
+        return PlainTextResponse("ok")
+
+    routes = [
+        Route("/api/v1/ping", endpoint),
+        Route("/api/v1/assessments/token/{token}/start", endpoint),
+    ]
+
+    class _PassThrough(BaseHTTPMiddleware):
+        async def dispatch(self, request, call_next):
+            return await call_next(request)
+
+    bare = Starlette(routes=routes)
+    base_http = Starlette(routes=routes)
+    for _ in range(4):
+        base_http.add_middleware(_PassThrough)
+    pure_asgi = Starlette(routes=routes)
+    pure_asgi.add_middleware(mw.SecurityHeadersMiddleware, production=True)
+    pure_asgi.add_middleware(mw.RateLimitMiddleware)
+    pure_asgi.add_middleware(mw.EnterpriseAccessMiddleware)
+    pure_asgi.add_middleware(mw.RequestLoggingMiddleware)
+    return {"bare": bare, "base_http": base_http, "pure_asgi": pure_asgi}
+
+
+def _scope(path: str) -> dict:
+    return {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": path,
+        "raw_path": path.encode(),
+        "root_path": "",
+        "query_string": b"",
+        "headers": [(b"host", b"bench"), (b"user-agent", b"bench")],
+        "client": ("127.0.0.1", 1234),
+        "server": ("bench", 80),
+    }
+
+
+async def _time_app(app, *, path: str, requests: int) -> list[float]:
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(_message):
+        return None
+
+    samples: list[float] = []
+    for _ in range(requests):
+        started = time.perf_counter()
+        await app(_scope(path), receive, send)
+        samples.append((time.perf_counter() - started) * 1e6)
+    return samples
+
+
+def _summary(label: str, samples: list[float], baseline: float | None) -> str:
+    mean = statistics.fmean(samples)
+    p95 = statistics.quantiles(samples, n=100)[94]
+    overhead = f" overhead={mean - baseline:.1f}us" if baseline is not None else ""
+    return f"{label:<24} mean={mean:.1f}us p95={p95:.1f}us{overhead}"
+
+
+async def _run(requests: int) -> None:
+    from app.platform.config import settings
+    from app.services import rate_limit
+
+    # Measure the in-process limiter: with no REDIS_URL the first lookup
+    # records the attempt and the limiter stays inline for the cooldown.
+    settings.REDIS_URL = ""
+    rate_limit._get_redis()
+    settings.MCP_RATE_LIMIT_PER_MINUTE = 0
+    logging.getLogger("tali.middleware").setLevel(logging.WARNING)
+    stacks = _build_stacks()
+    from app.platform import middleware as mw
+
+    original_max = mw._rate_limit_max
+    mw._rate_limit_max = lambda key: 10**9 if original_max(key) else 0
+    try:
+        for path in ("/api/v1/ping", "/api/v1/assessments/token/bench/start"):
+            print(f"path={path} requests={requests}")
+            baseline = None
+            for label, app in stacks.items():
+                await _time_app(app, path=path, requests=min(requests, 500))  # warm-up
+                samples = await _time_app(app, path=path, requests=requests)
+                print("  " + _summary(label, samples, baseline))
+                if baseline is None:
+                    baseline = statistics.fmean(samples)
+    finally:
+        mw._rate_limit_max = original_max
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=20_000)
+    args = parser.parse_args()
+    sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+    asyncio.run(_run(args.requests))
+
+
+if __name__ == "__main__":
+    main()
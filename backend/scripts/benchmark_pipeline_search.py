@@ -0,0 +1,198 @@
+"""Benchmark the role-pipeline search box against a large synthetic org.
+
+Seeds one organization with ``--candidates`` candidates (default 100k), each
+with an open application on a single role, inside a transaction that is rolled
+back at the end. It then times the legacy join-then-``ILIKE`` filter and the
+indexed semi-join search from ``application_text_search`` on the same count +
+first-page queries ``get_role_pipeline`` issues, and prints p50/p95 latency.
+
+Run against the disposable search CI database after
+``scripts/bootstrap_candidate_search_postgres.py`` so migration 191's indexes
+exist::
+
+    TALI_SEARCH_TEST_DATABASE_URL=postgresql://.../taali_search_test \\
+        python scripts/benchmark_pipeline_search.py --candidates 100000
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import statistics
+import sys
+import time
+from pathlib import Path
+
+from sqlalchemy.engine import make_url
+
+
+EXPECTED_DATABASE = "taali_search_test"
+DEFAULT_TERMS = ("ada", "lovelace", "ada.l", "gr", "engineer", "zzz-no-match")
+_FIRST_NAMES = ("Ada", "Grace", "Alan", "Barbara", "Edsger", "Linus", "Margaret", "Ken")
+_LAST_NAMES = ("Lovelace", "Hopper", "Turing", "Liskov", "Dijkstra", "Torvalds", "Hamilton", "Thompson")
+_POSITIONS = ("Software Engineer", "Data Scientist", "Product Manager", "SRE", "Designer")
+
+
+def _test_database_url() -> str:
+    raw_url = (os.getenv("TALI_SEARCH_TEST_DATABASE_URL") or "").strip()
+    if not raw_url:
+        raise SystemExit("TALI_SEARCH_TEST_DATABASE_URL is required for the search benchmark")
+    url = make_url(raw_url)
+    if url.get_backend_name() != "postgresql" or url.database != EXPECTED_DATABASE:
+        raise SystemExit(
+            "refusing to benchmark outside the explicit PostgreSQL database "
+            f"{EXPECTED_DATABASE!r}"
+        )
+    return raw_url
+
+
+def _seed(db, *, candidates: int) -> tuple[int, int]:
+    from sqlalchemy import insert, text
+
+    from app.models.candidate import Candidate
+    from app.models.candidate_application import CandidateApplication
+    from app.models.organization import Organization
+    from app.models.role import Role
+
+    org = Organization(name="Pipeline search benchmark", slug=f"pipeline-search-bench-{time.time_ns()}")
+    db.add(org)
+    db.flush()
+    role = Role(organization_id=org.id, name="Benchmark role", source="manual")
+    db.add(role)
+    db.flush()
+    chunk = 5_000
+    for start in range(0, candidates, chunk):
+        rows = []
+        for index in range(start, min(start + chunk, candidates)):
+            first = _FIRST_NAMES[index % len(_FIRST_NAMES)]
+            last = _LAST_NAMES[(index // len(_FIRST_NAMES)) % len(_LAST_NAMES)]
+            rows.append(
+                {
+                    "organization_id": org.id,
+                    "full_name": f"{first} {last} {index}",
+                    "email": f"{first}.{last}.{index}@bench.example".lower(),
+                    "position": _POSITIONS[index % len(_POSITIONS)],
+                }
+            )
+        candidate_ids = db.execute(
+            insert(Candidate).returning(Candidate.id), rows
+        ).scalars().all()
+        db.execute(
+            insert(CandidateApplication),
+            [
+                {
+                    "organization_id": org.id,
+                    "candidate_id": candidate_id,
+                    "role_id": role.id,
+                    "source": "manual",
+                    "pipeline_stage": "applied",
+                    "pipeline_stage_source": "recruiter",
+                    "application_outcome": "open",
+                }
+                for candidate_id in candidate_ids
+            ],
+        )
+    db.execute(text("ANALYZE candidates"))
+    db.execute(text("ANALYZE candidate_applications"))
+    return int(org.id), int(role.id)
+
+
+def _legacy_query(db, *, organization_id: int, role_id: int, term: str):
+    from app.models.candidate import Candidate
+    from app.models.candidate_application import CandidateApplication
+
+    pattern = f"%{term}%"
+    return (
+        db.query(CandidateApplication)
+        .filter(
+            CandidateApplication.organization_id == organization_id,
+            CandidateApplication.role_id == role_id,
+            CandidateApplication.application_outcome == "open",
+        )
+        .join(Candidate, Candidate.id == CandidateApplication.candidate_id)
+        .filter(
+            Candidate.full_name.ilike(pattern)
+            | Candidate.email.ilike(pattern)
+            | Candidate.position.ilike(pattern)
+        )
+    ), ()
+
+
+def _indexed_query(db, *, organization_id: int, role_id: int, term: str):
+    from app.domains.assessments_runtime.application_text_search import (
+        apply_application_text_search,
+        parse_application_text_search,
+        search_rank_order_column,
+    )
+    from app.models.candidate_application import CandidateApplication
+
+    search = parse_application_text_search(term)
+    query = db.query(CandidateApplication).filter(
+        CandidateApplication.organization_id == organization_id,
+        CandidateApplication.role_id == role_id,
+        CandidateApplication.application_outcome == "open",
+    )
+    query = apply_application_text_search(query, search, organization_id=organization_id)
+    return query, (search_rank_order_column(db, search),)
+
+
+def _time_variant(db, build, *, organization_id: int, role_id: int, terms, repeats: int) -> list[float]:
+    from app.models.candidate_application import CandidateApplication
+
+    samples: list[float] = []
+    for _ in range(repeats):
+        for term in terms:
+            started = time.perf_counter()
+            query, rank_order = build(db, organization_id=organization_id, role_id=role_id, term=term)
+            query.order_by(None).count()
+            (
+                query.with_entities(CandidateApplication.id)
+                .order_by(*rank_order, CandidateApplication.id.desc())
+                .limit(50)
+                .all()
+            )
+            samples.append((time.perf_counter() - started) * 1000.0)
+    return samples
+
+
+def _summary(label: str, samples: list[float]) -> str:
+    cuts = statistics.quantiles(samples, n=100)
+    return f"{label:<8} n={len(samples)} p50={cuts[49]:.1f}ms p95={cuts[94]:.1f}ms max={max(samples):.1f}ms"
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--candidates", type=int, default=100_000)
+    parser.add_argument("--repeats", type=int, default=20)
+    parser.add_argument("--terms", nargs="*", default=list(DEFAULT_TERMS))
+    args = parser.parse_args()
+
+    raw_url = _test_database_url()
+    os.environ["DATABASE_URL"] = raw_url
+    sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+    import app.models  # noqa: F401
+    from app.platform.database import SessionLocal
+
+    db = SessionLocal()
+    try:
+        organization_id, role_id = _seed(db, candidates=args.candidates)
+        common = {
+            "organization_id": organization_id,
+            "role_id": role_id,
+            "terms": args.terms,
+            "repeats": args.repeats,
+        }
+        # One warm-up pass each so neither variant pays cold-cache I/O alone.
+        _time_variant(db, _legacy_query, **{**common, "repeats": 1})
+        _time_variant(db, _indexed_query, **{**common, "repeats": 1})
+        print(f"candidates={args.candidates} terms={','.join(args.terms)}")
+        print(_summary("legacy", _time_variant(db, _legacy_query, **common)))
+        print(_summary("indexed", _time_variant(db, _indexed_query, **common)))
+    finally:
+        db.rollback()
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
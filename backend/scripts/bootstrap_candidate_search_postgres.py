@@ -3,7 +3,7 @@
 The production Alembic lineage starts by altering a pre-existing platform
 schema, so ``alembic upgrade head`` cannot initialize an empty database. This
 test-only bootstrap creates the current ORM schema, runs the actual
-candidate-search index migration from its parent revision, then stamps the
+candidate-search index migrations from their parent revisions, then stamps the
 schema at the repository head. It refuses every database name except the
 explicit CI test database.
 """
@@ -23,6 +23,8 @@ from sqlalchemy.engine import make_url
 EXPECTED_DATABASE = "taali_search_test"
 SEARCH_PARENT_REVISION = "159_add_sister_roles"
 SEARCH_REVISION = "160_add_candidate_search_indexes"
+TEXT_SEARCH_PARENT_REVISION = "190_deck_share_links"
+TEXT_SEARCH_REVISION = "191_add_application_text_search_indexes"
 
 
 def _test_database_url() -> str:
@@ -80,6 +82,8 @@ def main() -> None:
     config.set_main_option("script_location", str(backend_root / "alembic"))
     command.stamp(config, SEARCH_PARENT_REVISION)
     command.upgrade(config, SEARCH_REVISION)
+    command.stamp(config, TEXT_SEARCH_PARENT_REVISION)
+    command.upgrade(config, TEXT_SEARCH_REVISION)
     command.stamp(config, "head")
 
 
@@ -64,7 +64,10 @@ RATCHETED_FILES: dict[str, tuple[int, str]] = {
     "app/main.py": (1319, "application and router composition"),
     "app/agent_chat/tools.py": (2337, "agent-chat tool surface"),
     "app/candidate_search/top_candidates.py": (1413, "candidate search orchestration"),
-    "app/models/__init__.py": (396, "Alembic model metadata registry"),
+    # alembic/env.py builds target_metadata from ``app.models``, and model
+    # modules register their ORM hooks on import, so every table is registered
+    # here even when that grows the file; raised from 396 for new tables.
+    "app/models/__init__.py": (409, "Alembic model metadata registry"),
 }
 
 MERGE_HOTSPOTS = frozenset(
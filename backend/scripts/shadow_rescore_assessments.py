@@ -260,10 +260,14 @@ def main() -> int:
                 "  *** BAND FLIP ***" if cmp["band_flip"] else "",
             )
 
+    from app.components.assessments.rubric_grade_cache import grade_cache_stats
+
     summary = summarize_comparisons(comparisons)
     logger.info("=== shadow re-score summary (process-trace OFF -> ON) ===")
     for k, v in summary.items():
         logger.info("  %s: %s", k, v)
+    # Re-runs over unchanged submissions are served from the grade cache.
+    logger.info("  grade_cache: %s", grade_cache_stats())
     logger.info(
         "GUIDANCE: a low mean_abs_delta, few/zero band_flips and rank_correlation "
         "near 1.0 means the flag is safe to flip. Investigate band flips before flipping."
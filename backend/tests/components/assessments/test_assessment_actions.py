@@ -2,6 +2,7 @@ import json
 from pathlib import Path
 
 from tests.conftest import verify_user
+from tests.fakes.repo_snapshot import snapshot_stdout
 from app.models.organization import Organization
 from app.models.user import User
 from app.services.task_catalog import PERSISTED_TASK_SPEC_KEYS
@@ -329,9 +330,7 @@ def test_execute_auto_submits_when_time_expires(client, monkeypatch):
         def run_code(self, code):
             if "file_count_limit_exceeded" in code:
                 return {
-                    "stdout": json.dumps(
-                        {"files": {"src/main.py": "candidate work\n"}, "error": None}
-                    ),
+                    "stdout": snapshot_stdout({"src/main.py": "candidate work\n"}),
                     "stderr": "",
                     "error": None,
                 }
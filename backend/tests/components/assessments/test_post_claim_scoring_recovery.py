@@ -18,6 +18,7 @@ from app.models.candidate import Candidate
 from app.models.organization import Organization
 from app.models.task import Task
 from app.tasks import rubric_retry_tasks
+from tests.fakes.repo_snapshot import snapshot_stdout
 
 
 def _seed(db) -> Assessment:
@@ -225,7 +226,7 @@ def test_deferred_submission_returns_durable_receipt_before_grading(db):
     db.commit()
     sandbox = SimpleNamespace(
         run_code=lambda _code: {
-            "stdout": '{"files": {"src/main.py": "candidate work\\n"}, "error": null}'
+            "stdout": snapshot_stdout({"src/main.py": "candidate work\n"})
         }
     )
 
@@ -283,7 +284,7 @@ def test_timeout_terminal_status_survives_process_death_after_artifact_commit(db
     db.commit()
     sandbox = SimpleNamespace(
         run_code=lambda _code: {
-            "stdout": '{"files": {"src/main.py": "candidate work\\n"}, "error": null}'
+            "stdout": snapshot_stdout({"src/main.py": "candidate work\n"})
         }
     )
 
@@ -0,0 +1,216 @@
+from __future__ import annotations
+
+import contextlib
+import hashlib
+import io
+from datetime import timedelta
+
+import pytest
+
+from app.components.assessments.repo_snapshot import read_repo_snapshot
+from app.components.assessments.repository import utcnow
+from app.models.assessment import Assessment, AssessmentStatus
+from app.models.candidate import Candidate
+from app.models.organization import Organization
+from app.models.repo_snapshot import AssessmentRepoManifest, RepoBlobRef, RepoFileBlob
+from app.models.task import Task
+
+BASELINE = {"answer.py": "# starter\n", "README.md": "Repair the pipeline\n"}
+
+
+class _ExecSandbox:
+    """Runs the snapshot script for real against a local directory."""
+
+    def __init__(self) -> None:
+        self.scripts: list[str] = []
+
+    def run_code(self, code: str):
+        self.scripts.append(code)
+        out = io.StringIO()
+        with contextlib.redirect_stdout(out):
+            exec(code, {})
+        return {"stdout": out.getvalue()}
+
+
+@pytest.fixture
+def repo(tmp_path):
+    root = tmp_path.resolve() / "repo"
+    (root / "node_modules").mkdir(parents=True)
+    for path, content in BASELINE.items():
+        (root / path).write_text(content)
+    (root / "node_modules" / "dep.js").write_text("vendored\n")
+    return root
+
+
+def _seed(db, *, count: int = 1) -> tuple[list[Assessment], Task]:
+    org = Organization(name="Snapshot org", slug="snapshot-org", credits_balance=100)
+    db.add(org)
+    db.flush()
+    task = Task(
+        organization_id=org.id,
+        name="Snapshot task",
+        description="Produce an implementation artifact",
+        task_type="debugging",
+        difficulty="mid",
+        duration_minutes=30,
+        task_key="snapshot-task",
+        role="data_engineer",
+        repo_structure={"files": dict(BASELINE)},
+        extra_data={},
+    )
+    db.add(task)
+    db.flush()
+    assessments = []
+    for index in range(count):
+        candidate = Candidate(
+            organization_id=org.id, email=f"snap-{index}@example.com", full_name="Snap"
+        )
+        db.add(candidate)
+        db.flush()
+        assessment = Assessment(
+            organization_id=org.id,
+            candidate_id=candidate.id,
+            task_id=task.id,
+            token=f"snapshot-token-{index}",
+            status=AssessmentStatus.IN_PROGRESS,
+            duration_minutes=30,
+            expires_at=utcnow() + timedelta(days=1),
+        )
+        db.add(assessment)
+        assessments.append(assessment)
+    db.commit()
+    return assessments, task
+
+
+def _snapshot(sandbox, root, **kwargs):
+    return read_repo_snapshot(
+        sandbox,
+        str(root),
+        strict=kwargs.pop("strict", False),
+        max_files=kwargs.pop("max_files", 50),
+        max_file_bytes=100_000,
+        skip_dirs={"node_modules"},
+        **kwargs,
+    )
+
+
+def test_snapshots_transfer_only_files_changed_since_the_last_read(db, repo):
+    (assessment,), task = _seed(db)
+    sandbox = _ExecSandbox()
+    (repo / "answer.py").write_text("def answer():\n    return 42\n")
+    (repo / "notes.md").write_text("design notes\n")
+
+    first = _snapshot(sandbox, repo, assessment=assessment, task=task)
+
+    assert first["files"] == {
+        "README.md": BASELINE["README.md"],
+        "answer.py": "def answer():\n    return 42\n",
+        "notes.md": "design notes\n",
+    }
+    # The unchanged starter README never leaves the sandbox.
+    assert first["stats"]["transferred_blobs"] == 2
+    assert first["stats"]["reused_blobs"] == 1
+
+    (repo / "notes.md").write_text("design notes, revised\n")
+    second = _snapshot(sandbox, repo, assessment=assessment, task=task)
+    assert second["files"]["notes.md"] == "design notes, revised\n"
+    assert second["files"]["answer.py"] == "def answer():\n    return 42\n"
+    assert second["stats"]["transferred_blobs"] == 1
+
+    third = _snapshot(sandbox, repo, assessment=assessment, task=task)
+    assert third["files"] == second["files"]
+    assert third["stats"]["transferred_blobs"] == 0
+    db.expire_all()
+    manifest = db.get(AssessmentRepoManifest, assessment.id).manifest
+    assert set(manifest) == {"README.md", "answer.py", "notes.md"}
+
+
+def test_blob_store_is_shared_by_assessments_of_the_same_task(db, repo):
+    assessments, task = _seed(db, count=2)
+    sandbox = _ExecSandbox()
+    (repo / "answer.py").write_text("shared solution\n")
+
+    for assessment in assessments:
+        assert _snapshot(sandbox, repo, assessment=assessment, task=task)["files"]
+
+    db.expire_all()
+    # The common solution is stored once; the starter README is never stored.
+    assert db.query(RepoFileBlob).filter(RepoFileBlob.task_id == task.id).count() == 1
+
+
+def _stored_contents(db, task) -> set[str]:
+    db.expire_all()
+    return {
+        blob.content for blob in db.query(RepoFileBlob).filter(RepoFileBlob.task_id == task.id)
+    }
+
+
+def test_replaced_and_deleted_snapshots_release_unreferenced_blobs(db, repo):
+    (first, second), task = _seed(db, count=2)
+    sandbox = _ExecSandbox()
+    (repo / "answer.py").write_text("shared solution\n")
+    (repo / "notes.md").write_text("draft\n")
+    _snapshot(sandbox, repo, assessment=first, task=task)
+    _snapshot(sandbox, repo, assessment=second, task=task)
+
+    (repo / "notes.md").write_text("final\n")
+    _snapshot(sandbox, repo, assessment=first, task=task)
+    # "draft\n" is still listed by the second assessment's manifest.
+    assert _stored_contents(db, task) == {"shared solution\n", "draft\n", "final\n"}
+
+    assert db.query(RepoBlobRef).filter(RepoBlobRef.assessment_id == second.id).count() == 3
+
+    db.delete(db.get(Assessment, second.id))
+    db.commit()
+    assert db.get(AssessmentRepoManifest, second.id) is None
+    assert db.query(RepoBlobRef).filter(RepoBlobRef.assessment_id == second.id).count() == 0
+    assert _stored_contents(db, task) == {"shared solution\n", "final\n"}
+
+    (repo / "notes.md").write_text("final, revised\n")
+    _snapshot(sandbox, repo, assessment=first, task=task)
+    assert _stored_contents(db, task) == {"shared solution\n", "final, revised\n"}
+
+
+def test_non_utf8_file_is_stored_under_the_digest_of_its_text(db, repo):
+    (assessment,), task = _seed(db)
+    sandbox = _ExecSandbox()
+    (repo / "latin1.txt").write_bytes(b"caf\xe9\n")
+
+    first = _snapshot(sandbox, repo, assessment=assessment, task=task)
+
+    text = first["files"]["latin1.txt"]
+    assert text == "caf\ufffd\n"
+    db.expire_all()
+    blob = db.query(RepoFileBlob).filter(RepoFileBlob.content == text).one()
+    assert blob.sha256 == hashlib.sha256(text.encode("utf-8")).hexdigest()
+    assert db.get(AssessmentRepoManifest, assessment.id).manifest["latin1.txt"] == blob.sha256
+    # The sandbox never reports the replacement digest, so the file is re-sent.
+    again = _snapshot(sandbox, repo, assessment=assessment, task=task)
+    assert again["files"]["latin1.txt"] == text
+    assert again["stats"]["transferred_blobs"] == 1
+
+
+def test_missing_store_blobs_are_re_read_from_the_sandbox(db, repo):
+    (assessment,), task = _seed(db)
+    sandbox = _ExecSandbox()
+    (repo / "answer.py").write_text("candidate work\n")
+    _snapshot(sandbox, repo, assessment=assessment, task=task)
+    db.query(RepoFileBlob).delete()
+    db.commit()
+
+    again = _snapshot(sandbox, repo, assessment=assessment, task=task)
+
+    assert again["files"]["answer.py"] == "candidate work\n"
+    assert again["stats"]["transferred_blobs"] == 1
+
+
+def test_strict_policy_fails_closed_on_limits_and_skips_binaries(repo):
+    (repo / "blob.bin").write_bytes(b"\x00\x01binary")
+    sandbox = _ExecSandbox()
+
+    full = _snapshot(sandbox, repo, strict=True)
+    assert set(full["files"]) == {"README.md", "answer.py"}
+
+    limited = _snapshot(sandbox, repo, strict=True, max_files=1)
+    assert limited["error"] == "file_count_limit_exceeded"
+    assert limited["files"] == {}
@@ -8,6 +8,7 @@ metering is patched to no-op.
 from __future__ import annotations
 
 import json
+import threading
 from types import SimpleNamespace
 from unittest.mock import MagicMock, patch
 
@@ -18,6 +19,7 @@ from app.components.assessments.rubric_scoring import (
     RubricResult,
     RubricScorer,
     ScoringArtifacts,
+    _org_slots,
     _DISCERNMENT_LENS_PROMPT,
     _DILIGENCE_LENS_PROMPT,
     _DELIVERABLE_LENS_PROMPT,
@@ -29,6 +31,7 @@ from app.components.assessments.rubric_scoring import (
     fluency_axis_for_dimension,
     summarize_fluency_4d,
 )
+from app.platform.config import settings
 
 
 @pytest.fixture
@@ -107,13 +110,21 @@ def _grader_response(score, rating, reasoning="ok", citations=None):
 
 
 @pytest.fixture
-def patched_metered_client():
+def patched_metered_client(monkeypatch):
     """Patch ``MeteredAnthropicClient`` so we can inject grader responses
     without touching Anthropic. Returns a holder dict — tests populate
-    ``responses_to_yield`` IN ORDER (one per dimension graded)."""
+    ``responses_to_yield`` IN ORDER (one per dimension graded), or set
+    ``respond`` to answer each call from its kwargs.
+
+    Grading is pinned sequential so queued responses pop in rubric order,
+    and the grade cache is off so every dimension reaches the grader; the
+    concurrency and cache tests opt back in explicitly."""
+    monkeypatch.setattr(settings, "RUBRIC_GRADING_CONCURRENCY", 1)
+    monkeypatch.setattr(settings, "RUBRIC_GRADE_CACHE_ENABLED", False)
     holder = {
         "responses_to_yield": [],
         "calls": [],
+        "respond": None,
     }
 
     def factory(*args, **kwargs):
@@ -121,6 +132,8 @@ def patched_metered_client():
 
         def messages_create(**call_kwargs):
             holder["calls"].append(call_kwargs)
+            if holder["respond"] is not None:
+                return holder["respond"](call_kwargs)
             if not holder["responses_to_yield"]:
                 raise RuntimeError("No more canned responses queued")
             return holder["responses_to_yield"].pop(0)
@@ -649,6 +662,200 @@ def test_grade_rubric_zero_weights_falls_back_to_equal_weighting(
     assert result.weighted_score_100 == pytest.approx(50.0, abs=0.05)
 
 
+def _dimension_of(call_kwargs):
+    return call_kwargs["metering"]["metadata"]["dimension"]
+
+
+def test_grade_rubric_grades_model_dimensions_concurrently_in_rubric_order(
+    patched_metered_client, sample_rubric, sample_artifacts, monkeypatch,
+):
+    """Model-graded dimensions overlap on the pool, yet come back — and are
+    aggregated — in rubric order whatever order they finish in."""
+    monkeypatch.setattr(settings, "RUBRIC_GRADING_CONCURRENCY", 5)
+    monkeypatch.setattr(settings, "RUBRIC_GRADING_ORG_CONCURRENCY", 5)
+    monkeypatch.setitem(_org_slots, 1, threading.BoundedSemaphore(5))
+    scores = dict(zip(sample_rubric, [8, 6, 7, 5, 9]))
+    # Every grader call waits for all five to be in flight: this only
+    # completes if the dimensions really run concurrently.
+    barrier = threading.Barrier(len(scores), timeout=5)
+
+    def respond(call_kwargs):
+        dimension = _dimension_of(call_kwargs)
+        barrier.wait()
+        return _grader_response(scores[dimension], "good")
+
+    patched_metered_client["respond"] = respond
+    rubric = {
+        **sample_rubric,
+        "practice": {"weight": 0.0, "grader": "practice_outcome"},
+    }
+    scorer = RubricScorer(api_key="sk-fake", organization_id=1)
+    result = scorer.grade_rubric(rubric, sample_artifacts)
+
+    assert [d.dimension_id for d in result.dimensions] == list(rubric)
+    assert [d.score for d in result.dimensions[:5]] == [8, 6, 7, 5, 9]
+    assert result.weighted_score_100 == pytest.approx(69.8, abs=0.05)
+    assert len(patched_metered_client["calls"]) == 5
+
+
+def test_grade_rubric_reserves_every_dimension_before_grading(
+    patched_metered_client, sample_rubric, sample_artifacts,
+):
+    from app.services.usage_credit_reservations import CreditReservation
+
+    events: list[str] = []
+
+    def reserve(_db, **kwargs):
+        events.append(f"reserve:{kwargs['metadata']['dimension']}")
+        return CreditReservation(
+            organization_id=1, feature="assessment", amount=1,
+            external_ref=kwargs["external_ref"], live=False,
+        )
+
+    def respond(call_kwargs):
+        events.append(f"grade:{_dimension_of(call_kwargs)}")
+        return _grader_response(7, "good")
+
+    patched_metered_client["respond"] = respond
+    scorer = RubricScorer(api_key="sk-fake", organization_id=1)
+    with patch(
+        "app.components.assessments.rubric_scoring.reserve_credits",
+        side_effect=reserve,
+    ):
+        result = scorer.grade_rubric(sample_rubric, sample_artifacts)
+
+    assert result.fully_graded
+    assert events[:5] == [f"reserve:{dim}" for dim in sample_rubric]
+    assert events[5:] == [f"grade:{dim}" for dim in sample_rubric]
+
+
+def test_grade_rubric_credit_refusal_mid_batch_fails_only_unreserved_dims(
+    patched_metered_client, sample_rubric, sample_artifacts, monkeypatch,
+):
+    from app.services.usage_credit_reservations import CreditReservation
+    from app.services.usage_metering_service import InsufficientCreditsError
+
+    monkeypatch.setattr(settings, "RUBRIC_GRADING_CONCURRENCY", 4)
+    reserved: list[str] = []
+
+    def reserve(_db, **kwargs):
+        if len(reserved) == 2:
+            raise InsufficientCreditsError(
+                organization_id=1, required=60_000, available=0,
+            )
+        reserved.append(kwargs["metadata"]["dimension"])
+        return CreditReservation(
+            organization_id=1, feature="assessment", amount=1,
+            external_ref=kwargs["external_ref"], live=False,
+        )
+
+    patched_metered_client["respond"] = lambda _kwargs: _grader_response(8, "good")
+    scorer = RubricScorer(api_key="sk-fake", organization_id=1)
+    with patch(
+        "app.components.assessments.rubric_scoring.reserve_credits",
+        side_effect=reserve,
+    ):
+        result = scorer.grade_rubric(sample_rubric, sample_artifacts)
+
+    dims = list(sample_rubric)
+    assert reserved == dims[:2]
+    assert sorted(_dimension_of(c) for c in patched_metered_client["calls"]) == sorted(dims[:2])
+    assert result.failed_dimension_ids == dims[2:]
+    assert result.weighted_score_100 == pytest.approx(80.0, abs=0.05)
+
+
+# ---- Rubric grade cache ------------------------------------------------------
+
+
+@pytest.fixture
+def grade_cache(db, monkeypatch):
+    from app.components.assessments import rubric_grade_cache
+
+    monkeypatch.setattr(settings, "RUBRIC_GRADE_CACHE_ENABLED", True)
+    rubric_grade_cache.reset_grade_cache_stats()
+    yield rubric_grade_cache
+    rubric_grade_cache.reset_grade_cache_stats()
+
+
+def test_grade_cache_serves_unchanged_rescore_without_grader_calls(
+    patched_metered_client, grade_cache, sample_rubric, sample_artifacts,
+):
+    scores = dict(zip(sample_rubric, [8, 6, 7, 5, 9]))
+    patched_metered_client["respond"] = lambda kw: _grader_response(
+        scores[_dimension_of(kw)], "good", reasoning=f"why {_dimension_of(kw)}",
+    )
+    first = RubricScorer(api_key="sk-fake", organization_id=1).grade_rubric(
+        sample_rubric, sample_artifacts,
+    )
+    assert first.cached_dimension_ids == []
+    assert len(patched_metered_client["calls"]) == 5
+
+    # Re-weighting does not invalidate: weights are applied after lookup.
+    reweighted = {
+        dim: {**spec, "weight": 0.2} for dim, spec in sample_rubric.items()
+    }
+    second = RubricScorer(api_key="sk-fake", organization_id=1).grade_rubric(
+        reweighted, sample_artifacts,
+    )
+
+    assert len(patched_metered_client["calls"]) == 5
+    assert second.cached_dimension_ids == list(sample_rubric)
+    assert [d.score for d in second.dimensions] == [8, 6, 7, 5, 9]
+    assert second.dimensions[0].reasoning == "why framework_assessment"
+    assert [d.weight for d in second.dimensions] == [0.2] * 5
+    assert second.weighted_score_100 == pytest.approx(70.0, abs=0.05)
+    assert grade_cache.grade_cache_stats() == {"hits": 5, "misses": 5, "hit_rate": 0.5}
+
+
+def test_grade_cache_retry_regrades_only_failed_dimensions(
+    patched_metered_client, grade_cache, sample_rubric, sample_artifacts,
+):
+    def flaky(kw):
+        if _dimension_of(kw) == "quality_checks":
+            return SimpleNamespace(content=[SimpleNamespace(text="not JSON")])
+        return _grader_response(7, "good")
+
+    patched_metered_client["respond"] = flaky
+    first = RubricScorer(api_key="sk-fake", organization_id=1).grade_rubric(
+        sample_rubric, sample_artifacts,
+    )
+    assert first.failed_dimension_ids == ["quality_checks"]
+
+    patched_metered_client["calls"].clear()
+    patched_metered_client["respond"] = lambda _kw: _grader_response(6, "good")
+    retry = RubricScorer(api_key="sk-fake", organization_id=1).grade_rubric(
+        sample_rubric, sample_artifacts,
+    )
+
+    assert [_dimension_of(c) for c in patched_metered_client["calls"]] == ["quality_checks"]
+    assert retry.fully_graded
+    assert "quality_checks" not in retry.cached_dimension_ids
+    assert len(retry.cached_dimension_ids) == 4
+
+
+def test_grade_cache_misses_when_evidence_lens_or_org_changes(
+    patched_metered_client, grade_cache, sample_artifacts,
+):
+    from dataclasses import replace
+
+    rubric = {"framework_assessment": {"weight": 1.0, "criteria": {"good": "x"}}}
+    patched_metered_client["respond"] = lambda _kw: _grader_response(7, "good")
+    RubricScorer(api_key="sk-fake", organization_id=1).grade_rubric(rubric, sample_artifacts)
+
+    changed_evidence = replace(sample_artifacts, design_doc="# A different design")
+    lensed = {"framework_assessment": {**rubric["framework_assessment"], "lens": "deliverable"}}
+    for org_id, spec, artifacts in (
+        (1, rubric, changed_evidence),
+        (1, lensed, sample_artifacts),
+        (2, rubric, sample_artifacts),
+    ):
+        result = RubricScorer(api_key="sk-fake", organization_id=org_id).grade_rubric(
+            spec, artifacts,
+        )
+        assert result.cached_dimension_ids == []
+    assert len(patched_metered_client["calls"]) == 4
+
+
 # ---- Practice proficiency (practice_outcome grader + practice lens) ---------
 
 
@@ -0,0 +1,222 @@
+from __future__ import annotations
+
+import contextlib
+from datetime import timedelta
+
+import pytest
+
+from app.components.assessments import sandbox_pool, service
+from app.components.assessments.repository import utcnow
+from app.components.assessments.task_snapshot import freeze_assessment_task
+from app.components.integrations.e2b.local_provider import LocalSandboxProvider
+from app.models.assessment import Assessment, AssessmentStatus
+from app.models.candidate import Candidate
+from app.models.organization import Organization
+from app.models.sandbox_pool_entry import SANDBOX_POOL_READY, SandboxPoolEntry
+from app.models.task import Task
+from app.platform.config import settings
+
+
+@pytest.fixture(autouse=True)
+def pool_settings(monkeypatch):
+    LocalSandboxProvider.reset()
+    monkeypatch.setattr(settings, "SANDBOX_POOL_ENABLED", True)
+    monkeypatch.setattr(settings, "SANDBOX_POOL_SIZE_PER_TASK", 2)
+    monkeypatch.setattr(settings, "SANDBOX_POOL_MAX_TASKS", 10)
+    monkeypatch.setattr(settings, "SANDBOX_POOL_MAX_AGE_SECONDS", 1800)
+    replenish_requests: list[int] = []
+    monkeypatch.setattr(
+        sandbox_pool, "_request_replenish", lambda: replenish_requests.append(1)
+    )
+    yield replenish_requests
+    LocalSandboxProvider.reset()
+
+
+def _seed(db, *, pending: int = 2, slug: str = "pool-org") -> tuple[list[Assessment], Task]:
+    org = Organization(name="Pool org", slug=slug, credits_balance=100_000)
+    db.add(org)
+    db.flush()
+    task = Task(
+        organization_id=org.id,
+        name="Pool task",
+        description="Produce an implementation artifact",
+        task_type="debugging",
+        difficulty="mid",
+        duration_minutes=30,
+        starter_code="print('starter')\n",
+        test_code="def test_ok(): assert True\n",
+        task_key=f"{slug}-task",
+        role="data_engineer",
+        scenario="Repair the pipeline",
+        repo_structure={"files": {"answer.py": "# starter\n"}},
+        evaluation_rubric={"implementation": {"weight": 1.0}},
+        extra_data={},
+    )
+    db.add(task)
+    db.flush()
+    assessments = []
+    for index in range(pending):
+        candidate = Candidate(
+            organization_id=org.id,
+            email=f"{slug}-{index}@example.com",
+            full_name=f"Pool Candidate {index}",
+        )
+        db.add(candidate)
+        db.flush()
+        assessment = Assessment(
+            organization_id=org.id,
+            candidate_id=candidate.id,
+            task_id=task.id,
+            token=f"{slug}-token-{index}",
+            status=AssessmentStatus.PENDING,
+            duration_minutes=30,
+            expires_at=utcnow() + timedelta(days=1),
+        )
+        freeze_assessment_task(assessment, task)
+        db.add(assessment)
+        assessments.append(assessment)
+    db.commit()
+    return assessments, task
+
+
+def _entries(db) -> list[SandboxPoolEntry]:
+    db.expire_all()
+    return db.query(SandboxPoolEntry).order_by(SandboxPoolEntry.id).all()
+
+
+def test_replenish_warms_up_to_pool_size_per_pending_snapshot(db):
+    assessments, task = _seed(db, pending=3)
+    provider = LocalSandboxProvider()
+
+    summary = sandbox_pool.replenish_sandbox_pool(db, provider)
+
+    entries = _entries(db)
+    assert summary["warmed"] == 2
+    assert [entry.status for entry in entries] == [SANDBOX_POOL_READY] * 2
+    assert {entry.task_snapshot_sha256 for entry in entries} == {
+        assessments[0].task_spec_snapshot_sha256
+    }
+    assert all(entry.task_id == task.id for entry in entries)
+    # Full pool: the next sweep creates nothing.
+    assert sandbox_pool.replenish_sandbox_pool(db, provider)["warmed"] == 0
+    assert len(LocalSandboxProvider.created) == 2
+
+
+def test_replenish_is_a_noop_when_disabled(db, monkeypatch):
+    _seed(db)
+    monkeypatch.setattr(settings, "SANDBOX_POOL_ENABLED", False)
+
+    assert sandbox_pool.replenish_sandbox_pool(db, LocalSandboxProvider()) == {
+        "skipped": "disabled"
+    }
+    assert LocalSandboxProvider.created == []
+
+
+def test_replenish_returns_at_once_while_another_run_holds_the_lock(db, monkeypatch):
+    _seed(db)
+    monkeypatch.setattr(
+        sandbox_pool, "_replenish_lock", lambda _db: contextlib.nullcontext(False)
+    )
+
+    assert sandbox_pool.replenish_sandbox_pool(db, LocalSandboxProvider()) == {
+        "skipped": "in_progress"
+    }
+    assert LocalSandboxProvider.created == []
+    assert _entries(db) == []
+
+
+def test_each_pooled_sandbox_is_handed_out_once(db, pool_settings):
+    assessments, task = _seed(db)
+    provider = LocalSandboxProvider()
+    sandbox_pool.replenish_sandbox_pool(db, provider)
+    sha = assessments[0].task_spec_snapshot_sha256
+
+    first = sandbox_pool.claim_pooled_sandbox(provider, task, sha)
+    second = sandbox_pool.claim_pooled_sandbox(provider, task, sha)
+
+    assert first is not None and second is not None
+    assert first[0].sandbox_id != second[0].sandbox_id
+    assert first[1]["success"] is True
+    assert sandbox_pool.claim_pooled_sandbox(provider, task, sha) is None
+    assert sandbox_pool.claim_pooled_sandbox(provider, task, "other-snapshot") is None
+    assert _entries(db) == []
+    assert len(pool_settings) == 2
+
+
+def test_claim_falls_through_a_sandbox_the_provider_already_expired(db):
+    assessments, task = _seed(db)
+    provider = LocalSandboxProvider()
+    sandbox_pool.replenish_sandbox_pool(db, provider)
+    stale, fresh = [entry.sandbox_id for entry in _entries(db)]
+    LocalSandboxProvider.expire(stale)
+
+    claimed = sandbox_pool.claim_pooled_sandbox(
+        provider, task, assessments[0].task_spec_snapshot_sha256
+    )
+
+    assert claimed is not None
+    assert claimed[0].sandbox_id == fresh
+    assert _entries(db) == []
+
+
+def test_reaper_closes_aged_and_unwanted_entries(db):
+    assessments, _task = _seed(db)
+    other_assessments, _other_task = _seed(db, pending=1, slug="pool-org-b")
+    provider = LocalSandboxProvider()
+    sandbox_pool.replenish_sandbox_pool(db, provider)
+    entries = _entries(db)
+    assert len(entries) == 3
+    aged = next(
+        entry for entry in entries
+        if entry.task_snapshot_sha256 == assessments[0].task_spec_snapshot_sha256
+    )
+    aged.created_at = utcnow() - timedelta(hours=1)
+    # The other snapshot's only invite expires: its warm sandbox is unwanted.
+    other_assessments[0].expires_at = utcnow() - timedelta(minutes=1)
+    db.commit()
+
+    summary = sandbox_pool.reap_sandbox_pool(db, provider)
+
+    assert summary == {"expired": 1, "unwanted": 1}
+    remaining = _entries(db)
+    assert len(remaining) == 1
+    assert LocalSandboxProvider.live_sandbox_ids() == [remaining[0].sandbox_id]
+
+
+def test_first_start_uses_pooled_sandbox_without_cold_provisioning(db, monkeypatch):
+    assessments, _task = _seed(db, pending=1)
+    sandbox_pool.replenish_sandbox_pool(db, LocalSandboxProvider())
+    pooled_id = _entries(db)[0].sandbox_id
+    created_before = list(LocalSandboxProvider.created)
+
+    monkeypatch.setattr(service.settings, "E2B_API_KEY", "test-e2b-key")
+    monkeypatch.setattr(service, "E2BService", LocalSandboxProvider)
+    monkeypatch.setattr(service, "resolve_ai_mode", lambda: "claude_cli_terminal")
+    monkeypatch.setattr(service, "_enforce_artifact_first_task", lambda _task: None)
+    monkeypatch.setattr(
+        service,
+        "get_assessment_start_gate",
+        lambda *_args, **_kwargs: {
+            "can_start": True, "reason": None, "message": None, "organization": None,
+        },
+    )
+    monkeypatch.setattr(
+        service,
+        "_clone_assessment_branch_into_workspace",
+        lambda *_args: pytest.fail("a pooled start must not re-materialize"),
+    )
+    monkeypatch.setattr(
+        service,
+        "_run_workspace_bootstrap",
+        lambda *_args, **_kwargs: pytest.fail("a pooled start must not re-bootstrap"),
+    )
+
+    assessment = db.get(Assessment, assessments[0].id)
+    result = service.start_or_resume_assessment(assessment, db)
+
+    db.refresh(assessment)
+    assert result["sandbox_id"] == pooled_id
+    assert assessment.status == AssessmentStatus.IN_PROGRESS
+    assert assessment.e2b_session_id == pooled_id
+    assert LocalSandboxProvider.created == created_before
+    assert _entries(db) == []
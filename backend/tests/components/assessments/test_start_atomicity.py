@@ -257,7 +257,7 @@ def test_resume_reconnects_verified_workspace_without_provisioning_or_bootstrap(
     monkeypatch.setattr(
         service,
         "_read_sandbox_repo_files",
-        lambda *_args: {"files": {"answer.py": "candidate work\n"}},
+        lambda *_args, **_kwargs: {"files": {"answer.py": "candidate work\n"}},
     )
 
     result = service.start_or_resume_assessment(assessment, db)
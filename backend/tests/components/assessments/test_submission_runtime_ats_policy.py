@@ -12,16 +12,12 @@ from app.models.candidate import Candidate
 from app.models.organization import Organization
 from app.models.task import Task
 from app.tasks import assessment_tasks
+from tests.fakes.repo_snapshot import snapshot_stdout
 
 
 class _SubmissionSandbox:
     def run_code(self, _code):
-        return {
-            "stdout": (
-                '{"files":{"src/main.py":"candidate work\\n"},'
-                '"error":null}\n'
-            )
-        }
+        return {"stdout": snapshot_stdout({"src/main.py": "candidate work\n"}) + "\n"}
 
 
 class _SubmissionRuntime:
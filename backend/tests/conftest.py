@@ -28,6 +28,8 @@ os.environ["DATABASE_URL"] = os.environ.get(
 # tests can opt-in by monkeypatching settings.
 os.environ["MVP_DISABLE_WORKABLE"] = "true"
 os.environ["MVP_DISABLE_STRIPE"] = "true"
+# Parse PDFs inline; the extraction process pool has its own targeted tests.
+os.environ["PDF_EXTRACT_WORKERS"] = "0"
 # Unit/API tests must never inherit developer or CI provider credentials. Tests
 # that exercise provider-aware branches opt in with local fakes/monkeypatches.
 # This is especially important now that semantic search can select Graphiti,
@@ -82,7 +84,8 @@ from sqlalchemy.orm import sessionmaker
 from sqlalchemy.pool import NullPool
 from app.platform.database import Base, get_db
 from app.main import app
-from app.platform.middleware import _rate_limit_store
+from app.mcp.handlers import reset_stage_counts_memo
+from app.services import rate_limit as shared_rate_limit
 from app.models.user import User
 from app.models.organization import Organization
 from app.models.task import Task
@@ -204,26 +207,6 @@ except Exception:  # pragma: no cover — model import shouldn't fail
     pass
 
 
-# Same BigInteger-PK workaround for brain_feed_outbox — the durable outbound
-# mainspring brain feed. Rows are written by the brain-feed sweep; register
-# globally here so any test exercising the feed gets an autoincrementing PK.
-_BRAIN_FEED_OUTBOX_PK_COUNTER = {"n": 0}
-
-
-def _assign_brain_feed_outbox_pk(mapper, connection, target):  # pragma: no cover
-    if getattr(target, "id", None) is None:
-        _BRAIN_FEED_OUTBOX_PK_COUNTER["n"] += 1
-        target.id = _BRAIN_FEED_OUTBOX_PK_COUNTER["n"]
-
-
-try:
-    from app.models.brain_feed_outbox import BrainFeedOutbox as _BrainFeedOutbox
-
-    event.listen(_BrainFeedOutbox, "before_insert", _assign_brain_feed_outbox_pk)
-except Exception:  # pragma: no cover — model import shouldn't fail
-    pass
-
-
 # Same BigInteger-PK workaround for agent_needs_input. Rows are written by
 # the ask_recruiter action from many code paths (data-readiness sync, the
 # orchestrator survey, route-level reject flows), so register globally here —
@@ -304,14 +287,18 @@ def db():
 
 
 @pytest.fixture(scope="function")
-def client(db):
+def client(db, monkeypatch):
     app.dependency_overrides[get_db] = override_get_db
-    # Clear in-memory rate limit state between tests to prevent 429 bleed-through
-    _rate_limit_store.clear()
+    # Keep the middleware limiter in-process and clear it between tests to
+    # prevent 429 bleed-through (an ambient Redis would persist counts).
+    monkeypatch.setattr(shared_rate_limit, "_get_redis", lambda: None)
+    shared_rate_limit.reset_memory_buckets()
+    # Org ids repeat across tests, so per-org MCP memos must not survive one.
+    reset_stage_counts_memo()
     with TestClient(app) as c:
         yield c
     app.dependency_overrides.clear()
-    _rate_limit_store.clear()
+    shared_rate_limit.reset_memory_buckets()
 
 
 # ---------------------------------------------------------------------------
@@ -334,6 +321,35 @@ def verify_user(email: str) -> None:
         db.close()
 
 
+@pytest.fixture
+def query_budget():
+    """Assert the SQL a block runs stays within a budget.
+
+    ``with query_budget(20, max_repeats=3): client.get(...)`` fails with the
+    profile (repeated fingerprints, slowest statements) when the block runs
+    more than 20 statements or any one fingerprint more than 3 times — the
+    N+1 signature. Yields the ``QueryProfile`` for finer assertions.
+    """
+    from contextlib import contextmanager
+
+    from app.platform.sql_profiler import profile_queries
+
+    @contextmanager
+    def _budget(max_queries: int, *, max_repeats: int | None = None):
+        with profile_queries(capture_all=True) as profile:
+            yield profile
+        summary = profile.summary(duplicate_threshold=(max_repeats or 0) + 1)
+        assert profile.query_count <= max_queries, (
+            f"{profile.query_count} queries > budget {max_queries}: {summary}"
+        )
+        if max_repeats is not None:
+            assert not summary["duplicates"], (
+                f"statement repeated more than {max_repeats} times: {summary['duplicates']}"
+            )
+
+    return _budget
+
+
 # ---------------------------------------------------------------------------
 # Factory helpers — create test entities quickly and consistently
 # ---------------------------------------------------------------------------
@@ -0,0 +1,39 @@
+"""Sandbox-side output of the repo snapshot engine, for ``run_code`` stubs.
+
+Builds the exact stdout line ``components/assessments/repo_snapshot`` parses:
+a ``path -> sha256`` manifest plus a gzip'd tar of every blob (a full
+transfer, as if the server held no hints).
+"""
+
+from __future__ import annotations
+
+import base64
+import hashlib
+import io
+import json
+import tarfile
+
+
+def snapshot_stdout(files: dict[str, str], error: str | None = None) -> str:
+    manifest: dict[str, str] = {}
+    buf = io.BytesIO()
+    with tarfile.open(fileobj=buf, mode="w:gz") as bundle:
+        sent: set[str] = set()
+        for path, content in sorted(files.items()):
+            raw = content.encode("utf-8")
+            digest = hashlib.sha256(raw).hexdigest()
+            manifest[path] = digest
+            if digest in sent:
+                continue
+            sent.add(digest)
+            member = tarfile.TarInfo(digest)
+            member.size = len(raw)
+            bundle.addfile(member, io.BytesIO(raw))
+    return json.dumps(
+        {
+            "manifest": manifest,
+            "bundle": base64.b64encode(buf.getvalue()).decode("ascii"),
+            "skipped": [],
+            "error": error,
+        }
+    )
@@ -0,0 +1,60 @@
+import threading
+import time
+
+import pytest
+from sqlalchemy import create_engine, exc, text
+from sqlalchemy.pool import QueuePool
+
+from app.platform import db_pool_metrics, metrics
+
+
+@pytest.fixture
+def pool_engine(monkeypatch, tmp_path):
+    monkeypatch.setattr(metrics, "_redis", lambda: None)
+    metrics.registry.reset()
+    engine = create_engine(
+        f"sqlite:///{tmp_path / 'pool.db'}",
+        poolclass=QueuePool,
+        pool_size=1,
+        max_overflow=0,
+        pool_timeout=0.2,
+    )
+    db_pool_metrics.instrument_engine(engine, name="test")
+    yield engine
+    engine.dispose()
+    db_pool_metrics._engines.pop("test", None)
+    metrics.registry.reset()
+
+
+def test_checkout_wait_and_timeouts_are_recorded(pool_engine):
+    wait = db_pool_metrics.checkout_wait_seconds
+    held = pool_engine.connect()
+    db_pool_metrics.sample_pool_usage()
+    assert db_pool_metrics.pool_checked_out.value(engine="test") == 1
+
+    with pytest.raises(exc.TimeoutError):
+        pool_engine.connect()
+    assert db_pool_metrics.checkout_timeouts_total.value(engine="test") == 1
+
+    releaser = threading.Timer(0.05, held.close)
+    releaser.start()
+    with pool_engine.connect() as conn:
+        conn.execute(text("select 1"))
+    releaser.join()
+
+    assert wait.count(engine="test") == 3
+    # The timed-out attempt waited pool_timeout, the last one until release.
+    assert wait.sum(engine="test") >= 0.2 + 0.05
+    db_pool_metrics.sample_pool_usage()
+    assert db_pool_metrics.pool_checked_out.value(engine="test") == 0
+
+
+def test_instrumenting_twice_keeps_one_wrapper(pool_engine):
+    wrapper = pool_engine.raw_connection
+    db_pool_metrics.instrument_engine(pool_engine, name="test")
+    assert pool_engine.raw_connection is wrapper
+
+    started = time.perf_counter()
+    pool_engine.connect().close()
+    assert db_pool_metrics.checkout_wait_seconds.count(engine="test") == 1
+    assert db_pool_metrics.checkout_wait_seconds.sum(engine="test") <= time.perf_counter() - started
@@ -0,0 +1,214 @@
+import math
+import time
+
+import pytest
+
+from app.platform import metrics
+from app.platform.config import settings
+
+
+class _FakePipeline:
+    def __init__(self, redis):
+        self._redis = redis
+        self._ops = []
+
+    def __getattr__(self, name):
+        def queue(*args, **kwargs):
+            self._ops.append((name, args, kwargs))
+            return self
+
+        return queue
+
+    def execute(self):
+        ops, self._ops = self._ops, []
+        return [getattr(self._redis, name)(*args, **kwargs) for name, args, kwargs in ops]
+
+
+class FakeRedis:
+    def __init__(self):
+        self.hashes: dict[str, dict[bytes, bytes]] = {}
+        self.sets: dict[str, set[str]] = {}
+        self.ttls: dict[str, int] = {}
+
+    def pipeline(self, transaction=True):
+        return _FakePipeline(self)
+
+    def hincrbyfloat(self, key, field, amount):
+        bucket = self.hashes.setdefault(key, {})
+        value = float(bucket.get(field.encode(), b"0")) + float(amount)
+        bucket[field.encode()] = repr(value).encode()
+        return value
+
+    def hgetall(self, key):
+        return dict(self.hashes.get(key, {}))
+
+    def hset(self, key, mapping):
+        self.hashes.setdefault(key, {}).update(
+            {field.encode(): repr(float(value)).encode() for field, value in mapping.items()}
+        )
+
+    def delete(self, key):
+        self.hashes.pop(key, None)
+
+    def expire(self, key, seconds):
+        self.ttls[key] = seconds
+
+    def sadd(self, key, member):
+        self.sets.setdefault(key, set()).add(member)
+
+    def srem(self, key, member):
+        self.sets.get(key, set()).discard(member)
+
+    def smembers(self, key):
+        return set(self.sets.get(key, set()))
+
+
+@pytest.fixture
+def registry(monkeypatch):
+    monkeypatch.setattr(metrics, "_redis", lambda: None)
+    return metrics.MetricsRegistry()
+
+
+def test_counter_gauge_and_histogram_render_prometheus_text(registry):
+    runs = registry.counter("jobs_total", "Jobs run.", ("queue",))
+    depth = registry.gauge("queue_depth", "Waiting.", ("queue",))
+    latency = registry.histogram("latency_seconds", "Latency.", ("route",), buckets=(0.1, 1.0))
+
+    runs.inc(queue="celery")
+    runs.inc(2, queue="celery")
+    depth.set(7, queue="scoring")
+    for value in (0.05, 0.1, 0.5, 3.0):
+        latency.observe(value, route='/a"b')
+
+    assert runs.value(queue="celery") == 3
+    assert latency.count(route='/a"b') == 4
+    assert latency.sum(route='/a"b') == pytest.approx(3.65)
+    text = registry.render()
+    assert "# TYPE jobs_total counter\njobs_total{queue=\"celery\"} 3\n" in text
+    assert 'queue_depth{queue="scoring"} 7' in text
+    assert 'latency_seconds_bucket{route="/a\\"b",le="0.1"} 2' in text
+    assert 'latency_seconds_bucket{route="/a\\"b",le="1"} 3' in text
+    assert 'latency_seconds_bucket{route="/a\\"b",le="+Inf"} 4' in text
+    assert 'latency_seconds_count{route="/a\\"b"} 4' in text
+
+    with pytest.raises(ValueError):
+        runs.inc(queue="celery", task="extra")
+    registry.reset()
+    assert runs.value(queue="celery") == 0
+
+
+def test_bucket_quantile_interpolates_like_histogram_quantile():
+    buckets = (0.1, 0.5, 1.0)
+    assert metrics.bucket_quantile(buckets, [0, 0, 0, 0], 0.5) is None
+    assert metrics.bucket_quantile(buckets, [10, 0, 0, 0], 0.5) == pytest.approx(0.05)
+    assert metrics.bucket_quantile(buckets, [5, 5, 0, 0], 0.75) == pytest.approx(0.3)
+    # Ranks past the last finite bound report that bound.
+    assert metrics.bucket_quantile(buckets, [0, 0, 0, 3], 0.99) == 1.0
+    assert not math.isinf(metrics.bucket_quantile(buckets, [1, 0, 0, 1], 0.99))
+
+
+def test_shared_metrics_report_totals_across_processes(monkeypatch):
+    fake = FakeRedis()
+    monkeypatch.setattr(metrics, "_redis", lambda: fake)
+    monkeypatch.setattr(settings, "METRICS_FLUSH_SECONDS", 3600.0)
+    web = metrics.MetricsRegistry()
+    worker = metrics.MetricsRegistry()
+    for registry in (web, worker):
+        registry.counter("runs_total", "Runs.", ("state",), shared=True)
+        registry.histogram("run_seconds", "Run time.", (), buckets=(1.0,), shared=True)
+
+    web.get("runs_total").inc(state="SUCCESS")
+    worker.get("runs_total").inc(2, state="SUCCESS")
+    worker.get("run_seconds").observe(0.5)
+    worker.get("run_seconds").observe(4.0)
+    # Buffered until the flush interval elapses (or a render / shutdown flush).
+    assert fake.hashes == {}
+    assert worker.flush() is True
+
+    text = web.render()
+    assert 'runs_total{state="SUCCESS"} 3' in text
+    assert 'run_seconds_bucket{le="1"} 1' in text
+    assert "run_seconds_count 2" in text
+    assert "run_seconds_sum 4.5" in text
+    # Process-local values stay available to tests and the owning process.
+    assert web.get("runs_total").value(state="SUCCESS") == 1
+
+
+def test_shared_gauges_sum_live_processes_and_drop_expired_ones(monkeypatch):
+    fake = FakeRedis()
+    monkeypatch.setattr(metrics, "_redis", lambda: fake)
+    monkeypatch.setattr(settings, "METRICS_FLUSH_SECONDS", 3600.0)
+    web, worker = metrics.MetricsRegistry(), metrics.MetricsRegistry()
+    for process, registry in (("web:1", web), ("web:2", worker)):
+        gauge = registry.gauge("in_flight", "In flight.", ("method",), shared=True)
+        gauge.inc(method="GET")
+        gauge.inc(method="GET")
+        gauge.dec(method="GET")
+        monkeypatch.setattr(metrics, "_process_id", lambda process=process: process)
+        assert registry.flush() is True
+    worker.get("in_flight").set(5, method="POST")
+    assert worker.flush() is True
+
+    monkeypatch.setattr(metrics, "_process_id", lambda: "web:1")
+    text = web.render()
+    assert 'in_flight{method="GET"} 2' in text
+    assert 'in_flight{method="POST"} 5' in text
+    # Absolute values: re-publishing does not accumulate.
+    assert web.flush() is True
+    assert 'in_flight{method="GET"} 2' in web.render()
+    assert set(fake.ttls.values()) == {3 * 3600}
+
+    # A process that stops flushing (died mid-request) expires and drops out.
+    fake.delete("taali:metrics:v1:in_flight:proc:web:2")
+    text = web.render()
+    assert 'in_flight{method="GET"} 1' in text
+    assert "POST" not in text
+    assert fake.sets["taali:metrics:v1:in_flight:procs"] == {"taali:metrics:v1:in_flight:proc:web:1"}
+
+    # A clean shutdown withdraws the process's gauges straight away.
+    web.shutdown()
+    assert "taali:metrics:v1:in_flight:proc:web:1" not in fake.hashes
+
+
+def test_flush_thread_publishes_without_blocking_updates(monkeypatch):
+    fake = FakeRedis()
+    monkeypatch.setattr(metrics, "_redis", lambda: fake)
+    monkeypatch.setattr(settings, "METRICS_FLUSH_SECONDS", 0.01)
+    registry = metrics.MetricsRegistry()
+    runs = registry.counter("runs_total", "Runs.", shared=True)
+    try:
+        runs.inc()
+        deadline = time.monotonic() + 5
+        while "taali:metrics:v1:runs_total" not in fake.hashes and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert fake.hashes["taali:metrics:v1:runs_total"] == {b'[""]': b"1.0"}
+    finally:
+        registry.shutdown()
+
+
+def test_forked_child_drops_the_parents_buffered_state(monkeypatch):
+    monkeypatch.setattr(metrics, "_redis", lambda: None)
+    registry = metrics.MetricsRegistry()
+    registry.counter("runs_total", "Runs.", shared=True).inc()
+    registry.gauge("in_flight", "In flight.", shared=True).inc()
+
+    metrics._forget_in_child()
+
+    assert registry._pending == {}
+    assert registry._flusher_pid is None
+    assert registry.get("in_flight").value() == 0
+
+
+def test_histogram_quantiles_render_as_a_gauge_family(registry):
+    latency = registry.histogram(
+        "latency_seconds", "Latency.", ("route",), buckets=(0.1, 1.0), quantiles=(0.5, 0.99)
+    )
+    for value in (0.05, 0.05, 0.5, 0.5):
+        latency.observe(value, route="/a")
+
+    text = registry.render()
+    assert "# TYPE latency_seconds_quantile gauge" in text
+    assert 'latency_seconds_quantile{route="/a",quantile="0.5"} 0.1' in text
+    assert 'latency_seconds_quantile{route="/a",quantile="0.99"} 0.982' in text
+    with pytest.raises(ValueError):
+        registry.histogram("bad_seconds", "Bad.", quantiles=(99,))
@@ -0,0 +1,55 @@
+import logging
+
+from sqlalchemy import create_engine, text
+
+from app.platform import sql_profiler
+from app.platform.config import settings
+from app.platform.sql_profiler import fingerprint, profile_queries
+from tests.conftest import auth_headers
+
+
+def test_fingerprint_ignores_values_and_in_list_length():
+    assert fingerprint("SELECT * FROM t WHERE id = 12 AND name = 'x'") == fingerprint(
+        "SELECT *  FROM t\n WHERE id = 7 AND name = 'it''s'"
+    )
+    assert fingerprint("SELECT a FROM t WHERE id IN (?, ?, ?)") == fingerprint(
+        "SELECT a FROM t WHERE id IN (%(id_1)s)"
+    )
+    assert fingerprint("SELECT a FROM t1 WHERE x = :x_1") == "SELECT a FROM t1 WHERE x = ?"
+
+
+def test_profile_counts_repeats_and_keeps_the_slowest():
+    engine = create_engine("sqlite://")
+    with engine.connect() as conn:
+        conn.execute(text("CREATE TABLE t (id INTEGER)"))
+        with profile_queries() as profile:
+            for value in range(6):
+                conn.execute(text("SELECT id FROM t WHERE id = :id"), {"id": value})
+            conn.execute(text("SELECT count(*) FROM t"))
+        conn.execute(text("SELECT 1"))
+
+    assert profile.query_count == 7
+    assert profile.db_ms > 0
+    (repeated,) = profile.duplicates(5)
+    assert repeated.count == 6
+    assert repeated.statement == "SELECT id FROM t WHERE id = ?"
+    assert len(profile.slowest()) == 5
+    assert sql_profiler.current_profile() is None
+
+
+def test_middleware_is_opt_in_and_reports_headers(client, monkeypatch, caplog):
+    response = client.get("/api/v1/roles")
+    assert "x-db-query-count" not in response.headers
+
+    monkeypatch.setattr(settings, "SQL_PROFILING_ENABLED", True)
+    monkeypatch.setattr(settings, "SQL_PROFILING_WARN_QUERIES", 0)
+    headers, _ = auth_headers(client)
+    with caplog.at_level(logging.INFO, logger="tali.middleware"):
+        response = client.get("/api/v1/roles", headers=headers)
+    assert response.status_code == 200
+    assert int(response.headers["x-db-query-count"]) > 0
+    assert float(response.headers["x-db-time-ms"]) >= 0
+    assert response.headers["x-db-duplicate-statements"] == "0"
+    warnings = [r for r in caplog.records if r.getMessage().startswith("sql_profile")]
+    assert warnings and warnings[-1].levelno == logging.WARNING
+    assert "path=/api/v1/roles" in warnings[-1].getMessage()
@@ -37,6 +37,23 @@ def test_imbalanced_not_degenerate():
     assert fit.youden_j > 0.9
 
 
+def test_matches_the_full_scan_golden_fit():
+    import math
+    import random
+
+    rng = random.Random(7)
+    scores = [round(rng.uniform(0, 100), 1) for _ in range(400)]
+    pairs = [
+        (int(x), int(rng.random() < 1 / (1 + math.exp(-(x - 60) / 8))))
+        for x in scores
+    ]
+    fit = learn_threshold(pairs)
+    assert fit is not None
+    assert (fit.threshold, fit.youden_j) == (53.0, 0.7872284397630019)
+    assert (fit.n_positive, fit.n_negative) == (155, 245)
+    assert fit.curve[12] == {"t": 60, "tpr": 0.8, "fpr": 0.078, "j": 0.722}
+
+
 def test_shrink_pulls_sparse_role_toward_org():
     t_sparse, w_sparse = shrink_and_clamp_to_org(t_role=80, n_role=10, t_org=60)
     assert w_sparse < 0.2                 # low trust in a thin role
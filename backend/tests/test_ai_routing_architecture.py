@@ -68,7 +68,9 @@ _LEGACY_MESSAGES_CALLS = Counter(
         ("app/components/assessments/rubric_scoring.py", "messages.create"): 1,
         ("app/cv_matching/archetype_synthesizer.py", "messages.create"): 1,
         ("app/cv_matching/calibrators/judge.py", "messages.create"): 1,
+        ("app/cv_matching/holistic_batch.py", "messages.batches.create"): 1,
         ("app/cv_parsing/batch.py", "messages.batches.create"): 1,
+        ("app/domains/outreach/draft_batch.py", "messages.batches.create"): 1,
         ("app/services/fit_matching_service.py", "messages.create"): 2,
         ("app/services/intent_chip_parser.py", "messages.create"): 1,
         ("app/services/interview_focus_service.py", "messages.create"): 1,
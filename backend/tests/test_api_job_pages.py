@@ -671,6 +671,150 @@ def test_careers_board_unknown_slug_404(client):
     assert resp.status_code == 404
 
 
+# --------------------------------------------------------------------------- #
+# Public payload cache: content version, ETag / 304, batched board query
+# --------------------------------------------------------------------------- #
+class _FakeVersionRedis:
+    """In-memory stand-in for the content-version counters (get / pipelined incr)."""
+
+    def __init__(self):
+        self.store: dict[str, int] = {}
+
+    def get(self, key):
+        return self.store.get(key)
+
+    def pipeline(self, transaction=True):
+        fake, queued = self, []
+
+        class _Pipe:
+            def incr(self, key):
+                queued.append(key)
+
+            def execute(self):
+                for key in queued:
+                    fake.store[key] = int(fake.store.get(key) or 0) + 1
+
+        return _Pipe()
+
+
+@pytest.fixture
+def version_redis(monkeypatch):
+    from app.domains.job_pages.public_views import reset_public_view_cache
+    from app.models import public_content_version as versions
+
+    fake = _FakeVersionRedis()
+    monkeypatch.setattr(versions, "_redis", lambda: fake)
+    reset_public_view_cache()
+    yield fake
+    reset_public_view_cache()
+
+
+def _count_statements(db):
+    from sqlalchemy import event
+
+    statements: list[str] = []
+    engine = db.get_bind()
+
+    def _record(_conn, _cursor, statement, *_args):
+        statements.append(statement)
+
+    event.listen(engine, "before_cursor_execute", _record)
+    return statements, lambda: event.remove(engine, "before_cursor_execute", _record)
+
+
+def test_public_payloads_carry_etag_and_answer_304(client, db):
+    headers, _ = auth_headers(client, organization_name="Etag Co")
+    token = _publish(client, headers, db, title="Cached Role")
+    slug = _org_slug(db, "Etag Co")
+
+    for url in (f"/api/v1/public/job/{token}", f"/api/v1/public/careers/{slug}"):
+        first = client.get(url)
+        assert first.status_code == 200
+        etag = first.headers["etag"]
+        assert first.headers["cache-control"] == (
+            f"public, max-age={settings.PUBLIC_CAREERS_CACHE_SECONDS}"
+        )
+        not_modified = client.get(url, headers={"If-None-Match": f'W/{etag}, "other"'})
+        assert not_modified.status_code == 304
+        assert not_modified.content == b""
+        assert not_modified.headers["etag"] == etag
+        assert client.get(url, headers={"If-None-Match": '"stale"'}).status_code == 200
+
+
+def test_public_payloads_cached_until_content_version_bumps(client, db, version_redis):
+    headers, _ = auth_headers(client, organization_name="Version Co")
+    token = _publish(client, headers, db, title="Versioned Role")
+    slug = _org_slug(db, "Version Co")
+    board_url = f"/api/v1/public/careers/{slug}"
+    page_url = f"/api/v1/public/job/{token}"
+    assert client.get(page_url).json()["accepts_applications"] is True
+    assert len(client.get(board_url).json()["jobs"]) == 1
+
+    statements, stop = _count_statements(db)
+    try:
+        assert client.get(page_url).status_code == 200
+        assert client.get(board_url).status_code == 200
+    finally:
+        stop()
+    assert statements == []  # both served from the version-keyed cache
+
+    # A role state change commits → org version bump → both re-render.
+    page = db.query(JobPage).filter(JobPage.token == token).one()
+    role = db.query(Role).join(RoleBrief, RoleBrief.role_id == Role.id).filter(
+        RoleBrief.id == page.brief_id
+    ).one()
+    role.agentic_mode_enabled = False
+    db.commit()
+    assert client.get(page_url).json()["accepts_applications"] is False
+    assert client.get(board_url).json()["jobs"] == []
+
+    # Closing the page reads as gone straight away.
+    page.status = "closed"
+    db.commit()
+    assert client.get(page_url).status_code == 404
+
+
+def test_only_rendered_columns_bump_the_content_version(client, db, version_redis):
+    headers, _ = auth_headers(client, organization_name="Quiet Co")
+    token = _publish(client, headers, db, title="Quiet Role")
+    page = db.query(JobPage).filter(JobPage.token == token).one()
+    role = db.query(Role).join(RoleBrief, RoleBrief.role_id == Role.id).filter(
+        RoleBrief.id == page.brief_id
+    ).one()
+    org = db.get(Organization, page.organization_id)
+    key = f"public-content-version:{page.organization_id}"
+    before = version_redis.store.get(key)
+
+    # Internal bookkeeping never reaches a public payload.
+    role.description = "internal notes for the hiring team"
+    org.credits_balance = (org.credits_balance or 0) + 5
+    db.commit()
+    assert version_redis.store.get(key) == before
+
+    role.job_status = "paused"
+    db.commit()
+    assert version_redis.store.get(key) == (before or 0) + 1
+
+
+def test_careers_board_query_count_is_independent_of_page_count(client, db):
+    headers, _ = auth_headers(client, organization_name="Batched Co")
+    _publish(client, headers, db, title="One")
+    slug = _org_slug(db, "Batched Co")
+
+    def _board_statements() -> int:
+        statements, stop = _count_statements(db)
+        try:
+            assert client.get(f"/api/v1/public/careers/{slug}").status_code == 200
+        finally:
+            stop()
+        return len(statements)
+
+    with_one = _board_statements()
+    _publish(client, headers, db, title="Two")
+    _publish(client, headers, db, title="Three")
+    assert _board_statements() == with_one
+
+
 # --------------------------------------------------------------------------- #
 # Requisition serializer: careers_url
 # --------------------------------------------------------------------------- #
@@ -0,0 +1,125 @@
+"""Lazy CV-text hydration endpoints used by the CV viewer."""
+
+import io
+import json
+
+from app.models.candidate_application import CandidateApplication
+from tests.conftest import auth_headers
+
+
+def _role_with_applications(client, db, headers, cv_texts):
+    role = client.post("/api/v1/roles", json={"name": "CV viewer role"}, headers=headers).json()
+    job_spec = {"file": ("job-spec.txt", io.BytesIO(b"Python backend role"), "text/plain")}
+    assert (
+        client.post(
+            f"/api/v1/roles/{role['id']}/upload-job-spec", files=job_spec, headers=headers
+        ).status_code
+        == 200
+    )
+    ids = []
+    for index, cv_text in enumerate(cv_texts):
+        app = client.post(
+            f"/api/v1/roles/{role['id']}/applications",
+            json={
+                "candidate_email": f"cv-viewer-{index}@example.com",
+                "candidate_name": f"CV Viewer {index}",
+            },
+            headers=headers,
+        )
+        assert app.status_code in (200, 201), app.text
+        ids.append(app.json()["id"])
+        row = db.query(CandidateApplication).filter(CandidateApplication.id == ids[-1]).one()
+        row.cv_text = cv_text
+    db.commit()
+    return role, ids
+
+
+def _lines(response):
+    return [json.loads(line) for line in response.text.splitlines() if line]
+
+
+def test_batch_cv_text_streams_requested_rows_with_etags(client, db):
+    headers, _ = auth_headers(client)
+    role, ids = _role_with_applications(
+        client, db, headers, ["First CV body", "Second CV body", None]
+    )
+    other_headers, _ = auth_headers(client, email="cv-other@example.com", organization_name="Other Org")
+    _, foreign_ids = _role_with_applications(client, db, other_headers, ["Foreign CV"])
+
+    requested = [ids[1], ids[0], foreign_ids[0], 999999, ids[2]]
+    response = client.get(
+        f"/api/v1/applications/cv-text?ids={','.join(map(str, requested))}",
+        headers=headers,
+    )
+    assert response.status_code == 200, response.text
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+    lines = _lines(response)
+    assert [line["application_id"] for line in lines] == [ids[1], ids[0], ids[2]]
+    assert [line["cv_text"] for line in lines] == ["Second CV body", "First CV body", None]
+    assert lines[2]["etag"] is None
+    assert lines[0]["etag"] != lines[1]["etag"]
+
+    # The list endpoint stays small unless CVs are asked for inline.
+    listed = client.get(f"/api/v1/roles/{role['id']}/applications", headers=headers).json()
+    items = listed["items"] if isinstance(listed, dict) else listed
+    assert all(item.get("cv_text") is None for item in items)
+
+
+def test_batch_cv_text_skips_bodies_the_viewer_already_holds(client, db):
+    headers, _ = auth_headers(client)
+    _, ids = _role_with_applications(client, db, headers, ["Cached CV", "Fresh CV"])
+    first = _lines(
+        client.get(f"/api/v1/applications/cv-text?ids={ids[0]},{ids[1]}", headers=headers)
+    )
+    cached_etag = first[0]["etag"]
+
+    again = _lines(
+        client.get(
+            f"/api/v1/applications/cv-text?ids={ids[0]},{ids[1]}",
+            headers={**headers, "If-None-Match": cached_etag},
+        )
+    )
+    assert again[0] == {
+        "application_id": ids[0],
+        "etag": cached_etag,
+        "cv_text": None,
+        "not_modified": True,
+    }
+    assert again[1]["cv_text"] == "Fresh CV"
+
+    row = db.query(CandidateApplication).filter(CandidateApplication.id == ids[0]).one()
+    row.cv_text = "Cached CV, revised"
+    db.commit()
+    changed = _lines(
+        client.get(
+            f"/api/v1/applications/cv-text?ids={ids[0]}",
+            headers={**headers, "If-None-Match": cached_etag},
+        )
+    )
+    assert changed[0]["cv_text"] == "Cached CV, revised"
+    assert changed[0]["etag"] != cached_etag
+
+
+def test_batch_cv_text_validates_ids(client, db):
+    headers, _ = auth_headers(client)
+    assert client.get("/api/v1/applications/cv-text?ids=abc", headers=headers).status_code == 422
+    too_many = ",".join(str(i) for i in range(1, 202))
+    assert client.get(f"/api/v1/applications/cv-text?ids={too_many}", headers=headers).status_code == 422
+
+
+def test_single_cv_text_honours_if_none_match(client, db):
+    headers, _ = auth_headers(client)
+    _, ids = _role_with_applications(client, db, headers, ["Single CV body", None])
+
+    response = client.get(f"/api/v1/applications/{ids[0]}/cv-text", headers=headers)
+    assert response.status_code == 200, response.text
+    assert response.text == "Single CV body"
+    etag = response.headers["etag"]
+
+    cached = client.get(
+        f"/api/v1/applications/{ids[0]}/cv-text",
+        headers={**headers, "If-None-Match": etag},
+    )
+    assert cached.status_code == 304
+    assert cached.content == b""
+    assert client.get(f"/api/v1/applications/{ids[1]}/cv-text", headers=headers).status_code == 404
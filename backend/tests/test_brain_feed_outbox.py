@@ -24,6 +24,7 @@ from app.models.brain_feed_outbox import (
     BRAIN_FEED_STATUS_PENDING,
     BRAIN_FEED_STATUS_SENT,
     BrainFeedOutbox,
+    BrainFeedSweepCursor,
 )
 from app.models.candidate import Candidate
 from app.models.candidate_application import CandidateApplication
@@ -203,6 +204,71 @@ def test_sweep_usage_rollup_only_whole_past_days(db, feed_on):
     assert row.payload["event_count"] == 2
 
 
+def _add_decision(db, decision, *, key, resolved_at):
+    extra = AgentDecision(
+        organization_id=decision.organization_id,
+        role_id=decision.role_id,
+        application_id=decision.application_id,
+        decision_type="advance_to_interview",
+        recommendation="advance_to_interview",
+        status="approved",
+        human_disposition="approved",
+        reasoning="paged decision",
+        confidence=0.5,
+        model_version="test-model",
+        prompt_version="test-prompt",
+        idempotency_key=f"feed:{decision.application_id}:{key}",
+        resolved_at=resolved_at,
+    )
+    db.add(extra)
+    db.commit()
+    return extra
+
+
+def test_enqueue_many_skips_existing_event_ids(db, feed_on):
+    outbox.enqueue(db, record_kind="decision", event_id="decision-1", payload={"a": 1})
+
+    written = outbox.enqueue_many(
+        db,
+        record_kind="decision",
+        records=[("decision-1", {"a": 2}), ("decision-2", {"a": 3})],
+    )
+    db.commit()
+
+    assert written == 1
+    assert {r.event_id: r.payload for r in db.query(BrainFeedOutbox).all()} == {
+        "decision-1": {"a": 1},
+        "decision-2": {"a": 3},
+    }
+
+
+def test_sweep_pages_decisions_and_persists_high_water_mark(db, feed_on, monkeypatch):
+    monkeypatch.setattr(sweep, "_SWEEP_PAGE_SIZE", 2)
+    base = datetime.now(timezone.utc) - timedelta(hours=2)
+    _org, _role, _app, decision = _seed_resolved_decision(db, resolved_at=base)
+    newest = decision
+    for index in range(4):
+        newest = _add_decision(
+            db, decision, key=f"page-{index}", resolved_at=base + timedelta(minutes=index + 1)
+        )
+
+    assert sweep.sweep_and_enqueue(db)["decisions"] == 5
+    cursor = db.get(BrainFeedSweepCursor, "decision")
+    assert cursor.last_seen_id == newest.id
+
+    # Rows stamped inside the overlap window are still picked up; rows older
+    # than it (behind the high-water mark) are no longer scanned.
+    inside = _add_decision(
+        db, decision, key="late-inside", resolved_at=base + timedelta(minutes=1)
+    )
+    _add_decision(db, decision, key="late-behind", resolved_at=base - timedelta(hours=1))
+    assert sweep.sweep_and_enqueue(db)["decisions"] == 1
+    assert db.query(BrainFeedOutbox).filter_by(
+        event_id=f"decision-{inside.id}"
+    ).count() == 1
+    assert db.query(BrainFeedOutbox).count() == 6
+
+
 # ---------------------------------------------------------------------------
 # Drain: disabled / shadow / live
 # ---------------------------------------------------------------------------
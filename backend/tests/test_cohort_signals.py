@@ -19,7 +19,13 @@ from app.models.candidate import Candidate
 from app.models.candidate_application import CandidateApplication
 from app.models.organization import Organization
 from app.models.role import ROLE_KIND_SISTER, Role
+from app.models.role_cohort_feature import (
+    RoleCohortFeatureCount,
+    RoleCohortMember,
+    RoleCohortState,
+)
 from app.models.sister_role_evaluation import SisterRoleEvaluation
+from app.services import cohort_feature_store
 from app.services.cohort_signals_service import (
     MIN_LIFT,
     compute_cohort_signals,
@@ -397,6 +403,183 @@ def test_related_cohort_signals_use_membership_and_role_local_score(db):
     assert "owner-only" not in skill_signals
 
 
+# ---------------------------------------------------------------------------
+# Maintained feature counts
+# ---------------------------------------------------------------------------
+
+
+def _without_timestamp(payload: dict) -> dict:
+    return {key: value for key, value in payload.items() if key != "computed_at"}
+
+
+def test_feature_store_applies_changes_incrementally_and_matches_recount(db):
+    org = _make_org(db)
+    role = _make_role(db, org)
+    apps: list[CandidateApplication] = []
+    for i in range(12):
+        c = _make_candidate(
+            db,
+            org=org,
+            email=f"m{i}@x.test",
+            skills=["python", "kubernetes"] if i < 5 else ["python"],
+            companies=["Acme"] if i % 3 == 0 else ["Other Co"],
+        )
+        apps.append(_make_application(db, org=org, role=role, candidate=c, taali=90.0 - i))
+
+    first = cohort_feature_store.cohort_signals(
+        db, role_id=int(role.id), organization_id=int(org.id)
+    )
+    assert _without_timestamp(first) == _without_timestamp(
+        compute_cohort_signals(db, role_id=int(role.id), organization_id=int(org.id))
+    )
+    state = db.get(RoleCohortState, int(role.id))
+    rebuilt_at = state.rebuilt_at
+
+    # A rescore that moves a bottom applicant into the top set, a profile
+    # edit, a new applicant and a withdrawn one.
+    apps[11].taali_score_cache_100 = 99.0
+    apps[11].candidate.skills = ["go", "terraform"]
+    apps[0].candidate.education_entries = [{"institution": "MIT"}]
+    newcomer = _make_candidate(db, org=org, email="new@x.test", skills=["go"])
+    _make_application(db, org=org, role=role, candidate=newcomer, taali=95.0)
+    apps[3].deleted_at = datetime.now(timezone.utc)
+    db.flush()
+
+    stale = (
+        db.query(RoleCohortMember)
+        .filter(
+            RoleCohortMember.role_id == int(role.id),
+            RoleCohortMember.version != RoleCohortMember.applied_version,
+        )
+        .count()
+    )
+    assert stale == 4
+
+    second = cohort_feature_store.cohort_signals(
+        db, role_id=int(role.id), organization_id=int(org.id)
+    )
+    assert _without_timestamp(second) == _without_timestamp(
+        compute_cohort_signals(db, role_id=int(role.id), organization_id=int(org.id))
+    )
+    assert second["pool_size"] == 12
+    assert db.get(RoleCohortState, int(role.id)).rebuilt_at == rebuilt_at
+    members = {
+        m.application_id: m
+        for m in db.query(RoleCohortMember).filter(RoleCohortMember.role_id == int(role.id))
+    }
+    assert members[int(apps[11].id)].in_top is True
+    assert members[int(apps[3].id)].score is None
+    assert all(m.version == m.applied_version for m in members.values())
+
+
+def test_feature_store_reads_without_loading_candidates(db):
+    org = _make_org(db)
+    role = _make_role(db, org)
+    for i in range(8):
+        c = _make_candidate(db, org=org, email=f"q{i}@x.test", skills=["python"])
+        _make_application(db, org=org, role=role, candidate=c, taali=80.0 - i)
+    cohort_feature_store.cohort_signals(db, role_id=int(role.id), organization_id=int(org.id))
+
+    statements: list[str] = []
+
+    def _record(_conn, _cursor, statement, *_args):
+        statements.append(statement)
+
+    engine = db.get_bind()
+    event.listen(engine, "before_cursor_execute", _record)
+    try:
+        payload = cohort_feature_store.cohort_signals(
+            db, role_id=int(role.id), organization_id=int(org.id)
+        )
+    finally:
+        event.remove(engine, "before_cursor_execute", _record)
+
+    assert payload["pool_size"] == 8
+    assert not any("FROM candidates" in statement for statement in statements)
+    assert not any("FROM candidate_applications" in statement for statement in statements)
+
+
+def test_profile_edits_mark_members_in_one_statement_only_when_features_change(db):
+    org = _make_org(db)
+    role = _make_role(db, org)
+    other = _make_role(db, org, name="Other")
+    person = _make_candidate(
+        db, org=org, email="p@x.test", skills=["Python"], companies=["Acme"], titles=["Engineer"]
+    )
+    for i in range(6):
+        c = _make_candidate(db, org=org, email=f"s{i}@x.test", skills=["python"])
+        _make_application(db, org=org, role=role, candidate=c, taali=80.0 - i)
+    _make_application(db, org=org, role=role, candidate=person, taali=85.0)
+    _make_application(db, org=org, role=other, candidate=person, taali=60.0)
+    for target in (role, other):
+        cohort_feature_store.cohort_signals(
+            db, role_id=int(target.id), organization_id=int(org.id)
+        )
+    db.commit()
+    db.refresh(person)
+
+    statements: list[str] = []
+
+    def _record(_conn, _cursor, statement, *_args):
+        statements.append(statement)
+
+    engine = db.get_bind()
+    event.listen(engine, "before_cursor_execute", _record)
+    try:
+        # Same normalized features: only dates and casing differ.
+        person.skills = ["python "]
+        person.experience_entries = [
+            {"title": "engineer", "company": "ACME", "start_date": "2020-01"}
+        ]
+        db.flush()
+        assert not any("candidate_applications" in st for st in statements)
+        assert not any("INSERT INTO role_cohort_members" in st for st in statements)
+
+        person.skills = ["python", "rust"]
+        db.flush()
+    finally:
+        event.remove(engine, "before_cursor_execute", _record)
+
+    upserts = [st for st in statements if "INSERT INTO role_cohort_members" in st]
+    assert len(upserts) == 1
+    stale = {
+        m.role_id
+        for m in db.query(RoleCohortMember).filter(
+            RoleCohortMember.version != RoleCohortMember.applied_version
+        )
+    }
+    assert stale == {int(role.id), int(other.id)}
+
+
+def test_reconcile_role_cohorts_rebuilds_and_drops_deleted_roles(db):
+    org = _make_org(db)
+    role = _make_role(db, org)
+    gone = _make_role(db, org, name="Gone")
+    for i in range(6):
+        c = _make_candidate(db, org=org, email=f"r{i}@x.test", skills=["python"])
+        _make_application(db, org=org, role=role, candidate=c, taali=80.0 - i)
+        _make_application(db, org=org, role=gone, candidate=c, taali=70.0 - i)
+    for target in (role, gone):
+        cohort_feature_store.cohort_signals(
+            db, role_id=int(target.id), organization_id=int(org.id)
+        )
+    state = db.get(RoleCohortState, int(role.id))
+    state.rebuilt_at = datetime.now(timezone.utc) - timedelta(days=2)
+    # Drift a writer outside the ORM could cause.
+    db.query(RoleCohortFeatureCount).filter(
+        RoleCohortFeatureCount.role_id == int(role.id)
+    ).update({"pool_n": 99}, synchronize_session=False)
+    gone.deleted_at = datetime.now(timezone.utc)
+    db.commit()
+
+    summary = cohort_feature_store.reconcile_role_cohorts(db)
+
+    assert summary == {"refreshed": 0, "rebuilt": 1, "removed": 1}
+    assert db.get(RoleCohortState, int(gone.id)) is None
+    python = db.get(RoleCohortFeatureCount, (int(role.id), "skills", "python"))
+    assert python.pool_n == 6
+
+
 # ---------------------------------------------------------------------------
 # Renderer
 # ---------------------------------------------------------------------------
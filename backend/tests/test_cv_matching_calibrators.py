@@ -17,6 +17,7 @@ from app.cv_matching.calibrators import (
     IsotonicCalibrator,
     PlattCalibrator,
     apply_calibrator,
+    apply_calibrator_many,
     fit_calibrator,
     load_calibrator,
     save_calibrator,
@@ -96,6 +97,34 @@ def test_isotonic_round_trip_through_json():
         assert abs(restored.predict(x) - cal.predict(x)) < 1e-9
 
 
+def _golden_pairs() -> tuple[list[float], list[bool]]:
+    import random
+
+    rng = random.Random(7)
+    X = [round(rng.uniform(0, 100), 1) for _ in range(400)]
+    y = [rng.random() < 1 / (1 + math.exp(-(x - 60) / 8)) for x in X]
+    return X, y
+
+
+def test_fits_reproduce_the_per_sample_golden_outputs():
+    """Grouped Platt descent and stack PAV match the per-sample originals."""
+    X, y = _golden_pairs()
+
+    platt = PlattCalibrator().fit(X, y)
+    assert abs(platt.a - 3.001540970250088) < 1e-12
+    assert abs(platt.b - -1.0992911947000668) < 1e-12
+
+    isotonic = IsotonicCalibrator().fit(X, y)
+    assert len(isotonic.breakpoints) == 141
+    assert isotonic.breakpoints[:3] == [(0.0, 0.0), (0.4, 0.0), (0.4, 0.0)]
+    assert [isotonic.predict(x) for x in (5.0, 42.25, 61.0, 99.0)] == [
+        0.0,
+        0.07563076633402373,
+        0.5677339901477833,
+        1.0,
+    ]
+
+
 # --------------------------------------------------------------------------- #
 # fit_calibrator (auto-selection + persistence)                                #
 # --------------------------------------------------------------------------- #
@@ -171,6 +200,78 @@ def test_save_calibrator_writes_timestamped_and_latest():
     _cleanup_snapshot(role_family, dimension)
 
 
+def test_predict_many_matches_predict():
+    X = [10, 20, 30, 40, 50, 60, 70, 80, 90]
+    y = [False, False, True, False, True, True, False, True, True]
+    probes = [-5.0, 10.0, 12.5, 35.0, 50.0, 64.0, 90.0, 120.0]
+    for cal in (PlattCalibrator().fit(X, y), IsotonicCalibrator().fit(X, y)):
+        assert cal.predict_many(probes) == [cal.predict(x) for x in probes]
+    assert IsotonicCalibrator().predict_many([1.0, 2.0]) == [0.0, 0.0]
+
+
+def test_registry_parses_a_snapshot_once_and_picks_up_new_fits(monkeypatch):
+    from app.cv_matching.calibrators import api, registry
+
+    role_family = "test_registry"
+    dimension = "cv_fit"
+    _cleanup_snapshot(role_family, dimension)
+    registry.reset_calibrator_registry()
+    reads = []
+    real_read = api._read_calibrator
+    monkeypatch.setattr(
+        api, "_read_calibrator", lambda path: reads.append(path) or real_read(path)
+    )
+
+    fit_calibrator(
+        role_family=role_family, dimension=dimension, X=[10, 90], y=[False, True]
+    )
+    first = [apply_calibrator(role_family, dimension, 50.0) for _ in range(5)]
+    assert len(reads) == 1
+    assert apply_calibrator_many(role_family, dimension, [50.0, 90.0]) == [
+        first[0],
+        apply_calibrator(role_family, dimension, 90.0),
+    ]
+    assert len(reads) == 1
+
+    # A refit in this process is visible on the next lookup.
+    fit_calibrator(
+        role_family=role_family, dimension=dimension, X=[10, 90], y=[True, False]
+    )
+    assert apply_calibrator(role_family, dimension, 90.0) < first[0]
+    assert len(reads) == 2
+    _cleanup_snapshot(role_family, dimension)
+    registry.reset_calibrator_registry()
+
+
+def test_registry_refreshes_stale_entries_off_the_lookup_path(monkeypatch):
+    from app.cv_matching.calibrators import registry
+
+    role_family = "test_registry_refresh"
+    dimension = "cv_fit"
+    _cleanup_snapshot(role_family, dimension)
+    registry.reset_calibrator_registry()
+    assert apply_calibrator(role_family, dimension, 50.0) is None
+
+    # Another worker writes a snapshot; this process only sees it once the
+    # (here: forced) version re-check runs.
+    latest = _SNAPSHOT_DIR / f"{role_family}_{dimension}_latest.json"
+    _SNAPSHOT_DIR.mkdir(parents=True, exist_ok=True)
+    latest.write_text(json.dumps(PlattCalibrator().fit([10, 90], [False, True]).to_dict()))
+    assert apply_calibrator(role_family, dimension, 50.0) is None
+    assert registry.refresh_calibrators() == 1
+    assert apply_calibrator(role_family, dimension, 90.0) > 0.5
+
+    scheduled = []
+    monkeypatch.setattr(registry, "_REFRESH_SECONDS", 0.0)
+    monkeypatch.setattr(
+        registry, "_schedule_refresh", lambda key, entry: scheduled.append(key)
+    )
+    assert apply_calibrator(role_family, dimension, 90.0) > 0.5
+    assert scheduled == [(role_family, dimension)]
+    _cleanup_snapshot(role_family, dimension)
+    registry.reset_calibrator_registry()
+
+
 # ---------------------------------------------------------------------------
 # Realized-outcome label extraction (model-refinement loop)
 # ---------------------------------------------------------------------------
@@ -49,6 +49,25 @@ class _FakeRedis:
     def setex(self, key, _ttl, value):
         self.store[key] = value
 
+    def mget(self, keys):
+        return [self.store.get(key) for key in keys]
+
+    def pipeline(self, transaction=True):
+        return _FakePipeline(self)
+
+
+class _FakePipeline:
+    def __init__(self, redis):
+        self.redis = redis
+        self.queued: list[tuple[str, str]] = []
+
+    def setex(self, key, _ttl, value):
+        self.queued.append((key, value))
+
+    def execute(self):
+        for key, value in self.queued:
+            self.redis.setex(key, None, value)
+
 
 class _Client:
     def __init__(self, response):
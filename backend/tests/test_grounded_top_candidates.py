@@ -79,7 +79,7 @@ def _no_grounding_cache(monkeypatch):
 
 
 class _FakeRedis:
-    """Minimal in-memory stand-in for the grounding cache (get / setex)."""
+    """Minimal in-memory stand-in for the grounding cache (mget / pipelined setex)."""
 
     def __init__(self):
         self.store: dict[str, str] = {}
@@ -90,6 +90,25 @@ class _FakeRedis:
     def setex(self, key, _ttl, value):
         self.store[key] = value
 
+    def mget(self, keys):
+        return [self.store.get(key) for key in keys]
+
+    def pipeline(self, transaction=True):
+        return _FakePipeline(self)
+
+
+class _FakePipeline:
+    def __init__(self, redis):
+        self.redis = redis
+        self.queued: list[tuple[str, str]] = []
+
+    def setex(self, key, _ttl, value):
+        self.queued.append((key, value))
+
+    def execute(self):
+        for key, value in self.queued:
+            self.redis.setex(key, None, value)
+
 
 def _route_factory(client):
     return lambda _execution: client
@@ -403,6 +422,109 @@ def test_grounding_cache_key_tracks_route_behavior(monkeypatch):
     assert rerouted != first
 
 
+def test_window_prefetches_cache_once_and_grounds_only_misses(monkeypatch):
+    """One MGET covers the window, cached candidates are routed but never
+    re-read or re-called, and the misses' fresh verdicts are written back in
+    one pipeline."""
+    fake = _FakeRedis()
+    reads: list[list[str]] = []
+    flushes: list[int] = []
+    real_mget, real_pipeline = fake.mget, fake.pipeline
+
+    def _mget(keys):
+        reads.append(list(keys))
+        return real_mget(keys)
+
+    def _pipeline(transaction=True):
+        pipe = real_pipeline(transaction)
+        real_execute = pipe.execute
+        pipe.execute = lambda: flushes.append(len(pipe.queued)) or real_execute()
+        return pipe
+
+    fake.mget, fake.pipeline = _mget, _pipeline
+    monkeypatch.setattr(ge, "_redis", lambda: fake)
+    monkeypatch.setattr(
+        ge, "_planned_behavior_fingerprint", lambda **_k: "test-grounding-behavior"
+    )
+    routed: list[str] = []
+    real_prepare = ge.prepare_route
+    monkeypatch.setattr(
+        ge,
+        "prepare_route",
+        lambda *a, **k: routed.append(k["attribution"].entity_id) or real_prepare(*a, **k),
+    )
+    monkeypatch.setattr(tc, "_collect_evidence", lambda app: (app.cv, None))
+    client = _CountingClient(lambda _n: _met_response())
+    cached_app = SimpleNamespace(id=1, cv="Led the core banking platform migration")
+    fresh_app = SimpleNamespace(id=2, cv="Led the core banking platform migration at Acme")
+    window = dict(
+        criteria=["banking domain experience"],
+        route_client_factory=_route_factory(client),
+        organization_id=1,
+    )
+    tc._ground_window([cached_app], **window)
+    reads.clear()
+    flushes.clear()
+    routed.clear()
+    client.calls = 0
+
+    grounded = tc._ground_window([cached_app, fresh_app], **window)
+
+    assert [app.id for app, _ in grounded] == [1, 2]
+    assert all(verdicts[0].status == "met" for _, verdicts in grounded)
+    assert len(reads) == 1 and len(reads[0]) == 2
+    assert sorted(routed) == ["application:1", "application:2"]
+    assert client.calls == 1
+    assert flushes == [1]
+    assert len(fake.store) == 2
+
+
+def test_fully_cached_candidate_is_not_served_when_routing_refuses(monkeypatch):
+    fake = _FakeRedis()
+    monkeypatch.setattr(ge, "_redis", lambda: fake)
+    monkeypatch.setattr(
+        ge, "_planned_behavior_fingerprint", lambda **_k: "test-grounding-behavior"
+    )
+    monkeypatch.setattr(tc, "_collect_evidence", lambda app: (app.cv, None))
+    client = _CountingClient(lambda _n: _met_response())
+    app = SimpleNamespace(id=1, cv="Led the core banking platform migration")
+    window = dict(
+        criteria=["banking domain experience"],
+        route_client_factory=_route_factory(client),
+        organization_id=1,
+    )
+    tc._ground_window([app], **window)
+    assert fake.store
+
+    def _refuse(*_a, **_k):
+        raise PermissionError("role authority revoked")
+
+    monkeypatch.setattr(ge, "prepare_route", _refuse)
+
+    grounded = tc._ground_window([app], **window)
+
+    assert grounded[0][1][0].status == "error"
+    assert client.calls == 1
+
+
+def test_window_prefetch_degrades_without_redis(monkeypatch):
+    monkeypatch.setattr(
+        ge, "_planned_behavior_fingerprint", lambda **_k: pytest.fail("planned without cache")
+    )
+    monkeypatch.setattr(tc, "_collect_evidence", lambda app: (app.cv, None))
+    client = _CountingClient(lambda _n: _met_response())
+
+    grounded = tc._ground_window(
+        [SimpleNamespace(id=1, cv="Led the core banking platform migration")],
+        criteria=["banking domain experience"],
+        route_client_factory=_route_factory(client),
+        organization_id=1,
+    )
+
+    assert grounded[0][1][0].status == "met"
+    assert client.calls == 1
+
+
 def test_ambiguous_failure_is_not_replayed_or_cached(monkeypatch):
     """An outcome-ambiguous error is surfaced after exactly one attempt."""
     fake = _FakeRedis()
@@ -562,6 +684,74 @@ def test_find_top_candidates_shows_error_not_hidden(monkeypatch):
     assert any(w["code"] == "evidence_incomplete" for w in out["warnings"])
 
 
+def test_find_top_candidates_streams_shortlist_then_verdicts(monkeypatch):
+    """Streaming callers get the score-ranked shortlist before any evidence
+    check finishes, then one verdict event per candidate; the returned
+    payload is unchanged."""
+    from app.candidate_search import runner as runner_mod
+
+    monkeypatch.setattr(runner_mod, "run_search", lambda **kw: SearchOutput(
+        application_ids=[1, 2],
+        parsed_filter=ParsedFilter(soft_criteria=["banking experience"]),
+        warnings=[]))
+    apps = [_fake_app(1, taali=60, name="A"), _fake_app(2, taali=90, name="B")]
+    monkeypatch.setattr(tc, "_pool_count", lambda bq: 2)
+    monkeypatch.setattr(tc, "_load_candidates", lambda bq, **kw: list(apps))
+    monkeypatch.setattr(tc, "_collect_evidence", lambda app: ("cv", None))
+    events: list[dict] = []
+
+    def _ground(_cv, _notes, *, criteria, application_id, **_kwargs):
+        # Every verdict lands after the shortlist was published.
+        assert events and events[0]["phase"] == "shortlist"
+        return [ge.CriterionVerdict(criterion=c, status="met", grounded=True)
+                for c in criteria]
+
+    monkeypatch.setattr(tc, "_ground", _ground)
+
+    out = tc.find_top_candidates(
+        db=MagicMock(), organization_id=1, query="banking experience",
+        base_query=MagicMock(), limit=5, on_progress=events.append,
+    )
+
+    shortlist, *verdicts = events
+    assert [row["application_id"] for row in shortlist["candidates"]] == [2, 1]
+    assert all(row["provisional"] and row["criteria"] == []
+               for row in shortlist["candidates"])
+    assert shortlist["window"] == 2
+    assert sorted(event["application_id"] for event in verdicts) == [1, 2]
+    assert sorted(event["checked"] for event in verdicts) == [1, 2]
+    assert verdicts[0]["criteria"][0]["status"] == "met"
+    # The final order also weighs query relevance; it is the authoritative one.
+    assert sorted(c["application_id"] for c in out["candidates"]) == [1, 2]
+    assert "provisional" not in out["candidates"][0]
+
+
+def test_failing_progress_callback_never_breaks_the_search(monkeypatch):
+    from app.candidate_search import runner as runner_mod
+
+    monkeypatch.setattr(runner_mod, "run_search", lambda **kw: SearchOutput(
+        application_ids=[1],
+        parsed_filter=ParsedFilter(soft_criteria=["banking experience"]),
+        warnings=[]))
+    monkeypatch.setattr(tc, "_pool_count", lambda bq: 1)
+    monkeypatch.setattr(tc, "_load_candidates", lambda bq, **kw: [_fake_app(1, taali=80)])
+    monkeypatch.setattr(tc, "_collect_evidence", lambda app: ("cv", None))
+    monkeypatch.setattr(tc, "_ground", lambda *_a, criteria, **_k: [
+        ge.CriterionVerdict(criterion=c, status="met", grounded=True) for c in criteria
+    ])
+
+    def _broken(_event):
+        raise RuntimeError("client went away")
+
+    out = tc.find_top_candidates(
+        db=MagicMock(), organization_id=1, query="banking experience",
+        base_query=MagicMock(), limit=5, on_progress=_broken,
+    )
+
+    assert out["search_status"] == "matches_found"
+    assert out["evidence_succeeded"] == 1
+
+
 def test_qualified_is_unknown_when_requested_criteria_are_capped(monkeypatch):
     from app.candidate_search import runner as runner_mod
 
@@ -0,0 +1,349 @@
+"""Bulk holistic scoring via the Message Batches API (cv_matching/holistic_batch).
+
+Pins: requests rendered from the same call specs the sync path uses, a batch-
+delivery job parking on a holistic cache miss instead of calling Sonnet,
+per-org submission marking jobs in-batch, result application through the
+shared score cache (persisted by the normal worker without the cache fee),
+failure hand-off to the live path, stale re-parking and the reaper's batch
+window.
+"""
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+from typing import Any
+
+import pytest
+
+from app.cv_matching import holistic
+from app.cv_matching import holistic_batch
+from app.cv_matching.holistic import _Derivation, _LeanScore, _ReqItem, holistic_calls
+from app.cv_matching.holistic_batch import (
+    apply_score_batch_results,
+    build_holistic_batch_requests,
+    custom_id_for,
+    dispatch_score_jobs,
+    parse_custom_id,
+    release_parked_score_jobs,
+    sweep_parked_score_jobs,
+)
+from app.llm import structured_tool_params
+from app.models.anthropic_batch_job import AnthropicBatchJob
+from app.models.candidate import Candidate
+from app.models.candidate_application import CandidateApplication
+from app.models.cv_score_job import (
+    SCORE_BATCH_AWAITING_SUBMIT,
+    SCORE_DELIVERY_BATCH,
+    SCORE_DELIVERY_LIVE,
+    SCORE_JOB_DONE,
+    SCORE_JOB_PENDING,
+    SCORE_JOB_RUNNING,
+    CvScoreJob,
+)
+from app.models.organization import Organization
+from app.models.role import Role
+from app.platform.config import settings
+from app.services import cv_score_orchestrator
+from app.services.cv_score_orchestrator import enqueue_score, holistic_inputs_for
+from app.services.metered_anthropic_client import MeteredAnthropicClient
+
+CV_TEXT = "Senior data engineer. Built PySpark ETL pipelines at Acme since 2019."
+
+
+@pytest.fixture(autouse=True)
+def _batch_scoring(monkeypatch):
+    monkeypatch.setattr(settings, "ANTHROPIC_API_KEY", "test-key-not-used")
+    monkeypatch.setattr(settings, "HOLISTIC_SCORING_ENABLED", True)
+    monkeypatch.setattr(settings, "HOLISTIC_SCORING_ORG_IDS", "*")
+    monkeypatch.setattr(settings, "HOLISTIC_SCORE_BATCH_ENABLED", True)
+    monkeypatch.setattr(settings, "ENABLE_PRE_SCREEN_GATE", False)
+    monkeypatch.setattr(holistic_batch, "derive_requirements", lambda *_a, **_k: _deriv())
+
+    def _no_live_call(*_args, **_kwargs):
+        raise AssertionError("batch-delivery scoring must not call Sonnet inline")
+
+    monkeypatch.setattr(holistic, "run_holistic_match", _no_live_call)
+
+
+def _deriv() -> _Derivation:
+    return _Derivation(
+        core_capability="Data pipeline engineering",
+        requirements=[_ReqItem(requirement="PySpark ETL", importance="critical", is_core=True)],
+    )
+
+
+def _seed(db, *, email: str = "batch@x.test", cv_text: str = CV_TEXT):
+    org = Organization(name="O", slug=f"hsb-{email}")
+    db.add(org)
+    db.flush()
+    role = Role(
+        organization_id=org.id,
+        name="Data engineer",
+        source="manual",
+        job_spec_text="Data engineer building PySpark ETL pipelines.",
+        agentic_mode_enabled=True,
+        monthly_usd_budget_cents=5000,
+    )
+    db.add(role)
+    db.flush()
+    candidate = Candidate(organization_id=org.id, email=email, full_name="C")
+    db.add(candidate)
+    db.flush()
+    app = CandidateApplication(
+        organization_id=org.id,
+        candidate_id=candidate.id,
+        role_id=role.id,
+        status="applied",
+        source="manual",
+        cv_text=cv_text,
+    )
+    db.add(app)
+    db.commit()
+    return app
+
+
+class _FakeBatches:
+    def __init__(self):
+        self.created: list[dict] = []
+
+    def create(self, **kwargs: Any):
+        self.created.append(kwargs)
+        return SimpleNamespace(id=f"msgbatch_hs_{len(self.created)}")
+
+
+def _patch_client(monkeypatch, fake: _FakeBatches):
+    def _get_metered_client(*, organization_id=None):
+        inner = SimpleNamespace(messages=SimpleNamespace(batches=fake))
+        return MeteredAnthropicClient(inner=inner, organization_id=organization_id)
+
+    monkeypatch.setattr(
+        "app.services.claude_client_resolver.get_metered_client", _get_metered_client
+    )
+
+
+def _tool_entry(custom_id: str, name: str, payload: dict):
+    block = SimpleNamespace(type="tool_use", name=name, input=payload)
+    message = SimpleNamespace(
+        content=[block], usage=SimpleNamespace(input_tokens=1200, output_tokens=300)
+    )
+    return SimpleNamespace(
+        custom_id=custom_id, result=SimpleNamespace(type="succeeded", message=message)
+    )
+
+
+def _score_entry(job_id: int, overall: int = 74):
+    lean = _LeanScore(
+        overall=overall,
+        core_capability_score=80,
+        verdict="Solid fit",
+        reasoning="Hands-on PySpark pipelines.",
+        matching_skills=["PySpark"],
+    )
+    return _tool_entry(
+        custom_id_for(job_id, "score"), "score_candidate", lean.model_dump(mode="json")
+    )
+
+
+def _park(db, app) -> CvScoreJob:
+    job = enqueue_score(db, app, force=True, batch=True)
+    assert job is not None and job.delivery == SCORE_DELIVERY_BATCH
+    db.expire_all()
+    return db.get(CvScoreJob, job.id)
+
+
+def _submitted(db, monkeypatch, app) -> tuple[CvScoreJob, AnthropicBatchJob]:
+    job = _park(db, app)
+    _patch_client(monkeypatch, _FakeBatches())
+    sweep_parked_score_jobs(db)
+    db.commit()
+    row = db.query(AnthropicBatchJob).filter_by(feature="score").one()
+    return job, row
+
+
+# ---- request rendering -----------------------------------------------------
+
+
+def test_custom_id_roundtrip():
+    assert parse_custom_id(custom_id_for(42, "score")) == (42, "score")
+    assert parse_custom_id(custom_id_for(42, "report")) == (42, "report")
+    assert parse_custom_id("hscore-42-other") is None
+    assert parse_custom_id("cvparse-42") is None
+
+
+def test_requests_match_sync_call_params():
+    inputs = holistic.prepare_holistic_inputs(CV_TEXT, "Data engineer role.")
+    requests = build_holistic_batch_requests(7, inputs, _deriv())
+    calls = holistic_calls(inputs, _deriv())
+
+    assert [r["custom_id"] for r in requests] == ["hscore-7-score", "hscore-7-report"]
+    for request, spec in zip(requests, calls.values()):
+        tools, tool_choice, _ = structured_tool_params(spec["output_model"], spec["tool_name"])
+        assert request["params"] == {
+            "model": spec["model"],
+            "max_tokens": spec["max_tokens"],
+            "temperature": spec["temperature"],
+            "system": spec["system"],
+            "messages": spec["messages"],
+            "tools": tools,
+            "tool_choice": tool_choice,
+        }
+
+
+# ---- park → submit → apply → persist ----------------------------------------
+
+
+def test_cache_miss_parks_instead_of_calling_sonnet(db):
+    app = _seed(db)
+
+    job = _park(db, app)
+
+    assert job.status == SCORE_JOB_PENDING
+    assert job.error_message == SCORE_BATCH_AWAITING_SUBMIT
+    assert job.batch_trace_id is None
+
+
+def test_sweep_submits_per_org_batch_and_marks_jobs_in_flight(db, monkeypatch):
+    app = _seed(db)
+    job = _park(db, app)
+    fake = _FakeBatches()
+    _patch_client(monkeypatch, fake)
+
+    summary = sweep_parked_score_jobs(db)
+    db.commit()
+
+    assert [b["jobs"] for b in summary["batches"]] == [1]
+    assert [r["custom_id"] for r in fake.created[0]["requests"]] == [
+        custom_id_for(job.id, "score"),
+        custom_id_for(job.id, "report"),
+    ]
+    db.refresh(job)
+    assert job.status == SCORE_JOB_RUNNING
+    assert job.error_message == "in_batch:msgbatch_hs_1"
+    row = db.query(AnthropicBatchJob).filter_by(feature="score").one()
+    per = row.context[custom_id_for(job.id, "score")]
+    assert per["entity_id"] == f"application:{app.id}"
+    assert per["derivation"]["core_capability"] == "Data pipeline engineering"
+
+    # In flight: a second sweep has nothing parked to submit.
+    assert sweep_parked_score_jobs(db)["batches"] == []
+    assert len(fake.created) == 1
+
+
+def test_applied_result_is_persisted_by_worker_without_cache_fee(db, monkeypatch):
+    app = _seed(db)
+    job, row = _submitted(db, monkeypatch, app)
+    fees: list[Any] = []
+    monkeypatch.setattr(
+        "app.services.provider_usage_admission.reserve_provider_usage",
+        lambda **kwargs: fees.append(kwargs),
+    )
+    entries = [
+        _score_entry(job.id),
+        SimpleNamespace(
+            custom_id=custom_id_for(job.id, "report"), result=SimpleNamespace(type="errored")
+        ),
+    ]
+
+    summary = apply_score_batch_results(db, entries, context=row.context)
+    db.commit()
+    assert summary["applied"] == 1 and summary["dispatch"] == [job.id]
+    db.refresh(job)
+    assert job.status == SCORE_JOB_PENDING and job.batch_trace_id
+    inputs = holistic_inputs_for(db, db.get(CandidateApplication, app.id))
+    assert holistic.cached_holistic_output(inputs).trace_id == job.batch_trace_id
+
+    assert dispatch_score_jobs(db, summary["dispatch"]) == 1
+    db.expire_all()
+    job = db.get(CvScoreJob, job.id)
+    assert job.status == SCORE_JOB_DONE
+    assert job.cache_hit == "batch"
+    assert float(db.get(CandidateApplication, app.id).cv_match_score) == pytest.approx(74.0)
+    assert fees == []
+
+
+def test_failed_score_result_hands_job_to_live_path(db, monkeypatch):
+    app = _seed(db)
+    job, row = _submitted(db, monkeypatch, app)
+    entries = [
+        SimpleNamespace(
+            custom_id=custom_id_for(job.id, "score"), result=SimpleNamespace(type="expired")
+        ),
+    ]
+
+    summary = apply_score_batch_results(db, entries, context=row.context)
+
+    assert summary["requeued"] == 1 and summary["dispatch"] == [job.id]
+    assert job.delivery == SCORE_DELIVERY_LIVE
+    assert job.status == SCORE_JOB_PENDING and job.error_message is None
+
+
+def test_inputs_changed_mid_flight_reparks_job(db, monkeypatch):
+    app = _seed(db)
+    job, row = _submitted(db, monkeypatch, app)
+    db.get(CandidateApplication, app.id).cv_text = CV_TEXT + " Now also Terraform."
+    db.commit()
+
+    summary = apply_score_batch_results(db, [_score_entry(job.id)], context=row.context)
+
+    assert summary["stale_reparked"] == 1 and summary["dispatch"] == []
+    assert job.status == SCORE_JOB_PENDING
+    assert job.error_message == SCORE_BATCH_AWAITING_SUBMIT
+
+
+def test_flag_off_releases_parked_jobs_to_live(db, monkeypatch):
+    app = _seed(db)
+    job = _park(db, app)
+    monkeypatch.setattr(settings, "HOLISTIC_SCORE_BATCH_ENABLED", False)
+
+    summary = release_parked_score_jobs(db)
+
+    assert summary == {"released": 1, "dispatch": [job.id]}
+    assert job.delivery == SCORE_DELIVERY_LIVE and job.error_message is None
+
+
+def test_reaper_leaves_parked_jobs_to_the_batch_sweep(db, monkeypatch):
+    from app.tasks import scoring_tasks
+
+    app = _seed(db)
+    job = _park(db, app)
+    # Older than the pending cutoff (DEFAULT_PENDING_STALE_MINUTES).
+    job.queued_at = datetime.now(timezone.utc) - timedelta(hours=7)
+    db.commit()
+    requeued: list[int] = []
+    monkeypatch.setattr(
+        cv_score_orchestrator,
+        "enqueue_score",
+        lambda _db, application, **_k: requeued.append(application.id),
+    )
+
+    summary = scoring_tasks.recover_stuck_score_jobs()
+
+    assert requeued == []
+    db.expire_all()
+    parked = db.get(CvScoreJob, job.id)
+    assert parked.status == SCORE_JOB_PENDING
+    assert parked.error_message == SCORE_BATCH_AWAITING_SUBMIT
+    assert summary["stale_attempts"] == 0
+
+
+def test_reaper_leaves_in_batch_jobs_until_batch_window(db, monkeypatch):
+    from app.tasks import scoring_tasks
+
+    app = _seed(db)
+    job, _row = _submitted(db, monkeypatch, app)
+    job.started_at = datetime.now(timezone.utc) - timedelta(hours=3)
+    db.commit()
+    requeued: list[int] = []
+    monkeypatch.setattr(
+        cv_score_orchestrator,
+        "enqueue_score",
+        lambda _db, application, **_k: requeued.append(application.id),
+    )
+
+    scoring_tasks.recover_stuck_score_jobs()
+    assert requeued == []
+
+    job.started_at = datetime.now(timezone.utc) - timedelta(hours=27)
+    db.commit()
+    scoring_tasks.recover_stuck_score_jobs()
+    assert requeued == [app.id]
@@ -23,6 +23,7 @@ from fastapi.testclient import TestClient
 from app.main import app
 from app.platform import middleware as mw
 from app.platform.config import settings
+from app.services import rate_limit
 
 
 MCP_HEADERS_BASE = {
@@ -33,10 +34,11 @@ _BODY = {"jsonrpc": "2.0", "id": 1, "method": "tools/list"}
 
 
 @pytest.fixture(autouse=True)
-def _reset_rate_state():
-    mw._rate_limit_store.clear()
+def _reset_rate_state(monkeypatch):
+    monkeypatch.setattr(rate_limit, "_get_redis", lambda: None)
+    rate_limit.reset_memory_buckets()
     yield
-    mw._rate_limit_store.clear()
+    rate_limit.reset_memory_buckets()
 
 
 @pytest.fixture
@@ -47,10 +49,10 @@ def mcp_client():
     TestClient can't complete — is simply "not 429", keeping these tests
     focused on the rate-limit boundary rather than MCP session plumbing.
     """
-    mw._rate_limit_store.clear()
+    rate_limit.reset_memory_buckets()
     with TestClient(app, raise_server_exceptions=False) as c:
         yield c
-    mw._rate_limit_store.clear()
+    rate_limit.reset_memory_buckets()
 
 
 def _post_mcp(client, headers):
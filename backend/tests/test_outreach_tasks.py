@@ -2,7 +2,8 @@
 
 Covers:
 - generate task: metered draft written, Feature.OUTREACH_DRAFT metering asserted,
-  failure isolation (one bad message → failed, campaign still ready).
+  failure isolation (one bad message → failed, campaign still ready), concurrent
+  drafting behind one cached campaign prefix, Message Batches mode.
 - send task: suppression re-check skip, unsubscribe footer + reply_to +
   List-Unsubscribe header present, resend_email_id stored, only-approved sends,
   per-message failure isolation.
@@ -11,6 +12,9 @@ Covers:
 """
 from __future__ import annotations
 
+import threading
+import time
+from types import SimpleNamespace
 from unittest.mock import MagicMock, patch
 
 from app.models.organization import Organization
@@ -18,6 +22,7 @@ from app.models.outreach_campaign import (
     MESSAGE_STATUS_APPROVED,
     MESSAGE_STATUS_QUEUED,
     MESSAGE_STATUS_DRAFT,
+    MESSAGE_STATUS_DRAFTING,
     MESSAGE_STATUS_FAILED,
     MESSAGE_STATUS_INTERESTED,
     MESSAGE_STATUS_PENDING,
@@ -35,6 +40,7 @@ from app.models.prospect import (
     Prospect,
 )
 from app.models.user import User
+from app.platform.config import settings
 from app.services.email_suppression_service import suppress
 from app.services.resend_webhook_service import apply_resend_event
 from tests.conftest import auth_headers
@@ -151,26 +157,195 @@ def test_generate_failure_isolated(db):
     assert c.status == "ready"  # campaign still reaches ready
 
 
+def test_generate_drafts_concurrently_behind_a_cached_campaign_prefix(db):
+    org, user = _org_and_user(db)
+    c = _campaign(db, org.id, user.id, status="generating")
+    messages = [
+        _msg(db, c, org.id, f"fan-{index}@example.com", status=MESSAGE_STATUS_PENDING)
+        for index in range(5)
+    ]
+    # A row a crashed run left 'drafting' (outside any batch) is resumed.
+    stranded = _msg(db, c, org.id, "stranded@example.com", status=MESSAGE_STATUS_DRAFTING)
+
+    from app.tasks import outreach_tasks
+
+    calls: list[dict] = []
+    lock = threading.Lock()
+
+    class _OK:
+        ok = True
+        value = type("V", (), {"subject": "S", "body": "B {{cta_url}}"})()
+        error_reason = None
+
+    def _fake_generate(_client, **kwargs):
+        time.sleep(0.02)
+        with lock:
+            calls.append({"thread": threading.current_thread().name, **kwargs})
+        return _OK()
+
+    with patch("app.services.claude_client_resolver.get_metered_client", return_value=MagicMock()), \
+         patch("app.llm.structured.generate_structured", side_effect=_fake_generate), \
+         patch.object(settings, "OUTREACH_DRAFT_COMMIT_EVERY", 2):
+        summary = outreach_tasks.generate_campaign_drafts(c.id)
+
+    assert summary == {"ok": True, "drafted": 6, "failed": 0}
+    for message in [*messages, stranded]:
+        db.refresh(message)
+        assert message.status == MESSAGE_STATUS_DRAFT
+    # One identical, cache-marked system prefix carrying the brief; the user
+    # turn carries only the recipient.
+    systems = {repr(call["system"]) for call in calls}
+    assert len(systems) == 1
+    (block,) = calls[0]["system"]
+    assert block["cache_control"] == {"type": "ephemeral"}
+    assert c.brief in block["text"]
+    assert all(c.brief not in call["messages"][0]["content"] for call in calls)
+    # The first call warms the cache alone; the rest fan out on the pool.
+    assert not calls[0]["thread"].startswith("outreach-draft")
+    assert all(call["thread"].startswith("outreach-draft") for call in calls[1:])
+
+
+class _FakeDraftBatches:
+    def __init__(self):
+        self.created: list[dict] = []
+
+    def create(self, **kwargs):
+        assert "metering" not in kwargs  # the metered wrapper strips it
+        self.created.append(kwargs)
+        return SimpleNamespace(id=f"msgbatch_outreach_{len(self.created)}")
+
+
+def test_large_campaign_drafts_through_message_batch(db):
+    from app.domains.outreach.draft_batch import apply_draft_batch_results, custom_id_for
+    from app.domains.outreach.draft_pipeline import DraftOutput
+    from app.llm import structured_tool_params
+    from app.models.anthropic_batch_job import AnthropicBatchJob
+    from app.models.role import Role
+    from app.services.metered_anthropic_client import MeteredAnthropicClient
+    from app.tasks import outreach_tasks
+
+    org, user = _org_and_user(db)
+    role = Role(
+        organization_id=org.id,
+        name="Backend",
+        source="manual",
+        job_spec_text="hire",
+        monthly_usd_budget_cents=5000,
+    )
+    db.add(role)
+    db.commit()
+    c = _campaign(db, org.id, user.id, status="generating")
+    c.role_id = role.id
+    db.commit()
+    ok_msg = _msg(db, c, org.id, "batch-ok@example.com", status=MESSAGE_STATUS_PENDING)
+    bad_msg = _msg(db, c, org.id, "batch-bad@example.com", status=MESSAGE_STATUS_PENDING)
+
+    batches = _FakeDraftBatches()
+    client = MeteredAnthropicClient(
+        inner=SimpleNamespace(messages=SimpleNamespace(batches=batches)),
+        organization_id=org.id,
+    )
+    with patch("app.services.claude_client_resolver.get_metered_client", return_value=client), \
+         patch("app.llm.structured.generate_structured") as gen, \
+         patch.object(settings, "OUTREACH_DRAFT_BATCH_MIN_RECIPIENTS", 2):
+        summary = outreach_tasks.generate_campaign_drafts(c.id)
+        # A re-run while the batch is open leaves its rows alone.
+        outreach_tasks.generate_campaign_drafts(c.id)
+
+    assert summary == {"ok": True, "batched": 2, "batch_id": "msgbatch_outreach_1"}
+    gen.assert_not_called()
+    (submitted,) = batches.created
+    assert {r["custom_id"] for r in submitted["requests"]} == {
+        custom_id_for(ok_msg.id),
+        custom_id_for(bad_msg.id),
+    }
+    params = submitted["requests"][0]["params"]
+    assert params["system"][0]["cache_control"] == {"type": "ephemeral", "ttl": "1h"}
+    job = db.query(AnthropicBatchJob).one()
+    assert job.feature == "outreach_draft" and job.status == "submitted"
+    db.refresh(c)
+    assert c.status == "generating"
+
+    _, _, tool_name = structured_tool_params(DraftOutput)
+    block = SimpleNamespace(
+        type="tool_use", name=tool_name, input={"subject": "Hi", "body": "Hello there"}
+    )
+    entries = [
+        SimpleNamespace(
+            custom_id=custom_id_for(ok_msg.id),
+            result=SimpleNamespace(type="succeeded", message=SimpleNamespace(content=[block])),
+        ),
+        SimpleNamespace(
+            custom_id=custom_id_for(bad_msg.id), result=SimpleNamespace(type="expired")
+        ),
+    ]
+    db.expire_all()  # the poll runs on a fresh session
+    applied = apply_draft_batch_results(db, entries, context=job.context)
+    db.commit()
+
+    assert applied == {"drafted": 1, "failed": 1, "skipped": 0}
+    db.refresh(ok_msg)
+    db.refresh(bad_msg)
+    db.refresh(c)
+    assert ok_msg.status == MESSAGE_STATUS_DRAFT
+    assert ok_msg.body.endswith("{{cta_url}}")  # CTA rail applied to batch drafts
+    assert bad_msg.status == MESSAGE_STATUS_FAILED and bad_msg.error == "batch_expired"
+    assert c.status == "ready"
+
+
 # ---------------------------------------------------------------------------
 # Send task
 # ---------------------------------------------------------------------------
 
 
-def _run_send(db, campaign_id, send_result=None):
+def _run_send(db, campaign_id, send_result=None, email_service=None):
     from app.tasks import outreach_tasks
 
-    fake_email = MagicMock()
-    fake_email.send_outreach_email.return_value = send_result or {
-        "success": True,
-        "email_id": "re_out_1",
-    }
+    fake_email = email_service or MagicMock()
+    if email_service is None:
+        fake_email.send_outreach_email.return_value = send_result or {
+            "success": True,
+            "email_id": "re_out_1",
+        }
     with patch(
         "app.components.notifications.email_client.EmailService", return_value=fake_email
-    ), patch.object(outreach_tasks.time, "sleep", return_value=None):
+    ), patch.object(settings, "OUTREACH_SEND_RATE_PER_SECOND", 1000.0), patch.object(
+        settings, "OUTREACH_SEND_BURST", 50
+    ):
         outreach_tasks.send_campaign_messages(campaign_id)
     return fake_email
 
 
+class _LocalEmailProvider:
+    """Stand-in for ``EmailService``: records sends, dedupes idempotency keys
+    like Resend does, and overlaps calls so concurrency is observable."""
+
+    def __init__(self, *, latency: float = 0.02, fail: frozenset[str] = frozenset()):
+        self.latency = latency
+        self.fail = fail
+        self.delivered: list[str] = []
+        self.ids_by_key: dict[str, str] = {}
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self._lock = threading.Lock()
+
+    def send_outreach_email(self, *, to_email, idempotency_key=None, **_kwargs):
+        with self._lock:
+            if idempotency_key in self.ids_by_key:
+                return {"success": True, "email_id": self.ids_by_key[idempotency_key]}
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        time.sleep(self.latency)
+        with self._lock:
+            self.in_flight -= 1
+            if to_email in self.fail:
+                return {"success": False, "error": "mailbox unavailable"}
+            email_id = f"re_local_{len(self.ids_by_key) + 1}"
+            self.ids_by_key[idempotency_key] = email_id
+            self.delivered.append(to_email)
+            return {"success": True, "email_id": email_id}
+
+
 def test_send_only_approved_with_footer_and_headers(db):
     org, user = _org_and_user(db)
     c = _campaign(db, org.id, user.id)
@@ -288,6 +463,93 @@ def test_send_failure_isolated(db):
     assert prospect.status == PROSPECT_STATUS_NEW
 
 
+def test_send_runs_concurrently_reports_throughput_and_resumes_idempotently(db):
+    org, user = _org_and_user(db)
+    c = _campaign(db, org.id, user.id)
+    messages = [
+        _msg(
+            db, c, org.id, f"wave-{index}@example.com",
+            status=MESSAGE_STATUS_QUEUED, body="B {{cta_url}}",
+        )
+        for index in range(12)
+    ]
+    provider = _LocalEmailProvider(fail=frozenset({"wave-3@example.com"}))
+
+    from app.tasks import outreach_tasks
+
+    with patch(
+        "app.components.notifications.email_client.EmailService", return_value=provider
+    ), patch.object(settings, "OUTREACH_SEND_RATE_PER_SECOND", 1000.0), patch.object(
+        settings, "OUTREACH_SEND_BURST", 50
+    ), patch.object(settings, "OUTREACH_SEND_COMMIT_EVERY", 5):
+        summary = outreach_tasks.send_campaign_messages(c.id)
+
+    assert summary["sent"] == 11 and summary["failed"] == 1
+    assert summary["sends_per_second"] > 0
+    assert provider.max_in_flight > 1
+    for message in messages:
+        db.refresh(message)
+    assert {m.status for m in messages} == {MESSAGE_STATUS_SENT, MESSAGE_STATUS_FAILED}
+    assert len({m.resend_email_id for m in messages if m.resend_email_id}) == 11
+
+    # A worker restart before the status commit leaves rows 'queued'; the
+    # redelivered task re-sends them under the same idempotency key, and the
+    # provider does not deliver a second copy.
+    replayed = messages[0]
+    original_id = replayed.resend_email_id
+    replayed.status = MESSAGE_STATUS_QUEUED
+    replayed.resend_email_id = None
+    db.commit()
+    _run_send(db, c.id, email_service=provider)
+    db.refresh(replayed)
+    assert replayed.status == MESSAGE_STATUS_SENT
+    assert replayed.resend_email_id == original_id
+    assert provider.delivered.count(replayed.email) == 1
+
+
+def test_token_bucket_shapes_the_send_rate():
+    import threading
+
+    from app.domains.outreach.campaign_sender import OutreachSend, deliver
+    from app.platform.token_bucket import TokenBucket
+
+    clock = {"t": 100.0}
+    clock_lock = threading.Lock()
+
+    def _sleep(seconds):
+        with clock_lock:
+            clock["t"] += seconds
+
+    sent_at: list[float] = []
+
+    def _send_one(**_kwargs):
+        with clock_lock:
+            sent_at.append(clock["t"] - 100.0)
+        return {"success": True}
+
+    sends = [
+        OutreachSend(message_id=index, email_kwargs={"to_email": f"r{index}@x.test"})
+        for index in range(6)
+    ]
+    results = list(
+        deliver(
+            sends,
+            send_one=_send_one,
+            rate_per_second=20.0,
+            burst=2,
+            concurrency=4,
+            bucket=TokenBucket(20.0, 2, monotonic=lambda: clock["t"], sleep=_sleep),
+        )
+    )
+    # Two tokens up front, then one every 0.05s: by time t no more than
+    # 2 + 20t sends have gone out, so the sixth waits at least 0.2s.
+    for index, at in enumerate(sorted(sent_at)):
+        assert at >= (index - 1) / 20.0 - 1e-9
+    assert sorted(sent_at)[:2] == [0.0, 0.0]
+    assert sorted(send.message_id for send, _ in results) == list(range(6))
+    assert all(result["success"] for _, result in results)
+
+
 def test_email_client_sets_list_unsubscribe_header_and_reply_to():
     """The EmailService.send_outreach_email wire layer: List-Unsubscribe header
     (URL form) + List-Unsubscribe-Post + reply_to are present on the Resend
@@ -296,7 +558,7 @@ def test_email_client_sets_list_unsubscribe_header_and_reply_to():
 
     captured = {}
 
-    def _fake_send(payload, *, recipient):
+    def _fake_send(payload, *, recipient, idempotency_key=None):
         captured["payload"] = payload
         return {"id": "re_hdr_1"}
 
@@ -0,0 +1,266 @@
+"""Single-pass PDF extraction plus the cached / pooled front end.
+
+PDFs are built in-test (one Helvetica text object per fragment at explicit
+coordinates) so the fixtures need no PDF-writing dependency.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+import zlib
+
+import pypdf
+import pytest
+
+from app.platform.config import settings
+from app.services import pdf_extraction
+from app.services import pdf_text
+
+
+def _pdf(fragments: list[tuple[float, float, str]]) -> bytes:
+    stream = "\n".join(
+        f"BT /F1 10 Tf 1 0 0 1 {x:.1f} {y:.1f} Tm ({text}) Tj ET" for x, y, text in fragments
+    ).encode("latin-1")
+    objects = [
+        b"<< /Type /Catalog /Pages 2 0 R >>",
+        b"<< /Type /Pages /Kids [3 0 R] /Count 1 >>",
+        b"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 540 792] "
+        b"/Resources << /Font << /F1 4 0 R >> >> /Contents 5 0 R >>",
+        b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>",
+        b"<< /Length %d >>\nstream\n" % len(stream) + stream + b"\nendstream",
+    ]
+    out = bytearray(b"%PDF-1.4\n")
+    offsets = []
+    for number, body in enumerate(objects, start=1):
+        offsets.append(len(out))
+        out += b"%d 0 obj\n" % number + body + b"\nendobj\n"
+    xref = len(out)
+    out += b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1)
+    out += b"".join(b"%010d 00000 n \n" % offset for offset in offsets)
+    out += b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (len(objects) + 1, xref)
+    return bytes(out)
+
+
+def _single_column_pdf() -> bytes:
+    return _pdf(
+        [
+            (40.0, 740.0, "Ada Lovelace"),
+            (40.0, 720.0, "Senior analytical engine programmer with a long record of shipped work."),
+            (40.0, 700.0, "EXPERIENCE"),
+            (40.0, 680.0, "Wrote the first published algorithm for a computing machine."),
+        ]
+    )
+
+
+def _two_column_pdf() -> bytes:
+    fragments = [(300.0, 760.0, "Grace Hopper")]
+    y = 730.0
+    while y > 150.0:
+        fragments.append((20.0, y, "Skill"))
+        # Offset so no visual line holds both columns (pypdf reports a
+        # same-line continuation without its own text matrix).
+        fragments.append((300.0, y - 12.0, "Compiler work"))
+        y -= 24.0
+    return _pdf(fragments)
+
+
+@pytest.fixture(autouse=True)
+def _fresh_cache(monkeypatch):
+    monkeypatch.setattr(settings, "PDF_TEXT_CACHE_TTL", 0)
+    monkeypatch.setattr(settings, "PDF_EXTRACT_WORKERS", 0)
+    pdf_extraction.reset_pdf_text_cache()
+    yield
+    pdf_extraction.reset_pdf_text_cache()
+    if pdf_extraction._pool is not None:
+        pdf_extraction._pool.close()
+        pdf_extraction._pool = None
+
+
+def test_document_is_parsed_once_for_all_layouts(monkeypatch):
+    opened = []
+    real_reader = pypdf.PdfReader
+
+    def counting_reader(*args, **kwargs):
+        opened.append(1)
+        return real_reader(*args, **kwargs)
+
+    monkeypatch.setattr(pypdf, "PdfReader", counting_reader)
+
+    text = pdf_text.extract_text_from_pdf(_single_column_pdf())
+
+    assert opened == [1]
+    assert text.startswith("Ada Lovelace")
+    assert "EXPERIENCE" in text
+
+
+def test_columnar_layout_reads_header_column_first():
+    text = pdf_text.extract_text_from_pdf(_two_column_pdf())
+    lines = text.splitlines()
+
+    assert lines[0] == "Grace Hopper"
+    # The main column is read through before the sidebar starts.
+    assert lines.index("Skill") > max(i for i, line in enumerate(lines) if line == "Compiler work")
+
+
+def test_repeat_extraction_is_served_from_content_cache(monkeypatch):
+    calls = []
+    real = pdf_extraction.extract_text_from_pdf
+    monkeypatch.setattr(
+        pdf_extraction,
+        "extract_text_from_pdf",
+        lambda content: calls.append(len(content)) or real(content),
+    )
+    content = _single_column_pdf()
+
+    first = pdf_extraction.extract_pdf_text(content)
+    second = pdf_extraction.extract_pdf_text(bytes(content))
+
+    assert first == second != ""
+    assert len(calls) == 1
+
+
+def test_shared_cache_round_trips_compressed_text(monkeypatch):
+    class _FakeRedis:
+        def __init__(self):
+            self.store = {}
+
+        def get(self, key):
+            return self.store.get(key)
+
+        def setex(self, key, ttl, value):
+            self.store[key] = value
+
+    fake = _FakeRedis()
+    monkeypatch.setattr(settings, "PDF_TEXT_CACHE_TTL", 3600)
+    monkeypatch.setattr(pdf_extraction, "_redis", lambda: fake)
+    content = _single_column_pdf()
+    text = pdf_extraction.extract_pdf_text(content)
+
+    (key, payload), = fake.store.items()
+    assert key == "pdf_text:v1:" + pdf_extraction.pdf_content_digest(content)
+    assert zlib.decompress(payload).decode() == text
+
+    # Another process (empty LRU) is served from Redis without parsing.
+    pdf_extraction._memory_cache.clear()
+    monkeypatch.setattr(pdf_extraction, "extract_text_from_pdf", lambda _c: pytest.fail("re-parsed"))
+    assert pdf_extraction.extract_pdf_text(content) == text
+
+
+def test_process_pool_matches_inline_extraction(monkeypatch):
+    content = _two_column_pdf()
+    inline = pdf_text.extract_text_from_pdf(content)
+    monkeypatch.setattr(settings, "PDF_EXTRACT_WORKERS", 1)
+
+    assert pdf_extraction.extract_pdf_text(content) == inline
+    assert pdf_extraction._pool is not None
+
+
+def test_visitor_failure_keeps_default_text(monkeypatch):
+    real_reader = pypdf.PdfReader
+
+    class _FailingVisitorPage:
+        def __init__(self, page):
+            self._page = page
+            self.mediabox = page.mediabox
+
+        def extract_text(self, visitor_text=None):
+            if visitor_text is not None:
+                raise KeyError("broken font dictionary")
+            return self._page.extract_text()
+
+    class _Reader:
+        def __init__(self, *args, **kwargs):
+            self.pages = [_FailingVisitorPage(page) for page in real_reader(*args, **kwargs).pages]
+
+    monkeypatch.setattr(pypdf, "PdfReader", _Reader)
+
+    text = pdf_text.extract_text_from_pdf(_single_column_pdf())
+
+    assert "Ada Lovelace" in text
+    assert "EXPERIENCE" in text
+
+
+class _Worker:
+    """In-process stand-in for a spawned worker."""
+
+    killed: list["_Worker"] = []
+
+    def __init__(self, hang_on: bytes | None = None):
+        self.hang_on = hang_on
+
+    def extract(self, content, timeout):
+        if content == self.hang_on:
+            time.sleep(timeout)
+            raise pdf_extraction._WorkerGone(f"parse exceeded {timeout:.0f}s")
+        time.sleep(0.05)
+        return content.decode()
+
+    def kill(self):
+        _Worker.killed.append(self)
+
+
+def test_hung_parse_kills_only_its_worker_and_is_not_cached(monkeypatch):
+    _Worker.killed = []
+    started = []
+
+    def new_worker():
+        started.append(1)
+        return _Worker(hang_on=b"%PDF-stuck")
+
+    monkeypatch.setattr(pdf_extraction, "_ExtractionWorker", new_worker)
+    monkeypatch.setattr(settings, "PDF_EXTRACT_WORKERS", 2)
+    monkeypatch.setattr(settings, "PDF_EXTRACT_TIMEOUT_SECONDS", 0.3)
+
+    results: dict[bytes, str] = {}
+
+    def run(content):
+        results[content] = pdf_extraction.extract_pdf_text(content)
+
+    threads = [threading.Thread(target=run, args=(c,)) for c in (b"%PDF-stuck", b"one", b"two", b"three")]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    # Healthy files queued behind the hung one still get their text.
+    assert results == {b"%PDF-stuck": "", b"one": "one", b"two": "two", b"three": "three"}
+    assert len(_Worker.killed) == 1
+    assert pdf_extraction._memory_get(pdf_extraction.pdf_content_digest(b"%PDF-stuck")) is None
+    # The killed worker is replaced on the next checkout.
+    assert pdf_extraction.extract_pdf_text(b"four") == "four"
+    assert len(started) <= 3
+
+
+def test_queue_wait_does_not_count_toward_the_parse_timeout(monkeypatch):
+    monkeypatch.setattr(pdf_extraction, "_ExtractionWorker", _Worker)
+    monkeypatch.setattr(settings, "PDF_EXTRACT_WORKERS", 1)
+    # Each parse takes 0.05s; eight callers on one worker wait far longer.
+    monkeypatch.setattr(settings, "PDF_EXTRACT_TIMEOUT_SECONDS", 0.2)
+    contents = [f"doc-{index}".encode() for index in range(8)]
+    results: list[str] = []
+    threads = [
+        threading.Thread(target=lambda c=c: results.append(pdf_extraction.extract_pdf_text(c)))
+        for c in contents
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert sorted(results) == sorted(c.decode() for c in contents)
+
+
+def test_spawned_worker_is_killed_on_timeout(monkeypatch):
+    monkeypatch.setattr(settings, "PDF_EXTRACT_WORKERS", 1)
+    pool = pdf_extraction._extraction_pool()
+    worker = pool._checkout()
+    try:
+        # A worker busy with a previous message cannot answer in time.
+        worker._conn.send(_two_column_pdf())
+        with pytest.raises(pdf_extraction._WorkerGone):
+            worker.extract(_single_column_pdf(), 0.0)
+    finally:
+        worker.kill()
+        pool._release(None)
+    assert not worker._process.is_alive()
@@ -0,0 +1,150 @@
+"""Pure ASGI middleware behaviour on a minimal app (no DB, no routers).
+
+Pins what the BaseHTTPMiddleware versions guaranteed: headers land on
+streaming responses too, the SSO check reads the login body without
+consuming it for the endpoint, and 429s keep the candidate cache policy.
+"""
+
+from __future__ import annotations
+
+import pytest
+from fastapi.testclient import TestClient
+from starlette.applications import Starlette
+from starlette.requests import Request
+from starlette.responses import JSONResponse, StreamingResponse
+from starlette.routing import Route
+
+from app.platform import middleware as mw
+from app.services import rate_limit
+
+
+@pytest.fixture(autouse=True)
+def _memory_limiter(monkeypatch):
+    monkeypatch.setattr(rate_limit, "_get_redis", lambda: None)
+    rate_limit.reset_memory_buckets()
+    yield
+    rate_limit.reset_memory_buckets()
+
+
+async def _stream(_request: Request):
+    async def chunks():
+        yield b"one,"
+        yield b"two"
+
+    return StreamingResponse(chunks(), media_type="text/plain")
+
+
+async def _echo(request: Request):
+    return JSONResponse({"body": (await request.body()).decode(), "request_id": request.state.request_id})
+
+
+def _client() -> TestClient:
+    app = Starlette(
+        routes=[
+            Route("/stream", _stream),
+            Route("/api/v1/auth/forgot-password", _echo, methods=["POST"]),
+            Route("/api/v1/assessments/token/{token}/start", _echo, methods=["POST"]),
+        ]
+    )
+    app.add_middleware(mw.SecurityHeadersMiddleware, production=True)
+    app.add_middleware(mw.RateLimitMiddleware)
+    app.add_middleware(mw.EnterpriseAccessMiddleware)
+    app.add_middleware(mw.RequestLoggingMiddleware)
+    return TestClient(app)
+
+
+def test_streaming_response_gets_headers_and_full_body():
+    response = _client().get("/stream", headers={"X-Request-ID": "req-123"})
+
+    assert response.text == "one,two"
+    assert response.headers["X-Request-ID"] == "req-123"
+    assert float(response.headers["X-Process-Time-Ms"]) >= 0
+    assert response.headers["X-Frame-Options"] == "DENY"
+    assert response.headers["Strict-Transport-Security"].startswith("max-age=")
+
+
+def test_sso_check_replays_body_to_the_endpoint(monkeypatch):
+    seen: list[str] = []
+    monkeypatch.setattr(mw, "_sso_denial_reason", lambda email: seen.append(email))
+
+    response = _client().post(
+        "/api/v1/auth/forgot-password",
+        content=b'{"email": " Person@Example.com "}',
+        headers={"X-Request-ID": "req-sso", "Content-Type": "application/json"},
+    )
+
+    assert response.status_code == 200
+    assert response.json() == {"body": '{"email": " Person@Example.com "}', "request_id": "req-sso"}
+    assert seen == ["person@example.com"]
+
+
+def test_sso_denial_short_circuits_with_403(monkeypatch):
+    monkeypatch.setattr(mw, "_sso_denial_reason", lambda _email: "Use SSO")
+
+    response = _client().post("/api/v1/auth/forgot-password", json={"email": "a@b.co"})
+
+    assert response.status_code == 403
+    assert response.json() == {"detail": "Use SSO"}
+
+
+def test_rate_limited_candidate_path_keeps_candidate_policy():
+    client = _client()
+    statuses = [
+        client.post("/api/v1/assessments/token/tok/start").status_code
+        for _ in range(16)
+    ]
+
+    assert statuses[:15] == [200] * 15
+    assert statuses[15] == 429
+    limited = client.post("/api/v1/assessments/token/tok/start")
+    assert limited.headers["Cache-Control"].startswith("private, no-store")
+    assert limited.headers["X-Request-ID"]
+
+
+def test_request_metrics_use_route_templates_and_settle_in_flight(monkeypatch):
+    from fastapi import FastAPI
+
+    from app.platform import metrics
+
+    monkeypatch.setattr(metrics, "_redis", lambda: None)
+    metrics.registry.reset()
+    api = FastAPI()
+    in_flight_seen: list[float] = []
+
+    @api.get("/roles/{role_id}")
+    def _role(role_id: int):
+        in_flight_seen.append(mw.http_requests_in_flight.value(method="GET"))
+        return {"id": role_id}
+
+    @api.get("/boom")
+    def _boom():
+        raise RuntimeError("boom")
+
+    api.mount("/static", Starlette(routes=[Route("/{name}", _echo)]))
+    api.add_middleware(mw.RequestLoggingMiddleware)
+    client = TestClient(api, raise_server_exceptions=False)
+
+    assert client.get("/roles/12").status_code == 200
+    assert client.get("/roles/13").status_code == 200
+    assert client.get("/roles/nope").status_code == 422
+    assert client.get("/nothing-here").status_code == 404
+    assert client.get("/boom").status_code == 500
+    assert client.get("/static/app.js").status_code == 200
+
+    duration = mw.http_request_duration_seconds
+    assert duration.count(method="GET", route="/roles/{role_id}", status_class="2xx") == 2
+    assert duration.count(method="GET", route="/roles/{role_id}", status_class="4xx") == 1
+    assert duration.count(method="GET", route="<unmatched>", status_class="4xx") == 1
+    assert duration.count(method="GET", route="/boom", status_class="5xx") == 1
+    assert duration.count(method="GET", route="/static", status_class="2xx") == 1
+    assert in_flight_seen == [1.0, 1.0]
+    assert mw.http_requests_in_flight.value(method="GET") == 0
+
+    text = metrics.registry.render()
+    assert (
+        'taali_http_request_duration_seconds_count{method="GET",route="/roles/{role_id}",status_class="2xx"} 2'
+        in text
+    )
+    assert 'taali_http_request_duration_seconds_quantile{method="GET",route="/roles/{role_id}",status_class="2xx",quantile="0.99"}' in text
+    assert "/roles/12" not in text
+    metrics.registry.reset()
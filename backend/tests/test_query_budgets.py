@@ -0,0 +1,63 @@
+"""SQL query budgets for the hot recruiter read endpoints.
+
+Each budget is a little above today's count and, more importantly, must not
+grow with the roster: the second roster is three times larger and every
+fingerprint may repeat at most twice (``query_budget``'s N+1 guard).
+"""
+
+import io
+
+import pytest
+
+from tests.conftest import auth_headers
+
+# path template -> max statements per request (auth lookups included)
+_BUDGETS = {
+    "/api/v1/roles/{role_id}/applications": 12,
+    "/api/v1/roles/{role_id}/pipeline": 15,
+    "/api/v1/roles": 10,
+    "/api/v1/roles/{role_id}": 20,
+    "/api/v1/applications/{first_id}": 8,
+    "/api/v1/applications/cv-text?ids={ids}": 5,
+}
+
+
+def _add_applications(client, headers, role_id: int, ids: list[int], total: int) -> None:
+    while len(ids) < total:
+        response = client.post(
+            f"/api/v1/roles/{role_id}/applications",
+            json={
+                "candidate_email": f"budget-{len(ids)}@example.com",
+                "candidate_name": f"Budget {len(ids)}",
+            },
+            headers=headers,
+        )
+        assert response.status_code in (200, 201), response.text
+        ids.append(response.json()["id"])
+
+
+@pytest.mark.parametrize("template", sorted(_BUDGETS))
+def test_read_endpoint_stays_within_query_budget(client, query_budget, template):
+    headers, _ = auth_headers(client)
+    role = client.post("/api/v1/roles", json={"name": "Budget role"}, headers=headers).json()
+    job_spec = {"file": ("job-spec.txt", io.BytesIO(b"Python backend role"), "text/plain")}
+    assert (
+        client.post(
+            f"/api/v1/roles/{role['id']}/upload-job-spec", files=job_spec, headers=headers
+        ).status_code
+        == 200
+    )
+
+    ids: list[int] = []
+    counts = []
+    for roster_size in (3, 9):
+        _add_applications(client, headers, role["id"], ids, roster_size)
+        path = template.format(
+            role_id=role["id"], first_id=ids[0], ids=",".join(map(str, ids))
+        )
+        with query_budget(_BUDGETS[template], max_repeats=2) as profile:
+            response = client.get(path, headers=headers)
+        assert response.status_code == 200, response.text
+        counts.append(profile.query_count)
+
+    assert counts[0] == counts[1], f"query count grows with the roster: {counts}"
@@ -31,6 +31,50 @@ def test_zero_limit_blocks():
     assert rate_limit.check_rate_limit("x", limit=0, window_seconds=60) is False
 
 
+def test_multi_bucket_consume_is_all_or_nothing():
+    buckets = [("key:a", 5), ("ip:1", 2)]
+    assert rate_limit.consume_rate_limits(buckets, window_seconds=60) is None
+    assert rate_limit.consume_rate_limits(buckets, window_seconds=60) is None
+    # The IP guard is full, so the key bucket is not charged for the denial.
+    assert rate_limit.consume_rate_limits(buckets, window_seconds=60) == "ip:1"
+    assert rate_limit.consume_rate_limits([("key:a", 3)], window_seconds=60) is None
+    assert rate_limit.consume_rate_limits([("key:a", 3)], window_seconds=60) == "key:a"
+
+
+def test_multi_bucket_skips_disabled_buckets():
+    for _ in range(5):
+        assert rate_limit.consume_rate_limits([("off", 0)], window_seconds=60) is None
+
+
+def test_sliding_counter_weights_previous_window(monkeypatch):
+    wall = {"now": 6000.0}  # start of a 60s window
+    monkeypatch.setattr(rate_limit.time, "time", lambda: wall["now"])
+    for _ in range(4):
+        assert rate_limit.consume_rate_limits([("k", 4)], window_seconds=60) is None
+    assert rate_limit.consume_rate_limits([("k", 4)], window_seconds=60) == "k"
+
+    # 15s into the next window 75% of the previous count still applies (3),
+    # so only one more request fits; a fixed window would allow four.
+    wall["now"] += 75
+    assert rate_limit.consume_rate_limits([("k", 4)], window_seconds=60) is None
+    assert rate_limit.consume_rate_limits([("k", 4)], window_seconds=60) == "k"
+
+    # Two windows later the old counts are gone entirely.
+    wall["now"] += 120
+    assert rate_limit.consume_rate_limits([("k", 4)], window_seconds=60) is None
+
+
+def test_idle_sliding_buckets_are_evicted(monkeypatch):
+    wall = {"now": 6000.0}
+    monkeypatch.setattr(rate_limit.time, "time", lambda: wall["now"])
+    monkeypatch.setattr(rate_limit, "_MEMORY_MAX_KEYS", 3)
+    for index in range(4):
+        rate_limit.consume_rate_limits([(f"idle:{index}", 5)], window_seconds=60)
+    wall["now"] += 180
+    rate_limit.consume_rate_limits([("fresh", 5)], window_seconds=60)
+    assert set(rate_limit._sliding_buckets) == {"fresh"}
+
+
 class _FakeClock:
     def __init__(self, start: float = 1000.0):
         self.now = start
@@ -100,3 +144,43 @@ def test_no_redis_url_is_never_a_permanent_latch(monkeypatch):
     assert rate_limit._get_redis() is None
 
     rate_limit.reset_redis_state()
+
+
+def test_redis_sliding_window_checks_and_counts_in_one_script_call(monkeypatch):
+    """Check and increment run as one atomic script, not MGET then INCR."""
+    monkeypatch.setattr(rate_limit.time, "time", lambda: 6015.0)  # 25% into a 60s window
+    calls: list[tuple[list[str], list]] = []
+
+    class _Script:
+        def __init__(self, client):
+            self.registered_client = client
+
+        def __call__(self, *, keys, args):
+            calls.append((list(keys), list(args)))
+            return 2 if len(keys) == 4 else 0
+
+    class _Client:
+        def register_script(self, source):
+            assert "INCR" in source and "GET" in source
+            return _Script(self)
+
+    monkeypatch.setattr(rate_limit, "_sliding_script", None)
+    client = _Client()
+    denied = rate_limit._consume_redis(client, [("key:a", 5), ("ip:1", 2)], 60)
+
+    assert denied == "ip:1"
+    assert calls == [
+        (
+            [
+                "ratelimit:sw:key:a:100",
+                "ratelimit:sw:key:a:99",
+                "ratelimit:sw:ip:1:100",
+                "ratelimit:sw:ip:1:99",
+            ],
+            ["0.25", 120, 5, 2],
+        )
+    ]
+    # The registered script is reused for the same client.
+    assert rate_limit._consume_redis(client, [("key:a", 5)], 60) is None
+    assert rate_limit._sliding_script.registered_client is client
+    assert len(calls) == 2
@@ -0,0 +1,48 @@
+"""Shared pooled Redis client for best-effort caches (platform/redis_cache)."""
+
+from __future__ import annotations
+
+import pytest
+
+from app.platform import redis_cache
+from app.platform.config import settings
+
+
+@pytest.fixture(autouse=True)
+def _fresh_client():
+    redis_cache.reset_cache_redis()
+    yield
+    redis_cache.reset_cache_redis()
+
+
+def test_client_is_shared_and_pooled(monkeypatch):
+    monkeypatch.setattr(settings, "REDIS_URL", "redis://localhost:6399/0")
+
+    first = redis_cache.cache_redis()
+
+    assert first is redis_cache.cache_redis()
+    assert first.connection_pool.max_connections == redis_cache._MAX_CONNECTIONS
+
+
+def test_unconfigured_or_failed_redis_is_skipped(monkeypatch):
+    monkeypatch.setattr(settings, "REDIS_URL", "")
+    assert redis_cache.cache_redis() is None
+
+    monkeypatch.setattr(settings, "REDIS_URL", "redis://localhost:6399/0")
+    redis_cache.mark_cache_redis_failed()
+    assert redis_cache.cache_redis() is None
+
+    redis_cache.reset_cache_redis()
+    assert redis_cache.cache_redis() is not None
+
+
+def test_forked_child_builds_its_own_client(monkeypatch):
+    monkeypatch.setattr(settings, "REDIS_URL", "redis://localhost:6399/0")
+    parent = redis_cache.cache_redis()
+    disconnected = []
+    monkeypatch.setattr(parent.connection_pool, "disconnect", lambda: disconnected.append(True))
+
+    redis_cache._forget_in_child()
+
+    assert redis_cache.cache_redis() is not parent
+    assert disconnected == []  # the parent's sockets are left alone
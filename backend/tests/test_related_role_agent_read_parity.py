@@ -472,6 +472,66 @@ def test_mcp_role_summaries_count_explicit_related_membership_and_local_stages(d
     }
 
 
+def test_mcp_list_roles_stage_counts_match_per_role_reads_in_one_query(db):
+    from sqlalchemy import event
+
+    from app.mcp.handlers import get_role, list_roles
+
+    organization, _related, user, _member, _second_member, outsider = _world(db)
+    outsider.application_outcome = "open"
+    outsider.pipeline_stage = "applied"
+    extra_roles = [
+        Role(organization_id=int(organization.id), name=f"Empty role {index}")
+        for index in range(4)
+    ]
+    db.add_all(extra_roles)
+    db.commit()
+
+    statements: list[str] = []
+
+    def _count(_conn, _cursor, statement, *_args):
+        statements.append(statement)
+
+    engine = db.get_bind()
+    event.listen(engine, "before_cursor_execute", _count)
+    try:
+        listed = list_roles(db, user, include_stage_counts=True)
+    finally:
+        event.remove(engine, "before_cursor_execute", _count)
+
+    assert len(listed) == 6
+    for row in listed:
+        assert row["stage_counts"] == get_role(db, user, role_id=row["role_id"])["stage_counts"]
+    assert sum(row["stage_counts"]["applied"] for row in listed) == 1
+    # Stage counts cost one grouped query, however many roles the org has.
+    assert sum("GROUP BY" in statement for statement in statements) == 2
+
+
+def test_mcp_list_roles_stage_counts_memo_is_per_org_and_role_set(db):
+    from app.mcp.handlers import list_roles, reset_stage_counts_memo
+
+    organization, related, user, member, _second_member, _outsider = _world(db)
+    reset_stage_counts_memo()
+
+    def _related_review(**kwargs):
+        rows = list_roles(db, user, include_stage_counts=True, **kwargs)
+        return next(r for r in rows if r["role_id"] == related.id)["stage_counts"]["review"]
+
+    assert _related_review(memoize_stage_counts=True) == 1
+    db.query(SisterRoleEvaluation).filter(
+        SisterRoleEvaluation.source_application_id == member.id
+    ).update({"pipeline_stage": "advanced"})
+    db.commit()
+
+    assert _related_review(memoize_stage_counts=True) == 1
+    assert _related_review() == 0
+    # A new role changes the role set and bypasses the memo.
+    db.add(Role(organization_id=int(organization.id), name="Fresh role"))
+    db.commit()
+    assert _related_review(memoize_stage_counts=True) == 0
+    reset_stage_counts_memo()
+
+
 def test_autonomous_cohort_reads_use_related_membership_and_local_state(db):
     organization, related, _user, member, _second_member, _outsider = _world(db)
     run = _agent_run(
@@ -0,0 +1,151 @@
+from __future__ import annotations
+
+from app.domains.assessments_runtime.application_text_search import (
+    parse_application_text_search,
+)
+from app.models.candidate import Candidate
+from app.models.candidate_application import CandidateApplication
+from app.models.organization import Organization
+from app.models.role import Role
+from app.models.user import User
+from tests.conftest import auth_headers
+
+
+def _application(db, *, organization_id: int, role_id: int, name: str, email: str, position: str | None = None):
+    candidate = Candidate(
+        organization_id=organization_id,
+        email=email,
+        full_name=name,
+        position=position,
+    )
+    db.add(candidate)
+    db.flush()
+    application = CandidateApplication(
+        organization_id=organization_id,
+        candidate_id=candidate.id,
+        role_id=role_id,
+        source="manual",
+        pipeline_stage="applied",
+        pipeline_stage_source="recruiter",
+        application_outcome="open",
+    )
+    db.add(application)
+    db.flush()
+    return application
+
+
+def _seed_role(client, db):
+    headers, email = auth_headers(client)
+    user = db.query(User).filter(User.email == email).one()
+    role = Role(organization_id=user.organization_id, name="Search pipeline role", source="manual")
+    db.add(role)
+    db.flush()
+    return headers, user, role
+
+
+def _names(response) -> list[str]:
+    assert response.status_code == 200, response.text
+    return [item["candidate_name"] for item in response.json()["items"]]
+
+
+def test_parse_search_normalizes_whitespace_and_escapes_like_wildcards():
+    assert parse_application_text_search("   ") is None
+    search = parse_application_text_search("  Ada   LOVE_lace% ")
+    assert search.term == "ada love_lace%"
+    assert search.match_patterns == ("%ada love\\_lace\\%%",)
+    short = parse_application_text_search("ad")
+    assert short.prefix_only is True
+    assert short.match_patterns == ("ad%", "% ad%", "%.ad%", "%\\_ad%", "%-ad%")
+
+
+def test_pipeline_search_ranks_exact_then_prefix_then_contains(client, db):
+    headers, user, role = _seed_role(client, db)
+    org_id = int(user.organization_id)
+    _application(db, organization_id=org_id, role_id=role.id, name="Grace Lin", email="grace@example.com", position="Linguist")
+    _application(db, organization_id=org_id, role_id=role.id, name="Linus Moore", email="moore@example.com")
+    _application(db, organization_id=org_id, role_id=role.id, name="Lin", email="exact@example.com")
+    _application(db, organization_id=org_id, role_id=role.id, name="Bob Stone", email="stone@example.com")
+    db.commit()
+
+    names = _names(
+        client.get(f"/api/v1/roles/{role.id}/pipeline", params={"search": "LIN"}, headers=headers)
+    )
+
+    assert names == ["Lin", "Linus Moore", "Grace Lin"]
+
+
+def test_pipeline_search_matches_short_terms_at_word_starts(client, db):
+    headers, user, role = _seed_role(client, db)
+    org_id = int(user.organization_id)
+    _application(db, organization_id=org_id, role_id=role.id, name="Li Wei", email="wei@example.com")
+    _application(db, organization_id=org_id, role_id=role.id, name="Grace Li", email="grace@example.com")
+    _application(db, organization_id=org_id, role_id=role.id, name="Jenny Wu", email="jenny.li@example.com")
+    _application(db, organization_id=org_id, role_id=role.id, name="Amelia Stone", email="amelia@example.com")
+    db.commit()
+
+    names = _names(
+        client.get(f"/api/v1/roles/{role.id}/pipeline", params={"search": "li"}, headers=headers)
+    )
+
+    # Word starts only: "Amelia" contains "li" but no word starts with it.
+    assert names[0] == "Li Wei"
+    assert sorted(names) == ["Grace Li", "Jenny Wu", "Li Wei"]
+
+
+def test_explicit_sort_by_wins_over_search_rank(client, db):
+    headers, user, role = _seed_role(client, db)
+    org_id = int(user.organization_id)
+    exact = _application(db, organization_id=org_id, role_id=role.id, name="Lin", email="exact@example.com")
+    contains = _application(db, organization_id=org_id, role_id=role.id, name="Grace Lin", email="grace@example.com")
+    exact.pre_screen_score_100 = 40.0
+    contains.pre_screen_score_100 = 90.0
+    db.commit()
+
+    url = f"/api/v1/roles/{role.id}/pipeline"
+    assert _names(client.get(url, params={"search": "lin"}, headers=headers)) == ["Lin", "Grace Lin"]
+    assert _names(
+        client.get(url, params={"search": "lin", "sort_by": "pre_screen_score"}, headers=headers)
+    ) == ["Grace Lin", "Lin"]
+
+
+def test_pipeline_search_treats_wildcards_literally_and_stays_in_org(client, db):
+    headers, user, role = _seed_role(client, db)
+    org_id = int(user.organization_id)
+    _application(db, organization_id=org_id, role_id=role.id, name="Percent 100% Fit", email="pct@example.com")
+    _application(db, organization_id=org_id, role_id=role.id, name="Percent 1000 Fit", email="plain@example.com")
+    other_org = Organization(name="Other search org", slug=f"other-search-{role.id}")
+    db.add(other_org)
+    db.flush()
+    # A same-named candidate of another org, attached to this role's roster,
+    # must still be excluded by the semi-join's organization filter.
+    other_candidate = Candidate(organization_id=other_org.id, email="pct@example.com", full_name="Percent 100% Fit")
+    db.add(other_candidate)
+    db.flush()
+    db.add(
+        CandidateApplication(
+            organization_id=org_id,
+            candidate_id=other_candidate.id,
+            role_id=role.id,
+            source="manual",
+            pipeline_stage="applied",
+            pipeline_stage_source="recruiter",
+            application_outcome="open",
+        )
+    )
+    db.commit()
+
+    response = client.get(
+        f"/api/v1/roles/{role.id}/pipeline",
+        params={"search": "100%"},
+        headers=headers,
+    )
+
+    assert _names(response) == ["Percent 100% Fit"]
+    assert response.json()["stage_counts"]["all"] == 1
+    matching = set(
+        db.scalars(
+            parse_application_text_search("100%").matching_candidate_ids(organization_id=org_id)
+        )
+    )
+    assert other_candidate.id not in matching
+    assert len(matching) == 1
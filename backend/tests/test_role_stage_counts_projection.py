@@ -0,0 +1,188 @@
+from __future__ import annotations
+
+from datetime import datetime, timezone
+
+from sqlalchemy import select, update
+
+from app.domains.assessments_runtime import role_stage_count_projection
+from app.candidate_search.role_scope import resolve_candidate_role_scope
+from app.domains.assessments_runtime.role_stage_count_projection import (
+    projected_stage_counts,
+    reconcile_role_stage_counts,
+)
+from app.models.candidate import Candidate
+from app.models.candidate_application import CandidateApplication
+from app.models.role import Role
+from app.models.role_stage_count import RoleStageCount
+from app.models.user import User
+from tests.conftest import auth_headers
+
+
+def _application(db, *, organization_id: int, role_id: int, suffix: str, stage: str = "applied", source: str = "manual"):
+    candidate = Candidate(
+        organization_id=organization_id,
+        email=f"stage-counts-{suffix}@example.com",
+        full_name=f"Stage Counts {suffix}",
+    )
+    db.add(candidate)
+    db.flush()
+    application = CandidateApplication(
+        organization_id=organization_id,
+        candidate_id=candidate.id,
+        role_id=role_id,
+        source=source,
+        pipeline_stage=stage,
+        pipeline_stage_source="recruiter",
+        application_outcome="open",
+    )
+    db.add(application)
+    db.flush()
+    return application
+
+
+def _seed(client, db):
+    headers, email = auth_headers(client)
+    user = db.query(User).filter(User.email == email).one()
+    role = Role(organization_id=user.organization_id, name="Stage count role", source="manual")
+    db.add(role)
+    db.flush()
+    org_id = int(user.organization_id)
+    apps = [
+        _application(db, organization_id=org_id, role_id=role.id, suffix=f"{role.id}-a"),
+        _application(db, organization_id=org_id, role_id=role.id, suffix=f"{role.id}-b", stage="invited"),
+        _application(db, organization_id=org_id, role_id=role.id, suffix=f"{role.id}-c", stage="review", source="workable"),
+    ]
+    db.commit()
+    return headers, role, apps
+
+
+def _stage_counts(client, headers, role_id: int, **params) -> dict:
+    response = client.get(f"/api/v1/roles/{role_id}/pipeline", params=params, headers=headers)
+    assert response.status_code == 200, response.text
+    return response.json()["stage_counts"]
+
+
+def _projection(db, role_id: int) -> RoleStageCount | None:
+    db.expire_all()
+    return db.get(RoleStageCount, role_id)
+
+
+def test_pipeline_serves_fresh_projection_without_live_aggregate(client, db, monkeypatch):
+    headers, role, _apps = _seed(client, db)
+    row = _projection(db, role.id)
+    # Inserting the applications already marked the role stale.
+    assert row is not None and row.stale is True
+
+    first = _stage_counts(client, headers, role.id)
+    assert first == {"all": 3, "applied": 1, "invited": 1, "in_assessment": 0, "review": 1}
+    row = _projection(db, role.id)
+    assert row.stale is False and row.total == 3
+
+    def _fail(*_args, **_kwargs):
+        raise AssertionError("fresh projection must not rerun the live aggregate")
+
+    monkeypatch.setattr(role_stage_count_projection, "live_stage_counts", _fail)
+    assert _stage_counts(client, headers, role.id) == first
+
+
+def test_stage_and_outcome_writes_invalidate_after_commit(client, db):
+    headers, role, apps = _seed(client, db)
+    _stage_counts(client, headers, role.id)
+    version = _projection(db, role.id).version
+
+    apps[0].pipeline_stage = "in_assessment"
+    apps[1].application_outcome = "rejected"
+    db.flush()
+    # The writer's flush does not touch (or lock) the role's count row.
+    assert db.execute(
+        select(RoleStageCount.stale).where(RoleStageCount.role_id == role.id)
+    ).scalar_one() is False
+    db.rollback()
+    # A rolled-back write marks nothing.
+    assert _projection(db, role.id).stale is False
+
+    target = db.get(CandidateApplication, apps[0].id)
+    target.pipeline_stage = "in_assessment"
+    db.commit()
+    row = _projection(db, role.id)
+    assert row.stale is True and row.version > version
+
+    counts = _stage_counts(client, headers, role.id)
+    assert counts == {"all": 3, "applied": 0, "invited": 1, "in_assessment": 1, "review": 1}
+
+
+def test_projection_refresh_leaves_the_caller_session_alone(client, db, monkeypatch):
+    _headers, role, _apps = _seed(client, db)
+    scope = resolve_candidate_role_scope(db, organization_id=role.organization_id, role_id=role.id)
+
+    def _no_commit():
+        raise AssertionError("a read must not commit the caller's session")
+
+    monkeypatch.setattr(db, "commit", _no_commit)
+    counts = projected_stage_counts(db, organization_id=role.organization_id, role_scope=scope)
+
+    assert counts["all"] == 3
+    assert _projection(db, role.id).stale is False
+
+
+def test_workable_clear_marks_bulk_updated_rosters_stale(client, db, monkeypatch):
+    from app.domains.workable_sync import routes as workable_routes
+
+    monkeypatch.setattr(workable_routes.settings, "MVP_DISABLE_WORKABLE", False)
+    headers, role, _apps = _seed(client, db)
+    assert _stage_counts(client, headers, role.id)["all"] == 3
+
+    response = client.post("/api/v1/workable/clear", headers=headers)
+    assert response.status_code == 200, response.text
+
+    assert _projection(db, role.id).stale is True
+    assert _stage_counts(client, headers, role.id)["all"] == 2
+
+
+def test_filtered_pipeline_uses_live_counts(client, db):
+    headers, role, _apps = _seed(client, db)
+    _stage_counts(client, headers, role.id)
+
+    counts = _stage_counts(client, headers, role.id, source="workable")
+
+    assert counts == {"all": 1, "applied": 0, "invited": 0, "in_assessment": 0, "review": 1}
+    assert _projection(db, role.id).total == 3
+
+
+def test_stale_read_does_not_overwrite_newer_version(client, db):
+    headers, role, _apps = _seed(client, db)
+    row = _projection(db, role.id)
+    stored = role_stage_count_projection._store_counts(
+        db,
+        role_id=role.id,
+        organization_id=role.organization_id,
+        counts={"all": 99, "applied": 99},
+        seen_version=int(row.version) - 1,
+    )
+    assert stored is False
+    assert _projection(db, role.id).stale is True
+
+
+def test_reconciler_repairs_bulk_update_drift_and_drops_deleted_roles(client, db):
+    headers, role, apps = _seed(client, db)
+    _stage_counts(client, headers, role.id)
+    # Bulk UPDATEs bypass the ORM hooks, so the projection drifts.
+    db.execute(
+        update(CandidateApplication)
+        .where(CandidateApplication.id == apps[0].id)
+        .values(application_outcome="hired")
+        .execution_options(synchronize_session=False)
+    )
+    gone = Role(organization_id=role.organization_id, name="Deleted role", source="manual")
+    db.add(gone)
+    db.flush()
+    _application(db, organization_id=role.organization_id, role_id=gone.id, suffix=f"{gone.id}-gone")
+    gone.deleted_at = datetime.now(timezone.utc)
+    db.commit()
+    assert _projection(db, role.id).total == 3
+
+    summary = reconcile_role_stage_counts(db)
+
+    assert summary["repaired"] >= 1 and summary["removed"] >= 1
+    assert _projection(db, role.id).as_stage_counts()["all"] == 2
+    assert _projection(db, gone.id) is None
@@ -0,0 +1,131 @@
+"""Checkpointed, compacted Taali Chat history replay."""
+
+from __future__ import annotations
+
+from app.llm.history_compaction import (
+    compact_settled_tool_results,
+    with_cache_breakpoints,
+)
+from app.models.organization import Organization
+from app.models.taali_chat_conversation import TaaliChatConversation
+from app.models.taali_chat_history_checkpoint import TaaliChatHistoryCheckpoint
+from app.models.user import User
+from app.taali_chat import history as chat_history
+from app.taali_chat.conversation_store import persist_message
+
+BIG_RESULT = "x" * 9000
+
+
+def _turn(index: int) -> list[tuple[str, list[dict]]]:
+    tool_id = f"toolu_{index}"
+    return [
+        ("user", [{"type": "text", "text": f"question {index}"}]),
+        (
+            "assistant",
+            [{"type": "tool_use", "id": tool_id, "name": "search_applications", "input": {}}],
+        ),
+        (
+            "user",
+            [{"type": "tool_result", "tool_use_id": tool_id, "content": BIG_RESULT}],
+        ),
+        ("assistant", [{"type": "text", "text": f"answer {index}"}]),
+    ]
+
+
+def _conversation(db) -> TaaliChatConversation:
+    org = Organization(name="History org", slug="history-org")
+    db.add(org)
+    db.flush()
+    user = User(
+        organization_id=org.id,
+        email="history@example.test",
+        hashed_password="x",
+        full_name="Recruiter",
+    )
+    db.add(user)
+    db.flush()
+    conversation = TaaliChatConversation(
+        organization_id=org.id, user_id=user.id, title="History"
+    )
+    db.add(conversation)
+    db.flush()
+    return conversation
+
+
+def _persist_turns(db, conversation, turns: range) -> None:
+    for index in turns:
+        for role, content in _turn(index):
+            persist_message(db, conversation=conversation, role=role, content=content)
+    db.commit()
+
+
+def _strip_cache_control(messages):
+    return [
+        {
+            **message,
+            "content": [
+                {k: v for k, v in block.items() if k != "cache_control"}
+                for block in message["content"]
+            ],
+        }
+        for message in messages
+    ]
+
+
+def _tool_result_sizes(messages) -> list[int]:
+    return [
+        len(block["content"])
+        for message in messages
+        for block in message["content"]
+        if block.get("type") == "tool_result"
+    ]
+
+
+def test_compaction_keeps_recent_turns_and_is_replay_stable():
+    messages = [
+        {"role": role, "content": content}
+        for index in range(3)
+        for role, content in _turn(index)
+    ]
+
+    once = compact_settled_tool_results(messages)
+    twice = compact_settled_tool_results(once)
+
+    assert once == twice
+    sizes = _tool_result_sizes(once)
+    assert sizes[0] < 5000
+    assert sizes[1:] == [len(BIG_RESULT)] * 2
+    marked = with_cache_breakpoints(once, [3, len(once) - 1])
+    assert marked[3]["content"][-1]["cache_control"] == {"type": "ephemeral"}
+    assert "cache_control" not in once[3]["content"][-1]
+
+
+def test_checkpoint_folds_settled_turns_and_replays_only_the_delta(db):
+    conversation = _conversation(db)
+    _persist_turns(db, conversation, range(3))
+    before = chat_history.load_turn_history(db, conversation=conversation)
+
+    assert chat_history.advance_history_checkpoint(db, conversation=conversation)
+    db.commit()
+
+    checkpoint = db.get(TaaliChatHistoryCheckpoint, conversation.id)
+    assert len(checkpoint.messages) == 4  # the first, settled turn
+    assert checkpoint.compacted_tokens_saved > 0
+    after = chat_history.load_turn_history(db, conversation=conversation)
+    assert after.stats["checkpoint_messages"] == 4
+    assert after.stats["delta_messages"] == 8
+    # Folding changes where the history is read from, never what is replayed.
+    assert _strip_cache_control(after.messages) == _strip_cache_control(before.messages)
+    assert "cache_control" in after.messages[3]["content"][-1]
+    assert "cache_control" in after.messages[-1]["content"][-1]
+
+
+def test_checkpoint_waits_for_enough_new_rows(db):
+    conversation = _conversation(db)
+    _persist_turns(db, conversation, range(2))
+
+    assert not chat_history.advance_history_checkpoint(db, conversation=conversation)
+    assert db.get(TaaliChatHistoryCheckpoint, conversation.id) is None
+    stats = chat_history.load_turn_history(db, conversation=conversation).stats
+    assert stats["delta_messages"] == 8
+    assert stats["compacted_tokens_saved"] == 0
@@ -17,6 +17,7 @@ same event shapes as the live SDK.
 from __future__ import annotations
 
 import json
+import threading
 from types import SimpleNamespace
 from unittest.mock import patch
 
@@ -825,7 +826,8 @@ def test_verified_search_result_is_durable_before_later_tool_failure(db):
         )
     db.commit()
 
-    assert dispatched == ["find_top_candidates", "get_role"]
+    # Both are reads, so they may run side by side in either order.
+    assert sorted(dispatched) == ["find_top_candidates", "get_role"]
     assert len(fake_client.messages.calls) == 2
     assert raw_marker not in "".join(frames)
     second_round_messages = json.dumps(fake_client.messages.calls[1]["messages"])
@@ -1254,6 +1256,137 @@ def test_cited_pyspark_result_can_ground_taali_chat_answer(db):
     assert visible == supported_text
 
 
+def test_top_candidates_progress_streams_before_the_tool_result(db):
+    user, org = _seed_user(db)
+    fake_client = _FakeClient(
+        [
+            _tool_use_plan(
+                tool_id="toolu_progressive",
+                tool_name="find_top_candidates",
+                args={"query": "PySpark experience"},
+            ),
+            _text_only_plan("Two candidates are being checked."),
+        ]
+    )
+    routes_seen = []
+
+    def dispatch(name, *_args, on_progress=None, **_kwargs):
+        routes_seen.append(current_route())
+        on_progress({"phase": "shortlist", "provisional": True, "candidates": []})
+        on_progress({"phase": "verdict", "application_id": 7, "checked": 1, "window": 2})
+        return {"search_status": "matches_found", "candidates": [], "warnings": []}
+
+    with (
+        patch(
+            "app.taali_chat.service.routed_messages_client",
+            return_value=fake_client,
+        ),
+        patch("app.taali_chat.service.record_event"),
+        patch("app.taali_chat.tool_execution.dispatch_tool", side_effect=dispatch),
+    ):
+        frames = _drain(
+            run_chat_turn(
+                db=db,
+                user=user,
+                organization=org,
+                turn=ChatTurnInput(
+                    user_message="Show PySpark candidates", conversation_id=None
+                ),
+            )
+        )
+
+    progress = [
+        json.loads(frame[2:])[0]["tool_progress"]
+        for frame in frames
+        if frame.startswith("2:") and "tool_progress" in frame
+    ]
+    assert [event["phase"] for event in progress] == ["shortlist", "verdict"]
+    assert {event["tool_call_id"] for event in progress} == {"toolu_progressive"}
+    result_index = next(i for i, frame in enumerate(frames) if frame.startswith("a:"))
+    assert all(
+        i < result_index
+        for i, frame in enumerate(frames)
+        if "tool_progress" in frame
+    )
+    # The helper thread still runs inside the turn's routing scope.
+    assert routes_seen and routes_seen[0] is not None
+
+
+def test_read_tools_of_a_round_run_concurrently_before_writes(db):
+    user, org = _seed_user(db)
+    fake_client = _FakeClient(
+        [
+            _multi_tool_use_plan(
+                [
+                    ("toolu_write", "create_related_role", {"role_id": 1}),
+                    ("toolu_role", "get_role", {"role_id": 1}),
+                    ("toolu_roles", "list_roles", {}),
+                ]
+            ),
+            _text_only_plan("Both reads came back."),
+        ]
+    )
+    both_reads_running = threading.Barrier(2, timeout=10)
+    calls: list[tuple[str, str, int]] = []
+
+    def dispatch(name, *_args, db, user, **_kwargs):
+        calls.append((name, threading.current_thread().name, int(user.id)))
+        if name == "create_related_role":
+            return {"status": "queued"}
+        # Fails with BrokenBarrierError unless the other read is in flight.
+        both_reads_running.wait()
+        assert db is not dispatch_session
+        return {"tool": name}
+
+    dispatch_session = db
+    with (
+        patch(
+            "app.taali_chat.service.routed_messages_client", return_value=fake_client
+        ),
+        patch("app.taali_chat.service.record_event"),
+        patch("app.taali_chat.tool_execution.dispatch_tool", side_effect=dispatch),
+    ):
+        frames = _drain(
+            run_chat_turn(
+                db=db,
+                user=user,
+                organization=org,
+                turn=ChatTurnInput(
+                    user_message="Read both roles, then create one",
+                    conversation_id=None,
+                ),
+            )
+        )
+
+    assert sorted(name for name, _, _ in calls[:2]) == ["get_role", "list_roles"]
+    assert calls[2][0] == "create_related_role"
+    assert all(thread.startswith("taali-chat-tool") for _, thread, _ in calls[:2])
+    assert {user_id for _, _, user_id in calls} == {user.id}
+    results = [json.loads(frame[2:]) for frame in frames if frame.startswith("a:")]
+    assert [result["toolCallId"] for result in results] == [
+        "toolu_write",
+        "toolu_role",
+        "toolu_roles",
+    ]
+    assert results[1]["result"] == {"tool": "get_role"}
+    progress = [
+        json.loads(frame[2:])[0]["tool_progress"]
+        for frame in frames
+        if frame.startswith("2:") and "tool_progress" in frame
+    ]
+    for tool_call_id in ("toolu_role", "toolu_roles"):
+        phases = [
+            event["phase"]
+            for event in progress
+            if event["tool_call_id"] == tool_call_id
+        ]
+        assert phases == ["running", "done"]
+    first_result = next(i for i, frame in enumerate(frames) if frame.startswith("a:"))
+    assert all(
+        i < first_result for i, frame in enumerate(frames) if "tool_progress" in frame
+    )
+
+
 @pytest.mark.parametrize(
     ("user_message", "expected_tool", "supported_text"),
     [
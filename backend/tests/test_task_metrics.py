@@ -0,0 +1,115 @@
+"""Celery task/queue metrics recorded through signals and served at /metrics."""
+
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from app.platform import metrics
+from app.platform.config import settings
+from app.tasks import task_metrics
+from app.tasks.celery_app import celery_app
+
+
+@celery_app.task(name="tests.task_metrics.probe", bind=True, max_retries=1)
+def _probe(self, mode: str = "ok"):
+    if mode == "fail":
+        raise ValueError("boom")
+    if mode == "retry" and not self.request.retries:
+        raise self.retry(countdown=0)
+    return "done"
+
+
+@pytest.fixture(autouse=True)
+def _local_metrics(monkeypatch):
+    monkeypatch.setattr(metrics, "_redis", lambda: None)
+    monkeypatch.setattr(task_metrics, "_redis", lambda: None)
+    metrics.registry.reset()
+    yield
+    metrics.registry.reset()
+
+
+def _labels(state: str) -> dict:
+    return {"task": "tests.task_metrics.probe", "queue": "celery", "state": state}
+
+
+def test_task_runs_record_runtime_outcome_and_retries():
+    assert _probe.delay().get() == "done"
+    # Not propagated, as on a worker (eager propagation re-raises before postrun).
+    assert isinstance(_probe.apply(args=("fail",), throw=False).result, ValueError)
+    # An eager retry re-runs the task inline, and the second attempt succeeds.
+    assert _probe.apply(args=("retry",), throw=False).get() == "done"
+
+    assert task_metrics.runs_total.value(**_labels("SUCCESS")) == 2
+    assert task_metrics.runs_total.value(**_labels("FAILURE")) == 1
+    assert task_metrics.runs_total.value(**_labels("RETRY")) == 1
+    assert task_metrics.runtime_seconds.count(**_labels("SUCCESS")) == 2
+    assert task_metrics.retries_total.value(task="tests.task_metrics.probe", queue="celery") == 1
+
+
+def test_queue_wait_is_measured_from_publish_or_eta():
+    headers: dict = {}
+    task_metrics._stamp_published_at(headers=headers)
+    assert headers[task_metrics.PUBLISHED_AT_HEADER] == pytest.approx(time.time(), abs=5)
+
+    def started(**request):
+        request = {"delivery_info": {"routing_key": "scoring"}, "eta": None, **request}
+        task = SimpleNamespace(
+            name="tests.task_metrics.probe", queue=None, request=SimpleNamespace(**request)
+        )
+        task_metrics._task_started(task_id=str(len(task_metrics._started)), task=task)
+
+    started(**{task_metrics.PUBLISHED_AT_HEADER: time.time() - 30})
+    # A countdown task only starts waiting at its ETA.
+    started(
+        **{task_metrics.PUBLISHED_AT_HEADER: time.time() - 600},
+        eta=time.strftime("%Y-%m-%dT%H:%M:%S+00:00", time.gmtime(time.time() - 2)),
+    )
+    wait = task_metrics.queue_wait_seconds
+    labels = {"task": "tests.task_metrics.probe", "queue": "scoring"}
+    assert wait.count(**labels) == 2
+    assert 30 <= wait.sum(**labels) < 60
+    task_metrics._started.clear()
+
+
+def test_queue_depth_sums_priority_sublists(monkeypatch):
+    from kombu.transport.redis import Channel
+
+    lengths = {"celery": 2, f"celery{Channel.sep}6": 5, f"scoring{Channel.sep}9": 1}
+
+    class _Pipe:
+        def __init__(self):
+            self.ops = []
+
+        def llen(self, key):
+            self.ops.append(lengths.get(key, 0))
+
+        def hlen(self, key):
+            self.ops.append(4 if key == "unacked" else 0)
+
+        def execute(self):
+            return self.ops
+
+    monkeypatch.setattr(
+        task_metrics, "_redis", lambda: SimpleNamespace(pipeline=lambda transaction=False: _Pipe())
+    )
+    task_metrics.sample_queue_depths()
+
+    assert task_metrics.queue_depth.value(queue="celery") == 7
+    assert task_metrics.queue_depth.value(queue="scoring") == 1
+    assert task_metrics.unacked_messages.value() == 4
+
+
+def test_metrics_endpoint_requires_admin_secret(client, monkeypatch):
+    monkeypatch.setattr(settings, "ADMIN_SECRET", "metrics-admin-secret")
+    _probe.delay()
+
+    assert client.get("/metrics").status_code == 403
+    response = client.get("/metrics", headers={"X-Admin-Secret": "metrics-admin-secret"})
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain")
+    assert "# TYPE taali_celery_task_runs_total counter" in response.text
+    assert (
+        'taali_celery_task_runs_total{task="tests.task_metrics.probe",queue="celery",state="SUCCESS"} 1'
+        in response.text
+    )
@@ -17,8 +17,8 @@ from fastapi import HTTPException
 # document_service tests
 # ===================================================================
 
+from app.services.pdf_text import extract_text_from_pdf
 from app.services.document_service import (
-    extract_text_from_pdf,
     extract_text_from_docx,
     extract_text_from_txt,
     extract_text,
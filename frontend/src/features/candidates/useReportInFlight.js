@@ -16,9 +16,25 @@ import { useEffect, useRef } from 'react';
  *     only (share routes are unauth and can't call these APIs).
  *
  *  2. Lazy CV text — the initial load drops include_cv_text (the CV tab is one
- *     of six). The first time the CV tab is opened, fetch the parsed text once
- *     and merge it into the application in place.
+ *     of six). The first time the CV tab is opened, fetch the text from
+ *     `/applications/{id}/cv-text` and merge it into the application in place.
+ *     Texts are cached by their content-hash ETag, so reopening a CV sends
+ *     If-None-Match and an unchanged one comes back as an empty 304.
  */
+// application id → { etag, text }; the oldest entry is dropped past the cap.
+const CV_TEXT_CACHE_LIMIT = 50;
+const cvTextCache = new Map();
+
+const rememberCvText = (applicationId, etag, text) => {
+  cvTextCache.delete(applicationId);
+  cvTextCache.set(applicationId, { etag, text });
+  if (cvTextCache.size > CV_TEXT_CACHE_LIMIT) {
+    cvTextCache.delete(cvTextCache.keys().next().value);
+  }
+};
+
+export const clearCvTextCache = () => cvTextCache.clear();
+
 export function useReportInFlight({
   rolesApi,
   numericApplicationId,
@@ -130,25 +146,32 @@ export function useReportInFlight({
   useEffect(() => { cvTextFetchedRef.current = false; }, [cvTextScope]);
   useEffect(() => {
     if (activeTab !== 'cv' || isShareRoute || cvTextFetchedRef.current) return undefined;
-    if (!rolesApi?.getApplication || !Number.isFinite(numericApplicationId)) return undefined;
+    if (!rolesApi?.getApplicationCvText || !Number.isFinite(numericApplicationId)) return undefined;
     // Wait for the cold load to populate `application` before firing — if this
     // request beats the initial wave, merging into a null application would
     // discard the CV text and the one-shot guard would block any retry.
     if (!application) return undefined;
     if (application.cv_text) { cvTextFetchedRef.current = true; return undefined; }
     let cancelled = false;
-    rolesApi.getApplication(numericApplicationId, {
-      params: { include_cv_text: true, ...(reportRoleId ? { view_role_id: reportRoleId } : {}) },
+    const cached = cvTextCache.get(numericApplicationId);
+    rolesApi.getApplicationCvText(numericApplicationId, {
+      roleId: reportRoleId || null,
+      etag: cached?.etag || null,
     })
       .then((res) => {
-        const fresh = res?.data;
-        if (cancelled || !fresh) return;
+        let cvText = null;
+        if (res?.status === 304 && cached) {
+          cvText = cached.text;
+        } else if (typeof res?.data === 'string' && res.data) {
+          cvText = res.data;
+          const etag = res.headers?.etag;
+          if (etag) rememberCvText(numericApplicationId, etag, cvText);
+        }
+        if (cancelled || !cvText) return;
         // Only mark fetched once the merge actually lands, so a failed/empty
         // response can be retried on the next CV-tab activation.
         cvTextFetchedRef.current = true;
-        setApplication((cur) => (cur
-          ? { ...cur, cv_text: fresh.cv_text, cv_sections: fresh.cv_sections ?? cur.cv_sections }
-          : cur));
+        setApplication((cur) => (cur ? { ...cur, cv_text: cvText } : cur));
       })
       .catch(() => { /* leave the viewer's download-original fallback; allow retry */ });
     return () => { cancelled = true; };
@@ -1,7 +1,7 @@
 import { act, renderHook } from '@testing-library/react';
 import { afterEach, beforeEach, describe, expect, it, vi } from 'vitest';
 
-import { useReportInFlight } from './useReportInFlight';
+import { clearCvTextCache, useReportInFlight } from './useReportInFlight';
 
 describe('useReportInFlight role-scoped polling', () => {
   beforeEach(() => vi.useFakeTimers());
@@ -131,12 +131,13 @@ describe('useReportInFlight role-scoped polling', () => {
 
   it('reloads CV text when the same application is viewed in another logical role', async () => {
     vi.useRealTimers();
-    const getApplication = vi.fn()
-      .mockResolvedValueOnce({ data: { cv_text: 'Role A CV' } })
-      .mockResolvedValueOnce({ data: { cv_text: 'Role B CV' } });
+    clearCvTextCache();
+    const getApplicationCvText = vi.fn()
+      .mockResolvedValueOnce({ status: 200, data: 'Role A CV', headers: {} })
+      .mockResolvedValueOnce({ status: 200, data: 'Role B CV', headers: {} });
     const setApplication = vi.fn();
     const shared = {
-      rolesApi: { getApplication },
+      rolesApi: { getApplication: vi.fn(), getApplicationCvText },
       numericApplicationId: 77,
       isShareRoute: false,
       activeTab: 'cv',
@@ -154,17 +155,49 @@ describe('useReportInFlight role-scoped polling', () => {
     }), { initialProps: { roleId: 31 } });
 
     await act(async () => { await Promise.resolve(); });
-    expect(getApplication).toHaveBeenNthCalledWith(1, 77, {
-      params: { include_cv_text: true, view_role_id: 31 },
-    });
+    expect(getApplicationCvText).toHaveBeenNthCalledWith(1, 77, { roleId: 31, etag: null });
 
     rerender({ roleId: 135 });
     await act(async () => { await Promise.resolve(); });
 
-    expect(getApplication).toHaveBeenNthCalledWith(2, 77, {
-      params: { include_cv_text: true, view_role_id: 135 },
-    });
+    expect(getApplicationCvText).toHaveBeenNthCalledWith(2, 77, { roleId: 135, etag: null });
+    expect(shared.rolesApi.getApplication).not.toHaveBeenCalled();
     expect(setApplication).toHaveBeenCalledTimes(2);
     unmount();
   });
+
+  it('revalidates a cached CV with its ETag and reuses the text on a 304', async () => {
+    vi.useRealTimers();
+    clearCvTextCache();
+    const getApplicationCvText = vi.fn()
+      .mockResolvedValueOnce({ status: 200, data: 'Cached CV', headers: { etag: '"abc"' } })
+      .mockResolvedValueOnce({ status: 304, data: '', headers: { etag: '"abc"' } });
+    const merged = [];
+    const setApplication = vi.fn((update) => { merged.push(update({ id: 77 })); });
+    const props = {
+      rolesApi: { getApplicationCvText },
+      numericApplicationId: 77,
+      viewRoleId: 31,
+      isShareRoute: false,
+      activeTab: 'cv',
+      application: { id: 77, role_id: 31, cv_match_score: 68 },
+      agentDecision: null,
+      evaluating: false,
+      setEvaluating: vi.fn(),
+      setApplication,
+      loadAgentDecision: vi.fn(),
+      loadStandingReport: vi.fn(),
+    };
+
+    const first = renderHook(() => useReportInFlight(props));
+    await act(async () => { await Promise.resolve(); });
+    first.unmount();
+
+    const second = renderHook(() => useReportInFlight(props));
+    await act(async () => { await Promise.resolve(); });
+
+    expect(getApplicationCvText).toHaveBeenNthCalledWith(2, 77, { roleId: 31, etag: '"abc"' });
+    expect(merged).toEqual([{ id: 77, cv_text: 'Cached CV' }, { id: 77, cv_text: 'Cached CV' }]);
+    second.unmount();
+  });
 });
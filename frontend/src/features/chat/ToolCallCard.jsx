@@ -62,6 +62,39 @@ const resultCount = (toolName, result) => {
   return null;
 };
 
+// While a progressive tool runs, summarise its provisional evidence checks.
+const progressCount = (progress) => {
+  if (!progress || typeof progress.window !== 'number' || progress.window <= 0) return null;
+  return `checked ${progress.checked || 0} of ${progress.window}`;
+};
+
+// Provisional shortlist rows, each marked checked once its verdicts arrive.
+// The final tool result replaces them; they are never the answer.
+const ProvisionalShortlist = ({ progress }) => {
+  const rows = Array.isArray(progress?.candidates) ? progress.candidates : [];
+  if (rows.length === 0) return null;
+  const verdicts = progress.verdicts || {};
+  return (
+    <ol className="cp-tool-shortlist" aria-label="Provisional shortlist">
+      {rows.map((row) => {
+        const criteria = verdicts[row.application_id];
+        const met = Array.isArray(criteria)
+          ? criteria.filter((criterion) => criterion.status === 'met').length
+          : null;
+        return (
+          <li key={row.application_id}>
+            <span className="cp-tool-shortlist-rank">{row.rank}</span>
+            <span className="cp-tool-shortlist-name">{row.candidate_name || 'Candidate'}</span>
+            <span className="cp-tool-shortlist-status">
+              {met === null ? 'checking…' : `${met} of ${criteria.length} met`}
+            </span>
+          </li>
+        );
+      })}
+    </ol>
+  );
+};
+
 const PendingIcon = () => <MotionSpinner size={13} />;
 
 const ToolCallCard = ({ part }) => {
@@ -70,7 +103,7 @@ const ToolCallCard = ({ part }) => {
   const isError = status === 'error';
   const label = TOOL_LABELS[toolName] || String(toolName).replace(/_/g, ' ');
   const argSummary = summarizeArgs(args || {});
-  const count = isPending ? null : resultCount(toolName, result);
+  const count = isPending ? progressCount(part.progress) : resultCount(toolName, result);
   const summary = isError
     ? 'The tool did not complete.'
     : [argSummary, count].filter(Boolean).join(' · ')
@@ -105,7 +138,9 @@ const ToolCallCard = ({ part }) => {
       disclosureLabel="Details"
       disclosureAriaLabel={`${label} details`}
       aria-label={`${isError ? 'Error' : isPending ? 'Running' : 'Completed'} tool activity: ${label}`}
-    />
+    >
+      {isPending ? <ProvisionalShortlist progress={part.progress} /> : null}
+    </ChatActivity>
   );
 };
 
@@ -1,5 +1,5 @@
 import React from 'react';
-import { fireEvent, render, screen } from '@testing-library/react';
+import { fireEvent, render, screen, within } from '@testing-library/react';
 import { describe, expect, it } from 'vitest';
 
 import ToolCallCard from './ToolCallCard';
@@ -43,4 +43,69 @@ describe('ToolCallCard disclosure', () => {
     expect(activity).toHaveAttribute('data-severity', 'error');
     expect(screen.getByText('The tool did not complete.')).toBeInTheDocument();
   });
+
+  it('summarises provisional evidence checks while a search is still running', () => {
+    render(
+      <ToolCallCard
+        part={{
+          toolName: 'find_top_candidates',
+          args: { limit: 5 },
+          status: 'awaiting_result',
+          progress: { phase: 'verdict', checked: 3, window: 12, verdicts: {} },
+        }}
+      />,
+    );
+
+    expect(screen.getByText(/checked 3 of 12/)).toBeInTheDocument();
+  });
+
+  it('renders the provisional shortlist and marks candidates as their checks land', () => {
+    render(
+      <ToolCallCard
+        part={{
+          toolName: 'find_top_candidates',
+          args: { limit: 2 },
+          status: 'awaiting_result',
+          progress: {
+            phase: 'verdict',
+            provisional: true,
+            window: 2,
+            checked: 1,
+            candidates: [
+              { application_id: 11, rank: 1, candidate_name: 'Ada Lovelace', provisional: true },
+              { application_id: 12, rank: 2, candidate_name: 'Grace Hopper', provisional: true },
+            ],
+            verdicts: { 11: [{ status: 'met' }, { status: 'missing' }] },
+          },
+        }}
+      />,
+    );
+
+    const shortlist = screen.getByRole('list', { name: 'Provisional shortlist' });
+    const rows = within(shortlist).getAllByRole('listitem');
+    expect(rows).toHaveLength(2);
+    expect(rows[0]).toHaveTextContent('Ada Lovelace');
+    expect(rows[0]).toHaveTextContent('1 of 2 met');
+    expect(rows[1]).toHaveTextContent('Grace Hopper');
+    expect(rows[1]).toHaveTextContent('checking…');
+  });
+
+  it('drops the provisional shortlist once the tool result arrives', () => {
+    render(
+      <ToolCallCard
+        part={{
+          toolName: 'find_top_candidates',
+          args: { limit: 1 },
+          status: 'complete',
+          result: { candidates: [{ application_id: 11 }], shown: 1, total_matched: 4 },
+          progress: {
+            candidates: [{ application_id: 11, rank: 1, candidate_name: 'Ada Lovelace' }],
+          },
+        }}
+      />,
+    );
+
+    expect(screen.queryByRole('list', { name: 'Provisional shortlist' })).not.toBeInTheDocument();
+    expect(screen.getByText(/1 of 4/)).toBeInTheDocument();
+  });
 });
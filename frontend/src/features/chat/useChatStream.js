@@ -8,7 +8,7 @@
 //     role: 'user' | 'assistant',
 //     parts: [
 //       { type: 'text', text: '...' },
-//       { type: 'tool_call', toolCallId, toolName, args, status: 'streaming'|'complete'|'error' },
+//       { type: 'tool_call', toolCallId, toolName, args, progress?, status: 'streaming'|'complete'|'error' },
 //       { type: 'tool_result', toolCallId, result }
 //     ]
 //   }
@@ -26,6 +26,23 @@ import { freshAuth, turnUrl } from './api';
 
 const newId = () => `m_${Math.random().toString(36).slice(2, 9)}`;
 
+// Fold one `tool_progress` event into a tool_call part's provisional state:
+// the shortlist arrives first, then one verdict per candidate as it is checked.
+export const mergeToolProgress = (current, event) => {
+  if (event?.phase === 'shortlist') {
+    return { ...event, verdicts: current?.verdicts || {}, checked: current?.checked || 0 };
+  }
+  if (event?.phase === 'verdict') {
+    return {
+      ...(current || {}),
+      checked: event.checked,
+      window: event.window,
+      verdicts: { ...(current?.verdicts || {}), [event.application_id]: event.criteria },
+    };
+  }
+  return current;
+};
+
 const parseLine = (line) => {
   if (!line) return null;
   const colon = line.indexOf(':');
@@ -174,6 +191,21 @@ const useChatStream = ({ conversationId, onConversationId } = {}) => {
                       onConversationId?.(item.conversation_id);
                     }
                   }
+                  if (item?.tool_progress && typeof item.tool_progress.tool_call_id === 'string') {
+                    // Provisional output from a still-running tool (shortlist,
+                    // then per-candidate verdicts). The tool result replaces it.
+                    const { tool_call_id: toolCallId, ...event } = item.tool_progress;
+                    updateAssistant((m) => {
+                      const next = m.parts.slice();
+                      const idx = next.findIndex(
+                        (p) => p.type === 'tool_call' && p.toolCallId === toolCallId,
+                      );
+                      if (idx >= 0) {
+                        next[idx] = { ...next[idx], progress: mergeToolProgress(next[idx].progress, event) };
+                      }
+                      return { ...m, parts: next };
+                    });
+                  }
                   if (item?.progress && typeof item.progress.label === 'string') {
                     updateAssistant((m) => ({
                       ...m,
@@ -129,6 +129,17 @@ export const roles = {
     }),
   getPoolRescore: (jobId) => api.get(`/candidates/pool-rescore/${jobId}`),
   getApplication: (applicationId, config = {}) => api.get(`/applications/${applicationId}`, config),
+  // Plain-text CV for the viewer. Pass the ETag of a cached copy to get an
+  // empty 304 back when it is still current.
+  getApplicationCvText: (applicationId, { roleId = null, etag = null } = {}) => api.get(
+    `/applications/${applicationId}/cv-text`,
+    {
+      params: Number.isInteger(roleId) && roleId > 0 ? { role_id: roleId } : {},
+      headers: etag ? { 'If-None-Match': etag } : {},
+      responseType: 'text',
+      validateStatus: (status) => (status >= 200 && status < 300) || status === 304,
+    },
+  ),
   // HANDOFF v2 §3 — multi-link share contract.
   // POST mints a new link with mode + expiry preset; GET lists all links
   // (active + revoked + expired so the report footer can render audit
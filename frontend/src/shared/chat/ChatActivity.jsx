@@ -31,6 +31,7 @@ export function ChatActivity({
   disclosureAriaLabel,
   actions = [],
   detailOnly = false,
+  children,
   ...articleProps
 }) {
   const reduced = useReducedMotionSync();
@@ -71,6 +72,8 @@ export function ChatActivity({
 
         {summary ? <p className="tk-activity-summary">{summary}</p> : null}
 
+        {children}
+
         {source?.label ? (
           <div className="tk-activity-meta">
             {source.href ? (